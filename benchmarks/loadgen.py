@@ -0,0 +1,679 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""
+Drive checkout flows through the Sdk and report capacity numbers.
+
+Each flow looks up the payment methods, creates an order, validates the
+webhook notification of the order, fetches the order and, depending on
+the scenario, captures or refunds it. Workers run flows picked from a
+weighted scenario mix until the duration is over, as threads sharing one
+Sdk, as processes with an Sdk each, or as asyncio tasks sharing an
+AsyncSdk.
+
+The report gives the flows and API requests per second, the latency
+percentiles per step and the CPU time per request. CPU time is that of
+the load generator only, so run the API elsewhere, e.g. as a separate
+simulator process with ``--simulator``.
+
+Usage, from the root of a source checkout, which provides the simulator
+in ``tests.support.api_simulator`` and this module:
+
+    python -m benchmarks.loadgen --simulator [--mode thread|process|async]
+        [--concurrency 8] [--duration 10] [--mix checkout=6,capture=2,refund=2]
+    python -m benchmarks.loadgen --base-url http://127.0.0.1:8080/v1/
+    python -m benchmarks.loadgen --base-url URL --run-id r1 --record FILE
+    python -m benchmarks.loadgen --base-url URL --run-id r1 --cassette FILE
+
+Custom base URLs use the dev-only ``MSP_SDK_CUSTOM_BASE_URL`` override.
+A cassette recorded with ``--record`` is replayed with ``--cassette``
+when the base URL and the ``--run-id`` naming the orders are the same;
+workers stop at the first flow the cassette has no responses for.
+"""
+
+import argparse
+import asyncio
+import base64
+import datetime
+import hashlib
+import hmac
+import importlib.metadata
+import importlib.util
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from multisafepay import AsyncSdk, Sdk
+from multisafepay.api.paths.orders.order_id.capture.request.capture_request import (
+    CaptureOrderRequest,
+)
+from multisafepay.api.paths.orders.order_id.refund.request.refund_request import (
+    RefundOrderRequest,
+)
+from multisafepay.api.paths.orders.request.order_request import OrderRequest
+from multisafepay.transport import (
+    AsyncReplayTransport,
+    CassetteError,
+    HttpxAsyncTransport,
+    RecordingTransport,
+    ReplayTransport,
+    RequestsTransport,
+    Urllib3Transport,
+)
+from multisafepay.util.webhook import Webhook
+
+API_KEY = "loadgen-api-key"
+AMOUNT = 1000
+
+SCENARIOS = {
+    "checkout": ("payment_methods", "create", "webhook", "get"),
+    "capture": ("payment_methods", "create", "webhook", "get", "capture"),
+    "refund": ("payment_methods", "create", "webhook", "get", "refund"),
+}
+# Steps validating locally instead of calling the API.
+LOCAL_STEPS = {"webhook"}
+DEFAULT_MIX = "checkout=6,capture=2,refund=2"
+
+
+@dataclass
+class Options:
+    """Settings of a load run, shared with the worker processes."""
+
+    mode: str = "thread"
+    concurrency: int = 8
+    duration: float = 10.0
+    mix: dict[str, int] = field(default_factory=lambda: parse_mix(DEFAULT_MIX))
+    transport: str = "requests"
+    run_id: str = "load"
+    seed: int = 0
+    record: Optional[str] = None
+    cassette: Optional[str] = None
+    replay_speed: Optional[float] = None
+
+
+@dataclass
+class WorkerResult:
+    """Latencies and counters collected by one or more workers."""
+
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    flows: int = 0
+    failed_flows: int = 0
+    cpu_seconds: float = 0.0
+
+    def add(self: "WorkerResult", step: str, duration: float) -> None:
+        """Record the duration of a step."""
+        self.latencies.setdefault(step, []).append(duration)
+
+    def merge(self: "WorkerResult", other: "WorkerResult") -> None:
+        """Add the results of another worker."""
+        for step, durations in other.latencies.items():
+            self.latencies.setdefault(step, []).extend(durations)
+        for step, count in other.errors.items():
+            self.errors[step] = self.errors.get(step, 0) + count
+        self.flows += other.flows
+        self.failed_flows += other.failed_flows
+        self.cpu_seconds += other.cpu_seconds
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """
+    Parse a scenario mix such as ``checkout=6,refund=2``.
+
+    Parameters
+    ----------
+    text (str): Comma-separated scenario names with integer weights.
+
+    Returns
+    -------
+    dict[str, int]: The weights by scenario.
+
+    Raises
+    ------
+    ValueError: For unknown scenarios or weights that are not positive.
+
+    """
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(
+                f"Unknown scenario {name!r}, choose from {', '.join(SCENARIOS)}.",
+            )
+        mix[name] = int(weight or 1)
+        if mix[name] < 1:
+            raise ValueError("Scenario weights must be positive.")
+    return mix
+
+
+def _notification(order: dict[str, Any]) -> tuple[str, str]:
+    # The signed webhook the API would send for the order.
+    body = json.dumps(order, separators=(",", ":"), ensure_ascii=False)
+    timestamp = int(time.time())
+    signature = hmac.new(
+        API_KEY.encode(),
+        f"{timestamp}:{body}".encode(),
+        hashlib.sha512,
+    ).hexdigest()
+    auth = base64.b64encode(f"{timestamp}:{signature}".encode()).decode()
+    return body, auth
+
+
+class _Flow:
+    """The state of one flow: its order id and the order data seen."""
+
+    def __init__(self: "_Flow", order_id: str) -> None:
+        self.order_id = order_id
+        self.order: dict[str, Any] = {}
+
+    def order_request(self: "_Flow") -> OrderRequest:
+        return (
+            OrderRequest()
+            .add_type("direct")
+            .add_order_id(self.order_id)
+            .add_gateway("IDEAL")
+            .add_currency("EUR")
+            .add_amount(AMOUNT)
+            .add_description(f"Load test order {self.order_id}")
+        )
+
+    def validate_webhook(self: "_Flow") -> None:
+        body, auth = _notification(self.order)
+        if not Webhook.validate(body, auth, API_KEY, 60):
+            raise RuntimeError("The webhook notification did not validate.")
+
+
+def _sync_steps(sdk: Sdk) -> dict[str, Callable[[_Flow], object]]:
+    orders = sdk.get_order_manager()
+    methods = sdk.get_payment_method_manager()
+
+    def create(flow: _Flow) -> None:
+        flow.order = orders.create(flow.order_request()).get_body_data()
+
+    return {
+        "payment_methods": lambda _flow: methods.get_payment_methods(),
+        "create": create,
+        "webhook": _Flow.validate_webhook,
+        "get": lambda flow: orders.get(flow.order_id),
+        "capture": lambda flow: orders.capture(
+            flow.order_id,
+            CaptureOrderRequest().add_amount(AMOUNT),
+        ),
+        "refund": lambda flow: orders.refund(
+            flow.order_id,
+            RefundOrderRequest().add_amount(AMOUNT // 2).add_currency("EUR"),
+        ),
+    }
+
+
+def _scenarios(options: Options, worker: int) -> Callable[[], str]:
+    rng = random.Random(options.seed * 100_003 + worker)  # noqa: S311
+    names, weights = list(options.mix), list(options.mix.values())
+    return lambda: rng.choices(names, weights)[0]
+
+
+class _Schedule:
+    """
+    The flows of one worker, as its steps, timed while they run.
+
+    Iterating yields the flow and the name of each step to run until the
+    deadline; the time until the next item is recorded as the duration of
+    the step. A worker calls fail() when a step raised, which skips the rest
+    of the flow, and stops iterating when the cassette it replays has no
+    further flows of the worker, so that step is not recorded.
+    """
+
+    def __init__(
+        self: "_Schedule",
+        options: Options,
+        worker: int,
+        deadline: float,
+    ) -> None:
+        self.options = options
+        self.worker = worker
+        self.deadline = deadline
+        self.result = WorkerResult()
+        self._failed = False
+
+    def __iter__(self: "_Schedule") -> Iterator[tuple[_Flow, str]]:
+        result = self.result
+        next_scenario = _scenarios(self.options, self.worker)
+        iteration = 0
+        while time.perf_counter() < self.deadline:
+            flow = _Flow(f"{self.options.run_id}-{self.worker}-{iteration}")
+            iteration += 1
+            self._failed = False
+            for step in SCENARIOS[next_scenario()]:
+                started = time.perf_counter()
+                yield flow, step
+                result.add(step, time.perf_counter() - started)
+                if self._failed:
+                    result.errors[step] = result.errors.get(step, 0) + 1
+                    result.failed_flows += 1
+                    break
+            else:
+                result.flows += 1
+
+    def fail(self: "_Schedule") -> None:
+        """Mark the current step as failed."""
+        self._failed = True
+
+
+def _sync_transport(options: Options) -> object:
+    if options.cassette:
+        return ReplayTransport(
+            options.cassette,
+            speed=options.replay_speed,
+        )
+    pool = max(options.concurrency, 10)
+    if options.transport == "urllib3":
+        transport: object = Urllib3Transport(pool_maxsize=pool)
+    else:
+        transport = RequestsTransport(pool_maxsize=pool)
+    if options.record:
+        transport = RecordingTransport(transport, options.record)
+    return transport
+
+
+def _sync_worker(
+    sdk: Sdk,
+    options: Options,
+    worker: int,
+    deadline: float,
+) -> WorkerResult:
+    steps = _sync_steps(sdk)
+    schedule = _Schedule(options, worker, deadline)
+    for flow, step in schedule:
+        try:
+            steps[step](flow)
+        except CassetteError:  # noqa: PERF203
+            # The replayed cassette has no further flows of this worker.
+            break
+        except Exception:  # noqa: BLE001
+            schedule.fail()
+    return schedule.result
+
+
+def _run_threads(options: Options) -> WorkerResult:
+    transport = _sync_transport(options)
+    sdk = Sdk(api_key=API_KEY, is_production=False, transport=transport)
+    deadline = time.perf_counter() + options.duration
+    result = WorkerResult()
+    cpu = time.process_time()
+    with ThreadPoolExecutor(options.concurrency) as pool:
+        futures = [
+            pool.submit(_sync_worker, sdk, options, worker, deadline)
+            for worker in range(options.concurrency)
+        ]
+        for future in futures:
+            result.merge(future.result())
+    result.cpu_seconds = time.process_time() - cpu
+    close = getattr(transport, "close", None)
+    if close is not None:
+        close()
+    return result
+
+
+def _process_worker(args: tuple[Options, int, float]) -> WorkerResult:
+    options, worker, duration = args
+    cpu = time.process_time()
+    sdk = Sdk(
+        api_key=API_KEY,
+        is_production=False,
+        transport=_sync_transport(options),
+    )
+    result = _sync_worker(sdk, options, worker, time.perf_counter() + duration)
+    result.cpu_seconds = time.process_time() - cpu
+    return result
+
+
+def _run_processes(options: Options) -> WorkerResult:
+    result = WorkerResult()
+    with multiprocessing.Pool(options.concurrency) as pool:
+        for worker_result in pool.imap_unordered(
+            _process_worker,
+            [
+                (options, worker, options.duration)
+                for worker in range(options.concurrency)
+            ],
+        ):
+            result.merge(worker_result)
+    return result
+
+
+def _async_steps(sdk: AsyncSdk) -> dict[str, Callable[[_Flow], Awaitable]]:
+    orders = sdk.get_order_manager()
+    methods = sdk.get_payment_method_manager()
+
+    async def create(flow: _Flow) -> None:
+        response = await orders.create(flow.order_request())
+        flow.order = response.get_body_data()
+
+    async def webhook(flow: _Flow) -> None:
+        flow.validate_webhook()
+
+    return {
+        "payment_methods": lambda _flow: methods.get_payment_methods(),
+        "create": create,
+        "webhook": webhook,
+        "get": lambda flow: orders.get(flow.order_id),
+        "capture": lambda flow: orders.capture(
+            flow.order_id,
+            CaptureOrderRequest().add_amount(AMOUNT),
+        ),
+        "refund": lambda flow: orders.refund(
+            flow.order_id,
+            RefundOrderRequest().add_amount(AMOUNT // 2).add_currency("EUR"),
+        ),
+    }
+
+
+async def _async_worker(
+    sdk: AsyncSdk,
+    options: Options,
+    worker: int,
+    deadline: float,
+) -> WorkerResult:
+    steps = _async_steps(sdk)
+    schedule = _Schedule(options, worker, deadline)
+    for flow, step in schedule:
+        try:
+            await steps[step](flow)
+        except CassetteError:  # noqa: PERF203
+            break
+        except Exception:  # noqa: BLE001
+            schedule.fail()
+    return schedule.result
+
+
+async def _run_async(options: Options) -> WorkerResult:
+    if options.cassette:
+        transport: Any = AsyncReplayTransport(
+            options.cassette,
+            speed=options.replay_speed,
+        )
+    else:
+        transport = HttpxAsyncTransport()
+    result = WorkerResult()
+    cpu = time.process_time()
+    async with AsyncSdk(
+        api_key=API_KEY,
+        is_production=False,
+        transport=transport,
+    ) as sdk:
+        deadline = time.perf_counter() + options.duration
+        for worker_result in await asyncio.gather(
+            *(
+                _async_worker(sdk, options, worker, deadline)
+                for worker in range(options.concurrency)
+            ),
+        ):
+            result.merge(worker_result)
+    result.cpu_seconds = time.process_time() - cpu
+    return result
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    # Nearest-rank percentile of sorted values.
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _transport_name(options: Options) -> str:
+    if options.cassette:
+        return "cassette"
+    if options.mode == "async":
+        return "httpx"
+    return options.transport
+
+
+def summarize(result: WorkerResult, options: Options, wall: float) -> dict:
+    """
+    Summarize the results of a run.
+
+    Parameters
+    ----------
+    result (WorkerResult): The merged results of all workers.
+    options (Options): The settings of the run.
+    wall (float): Duration of the run in seconds.
+
+    Returns
+    -------
+    dict: The run settings, throughput, CPU time and latencies per step.
+
+    """
+    steps = {}
+    requests = 0
+    for step, durations in result.latencies.items():
+        ordered = sorted(durations)
+        if step not in LOCAL_STEPS:
+            requests += len(ordered)
+        steps[step] = {
+            "count": len(ordered),
+            "errors": result.errors.get(step, 0),
+            "mean_ms": 1000 * sum(ordered) / len(ordered),
+            "p50_ms": 1000 * _percentile(ordered, 0.5),
+            "p95_ms": 1000 * _percentile(ordered, 0.95),
+            "p99_ms": 1000 * _percentile(ordered, 0.99),
+            "max_ms": 1000 * ordered[-1],
+        }
+    try:
+        sdk_version = importlib.metadata.version("multisafepay")
+    except importlib.metadata.PackageNotFoundError:
+        sdk_version = "unknown"
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "sdk_version": sdk_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mode": options.mode,
+        "concurrency": options.concurrency,
+        "transport": _transport_name(options),
+        "mix": options.mix,
+        "duration_s": wall,
+        "flows": result.flows,
+        "failed_flows": result.failed_flows,
+        "flows_per_sec": result.flows / wall,
+        "requests": requests,
+        "requests_per_sec": requests / wall,
+        "cpu_us_per_request": (
+            1e6 * result.cpu_seconds / requests if requests else 0.0
+        ),
+        "steps": steps,
+    }
+
+
+def run(options: Options) -> dict:
+    """
+    Run the load and summarize it.
+
+    Parameters
+    ----------
+    options (Options): The settings of the run.
+
+    Returns
+    -------
+    dict: The summary, see summarize().
+
+    """
+    started = time.perf_counter()
+    if options.mode == "process":
+        result = _run_processes(options)
+    elif options.mode == "async":
+        result = asyncio.run(_run_async(options))
+    else:
+        result = _run_threads(options)
+    return summarize(result, options, time.perf_counter() - started)
+
+
+def print_summary(summary: dict) -> None:
+    """Print a summary as a table."""
+    print(
+        f"SDK {summary['sdk_version']}, {summary['mode']} mode, "
+        f"concurrency {summary['concurrency']}, {summary['transport']} "
+        f"transport, {summary['duration_s']:.1f}s",
+    )
+    print(
+        f"flows: {summary['flows']} ({summary['failed_flows']} failed), "
+        f"{summary['flows_per_sec']:.1f}/s",
+    )
+    print(
+        f"requests: {summary['requests']}, "
+        f"{summary['requests_per_sec']:.1f}/s, "
+        f"{summary['cpu_us_per_request']:.0f} us CPU/request",
+    )
+    print(
+        f"{'step':<16} {'count':>8} {'errors':>7} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}",
+    )
+    for step, stats in summary["steps"].items():
+        print(
+            f"{step:<16} {stats['count']:>8} {stats['errors']:>7} "
+            f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+            f"{stats['p99_ms']:>8.2f} {stats['max_ms']:>8.2f}",
+        )
+
+
+def _use_base_url(base_url: str) -> None:
+    os.environ.update(
+        {
+            "MSP_SDK_BUILD_PROFILE": "dev",
+            "MSP_SDK_ALLOW_CUSTOM_BASE_URL": "1",
+            "MSP_SDK_CUSTOM_BASE_URL": base_url,
+        },
+    )
+
+
+def _start_simulator(latency: float) -> subprocess.Popen:
+    # A separate process keeps the simulator's CPU time out of the report.
+    process = subprocess.Popen(
+        [  # noqa: S603
+            sys.executable,
+            "-m",
+            "tests.support.api_simulator",
+            "--port",
+            "0",
+            "--latency",
+            str(latency),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    for line in process.stdout or ():
+        name, _, value = line.removeprefix("export ").strip().partition("=")
+        if name == "MSP_SDK_CUSTOM_BASE_URL":
+            _use_base_url(value)
+            return process
+    process.kill()
+    raise RuntimeError("The simulator did not start.")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Run the command line interface.
+
+    Parameters
+    ----------
+    argv (Optional[list[str]]): The arguments, by default sys.argv.
+
+    Returns
+    -------
+    int: The exit status, 1 when flows failed.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.loadgen",
+        description="Drive checkout flows through the Sdk.",
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", help="API base URL, e.g. a simulator")
+    target.add_argument(
+        "--simulator",
+        action="store_true",
+        help="start the local API simulator of a source checkout",
+    )
+    parser.add_argument(
+        "--cassette",
+        help="replay a cassette recorded against the same base URL",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("thread", "process", "async"),
+        default="thread",
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument(
+        "--transport",
+        choices=("requests", "urllib3"),
+        default="requests",
+        help="sync transport of the thread and process modes",
+    )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="prefix of the order ids, by default unique per run",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--record", help="record the traffic to a cassette")
+    parser.add_argument("--replay-speed", type=float, default=None)
+    parser.add_argument("--simulator-latency", type=float, default=0.0)
+    parser.add_argument("--output", type=Path, help="write the summary JSON")
+    args = parser.parse_args(argv)
+    if not (args.base_url or args.simulator or args.cassette):
+        parser.error("pass --base-url, --simulator or --cassette.")
+    if args.simulator and importlib.util.find_spec("tests.support") is None:
+        parser.error(
+            "--simulator needs a source checkout: run it from the root of "
+            "the repository.",
+        )
+    if args.simulator and args.cassette:
+        parser.error("--cassette replays without the simulator.")
+    if args.record and (args.mode != "thread" or args.cassette):
+        parser.error("--record is supported in thread mode only.")
+    options = Options(
+        mode=args.mode,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        mix=parse_mix(args.mix),
+        transport=args.transport,
+        run_id=args.run_id or f"load-{int(time.time())}",
+        seed=args.seed,
+        record=args.record,
+        cassette=args.cassette,
+        replay_speed=args.replay_speed,
+    )
+    simulator = None
+    if args.simulator:
+        simulator = _start_simulator(args.simulator_latency)
+    elif args.base_url:
+        _use_base_url(args.base_url)
+    try:
+        summary = run(options)
+    finally:
+        if simulator is not None:
+            simulator.terminate()
+            simulator.wait()
+    print_summary(summary)
+    if args.output:
+        args.output.write_text(json.dumps(summary, indent=2) + "\n")
+    return 1 if summary["failed_flows"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
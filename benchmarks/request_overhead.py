@@ -0,0 +1,108 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""
+Measure the client-side overhead of a call, without any network I/O.
+
+The transport returns a prepared response immediately, so the time per
+call is spent building the URL, headers and request state and wrapping
+the response. The first line times building the URL and request state
+alone; "GET with metrics" adds recording into a MetricsRegistry and
+"GET with timings" adds the phase timings.
+
+Usage: python benchmarks/request_overhead.py [calls]
+"""
+
+import sys
+import time
+from typing import Callable
+
+from multisafepay.client import Client, MetricsRegistry
+
+BODY = b'{"success":true,"data":{"id":"IDEAL","description":"iDEAL"}}'
+
+
+class _Response:
+    status_code = 200
+    headers: dict[str, str] = {"Content-Type": "application/json"}
+    content = BODY
+
+    @staticmethod
+    def json() -> dict:
+        return {}
+
+    @staticmethod
+    def raise_for_status() -> None:
+        return
+
+
+class _NullTransport:
+    response = _Response()
+
+    def request(self: "_NullTransport", **_kwargs: object) -> _Response:
+        return self.response
+
+
+def _time(call: Callable[[], object], count: int) -> float:
+    for _ in range(min(count, 1000)):
+        call()
+    start = time.perf_counter()
+    for _ in range(count):
+        call()
+    return (time.perf_counter() - start) / count
+
+
+def main() -> None:
+    """Run the benchmark and print microseconds per call."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    client = Client(api_key="benchmark", transport=_NullTransport())
+    measured = Client(
+        api_key="benchmark",
+        transport=_NullTransport(),
+        metrics=MetricsRegistry(),
+    )
+    timed = Client(
+        api_key="benchmark",
+        transport=_NullTransport(),
+        record_timings=True,
+    )
+    params = {"include": "coupons", "country": "NL", "amount": 1000}
+    calls = {
+        "prepare GET request": lambda: client._prepare_request(  # noqa: SLF001
+            "GET",
+            client._build_url("json/gateways", params),  # noqa: SLF001
+            None,
+            None,
+            None,
+            None,
+            "json/gateways",
+        ),
+        "GET without params": lambda: client.create_get_request(
+            "json/gateways/IDEAL",
+        ),
+        "GET with params": lambda: client.create_get_request(
+            "json/gateways",
+            params,
+        ),
+        "GET with metrics": lambda: measured.create_get_request(
+            "json/gateways/IDEAL",
+        ),
+        "GET with timings": lambda: timed.create_get_request(
+            "json/gateways/IDEAL",
+        ),
+        "POST": lambda: client.create_post_request(
+            "json/orders",
+            request_body=b'{"order_id":"benchmark"}',
+        ),
+    }
+    print(f"{count} calls each, null transport")
+    for name, call in calls.items():
+        print(f"{name:<20} {_time(call, count) * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
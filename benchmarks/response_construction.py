@@ -0,0 +1,105 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""
+Compare the cost of wrapping an ApiResponse in a CustomApiResponse.
+
+The managers used to copy the response through ``.dict()`` and validate
+it again; they now wrap it with ``CustomApiResponse.from_api_response()``.
+Both are timed on the same order response, without the model building
+that is common to both.
+
+Usage: python benchmarks/response_construction.py [iterations]
+"""
+
+import sys
+import time
+from typing import Callable
+
+from multisafepay.api.base.response.api_response import ApiResponse
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+
+ORDER = {
+    "order_id": "benchmark-order",
+    "status": "completed",
+    "amount": 10000,
+    "currency": "EUR",
+    "customer": {
+        "first_name": "Jane",
+        "last_name": "Doe",
+        "address1": "Kraanspoor",
+        "house_number": "39C",
+        "zip_code": "1033SC",
+        "city": "Amsterdam",
+        "country": "NL",
+        "email": "jane.doe@example.com",
+    },
+    "shopping_cart": {
+        "items": [
+            {
+                "merchant_item_id": str(index),
+                "name": f"Item {index}",
+                "unit_price": 10.0,
+                "quantity": 1,
+                "tax_table_selector": "none",
+            }
+            for index in range(50)
+        ],
+    },
+    "payment_details": {"type": "IDEAL", "account_holder_name": "J. Doe"},
+}
+
+
+def _build_response() -> ApiResponse:
+    return ApiResponse.with_json(
+        status_code=200,
+        json_data={"success": True, "data": ORDER},
+        headers={
+            "Content-Type": "application/json",
+            "Date": "Sun, 18 Oct 2026 12:00:00 GMT",
+        },
+        context={"retries": 0, "retry_delay": 0.0, "rate_limit_wait": 0.0},
+        content=b"{}",
+    )
+
+
+def _copy_and_validate(response: ApiResponse) -> CustomApiResponse:
+    return CustomApiResponse(**{**response.dict(), "data": None})
+
+
+def _wrap(response: ApiResponse) -> CustomApiResponse:
+    return CustomApiResponse.from_api_response(response)
+
+
+def _time(
+    build: Callable[[ApiResponse], CustomApiResponse],
+    count: int,
+) -> float:
+    response = _build_response()
+    for _ in range(min(count, 100)):
+        build(response)
+    start = time.perf_counter()
+    for _ in range(count):
+        build(response)
+    return (time.perf_counter() - start) / count
+
+
+def main() -> None:
+    """Run the benchmark and print microseconds per response."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"{count} order responses with 50 cart items")
+    for name, build in (
+        ("dict() + validation", _copy_and_validate),
+        ("from_api_response()", _wrap),
+    ):
+        print(f"{name:<22} {_time(build, count) * 1e6:8.2f} us/response")
+
+
+if __name__ == "__main__":
+    main()
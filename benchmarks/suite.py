@@ -0,0 +1,526 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""
+Benchmark the hot paths of the SDK and compare the results to a baseline.
+
+Every benchmark runs in-process against the MockTransport of the test
+support code, so the numbers measure the SDK itself: building requests,
+encoding and decoding JSON, and building the response models. For each
+benchmark the suite reports the time per operation of several timed runs
+and the peak memory allocated by a single operation.
+
+Usage, from the root of the repository:
+
+    python -m benchmarks.suite run [--output FILE] [--repeat N] [--only NAME]
+    python -m benchmarks.suite compare BASELINE CURRENT [--threshold 0.1]
+
+``run`` prints the results and writes them as JSON to ``--output``.
+``compare`` prints the change per benchmark between two such files and
+exits with status 1 when a benchmark got slower, or allocates more, than
+the threshold allows. Times are compared by their best run, which is the
+least disturbed by other load on the machine.
+"""
+
+import argparse
+import base64
+import copy
+import datetime
+import hashlib
+import hmac
+import importlib.metadata
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Optional
+
+from multisafepay import Sdk
+from multisafepay.api.paths.orders.request.components.payment_options import (
+    PaymentOptions,
+)
+from multisafepay.api.paths.orders.request.order_request import OrderRequest
+from multisafepay.api.paths.orders.response.order_response import Order
+from multisafepay.api.shared.cart import CartItem, ShoppingCart
+from multisafepay.api.shared.customer import Customer
+from multisafepay.util.json_codec import default_json_codec
+from multisafepay.util.total_amount import validate_total_amount
+from multisafepay.util.webhook import Webhook
+
+from tests.support.mock_transport import MockResponse, MockTransport
+
+SCHEMA_VERSION = 1
+API_KEY = "benchmark-api-key"
+CART_SIZE = 20
+PAGE_SIZE = 500
+
+Operation = Callable[[], object]
+
+CUSTOMER = {
+    "locale": "nl_NL",
+    "ip_address": "185.49.169.194",
+    "first_name": "Jane",
+    "last_name": "Doe",
+    "address1": "Kraanspoor",
+    "house_number": "39C",
+    "zip_code": "1033SC",
+    "city": "Amsterdam",
+    "country": "NL",
+    "phone": "0612345678",
+    "email": "jane.doe@example.com",
+}
+
+ITEMS = [
+    {
+        "merchant_item_id": f"item-{index}",
+        "name": f"Item {index}",
+        "description": f"Description of item {index}",
+        "unit_price": 10.0,
+        "quantity": 1,
+        "tax_table_selector": "none",
+    }
+    for index in range(CART_SIZE)
+]
+
+ORDER = {
+    "order_id": "benchmark-order",
+    "transaction_id": "4051823",
+    "status": "completed",
+    "financial_status": "completed",
+    "amount": 10 * 100 * CART_SIZE,
+    "amount_refunded": 0,
+    "currency": "EUR",
+    "description": "Benchmark order",
+    "created": "2026-01-01T12:00:00",
+    "modified": "2026-01-01T12:00:05",
+    "customer": CUSTOMER,
+    "costs": [
+        {
+            "transaction_id": 1,
+            "amount": 0.29,
+            "description": "Transaction fee",
+            "type": "SYSTEM",
+            "status": "reserved",
+        },
+    ],
+    "payment_details": {
+        "type": "IDEAL",
+        "account_holder_name": "J. Doe",
+        "account_iban": "NL87ABNA0000000001",
+        "external_transaction_id": "0050001234567890",
+    },
+    "payment_methods": [
+        {
+            "amount": 10 * 100 * CART_SIZE,
+            "currency": "EUR",
+            "description": "Benchmark order",
+            "payment_description": "iDEAL",
+            "status": "completed",
+            "type": "IDEAL",
+        },
+    ],
+    "shopping_cart": {"items": ITEMS},
+    "checkout_options": {
+        "tax_tables": {
+            "default": {"shipping_taxed": True, "rate": 0.21},
+            "alternate": [
+                {"name": "none", "standalone": False, "rules": [{"rate": 0}]},
+            ],
+        },
+    },
+    "related_transactions": [],
+    "payment_url": "https://payv2.multisafepay.com/connect/benchmark",
+}
+
+TRANSACTION = {
+    "amount": 1000,
+    "completed": "2026-01-01T12:00:05",
+    "costs": ORDER["costs"],
+    "created": "2026-01-01T12:00:00",
+    "modified": "2026-01-01T12:00:05",
+    "currency": "EUR",
+    "customer": CUSTOMER,
+    "debit_credit": "C",
+    "description": "Benchmark order",
+    "financial_status": "completed",
+    "net": 971,
+    "order_id": "benchmark-order",
+    "payment_method": "IDEAL",
+    "payment_methods": ORDER["payment_methods"],
+    "site_id": "12345",
+    "status": "completed",
+    "transaction_id": "4051823",
+    "type": "payment",
+}
+
+
+def _sdk(body: dict) -> tuple[Sdk, MockTransport]:
+    response = MockResponse(json_data={"success": True, **body})
+    transport = MockTransport(response_factory=lambda *_: response)
+    return Sdk(api_key=API_KEY, transport=transport), transport
+
+
+def _order_request() -> OrderRequest:
+    cart = ShoppingCart().add_items(
+        [
+            CartItem()
+            .add_name(item["name"])
+            .add_description(item["description"])
+            .add_unit_price(item["unit_price"])
+            .add_quantity(item["quantity"])
+            .add_merchant_item_id(item["merchant_item_id"])
+            .add_tax_rate_percentage(0)
+            for item in ITEMS
+        ],
+    )
+    return (
+        OrderRequest()
+        .add_type("redirect")
+        .add_order_id("benchmark-order")
+        .add_gateway("IDEAL")
+        .add_currency("EUR")
+        .add_amount(ORDER["amount"])
+        .add_description("Benchmark order")
+        .add_customer(Customer(**CUSTOMER))
+        .add_payment_options(
+            PaymentOptions(
+                notification_url="https://example.com/notification",
+                redirect_url="https://example.com/redirect",
+                cancel_url="https://example.com/cancel",
+            ),
+        )
+        .add_shopping_cart(cart)
+    )
+
+
+def bench_order_request_to_dict() -> Operation:
+    """Serialize an order request with a shopping cart."""
+    return _order_request().to_dict
+
+
+def bench_validate_total_amount() -> Operation:
+    """Validate the amount of an order against its shopping cart."""
+    data = {"amount": ORDER["amount"], "shopping_cart": {"items": ITEMS}}
+    if not validate_total_amount(data):
+        raise RuntimeError("The benchmark order must have a valid amount.")
+    return lambda: validate_total_amount(data)
+
+
+def bench_order_create() -> Operation:
+    """Create an order through the OrderManager."""
+    sdk, transport = _sdk({"data": ORDER})
+    manager = sdk.get_order_manager()
+    request = _order_request()
+
+    def operation() -> object:
+        transport.request_history.clear()
+        return manager.create(request)
+
+    return operation
+
+
+def bench_order_get() -> Operation:
+    """Fetch and decode an order through the OrderManager."""
+    sdk, transport = _sdk({"data": ORDER})
+    manager = sdk.get_order_manager()
+
+    def operation() -> object:
+        transport.request_history.clear()
+        return manager.get("benchmark-order")
+
+    return operation
+
+
+def bench_transactions_page() -> Operation:
+    """Fetch and decode a large page of transactions."""
+    page = {
+        "data": [
+            {**TRANSACTION, "transaction_id": str(index)}
+            for index in range(PAGE_SIZE)
+        ],
+        "pager": {"after": "next", "before": None, "limit": PAGE_SIZE},
+    }
+    sdk, transport = _sdk(page)
+    manager = sdk.get_transaction_manager()
+
+    def operation() -> object:
+        transport.request_history.clear()
+        return manager.get_transactions({"limit": PAGE_SIZE})
+
+    return operation
+
+
+def bench_webhook_validate() -> Operation:
+    """Validate the signature of a webhook notification."""
+    body = json.dumps(ORDER)
+    compact = json.dumps(ORDER, separators=(",", ":"), ensure_ascii=False)
+    timestamp = int(time.time())
+    signature = hmac.new(
+        API_KEY.encode(),
+        f"{timestamp}:{compact}".encode(),
+        hashlib.sha512,
+    ).hexdigest()
+    auth = base64.b64encode(f"{timestamp}:{signature}".encode()).decode()
+
+    def operation() -> bool:
+        return Webhook.validate(body, auth, API_KEY, 3600)
+
+    if not operation():
+        raise RuntimeError("The benchmark webhook must validate.")
+    return operation
+
+
+def bench_order_from_dict() -> Operation:
+    """Build an Order model with the Decorator adapters."""
+    return lambda: Order.from_dict(copy.deepcopy(ORDER))
+
+
+BENCHMARKS: dict[str, Callable[[], Operation]] = {
+    "order_request_to_dict": bench_order_request_to_dict,
+    "validate_total_amount": bench_validate_total_amount,
+    "order_create": bench_order_create,
+    "order_get": bench_order_get,
+    "transactions_page": bench_transactions_page,
+    "webhook_validate": bench_webhook_validate,
+    "order_from_dict": bench_order_from_dict,
+}
+
+
+def _loops_for(operation: Operation, min_time: float) -> int:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        if time.perf_counter() - start >= min_time:
+            return loops
+        loops *= 2
+
+
+def _peak_bytes(operation: Operation) -> int:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(peak - baseline, 0)
+
+
+def measure(
+    operation: Operation,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> dict[str, float]:
+    """
+    Time an operation and measure its peak allocation.
+
+    Parameters
+    ----------
+    operation (Operation): The operation to measure.
+    repeat (int): Number of timed runs, by default 5.
+    min_time (float): Minimum duration of a timed run in seconds, by
+        default 0.2.
+
+    Returns
+    -------
+    dict[str, float]: The median and best time per operation in
+        microseconds, the operations per second, the spread of the runs in
+        percent of the median, the peak bytes allocated by one operation
+        and the number of loops per run.
+
+    """
+    loops = _loops_for(operation, min_time)
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        runs.append((time.perf_counter() - start) / loops)
+    median = statistics.median(runs)
+    return {
+        "median_us": median * 1e6,
+        "min_us": min(runs) * 1e6,
+        "ops_per_sec": 1 / median,
+        "stdev_pct": (
+            statistics.stdev(runs) / median * 100 if len(runs) > 1 else 0.0
+        ),
+        "peak_bytes": _peak_bytes(operation),
+        "loops": loops,
+    }
+
+
+def _sdk_version() -> str:
+    try:
+        return importlib.metadata.version("multisafepay")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def run(
+    names: Optional[list[str]] = None,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> dict:
+    """
+    Run the benchmarks.
+
+    Parameters
+    ----------
+    names (Optional[list[str]]): The benchmarks to run, by default all.
+    repeat (int): Number of timed runs per benchmark, by default 5.
+    min_time (float): Minimum duration of a timed run in seconds, by
+        default 0.2.
+
+    Returns
+    -------
+    dict: The results with a description of the environment, as written
+        to the baseline files.
+
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        results[name] = measure(BENCHMARKS[name](), repeat, min_time)
+        print(_format_result(name, results[name]), flush=True)
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "sdk_version": _sdk_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "json_codec": type(default_json_codec()).__name__,
+        "benchmarks": results,
+    }
+
+
+def _format_result(name: str, result: dict[str, float]) -> str:
+    return (
+        f"{name:<24} {result['median_us']:>11.1f} us/op "
+        f"{result['ops_per_sec']:>11.0f} op/s "
+        f"+-{result['stdev_pct']:>4.1f}% "
+        f"{result['peak_bytes'] / 1024:>10.1f} KiB peak"
+    )
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = 0.1,
+) -> list[str]:
+    """
+    Compare results to a baseline and print the changes.
+
+    Parameters
+    ----------
+    baseline (dict): The baseline results.
+    current (dict): The results to check.
+    threshold (float): Tolerated relative increase of the best time per
+        operation and of the peak allocation, by default 0.1 (10%).
+
+    Returns
+    -------
+    list[str]: The names of the benchmarks that regressed.
+
+    """
+    print(
+        f"baseline: SDK {baseline.get('sdk_version')} on Python "
+        f"{baseline.get('python')}, current: SDK {current.get('sdk_version')} "
+        f"on Python {current.get('python')}",
+    )
+    print(
+        f"{'best us/op':<24} {'baseline':>12} {'current':>12} "
+        f"{'time':>8} {'peak':>8}",
+    )
+    regressions = []
+    old, new = baseline["benchmarks"], current["benchmarks"]
+    for name in sorted(old.keys() & new.keys()):
+        time_change = new[name]["min_us"] / old[name]["min_us"] - 1
+        peak_change = (new[name]["peak_bytes"] + 1) / (
+            old[name]["peak_bytes"] + 1
+        ) - 1
+        regressed = time_change > threshold or peak_change > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<24} {old[name]['min_us']:>12.1f} "
+            f"{new[name]['min_us']:>12.1f} {time_change:>+8.1%} "
+            f"{peak_change:>+8.1%}{'  REGRESSION' if regressed else ''}",
+        )
+    for name in sorted(old.keys() - new.keys()):
+        print(f"{name:<24} missing from the current results")
+    for name in sorted(new.keys() - old.keys()):
+        print(f"{name:<24} not in the baseline")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Run the command line interface.
+
+    Parameters
+    ----------
+    argv (Optional[list[str]]): The arguments, by default sys.argv[1:].
+
+    Returns
+    -------
+    int: The exit status.
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", type=Path, help="write JSON here")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.2)
+    run_parser.add_argument(
+        "--only",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="run only this benchmark, may be repeated",
+    )
+    compare_parser = commands.add_parser(
+        "compare",
+        help="compare results to a baseline",
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.only, args.repeat, args.min_time)
+        if args.output is not None:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(results, indent=2) + "\n")
+        return 0
+    if not args.baseline.exists():
+        print(
+            f"No baseline at {args.baseline}; save one with "
+            "`make benchmark-baseline` or `python -m benchmarks.suite run "
+            "--output <path>`.",
+            file=sys.stderr,
+        )
+        return 2
+    regressions = compare(
+        json.loads(args.baseline.read_text()),
+        json.loads(args.current.read_text()),
+        args.threshold,
+    )
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
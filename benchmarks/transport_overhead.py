@@ -0,0 +1,82 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""
+Compare the per-request overhead of the built-in sync transports.
+
+Every transport sends the same keep-alive GET requests to a local server,
+so the difference between them is the client-side cost per request.
+
+Usage: python benchmarks/transport_overhead.py [requests_per_transport]
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from multisafepay.client import Client
+from multisafepay.transport import (
+    HttpxTransport,
+    RequestsTransport,
+    Urllib3Transport,
+)
+
+BODY = b'{"success": true, "data": {"id": "IDEAL", "description": "iDEAL"}}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self: "_Handler") -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self: "_Handler", *args: object) -> None:
+        pass
+
+
+def _time_transport(transport: object, url: str, count: int) -> float:
+    client = Client(api_key="benchmark", transport=transport)
+    client.url = url
+    for _ in range(min(count, 50)):
+        client.create_get_request("json/gateways/IDEAL")
+    start = time.perf_counter()
+    for _ in range(count):
+        client.create_get_request("json/gateways/IDEAL")
+    return (time.perf_counter() - start) / count
+
+
+def main() -> None:
+    """Run the benchmark and print microseconds per request."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    transports = {
+        "RequestsTransport": RequestsTransport,
+        "Urllib3Transport": Urllib3Transport,
+        "HttpxTransport": HttpxTransport,
+    }
+    print(f"{count} keep-alive GET requests per transport")
+    try:
+        for name, factory in transports.items():
+            with factory() as transport:
+                seconds = _time_transport(transport, url, count)
+            print(f"{name:<20} {seconds * 1e6:8.1f} us/request")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
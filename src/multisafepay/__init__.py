@@ -1,7 +1,64 @@
 """MultiSafepay Python SDK main package."""
 
-from multisafepay.sdk import Sdk
+import importlib
+from typing import TYPE_CHECKING
+
+# The names in __all__ are resolved at runtime by __getattr__ below.
+# ruff: noqa: TCH004
+if TYPE_CHECKING:
+    from multisafepay.async_sdk import AsyncSdk
+    from multisafepay.batch import AsyncBatch, Batch, BatchResult, BatchStats
+    from multisafepay.sdk import Sdk
+    from multisafepay.tenant_registry import (
+        TenantRegistry,
+        TenantRegistryStats,
+    )
+
+# Modules by exported name, relative to this package. They are imported on
+# first access, so importing Sdk does not import the async or batch code.
+_MODULES = {
+    "AsyncBatch": "batch",
+    "AsyncSdk": "async_sdk",
+    "Batch": "batch",
+    "BatchResult": "batch",
+    "BatchStats": "batch",
+    "Sdk": "sdk",
+    "TenantRegistry": "tenant_registry",
+    "TenantRegistryStats": "tenant_registry",
+}
 
 __all__ = [
+    "AsyncBatch",
+    "AsyncSdk",
+    "Batch",
+    "BatchResult",
+    "BatchStats",
     "Sdk",
+    "TenantRegistry",
+    "TenantRegistryStats",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import an exported class on first access.
+
+    Parameters
+    ----------
+    name (str): The name of the class.
+
+    Returns
+    -------
+    object: The class.
+
+    Raises
+    ------
+    AttributeError: If the name is not exported by this package.
+
+    """
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
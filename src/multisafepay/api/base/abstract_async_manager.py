@@ -0,0 +1,34 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Abstract base manager class for asyncio MultiSafepay API managers."""
+
+from multisafepay.api.base.abstract_manager import AbstractManager
+from multisafepay.client.async_client import AsyncClient
+
+
+class AbstractAsyncManager(AbstractManager):
+    """
+    A class to represent an abstract asyncio manager.
+
+    Attributes
+    ----------
+    client (AsyncClient): An instance of the AsyncClient class to be used by the manager.
+
+    """
+
+    def __init__(self: "AbstractAsyncManager", client: AsyncClient) -> None:
+        """
+        Initialize the AbstractAsyncManager with an AsyncClient instance.
+
+        Parameters
+        ----------
+        client (AsyncClient): An instance of the AsyncClient class to be used by the manager.
+
+        """
+        super().__init__(client)
+        self.client: AsyncClient = client
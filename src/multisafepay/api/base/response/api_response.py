@@ -7,10 +7,12 @@
 
 """API response wrapper class for handling MultiSafepay API responses."""
 
+import time
 from typing import Optional, Union
 
 from multisafepay.api.base.listings.pager import Pager
 from multisafepay.model.extra_model import ExtraModel
+from pydantic import PrivateAttr
 
 
 class ApiResponse(ExtraModel):
@@ -23,7 +25,11 @@ class ApiResponse(ExtraModel):
     status_code (int): The status code of the response.
     body (dict): The body of the response.
     context (Optional[dict]): The context of the response.
-    raw (Optional[str]): The raw response data as a string.
+    raw (Optional[str]): Raw response data set explicitly, if any. Use
+        get_raw(), which decodes ``content`` on demand.
+    content (Optional[bytes]): The original response body, if kept.
+    timings (Optional[dict[str, float]]): Seconds spent per phase of the
+        call, if recorded. Use get_timings().
 
     """
 
@@ -31,7 +37,25 @@ class ApiResponse(ExtraModel):
     status_code: int
     body: dict
     context: Optional[dict]
-    raw: Optional[str]
+    raw: Optional[str] = None
+    content: Optional[bytes] = None
+    timings: Optional[dict] = None
+    # perf_counter() reading taken when the response was built, from which
+    # the model building of the managers is timed.
+    _built_at: Optional[float] = PrivateAttr(default=None)
+
+    def __init__(self: "ApiResponse", **data: object) -> None:
+        """
+        Initialize the ApiResponse.
+
+        Parameters
+        ----------
+        **data (object): The field values of the response.
+
+        """
+        super().__init__(**data)
+        if self.timings is not None:
+            self._built_at = time.perf_counter()
 
     @staticmethod
     def with_json(
@@ -39,16 +63,25 @@ class ApiResponse(ExtraModel):
         json_data: dict,
         headers: dict,
         context: dict = None,
+        content: Optional[bytes] = None,
+        timings: Optional[dict[str, float]] = None,
     ) -> "ApiResponse":
         """
         Create an ApiResponse object with JSON data.
 
+        The raw text is not built here; get_raw() decodes ``content`` only
+        when it is asked for.
+
         Parameters
         ----------
         status_code (int): The status code of the response.
         json_data (dict): The JSON data of the response.
         headers (dict): The headers of the response.
         context (dict, optional): The context of the response. Defaults to None.
+        content (Optional[bytes], optional): The original response body to
+            keep for get_raw(). Defaults to None.
+        timings (Optional[dict[str, float]], optional): Seconds spent per
+            phase of the call, if recorded. Defaults to None.
 
         Returns
         -------
@@ -63,7 +96,8 @@ class ApiResponse(ExtraModel):
             body=data,
             context=context,
             headers=headers,
-            raw=json_data.__str__(),
+            content=content,
+            timings=timings,
         )
 
     def get_body_data(self: "ApiResponse") -> Optional[Union[dict, list]]:
@@ -143,17 +177,62 @@ class ApiResponse(ExtraModel):
         """
         return self.status_code
 
-    def get_raw(self: "ApiResponse") -> str:
+    def get_raw(self: "ApiResponse") -> Optional[str]:
         """
         Get the raw response data as a string.
 
         Returns
         -------
-        str: The raw response data as a string.
+        Optional[str]: The raw response data, decoded from the original
+            response body on each call, or None when the body was not kept
+            (lean mode or a transport without ``content``).
 
         """
+        if self.raw is None and self.content is not None:
+            return self.content.decode("utf-8", errors="replace")
         return self.raw
 
+    def get_content(self: "ApiResponse") -> Optional[bytes]:
+        """
+        Get the original response body.
+
+        Returns
+        -------
+        Optional[bytes]: The response body bytes, or None when not kept.
+
+        """
+        return self.content
+
+    def get_timings(self: "ApiResponse") -> Optional[dict[str, float]]:
+        """
+        Get the seconds spent per phase of the call.
+
+        The phases are ``send`` (the transport calls, over all attempts),
+        ``ttfb`` (time to first byte of the final attempt, where the
+        transport reports it), ``decode`` (JSON decoding) and, on responses
+        of the managers, ``model`` (building the response models).
+
+        Returns
+        -------
+        Optional[dict[str, float]]: The timings, or None when the client does
+            not record them or the response was shared or cached.
+
+        """
+        return self.timings
+
+    def seconds_since_built(self: "ApiResponse") -> Optional[float]:
+        """
+        Get the seconds passed since the client built the response.
+
+        Returns
+        -------
+        Optional[float]: The seconds, or None when timings are not recorded.
+
+        """
+        if self._built_at is None:
+            return None
+        return time.perf_counter() - self._built_at
+
     def get_pager(self: "ApiResponse") -> Optional[Pager]:
         """
         Get the pager object from the body of the response.
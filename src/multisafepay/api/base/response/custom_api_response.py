@@ -43,6 +43,41 @@ class CustomApiResponse(ApiResponse):
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    @classmethod
+    def from_api_response(
+        cls: type["CustomApiResponse"],
+        response: ApiResponse,
+        data: Optional[Union[dict, list]] = None,
+        **kwargs: object,
+    ) -> "CustomApiResponse":
+        """
+        Wrap an ApiResponse without copying or re-validating it.
+
+        The body, headers and context are shared with ``response`` rather
+        than copied, since they were validated when it was built. When
+        timings are recorded, the time since ``response`` was built, spent
+        building ``data``, is added as the ``model`` phase.
+
+        Parameters
+        ----------
+        response (ApiResponse): The response to wrap.
+        data (Any, optional): The decoded data of the response, by default None.
+        **kwargs (object): Additional attributes of the response, e.g. warnings.
+
+        Returns
+        -------
+        CustomApiResponse: The response with the data attached.
+
+        """
+        values = {**response.__dict__, "data": data, **kwargs}
+        model = response.seconds_since_built()
+        if response.timings is not None and model is not None:
+            values["timings"] = {**response.timings, "model": model}
+        return cls.construct(
+            _fields_set={*response.__fields_set__, "data", *kwargs},
+            **values,
+        )
+
     def get_data(self: "CustomApiResponse") -> Optional[Union[dict, list]]:
         """
         Get the data contained in the response.
@@ -1,25 +1,92 @@
 """API path endpoints for MultiSafepay SDK operations."""
 
-from multisafepay.api.paths.auth.auth_manager import AuthManager
-from multisafepay.api.paths.capture.capture_manager import CaptureManager
-from multisafepay.api.paths.categories.category_manager import (
-    CategoryManager,
-)
-from multisafepay.api.paths.gateways.gateway_manager import GatewayManager
-from multisafepay.api.paths.issuers.issuer_manager import IssuerManager
-from multisafepay.api.paths.me.me_manager import MeManager
-from multisafepay.api.paths.orders.order_manager import OrderManager
-from multisafepay.api.paths.payment_methods.payment_method_manager import (
-    PaymentMethodManager,
-)
-from multisafepay.api.paths.recurring.recurring_manager import (
-    RecurringManager,
-)
-from multisafepay.api.paths.transactions.transaction_manager import (
-    TransactionManager,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# The names in __all__ are resolved at runtime by __getattr__ below.
+# ruff: noqa: TCH004
+if TYPE_CHECKING:
+    from multisafepay.api.paths.auth.async_auth_manager import AsyncAuthManager
+    from multisafepay.api.paths.auth.auth_manager import AuthManager
+    from multisafepay.api.paths.capture.async_capture_manager import (
+        AsyncCaptureManager,
+    )
+    from multisafepay.api.paths.capture.capture_manager import CaptureManager
+    from multisafepay.api.paths.categories.async_category_manager import (
+        AsyncCategoryManager,
+    )
+    from multisafepay.api.paths.categories.category_manager import (
+        CategoryManager,
+    )
+    from multisafepay.api.paths.gateways.async_gateway_manager import (
+        AsyncGatewayManager,
+    )
+    from multisafepay.api.paths.gateways.gateway_manager import GatewayManager
+    from multisafepay.api.paths.issuers.async_issuer_manager import (
+        AsyncIssuerManager,
+    )
+    from multisafepay.api.paths.issuers.issuer_manager import IssuerManager
+    from multisafepay.api.paths.me.async_me_manager import AsyncMeManager
+    from multisafepay.api.paths.me.me_manager import MeManager
+    from multisafepay.api.paths.orders.async_order_manager import (
+        AsyncOrderManager,
+    )
+    from multisafepay.api.paths.orders.order_manager import OrderManager
+    from multisafepay.api.paths.payment_methods.async_payment_method_manager import (
+        AsyncPaymentMethodManager,
+    )
+    from multisafepay.api.paths.payment_methods.payment_method_manager import (
+        PaymentMethodManager,
+    )
+    from multisafepay.api.paths.recurring.async_recurring_manager import (
+        AsyncRecurringManager,
+    )
+    from multisafepay.api.paths.recurring.recurring_manager import (
+        RecurringManager,
+    )
+    from multisafepay.api.paths.transactions.async_transaction_manager import (
+        AsyncTransactionManager,
+    )
+    from multisafepay.api.paths.transactions.transaction_manager import (
+        TransactionManager,
+    )
+
+# Manager modules by class name, relative to this package. Managers are
+# imported on first access, so importing one does not import all of them.
+_MODULES = {
+    "AsyncAuthManager": "auth.async_auth_manager",
+    "AsyncCaptureManager": "capture.async_capture_manager",
+    "AsyncCategoryManager": "categories.async_category_manager",
+    "AsyncGatewayManager": "gateways.async_gateway_manager",
+    "AsyncIssuerManager": "issuers.async_issuer_manager",
+    "AsyncMeManager": "me.async_me_manager",
+    "AsyncOrderManager": "orders.async_order_manager",
+    "AsyncPaymentMethodManager": "payment_methods.async_payment_method_manager",
+    "AsyncRecurringManager": "recurring.async_recurring_manager",
+    "AsyncTransactionManager": "transactions.async_transaction_manager",
+    "AuthManager": "auth.auth_manager",
+    "CaptureManager": "capture.capture_manager",
+    "CategoryManager": "categories.category_manager",
+    "GatewayManager": "gateways.gateway_manager",
+    "IssuerManager": "issuers.issuer_manager",
+    "MeManager": "me.me_manager",
+    "OrderManager": "orders.order_manager",
+    "PaymentMethodManager": "payment_methods.payment_method_manager",
+    "RecurringManager": "recurring.recurring_manager",
+    "TransactionManager": "transactions.transaction_manager",
+}
 
 __all__ = [
+    "AsyncAuthManager",
+    "AsyncCaptureManager",
+    "AsyncCategoryManager",
+    "AsyncGatewayManager",
+    "AsyncIssuerManager",
+    "AsyncMeManager",
+    "AsyncOrderManager",
+    "AsyncPaymentMethodManager",
+    "AsyncRecurringManager",
+    "AsyncTransactionManager",
     "AuthManager",
     "CaptureManager",
     "CategoryManager",
@@ -31,3 +98,28 @@ __all__ = [
     "RecurringManager",
     "TransactionManager",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import a manager class on first access.
+
+    Parameters
+    ----------
+    name (str): The name of the manager class.
+
+    Returns
+    -------
+    object: The manager class.
+
+    Raises
+    ------
+    AttributeError: If the name is not a manager of this package.
+
+    """
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
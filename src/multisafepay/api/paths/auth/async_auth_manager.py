@@ -0,0 +1,56 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio authentication manager for handling API token operations."""
+
+from typing import Optional
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.auth.auth_manager import AuthManager
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+
+
+class AsyncAuthManager(AbstractAsyncManager):
+    """Asyncio counterpart of AuthManager with awaitable methods."""
+
+    def __init__(self: "AsyncAuthManager", client: AsyncClient) -> None:
+        """
+        Initialize the AsyncAuthManager with an async client.
+
+        Parameters
+        ----------
+            client (AsyncClient): The client used to make API requests.
+
+        """
+        super().__init__(client)
+
+    async def get_api_token(
+        self: "AsyncAuthManager",
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve the API token.
+
+        Parameters
+        ----------
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse
+            A custom API response containing the ApiToken object or warnings if the token could not be created.
+
+        """
+        response = await self.client.create_get_request(
+            "json/auth/api_token",
+            deadline=deadline,
+        )
+        return AuthManager.build_api_token_response(response)
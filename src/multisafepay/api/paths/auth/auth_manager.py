@@ -7,6 +7,8 @@
 
 """Authentication manager for handling API token operations."""
 
+from typing import Optional
+
 from multisafepay.api.base.abstract_manager import AbstractManager
 from multisafepay.api.base.response.api_response import ApiResponse
 from multisafepay.api.base.response.custom_api_response import (
@@ -14,6 +16,7 @@ from multisafepay.api.base.response.custom_api_response import (
 )
 from multisafepay.api.paths.auth.api_token.response.api_token import ApiToken
 from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
 from multisafepay.util.dict_utils import dict_empty
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from pydantic import ValidationError
@@ -33,13 +36,20 @@ class AuthManager(AbstractManager):
         """
         super().__init__(client)
 
-    def get_api_token(self: "AuthManager") -> CustomApiResponse:
+    def get_api_token(
+        self: "AuthManager",
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
         """
         Retrieve the API token.
 
         This method sends a GET request to the 'json/auth/api_token' endpoint
         and attempts to create an ApiToken object from the response data.
 
+        Parameters
+        ----------
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
         Returns
         -------
         CustomApiResponse
@@ -48,11 +58,26 @@ class AuthManager(AbstractManager):
         """
         response: ApiResponse = self.client.create_get_request(
             "json/auth/api_token",
+            deadline=deadline,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        return AuthManager.build_api_token_response(response)
+
+    @staticmethod
+    def build_api_token_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Create a custom API response containing an ApiToken.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse
+            A custom API response containing the ApiToken object or warnings if the token could not be created.
+
+        """
+        args: dict = {"data": None}
 
         if not dict_empty(response.get_body_data()):
             try:
@@ -65,4 +90,4 @@ class AuthManager(AbstractManager):
                     .get_messages()
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
@@ -0,0 +1,68 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio capture manager for handling reservation capture operations."""
+
+from typing import Optional
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.capture.capture_manager import CaptureManager
+from multisafepay.api.paths.capture.request.capture_request import (
+    CaptureRequest,
+)
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+
+
+class AsyncCaptureManager(AbstractAsyncManager):
+    """Asyncio counterpart of CaptureManager with awaitable methods."""
+
+    def __init__(self: "AsyncCaptureManager", client: AsyncClient) -> None:
+        """
+        Initialize the AsyncCaptureManager with an async client.
+
+        Parameters
+        ----------
+        client (AsyncClient): The client used to make API requests.
+
+        """
+        super().__init__(client)
+
+    async def capture_reservation_cancel(
+        self: "AsyncCaptureManager",
+        order_id: str,
+        capture_request: CaptureRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> CustomApiResponse:
+        """
+        Cancel a capture reservation.
+
+        Parameters
+        ----------
+        order_id (str): The ID of the order to cancel the capture reservation for.
+        capture_request (CaptureRequest): The capture request data.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse[CancelReservation]: The response containing the CancelReservation object.
+
+        """
+        json_data = self.client.json_codec.dumps(capture_request.dict())
+        encoded_order_id = self.encode_path_segment(order_id)
+        response = await self.client.create_patch_request(
+            f"json/capture/{encoded_order_id}",
+            request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+        return CaptureManager.build_cancel_reservation_response(response)
@@ -7,9 +7,10 @@
 
 """Capture manager for handling reservation capture operations."""
 
-import json
+from typing import Optional
 
 from multisafepay.api.base.abstract_manager import AbstractManager
+from multisafepay.api.base.response.api_response import ApiResponse
 from multisafepay.api.base.response.custom_api_response import (
     CustomApiResponse,
 )
@@ -18,6 +19,7 @@ from multisafepay.api.paths.capture.request.capture_request import (
 )
 from multisafepay.api.paths.capture.response.capture import CancelReservation
 from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
 from multisafepay.util.dict_utils import dict_empty
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from pydantic import ValidationError
@@ -41,6 +43,8 @@ class CaptureManager(AbstractManager):
         self: "CaptureManager",
         order_id: str,
         capture_request: CaptureRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CustomApiResponse:
         """
         Cancel a capture reservation.
@@ -52,22 +56,41 @@ class CaptureManager(AbstractManager):
         ----------
         order_id (str): The ID of the order to cancel the capture reservation for.
         capture_request (CaptureRequest): The capture request data.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
 
         Returns
         -------
         CustomApiResponse[CancelReservation]: The response containing the CancelReservation object.
 
         """
-        json_data = json.dumps(capture_request.dict())
+        json_data = self.client.json_codec.dumps(capture_request.dict())
         encoded_order_id = self.encode_path_segment(order_id)
         response = self.client.create_patch_request(
             f"json/capture/{encoded_order_id}",
             request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        return CaptureManager.build_cancel_reservation_response(response)
+
+    @staticmethod
+    def build_cancel_reservation_response(
+        response: ApiResponse,
+    ) -> CustomApiResponse:
+        """
+        Create a custom API response containing a CancelReservation.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse[CancelReservation]: The response containing the CancelReservation object.
+
+        """
+        args: dict = {"data": None}
         if not dict_empty(response.get_body_data()):
             try:
                 args["data"] = CancelReservation(
@@ -81,4 +104,4 @@ class CaptureManager(AbstractManager):
                     .get_messages()
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
@@ -1,9 +1,51 @@
 """Category API endpoints for retrieving payment categories."""
 
-from multisafepay.api.paths.categories.category_manager import (
-    CategoryManager,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# The managers in __all__ are resolved at runtime by __getattr__ below.
+# ruff: noqa: TCH004
+if TYPE_CHECKING:
+    from multisafepay.api.paths.categories.async_category_manager import (
+        AsyncCategoryManager,
+    )
+    from multisafepay.api.paths.categories.category_manager import (
+        CategoryManager,
+    )
+
+# Manager modules by class name, relative to this package, imported on
+# first access so that using one manager does not import the other.
+_MODULES = {
+    "AsyncCategoryManager": "async_category_manager",
+    "CategoryManager": "category_manager",
+}
 
 __all__ = [
+    "AsyncCategoryManager",
     "CategoryManager",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import a manager class on first access.
+
+    Parameters
+    ----------
+    name (str): The name of the manager class.
+
+    Returns
+    -------
+    object: The manager class.
+
+    Raises
+    ------
+    AttributeError: If the name is not a manager of this package.
+
+    """
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,57 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio category manager for retrieving transaction and payment categories."""
+
+from typing import Optional
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.categories.category_manager import (
+    CategoryManager,
+)
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+
+
+class AsyncCategoryManager(AbstractAsyncManager):
+    """Asyncio counterpart of CategoryManager with awaitable methods."""
+
+    def __init__(self: "AsyncCategoryManager", client: AsyncClient) -> None:
+        """
+        Initialize the AsyncCategoryManager with an async client.
+
+        Parameters
+        ----------
+        client (AsyncClient): The client used to make API requests.
+
+        """
+        super().__init__(client)
+
+    async def get_categories(
+        self: "AsyncCategoryManager",
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve the list of categories.
+
+        Parameters
+        ----------
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response object containing the list of categories and any warnings.
+
+        """
+        response = await self.client.create_get_request(
+            "json/categories",
+            deadline=deadline,
+        )
+        return CategoryManager.build_categories_response(response)
@@ -7,12 +7,16 @@
 
 """Category manager for retrieving transaction and payment categories."""
 
+from typing import Optional
+
 from multisafepay.api.base.abstract_manager import AbstractManager
+from multisafepay.api.base.response.api_response import ApiResponse
 from multisafepay.api.base.response.custom_api_response import (
     CustomApiResponse,
 )
 from multisafepay.api.paths.categories.response.category import Category
 from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from pydantic import ValidationError
 
@@ -31,24 +35,48 @@ class CategoryManager(AbstractManager):
         """
         super().__init__(client)
 
-    def get_categories(self: "CategoryManager") -> CustomApiResponse:
+    def get_categories(
+        self: "CategoryManager",
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
         """
         Retrieve the list of categories.
 
         This method makes an API request to retrieve the list of categories and
         returns a CustomApiResponse object containing the response data.
 
+        Parameters
+        ----------
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
         Returns
         -------
         CustomApiResponse: The response object containing the list of categories and any warnings.
 
         """
-        response = self.client.create_get_request("json/categories")
+        response = self.client.create_get_request(
+            "json/categories",
+            deadline=deadline,
+        )
+        return CategoryManager.build_categories_response(response)
+
+    @staticmethod
+    def build_categories_response(
+        response: ApiResponse,
+    ) -> CustomApiResponse:
+        """
+        Create a custom API response containing a list of categories.
 
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The response object containing the list of categories and any warnings.
+
+        """
+        args: dict = {"data": None}
 
         if isinstance(response.get_body_data(), list):
             try:
@@ -64,4 +92,4 @@ class CategoryManager(AbstractManager):
                     .get_messages()
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
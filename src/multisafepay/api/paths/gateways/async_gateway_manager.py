@@ -0,0 +1,97 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio gateway manager for payment gateway operations and information."""
+
+from typing import Optional
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.gateways.gateway_manager import (
+    ALLOWED_OPTIONS,
+    GatewayManager,
+)
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+
+
+class AsyncGatewayManager(AbstractAsyncManager):
+    """Asyncio counterpart of GatewayManager with awaitable methods."""
+
+    def __init__(self: "AsyncGatewayManager", client: AsyncClient) -> None:
+        """
+        Initialize the AsyncGatewayManager with an async client.
+
+        Parameters
+        ----------
+        client (AsyncClient): The client used to make API requests.
+
+        """
+        super().__init__(client)
+
+    async def get_gateways(
+        self: "AsyncGatewayManager",
+        include_coupons: bool = True,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve a list of gateways.
+
+        Parameters
+        ----------
+        include_coupons (bool): Whether to include coupons in the response (default is True).
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the list of gateways.
+
+        """
+        options = {}
+        if include_coupons:
+            options["include"] = "coupons"
+
+        response = await self.client.create_get_request(
+            "json/gateways",
+            options,
+            deadline=deadline,
+        )
+        return GatewayManager.build_gateways_response(response)
+
+    async def get_by_code(
+        self: "AsyncGatewayManager",
+        gateway_code: str,
+        options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve a gateway by its code.
+
+        Parameters
+        ----------
+        gateway_code (str): The code of the gateway to retrieve.
+        options (dict): Additional options for the request (default is None).
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the gateway data.
+
+        """
+        if options is None:
+            options = {}
+        options = {k: v for k, v in options.items() if k in ALLOWED_OPTIONS}
+
+        encoded_gateway_code = self.encode_path_segment(gateway_code)
+        response = await self.client.create_get_request(
+            f"json/gateways/{encoded_gateway_code}",
+            options,
+            deadline=deadline,
+        )
+        return GatewayManager.build_gateway_response(response)
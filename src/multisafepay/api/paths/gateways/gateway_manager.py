@@ -7,12 +7,16 @@
 
 """Gateway manager for handling payment gateway operations and information."""
 
+from typing import Optional
+
 from multisafepay.api.base.abstract_manager import AbstractManager
+from multisafepay.api.base.response.api_response import ApiResponse
 from multisafepay.api.base.response.custom_api_response import (
     CustomApiResponse,
 )
 from multisafepay.api.paths.gateways.response.gateway import Gateway
 from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
 from multisafepay.util.dict_utils import dict_empty
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from pydantic import ValidationError
@@ -42,6 +46,7 @@ class GatewayManager(AbstractManager):
     def get_gateways(
         self: "GatewayManager",
         include_coupons: bool = True,
+        deadline: Optional[DeadlineLike] = None,
     ) -> CustomApiResponse:
         """
         Retrieve a list of gateways.
@@ -49,6 +54,7 @@ class GatewayManager(AbstractManager):
         Parameters
         ----------
         include_coupons (bool): Whether to include coupons in the response (default is True).
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -59,11 +65,28 @@ class GatewayManager(AbstractManager):
         if include_coupons:
             options["include"] = "coupons"
 
-        response = self.client.create_get_request("json/gateways", options)
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        response = self.client.create_get_request(
+            "json/gateways",
+            options,
+            deadline=deadline,
+        )
+        return GatewayManager.build_gateways_response(response)
+
+    @staticmethod
+    def build_gateways_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Create a custom API response containing a list of gateways.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the list of gateways or warnings.
+
+        """
+        args: dict = {"data": None}
         if isinstance(response.get_body_data(), list):
             try:
                 args["data"] = [
@@ -78,12 +101,13 @@ class GatewayManager(AbstractManager):
                     .get_messages()
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
 
     def get_by_code(
         self: "GatewayManager",
         gateway_code: str,
         options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
     ) -> CustomApiResponse:
         """
         Retrieve a gateway by its code.
@@ -92,6 +116,7 @@ class GatewayManager(AbstractManager):
         ----------
         gateway_code (str): The code of the gateway to retrieve.
         options (dict): Additional options for the request (default is None).
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -106,11 +131,25 @@ class GatewayManager(AbstractManager):
         response = self.client.create_get_request(
             f"json/gateways/{encoded_gateway_code}",
             options,
+            deadline=deadline,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        return GatewayManager.build_gateway_response(response)
+
+    @staticmethod
+    def build_gateway_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Create a custom API response containing a single gateway.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the gateway data or warnings.
+
+        """
+        args: dict = {"data": None}
 
         if not dict_empty(response.get_body_data()):
             try:
@@ -123,4 +162,4 @@ class GatewayManager(AbstractManager):
                     .get_messages()
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
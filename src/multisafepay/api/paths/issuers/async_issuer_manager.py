@@ -0,0 +1,70 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio issuer manager for retrieving payment gateway issuers."""
+
+from typing import Optional
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.issuers.issuer_manager import IssuerManager
+from multisafepay.api.paths.issuers.response.issuer import (
+    ALLOWED_GATEWAY_CODES,
+)
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+from multisafepay.exception.invalid_argument import InvalidArgumentException
+
+
+class AsyncIssuerManager(AbstractAsyncManager):
+    """Asyncio counterpart of IssuerManager with awaitable methods."""
+
+    def __init__(self: "AsyncIssuerManager", client: AsyncClient) -> None:
+        """
+        Initialize the AsyncIssuerManager with an async client.
+
+        Parameters
+        ----------
+        client (AsyncClient): The client used to make API requests.
+
+        """
+        super().__init__(client)
+
+    async def get_issuers_by_gateway_code(
+        self: "AsyncIssuerManager",
+        gateway_code: str,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve issuers by gateway code.
+
+        Parameters
+        ----------
+        gateway_code (str): The code of the gateway to retrieve issuers for.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the list of issuers.
+
+        Raises
+        ------
+        InvalidArgumentException: If the provided gateway code is not allowed.
+
+        """
+        gateway_code = gateway_code.lower()
+        if gateway_code not in ALLOWED_GATEWAY_CODES:
+            raise InvalidArgumentException("Gateway code is not allowed")
+
+        encoded_gateway_code = self.encode_path_segment(gateway_code)
+        response = await self.client.create_get_request(
+            f"json/issuers/{encoded_gateway_code}",
+            deadline=deadline,
+        )
+        return IssuerManager.build_issuers_response(response)
@@ -7,7 +7,10 @@
 
 """Issuer manager for retrieving payment gateway issuers and bank options."""
 
+from typing import Optional
+
 from multisafepay.api.base.abstract_manager import AbstractManager
+from multisafepay.api.base.response.api_response import ApiResponse
 from multisafepay.api.base.response.custom_api_response import (
     CustomApiResponse,
 )
@@ -16,6 +19,7 @@ from multisafepay.api.paths.issuers.response.issuer import (
     Issuer,
 )
 from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
 from multisafepay.exception.invalid_argument import InvalidArgumentException
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from pydantic import ValidationError
@@ -38,6 +42,7 @@ class IssuerManager(AbstractManager):
     def get_issuers_by_gateway_code(
         self: "IssuerManager",
         gateway_code: str,
+        deadline: Optional[DeadlineLike] = None,
     ) -> CustomApiResponse:
         """
         Retrieve issuers by gateway code.
@@ -45,6 +50,7 @@ class IssuerManager(AbstractManager):
         Parameters
         ----------
         gateway_code (str): The code of the gateway to retrieve issuers for.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -62,11 +68,25 @@ class IssuerManager(AbstractManager):
         encoded_gateway_code = self.encode_path_segment(gateway_code)
         response = self.client.create_get_request(
             f"json/issuers/{encoded_gateway_code}",
+            deadline=deadline,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        return IssuerManager.build_issuers_response(response)
+
+    @staticmethod
+    def build_issuers_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Create a custom API response containing a list of issuers.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the list of issuers.
+
+        """
+        args: dict = {"data": None}
         if isinstance(response.get_body_data(), list):
             try:
                 args["data"] = [
@@ -82,4 +102,4 @@ class IssuerManager(AbstractManager):
                     .get_messages()
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
@@ -0,0 +1,55 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio me manager for retrieving account and merchant information."""
+
+from typing import Optional
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.me.me_manager import MeManager
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+
+
+class AsyncMeManager(AbstractAsyncManager):
+    """Asyncio counterpart of MeManager with awaitable methods."""
+
+    def __init__(self: "AsyncMeManager", client: AsyncClient) -> None:
+        """
+        Initialize the AsyncMeManager with an async client.
+
+        Parameters
+        ----------
+        client (AsyncClient): The client used to make API requests.
+
+        """
+        super().__init__(client)
+
+    async def get(
+        self: "AsyncMeManager",
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve the 'me' data.
+
+        Parameters
+        ----------
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response object containing the 'me' data and any warnings.
+
+        """
+        response = await self.client.create_get_request(
+            "json/me",
+            deadline=deadline,
+        )
+        return MeManager.build_me_response(response)
@@ -7,12 +7,16 @@
 
 """Me manager for retrieving account and merchant information."""
 
+from typing import Optional
+
 from multisafepay.api.base.abstract_manager import AbstractManager
+from multisafepay.api.base.response.api_response import ApiResponse
 from multisafepay.api.base.response.custom_api_response import (
     CustomApiResponse,
 )
 from multisafepay.api.paths.me.response.me import Me
 from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
 from multisafepay.util.dict_utils import dict_empty
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from pydantic import ValidationError
@@ -32,23 +36,43 @@ class MeManager(AbstractManager):
         """
         super().__init__(client)
 
-    def get(self: "MeManager") -> CustomApiResponse:
+    def get(
+        self: "MeManager",
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
         """
         Retrieve the 'me' data.
 
         This method makes an API request to retrieve the 'me' data and
         returns a CustomApiResponse object containing the response data.
 
+        Parameters
+        ----------
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response object containing the 'me' data and any warnings.
+
+        """
+        response = self.client.create_get_request("json/me", deadline=deadline)
+        return MeManager.build_me_response(response)
+
+    @staticmethod
+    def build_me_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Create a custom API response containing the 'me' data.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
         Returns
         -------
         CustomApiResponse: The response object containing the 'me' data and any warnings.
 
         """
-        response = self.client.create_get_request("json/me")
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        args: dict = {"data": None}
         if not dict_empty(response.get_body_data()):
             try:
                 args["data"] = Me(**response.get_body_data().copy())
@@ -60,4 +84,4 @@ class MeManager(AbstractManager):
                     .get_messages()
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
@@ -0,0 +1,249 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio order manager for handling order operations and API endpoints."""
+
+from typing import Optional, Union
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.orders.order_id.capture.request.capture_request import (
+    CaptureOrderRequest,
+)
+from multisafepay.api.paths.orders.order_id.refund.request.refund_request import (
+    RefundOrderRequest,
+)
+from multisafepay.api.paths.orders.order_id.update.request.update_request import (
+    UpdateOrderRequest,
+)
+from multisafepay.api.paths.orders.order_manager import OrderManager
+from multisafepay.api.paths.orders.request.order_request import OrderRequest
+from multisafepay.api.paths.orders.response.order_response import Order
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+
+
+class AsyncOrderManager(AbstractAsyncManager):
+    """Asyncio counterpart of OrderManager with awaitable methods."""
+
+    def __init__(self: "AsyncOrderManager", client: AsyncClient) -> None:
+        """
+        Initialize the AsyncOrderManager with an async client.
+
+        Parameters
+        ----------
+        client (AsyncClient): The client used to make API requests.
+
+        """
+        super().__init__(client)
+
+    async def get(
+        self: "AsyncOrderManager",
+        order_id: str,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve an order by its ID.
+
+        Parameters
+        ----------
+        order_id (str): The ID of the order to retrieve.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the order data.
+
+        """
+        encoded_order_id = self.encode_path_segment(order_id)
+        endpoint = f"json/orders/{encoded_order_id}"
+        context = {"order_id": order_id}
+        response = await self.client.create_get_request(
+            endpoint,
+            context=context,
+            deadline=deadline,
+        )
+        return OrderManager.build_order_response(response)
+
+    async def create(
+        self: "AsyncOrderManager",
+        request_order: OrderRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> CustomApiResponse:
+        """
+        Create a new order.
+
+        Parameters
+        ----------
+        request_order (OrderRequest): The request object containing order details.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the created order data.
+
+        """
+        json_data = self.client.json_codec.dumps(request_order.to_dict())
+        response = await self.client.create_post_request(
+            "json/orders",
+            request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+        return OrderManager.build_order_response(response)
+
+    async def update(
+        self: "AsyncOrderManager",
+        order_id: str,
+        update_request: UpdateOrderRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> CustomApiResponse:
+        """
+        Update an existing order.
+
+        Parameters
+        ----------
+        order_id (str): The ID of the order to update.
+        update_request (UpdateOrderRequest): The request object containing updated order details.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the updated order data.
+
+        """
+        json_data = self.client.json_codec.dumps(update_request.to_dict())
+        encoded_order_id = self.encode_path_segment(order_id)
+        response = await self.client.create_patch_request(
+            f"json/orders/{encoded_order_id}",
+            request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+        return OrderManager.build_update_response(response)
+
+    async def capture(
+        self: "AsyncOrderManager",
+        order_id: str,
+        capture_request: CaptureOrderRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> CustomApiResponse:
+        """
+        Capture an order.
+
+        Parameters
+        ----------
+        order_id (str): The ID of the order to capture.
+        capture_request (CaptureOrderRequest): The request object containing capture details.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the capture data.
+
+        """
+        json_data = self.client.json_codec.dumps(capture_request.to_dict())
+        encoded_order_id = self.encode_path_segment(order_id)
+        response = await self.client.create_post_request(
+            f"json/orders/{encoded_order_id}/capture",
+            request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+        return OrderManager.build_capture_response(response)
+
+    async def refund(
+        self: "AsyncOrderManager",
+        order_id: str,
+        request_refund: RefundOrderRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> CustomApiResponse:
+        """
+        Refund an order.
+
+        Parameters
+        ----------
+        order_id (str): The ID of the order to refund.
+        request_refund (RefundOrderRequest): The request object containing refund details.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the refund data.
+
+        """
+        json_data = self.client.json_codec.dumps(request_refund.to_dict())
+        encoded_order_id = self.encode_path_segment(order_id)
+        response = await self.client.create_post_request(
+            f"json/orders/{encoded_order_id}/refunds",
+            request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+        return OrderManager.build_refund_response(response)
+
+    async def refund_by_item(
+        self: "AsyncOrderManager",
+        order: Order,
+        merchant_item_id: Union[str, int],
+        quantity: int = 0,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> CustomApiResponse:
+        """
+        Refund an order by item.
+
+        Parameters
+        ----------
+        order (Order): The order to refund.
+        merchant_item_id (str | int): The merchant item ID to refund.
+        quantity Optional[int]: The quantity to refund (default is 0).
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the refund data.
+
+        """
+        request_refund = self.create_refund_request(order)
+        request_refund.checkout_data.refund_by_merchant_item_id(
+            merchant_item_id,
+            quantity,
+        )
+        return await self.refund(
+            order.order_id,
+            request_refund,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
+
+    @staticmethod
+    def create_refund_request(order: Order) -> RefundOrderRequest:
+        """
+        Create a refund request from an order.
+
+        Parameters
+        ----------
+        order (Order): The order to create a refund request from.
+
+        Returns
+        -------
+        RefundOrderRequest: The refund request object.
+
+        """
+        return OrderManager.create_refund_request(order)
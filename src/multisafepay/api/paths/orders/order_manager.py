@@ -7,8 +7,7 @@
 
 """Order manager for handling order operations and API endpoints."""
 
-import json
-from typing import Union
+from typing import Optional, Union
 
 from multisafepay.api.base.abstract_manager import AbstractManager
 from multisafepay.api.base.response.api_response import ApiResponse
@@ -38,8 +37,8 @@ from multisafepay.api.paths.orders.response.order_response import Order
 from multisafepay.api.shared.cart.shopping_cart import ShoppingCart
 from multisafepay.api.shared.description import Description
 from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
 from multisafepay.util.dict_utils import dict_empty
-from multisafepay.util.json_encoder import DecimalEncoder
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from multisafepay.value_object.amount import Amount
 from multisafepay.value_object.currency import Currency
@@ -61,7 +60,7 @@ class OrderManager(AbstractManager):
         super().__init__(client)
 
     @staticmethod
-    def __custom_api_response(response: ApiResponse) -> CustomApiResponse:
+    def build_order_response(response: ApiResponse) -> CustomApiResponse:
         """
         Create a custom API response from a given ApiResponse.
 
@@ -74,10 +73,7 @@ class OrderManager(AbstractManager):
         CustomApiResponse: The custom API response with additional data or warnings.
 
         """
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        args: dict = {"data": None}
         if not dict_empty(response.get_body_data()):
             try:
                 args["data"] = Order.from_dict(
@@ -88,15 +84,91 @@ class OrderManager(AbstractManager):
                     gen_could_not_created_msg("Order"),
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
 
-    def get(self: "OrderManager", order_id: str) -> CustomApiResponse:
+    @staticmethod
+    def build_update_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Create a custom API response for an order update.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response without data.
+
+        """
+        args: dict = {"data": None}
+        return CustomApiResponse.from_api_response(response, **args)
+
+    @staticmethod
+    def build_capture_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Create a custom API response containing an OrderCapture.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response with the capture data or warnings.
+
+        """
+        args: dict = {"data": None}
+        if not dict_empty(response.get_body_data()):
+            try:
+                args["data"] = OrderCapture.from_dict(
+                    d=response.get_body_data().copy(),
+                )
+            except ValidationError:
+                args["warnings"] = MessageList().add_message(
+                    gen_could_not_created_msg("OrderCapture"),
+                )
+
+        return CustomApiResponse.from_api_response(response, **args)
+
+    @staticmethod
+    def build_refund_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Create a custom API response containing an OrderRefund.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response with the refund data or warnings.
+
+        """
+        args: dict = {"data": None}
+        if not dict_empty(response.get_body_data()):
+            try:
+                args["data"] = OrderRefund.from_dict(
+                    d=response.get_body_data().copy(),
+                )
+            except ValidationError:
+                args["warnings"] = MessageList().add_message(
+                    gen_could_not_created_msg("OrderRefund"),
+                )
+
+        return CustomApiResponse.from_api_response(response, **args)
+
+    def get(
+        self: "OrderManager",
+        order_id: str,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
         """
         Retrieve an order by its ID.
 
         Parameters
         ----------
         order_id (str): The ID of the order to retrieve.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -108,13 +180,16 @@ class OrderManager(AbstractManager):
         context = {"order_id": order_id}
         response: ApiResponse = self.client.create_get_request(
             endpoint,
-            context,
+            context=context,
+            deadline=deadline,
         )
-        return OrderManager.__custom_api_response(response)
+        return OrderManager.build_order_response(response)
 
     def create(
         self: "OrderManager",
         request_order: OrderRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CustomApiResponse:
         """
         Create a new order.
@@ -122,23 +197,29 @@ class OrderManager(AbstractManager):
         Parameters
         ----------
         request_order (OrderRequest): The request object containing order details.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
 
         Returns
         -------
         CustomApiResponse: The custom API response containing the created order data.
 
         """
-        json_data = json.dumps(request_order.to_dict(), cls=DecimalEncoder)
+        json_data = self.client.json_codec.dumps(request_order.to_dict())
         response: ApiResponse = self.client.create_post_request(
             "json/orders",
             request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
         )
-        return OrderManager.__custom_api_response(response)
+        return OrderManager.build_order_response(response)
 
     def update(
         self: "OrderManager",
         order_id: str,
         update_request: UpdateOrderRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CustomApiResponse:
         """
         Update an existing order.
@@ -147,28 +228,30 @@ class OrderManager(AbstractManager):
         ----------
         order_id (str): The ID of the order to update.
         update_request (UpdateOrderRequest): The request object containing updated order details.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
 
         Returns
         -------
         CustomApiResponse: The custom API response containing the updated order data.
 
         """
-        json_data = json.dumps(update_request.to_dict(), cls=DecimalEncoder)
+        json_data = self.client.json_codec.dumps(update_request.to_dict())
         encoded_order_id = self.encode_path_segment(order_id)
         response = self.client.create_patch_request(
             f"json/orders/{encoded_order_id}",
             request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
-        return CustomApiResponse(**args)
+        return OrderManager.build_update_response(response)
 
     def capture(
         self: "OrderManager",
         order_id: str,
         capture_request: CaptureOrderRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CustomApiResponse:
         """
         Capture an order.
@@ -177,39 +260,31 @@ class OrderManager(AbstractManager):
         ----------
         order_id (str): The ID of the order to capture.
         capture_request (CaptureOrderRequest): The request object containing capture details.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
 
         Returns
         -------
         CustomApiResponse: The custom API response containing the capture data.
 
         """
-        json_data = json.dumps(capture_request.to_dict(), cls=DecimalEncoder)
+        json_data = self.client.json_codec.dumps(capture_request.to_dict())
         encoded_order_id = self.encode_path_segment(order_id)
 
         response = self.client.create_post_request(
             f"json/orders/{encoded_order_id}/capture",
             request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
-        if not dict_empty(response.get_body_data()):
-            try:
-                args["data"] = OrderCapture.from_dict(
-                    d=response.get_body_data().copy(),
-                )
-            except ValidationError:
-                args["warnings"] = MessageList().add_message(
-                    gen_could_not_created_msg("OrderCapture"),
-                )
-
-        return CustomApiResponse(**args)
+        return OrderManager.build_capture_response(response)
 
     def refund(
         self: "OrderManager",
         order_id: str,
         request_refund: RefundOrderRequest,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CustomApiResponse:
         """
         Refund an order.
@@ -218,39 +293,31 @@ class OrderManager(AbstractManager):
         ----------
         order_id (str): The ID of the order to refund.
         request_refund (RefundOrderRequest): The request object containing refund details.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
 
         Returns
         -------
         CustomApiResponse: The custom API response containing the refund data.
 
         """
-        json_data = json.dumps(request_refund.to_dict(), cls=DecimalEncoder)
+        json_data = self.client.json_codec.dumps(request_refund.to_dict())
         encoded_order_id = self.encode_path_segment(order_id)
         response = self.client.create_post_request(
             f"json/orders/{encoded_order_id}/refunds",
             request_body=json_data,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
-        if not dict_empty(response.get_body_data()):
-            try:
-                args["data"] = OrderRefund.from_dict(
-                    d=response.get_body_data().copy(),
-                )
-            except ValidationError:
-                args["warnings"] = MessageList().add_message(
-                    gen_could_not_created_msg("OrderRefund"),
-                )
-
-        return CustomApiResponse(**args)
+        return OrderManager.build_refund_response(response)
 
     def refund_by_item(
         self: "OrderManager",
         order: Order,
         merchant_item_id: Union[str, int],
         quantity: int = 0,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CustomApiResponse:
         """
         Refund an order by item.
@@ -260,6 +327,8 @@ class OrderManager(AbstractManager):
         order (Order): The order to refund.
         merchant_item_id (str | int): The merchant item ID to refund.
         quantity Optional[int]: The quantity to refund (default is 0).
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+        idempotency_key (Optional[str]): Idempotency key that makes the call safe to retry. Defaults to None.
 
         Returns
         -------
@@ -273,7 +342,12 @@ class OrderManager(AbstractManager):
         )
 
         # Encode the order_id before calling refund
-        return self.refund(order.order_id, request_refund)
+        return self.refund(
+            order.order_id,
+            request_refund,
+            deadline=deadline,
+            idempotency_key=idempotency_key,
+        )
 
     @staticmethod
     def create_refund_request(order: Order) -> RefundOrderRequest:
@@ -0,0 +1,130 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio payment method manager for available payment methods and configurations."""
+
+from typing import Optional
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.api_response import ApiResponse
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.payment_methods.payment_method_manager import (
+    ALLOWED_OPTIONS,
+    PaymentMethodManager,
+)
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+
+
+class AsyncPaymentMethodManager(AbstractAsyncManager):
+    """Asyncio counterpart of PaymentMethodManager with awaitable methods."""
+
+    def __init__(
+        self: "AsyncPaymentMethodManager",
+        client: AsyncClient,
+    ) -> None:
+        """
+        Initialize the AsyncPaymentMethodManager with an async client.
+
+        Parameters
+        ----------
+        client (AsyncClient): The client used to make API requests.
+
+        """
+        super().__init__(client)
+
+    async def get_payment_methods_request(
+        self: "AsyncPaymentMethodManager",
+        include_coupons: bool = True,
+        options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> ApiResponse:
+        """
+        Create a request to retrieve payment methods.
+
+        Parameters
+        ----------
+        include_coupons (bool): Whether to include coupons in the request. Defaults to True.
+        options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        ApiResponse: The API response containing the payment methods data.
+
+        """
+        if options is None:
+            options = {}
+        options = {k: v for k, v in options.items() if k in ALLOWED_OPTIONS}
+        if include_coupons:
+            options["include_coupons"] = "1"
+
+        return await self.client.create_get_request(
+            "json/payment-methods",
+            options,
+            deadline=deadline,
+        )
+
+    async def get_payment_methods(
+        self: "AsyncPaymentMethodManager",
+        include_coupons: bool = True,
+        options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve payment methods.
+
+        Parameters
+        ----------
+        include_coupons (bool): Whether to include coupons in the request. Defaults to True.
+        options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the payment methods data.
+
+        """
+        response = await self.get_payment_methods_request(
+            include_coupons,
+            options,
+            deadline=deadline,
+        )
+        return PaymentMethodManager.build_payment_methods_response(response)
+
+    async def get_by_gateway_code(
+        self: "AsyncPaymentMethodManager",
+        gateway_code: str,
+        options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve a payment method by its gateway code.
+
+        Parameters
+        ----------
+        gateway_code (str): The gateway code of the payment method.
+        options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the payment method data.
+
+        """
+        if options is None:
+            options = {}
+        options = {k: v for k, v in options.items() if k in ALLOWED_OPTIONS}
+        encoded_gateway_code = self.encode_path_segment(gateway_code)
+        response = await self.client.create_get_request(
+            f"json/payment-methods/{encoded_gateway_code}",
+            options,
+            deadline=deadline,
+        )
+        return PaymentMethodManager.build_payment_method_response(response)
@@ -7,6 +7,8 @@
 
 """Payment method manager for retrieving available payment methods and configurations."""
 
+from typing import Optional
+
 from multisafepay.api.base.abstract_manager import AbstractManager
 from multisafepay.api.base.response.custom_api_response import (
     CustomApiResponse,
@@ -15,6 +17,7 @@ from multisafepay.api.paths.payment_methods.response.payment_method import (
     PaymentMethod,
 )
 from multisafepay.client.client import ApiResponse, Client
+from multisafepay.client.deadline import DeadlineLike
 from multisafepay.util.dict_utils import dict_empty
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from pydantic import ValidationError
@@ -45,6 +48,7 @@ class PaymentMethodManager(AbstractManager):
         self: "PaymentMethodManager",
         include_coupons: bool = True,
         options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
     ) -> ApiResponse:
         """
         Create a request to retrieve payment methods.
@@ -53,6 +57,7 @@ class PaymentMethodManager(AbstractManager):
         ----------
         include_coupons (bool): Whether to include coupons in the request. Defaults to True.
         options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -65,12 +70,17 @@ class PaymentMethodManager(AbstractManager):
         if include_coupons:
             options["include_coupons"] = "1"
 
-        return self.client.create_get_request("json/payment-methods", options)
+        return self.client.create_get_request(
+            "json/payment-methods",
+            options,
+            deadline=deadline,
+        )
 
     def get_payment_methods(
         self: "PaymentMethodManager",
         include_coupons: bool = True,
         options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
     ) -> CustomApiResponse:
         """
         Retrieve payment methods.
@@ -79,18 +89,37 @@ class PaymentMethodManager(AbstractManager):
         ----------
         include_coupons (bool): Whether to include coupons in the request. Defaults to True.
         options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
         CustomApiResponse: The custom API response containing the payment methods data.
 
         """
-        response = self.get_payment_methods_request(include_coupons, options)
+        response = self.get_payment_methods_request(
+            include_coupons,
+            options,
+            deadline=deadline,
+        )
+        return PaymentMethodManager.build_payment_methods_response(response)
+
+    @staticmethod
+    def build_payment_methods_response(
+        response: ApiResponse,
+    ) -> CustomApiResponse:
+        """
+        Create a custom API response containing a list of payment methods.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the payment methods data.
 
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        """
+        args: dict = {"data": None}
 
         if isinstance(response.get_body_data(), list):
             try:
@@ -103,12 +132,13 @@ class PaymentMethodManager(AbstractManager):
                     gen_could_not_created_msg("Listing Payment Method"),
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
 
     def get_by_gateway_code(
         self: "PaymentMethodManager",
         gateway_code: str,
         options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
     ) -> CustomApiResponse:
         """
         Retrieve a payment method by its gateway code.
@@ -117,6 +147,7 @@ class PaymentMethodManager(AbstractManager):
         ----------
         gateway_code (str): The gateway code of the payment method.
         options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -130,11 +161,27 @@ class PaymentMethodManager(AbstractManager):
         response = self.client.create_get_request(
             f"json/payment-methods/{encoded_gateway_code}",
             options,
+            deadline=deadline,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        return PaymentMethodManager.build_payment_method_response(response)
+
+    @staticmethod
+    def build_payment_method_response(
+        response: ApiResponse,
+    ) -> CustomApiResponse:
+        """
+        Create a custom API response containing a single payment method.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The custom API response containing the payment method data.
+
+        """
+        args: dict = {"data": None}
         if not dict_empty(response.get_body_data()):
             try:
                 args["data"] = PaymentMethod.from_dict(
@@ -145,4 +192,4 @@ class PaymentMethodManager(AbstractManager):
                     gen_could_not_created_msg("Payment Method"),
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
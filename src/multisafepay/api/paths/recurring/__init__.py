@@ -1,9 +1,51 @@
 """Recurring payments API endpoints for managing subscriptions and tokens."""
 
-from multisafepay.api.paths.recurring.recurring_manager import (
-    RecurringManager,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# The managers in __all__ are resolved at runtime by __getattr__ below.
+# ruff: noqa: TCH004
+if TYPE_CHECKING:
+    from multisafepay.api.paths.recurring.async_recurring_manager import (
+        AsyncRecurringManager,
+    )
+    from multisafepay.api.paths.recurring.recurring_manager import (
+        RecurringManager,
+    )
+
+# Manager modules by class name, relative to this package, imported on
+# first access so that using one manager does not import the other.
+_MODULES = {
+    "AsyncRecurringManager": "async_recurring_manager",
+    "RecurringManager": "recurring_manager",
+}
 
 __all__ = [
+    "AsyncRecurringManager",
     "RecurringManager",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import a manager class on first access.
+
+    Parameters
+    ----------
+    name (str): The name of the manager class.
+
+    Returns
+    -------
+    object: The manager class.
+
+    Raises
+    ------
+    AttributeError: If the name is not a manager of this package.
+
+    """
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,132 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio recurring payment manager for tokenized payments and subscriptions."""
+
+from typing import Any, Optional
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.recurring.recurring_manager import (
+    RecurringManager,
+)
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+
+
+class AsyncRecurringManager(AbstractAsyncManager):
+    """
+    Asyncio counterpart of RecurringManager with awaitable methods.
+
+    Attributes
+    ----------
+    CREDIT_CARD_GATEWAY_CODE (str): The code for the credit card gateway.
+    CREDIT_CARD_GATEWAYS (list): List of supported credit card gateways.
+    tokens (dict): Dictionary to store tokens.
+
+    """
+
+    CREDIT_CARD_GATEWAY_CODE = RecurringManager.CREDIT_CARD_GATEWAY_CODE
+    CREDIT_CARD_GATEWAYS = RecurringManager.CREDIT_CARD_GATEWAYS
+
+    def __init__(
+        self: "AsyncRecurringManager",
+        client: AsyncClient,
+    ) -> None:
+        """
+        Initializes the AsyncRecurringManager with an async client.
+
+        Parameters
+        ----------
+        client: The client to use for API requests.
+
+        """
+        super().__init__(client)
+        self.tokens: Any = {}
+
+    async def get_list(
+        self: "AsyncRecurringManager",
+        reference: str,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieves a list of recurring tokens for a given customer reference.
+
+        Parameters
+        ----------
+        reference (str): The customer reference.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the list of tokens.
+
+        """
+        encoded_reference = self.encode_path_segment(reference)
+        response = await self.client.create_get_request(
+            f"json/recurring/{encoded_reference}",
+            deadline=deadline,
+        )
+        return RecurringManager.build_tokens_response(response)
+
+    async def get(
+        self: "AsyncRecurringManager",
+        token: str,
+        reference: str,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieves a specific recurring token for a given customer reference.
+
+        Parameters
+        ----------
+        token (str): The token to retrieve.
+        reference (str): The customer reference.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the token data.
+
+        """
+        encoded_reference = self.encode_path_segment(reference)
+        encoded_token = self.encode_path_segment(token)
+        response = await self.client.create_get_request(
+            f"json/recurring/{encoded_reference}/token/{encoded_token}",
+            deadline=deadline,
+        )
+        return RecurringManager.build_token_response(response)
+
+    async def delete(
+        self: "AsyncRecurringManager",
+        reference: str,
+        token: str,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Deletes a specific recurring token for a given customer reference.
+
+        Parameters
+        ----------
+        reference (str): The customer reference.
+        token (str): The token to delete.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response after deleting the token.
+
+        """
+        encoded_reference = self.encode_path_segment(reference)
+        encoded_token = self.encode_path_segment(token)
+        response = await self.client.create_delete_request(
+            f"json/recurring/{encoded_reference}/remove/{encoded_token}",
+            deadline=deadline,
+        )
+        return RecurringManager.build_delete_response(response)
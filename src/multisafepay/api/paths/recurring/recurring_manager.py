@@ -7,7 +7,7 @@
 
 """Recurring payment manager for handling tokenized payments and subscriptions."""
 
-from typing import Any
+from typing import Any, Optional
 
 from multisafepay.api.base.abstract_manager import AbstractManager
 from multisafepay.api.base.response.api_response import ApiResponse
@@ -18,6 +18,7 @@ from multisafepay.api.paths.recurring.customer_reference.token.token import (
     Token,
 )
 from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
 from multisafepay.util.dict_utils import dict_empty
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from pydantic import ValidationError
@@ -53,6 +54,7 @@ class RecurringManager(AbstractManager):
     def get_list(
         self: "RecurringManager",
         reference: str,
+        deadline: Optional[DeadlineLike] = None,
     ) -> CustomApiResponse:
         """
         Retrieves a list of recurring tokens for a given customer reference.
@@ -61,6 +63,7 @@ class RecurringManager(AbstractManager):
         ----------
         reference (str): The customer reference.
         force_api_call (bool): Whether to force an API call.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -70,11 +73,25 @@ class RecurringManager(AbstractManager):
         encoded_reference = self.encode_path_segment(reference)
         response: ApiResponse = self.client.create_get_request(
             f"json/recurring/{encoded_reference}",
+            deadline=deadline,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        return RecurringManager.build_tokens_response(response)
+
+    @staticmethod
+    def build_tokens_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Creates a custom API response containing a list of tokens.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the list of tokens.
+
+        """
+        args: dict = {"data": None}
 
         body_data = response.get_body_data()
 
@@ -93,12 +110,13 @@ class RecurringManager(AbstractManager):
                     gen_could_not_created_msg("Listing Tokens"),
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
 
     def get(
         self: "RecurringManager",
         token: str,
         reference: str,
+        deadline: Optional[DeadlineLike] = None,
     ) -> CustomApiResponse:
         """
         Retrieves a specific recurring token for a given customer reference.
@@ -107,6 +125,7 @@ class RecurringManager(AbstractManager):
         ----------
         token (str): The token to retrieve.
         reference (str): The customer reference.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -117,11 +136,25 @@ class RecurringManager(AbstractManager):
         encoded_token = self.encode_path_segment(token)
         response = self.client.create_get_request(
             f"json/recurring/{encoded_reference}/token/{encoded_token}",
+            deadline=deadline,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        return RecurringManager.build_token_response(response)
+
+    @staticmethod
+    def build_token_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Creates a custom API response containing a single token.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the token data.
+
+        """
+        args: dict = {"data": None}
         if not dict_empty(response.get_body_data()):
             try:
                 args["data"] = Token(**response.get_body_data().copy())
@@ -130,12 +163,13 @@ class RecurringManager(AbstractManager):
                     gen_could_not_created_msg("Listing Tokens"),
                 )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
 
     def delete(
         self: "RecurringManager",
         reference: str,
         token: str,
+        deadline: Optional[DeadlineLike] = None,
     ) -> CustomApiResponse:
         """
         Deletes a specific recurring token for a given customer reference.
@@ -144,6 +178,7 @@ class RecurringManager(AbstractManager):
         ----------
         reference (str): The customer reference.
         token (str): The token to delete.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -154,9 +189,23 @@ class RecurringManager(AbstractManager):
         encoded_token = self.encode_path_segment(token)
         response = self.client.create_delete_request(
             f"json/recurring/{encoded_reference}/remove/{encoded_token}",
+            deadline=deadline,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
-        return CustomApiResponse(**args)
+        return RecurringManager.build_delete_response(response)
+
+    @staticmethod
+    def build_delete_response(response: ApiResponse) -> CustomApiResponse:
+        """
+        Creates a custom API response for a token deletion.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The response after deleting the token.
+
+        """
+        args: dict = {"data": None}
+        return CustomApiResponse.from_api_response(response, **args)
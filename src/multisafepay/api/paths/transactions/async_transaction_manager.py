@@ -0,0 +1,147 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio transaction manager for retrieving and listing transaction data."""
+
+from collections.abc import AsyncIterator
+from typing import Optional
+
+from multisafepay.api.base.abstract_async_manager import AbstractAsyncManager
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.api.paths.transactions.response.transaction import (
+    Transaction,
+)
+from multisafepay.api.paths.transactions.transaction_manager import (
+    ALLOWED_OPTIONS,
+    TransactionManager,
+)
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.deadline import DeadlineLike
+from multisafepay.util.json_stream import JsonItemStream
+from multisafepay.util.message import MessageList
+
+
+class AsyncTransactionManager(AbstractAsyncManager):
+    """Asyncio counterpart of TransactionManager with awaitable methods."""
+
+    def __init__(
+        self: "AsyncTransactionManager",
+        client: AsyncClient,
+    ) -> None:
+        """
+        Initialize the AsyncTransactionManager with an async client.
+
+        Parameters
+        ----------
+        client (AsyncClient): The client used to make API requests.
+
+        """
+        super().__init__(client)
+
+    async def get_transactions(
+        self: "AsyncTransactionManager",
+        options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> CustomApiResponse:
+        """
+        Retrieve a list of transactions.
+
+        Parameters
+        ----------
+        options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the list of transactions
+
+        """
+        if options is None:
+            options = {}
+        options = {k: v for k, v in options.items() if k in ALLOWED_OPTIONS}
+
+        response = await self.client.create_get_request(
+            "json/transactions",
+            options,
+            deadline=deadline,
+        )
+        return TransactionManager.build_transactions_response(response)
+
+    async def stream_transactions(
+        self: "AsyncTransactionManager",
+        options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
+        all_pages: bool = False,
+        chunk_size: int = AsyncClient.DEFAULT_CHUNK_SIZE,
+        warnings: Optional[MessageList] = None,
+    ) -> AsyncIterator[Transaction]:
+        """
+        Stream transactions one by one while the response body is read.
+
+        Unlike get_transactions, the page is never decoded as a whole: the
+        ``data`` items are parsed as body chunks arrive and yielded as
+        Transaction objects, so memory stays flat however large the page
+        (``limit``) is. The request is sent when iteration starts.
+
+        Parameters
+        ----------
+        options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds
+            per page, or a Deadline shared by all pages. Defaults to None.
+        all_pages (bool): Follow the ``after`` cursor until the last page.
+            Defaults to False.
+        chunk_size (int): Maximum number of body bytes read at once.
+            Defaults to 64 KiB.
+        warnings (Optional[MessageList]): Collects a message for every item
+            that could not be turned into a Transaction; such items are
+            skipped, as get_transactions reports them as warnings instead of
+            raising. Defaults to None.
+
+        Returns
+        -------
+        AsyncIterator[Transaction]: The transactions, in response order.
+
+        """
+        if options is None:
+            options = {}
+        options = {k: v for k, v in options.items() if k in ALLOWED_OPTIONS}
+
+        while True:
+            parser = JsonItemStream("data")
+            chunks = await self.client.stream_get_request(
+                "json/transactions",
+                options,
+                deadline=deadline,
+                chunk_size=chunk_size,
+            )
+            streamed = 0
+            async for chunk in chunks:
+                for item in parser.feed(chunk):
+                    streamed += 1
+                    transaction = (
+                        TransactionManager.build_streamed_transaction(
+                            item,
+                            warnings,
+                        )
+                    )
+                    if transaction is not None:
+                        yield transaction
+            for item in parser.close():
+                streamed += 1
+                transaction = TransactionManager.build_streamed_transaction(
+                    item,
+                    warnings,
+                )
+                if transaction is not None:
+                    yield transaction
+
+            after = TransactionManager.next_cursor(parser.envelope)
+            if not all_pages or not streamed or not after:
+                return
+            options = {**options, "after": after}
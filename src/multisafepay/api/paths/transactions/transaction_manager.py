@@ -7,6 +7,9 @@
 
 """Transaction manager for retrieving and listing transaction data."""
 
+from collections.abc import Iterator
+from typing import Optional
+
 from multisafepay.api.base.abstract_manager import AbstractManager
 from multisafepay.api.base.listings.listing_pager import ListingPager
 from multisafepay.api.base.listings.pager import Pager
@@ -18,6 +21,8 @@ from multisafepay.api.paths.transactions.response.transaction import (
     Transaction,
 )
 from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
+from multisafepay.util.json_stream import JsonItemStream
 from multisafepay.util.message import MessageList, gen_could_not_created_msg
 from pydantic import ValidationError
 
@@ -55,6 +60,7 @@ class TransactionManager(AbstractManager):
     def get_transactions(
         self: "TransactionManager",
         options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
     ) -> CustomApiResponse:
         """
         Retrieve a list of transactions.
@@ -62,6 +68,7 @@ class TransactionManager(AbstractManager):
         Parameters
         ----------
         options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds. Defaults to None.
 
         Returns
         -------
@@ -75,11 +82,148 @@ class TransactionManager(AbstractManager):
         response: ApiResponse = self.client.create_get_request(
             "json/transactions",
             options,
+            deadline=deadline,
         )
-        args: dict = {
-            **response.dict(),
-            "data": None,
-        }
+        return TransactionManager.build_transactions_response(response)
+
+    def stream_transactions(
+        self: "TransactionManager",
+        options: dict = None,
+        deadline: Optional[DeadlineLike] = None,
+        all_pages: bool = False,
+        chunk_size: int = Client.DEFAULT_CHUNK_SIZE,
+        warnings: Optional[MessageList] = None,
+    ) -> Iterator[Transaction]:
+        """
+        Stream transactions one by one while the response body is read.
+
+        Unlike get_transactions, the page is never decoded as a whole: the
+        ``data`` items are parsed as body chunks arrive and yielded as
+        Transaction objects, so memory stays flat however large the page
+        (``limit``) is. The request is sent when iteration starts.
+
+        Parameters
+        ----------
+        options (dict): Additional options for the request. Defaults to None.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds
+            per page, or a Deadline shared by all pages. Defaults to None.
+        all_pages (bool): Follow the ``after`` cursor until the last page.
+            Defaults to False.
+        chunk_size (int): Maximum number of body bytes read at once.
+            Defaults to 64 KiB.
+        warnings (Optional[MessageList]): Collects a message for every item
+            that could not be turned into a Transaction; such items are
+            skipped, as get_transactions reports them as warnings instead of
+            raising. Defaults to None.
+
+        Returns
+        -------
+        Iterator[Transaction]: The transactions, in response order.
+
+        """
+        if options is None:
+            options = {}
+        options = {k: v for k, v in options.items() if k in ALLOWED_OPTIONS}
+
+        while True:
+            parser = JsonItemStream("data")
+            chunks = self.client.stream_get_request(
+                "json/transactions",
+                options,
+                deadline=deadline,
+                chunk_size=chunk_size,
+            )
+            streamed = 0
+            for chunk in chunks:
+                for item in parser.feed(chunk):
+                    streamed += 1
+                    transaction = (
+                        TransactionManager.build_streamed_transaction(
+                            item,
+                            warnings,
+                        )
+                    )
+                    if transaction is not None:
+                        yield transaction
+            for item in parser.close():
+                streamed += 1
+                transaction = TransactionManager.build_streamed_transaction(
+                    item,
+                    warnings,
+                )
+                if transaction is not None:
+                    yield transaction
+
+            after = TransactionManager.next_cursor(parser.envelope)
+            if not all_pages or not streamed or not after:
+                return
+            options = {**options, "after": after}
+
+    @staticmethod
+    def build_streamed_transaction(
+        item: dict,
+        warnings: Optional[MessageList] = None,
+    ) -> Optional[Transaction]:
+        """
+        Create a Transaction from a streamed ``data`` item.
+
+        Parameters
+        ----------
+        item (dict): The decoded item.
+        warnings (Optional[MessageList]): Collects a message when the item
+            is not a valid transaction. Defaults to None.
+
+        Returns
+        -------
+        Optional[Transaction]: The transaction, or None when the item is not
+            a valid transaction.
+
+        """
+        try:
+            return Transaction.from_dict(item)
+        except ValidationError:
+            if warnings is not None:
+                warnings.add_message(
+                    gen_could_not_created_msg("Streamed Transaction"),
+                )
+            return None
+
+    @staticmethod
+    def next_cursor(envelope: dict) -> Optional[str]:
+        """
+        Get the cursor of the next page from a listing response body.
+
+        Parameters
+        ----------
+        envelope (dict): The decoded response body, or its members other
+            than ``data``.
+
+        Returns
+        -------
+        Optional[str]: The ``after`` cursor, or None on the last page.
+
+        """
+        pager = envelope.get("pager") or {}
+        cursor = pager.get("cursor") or {}
+        return cursor.get("after") or pager.get("after")
+
+    @staticmethod
+    def build_transactions_response(
+        response: ApiResponse,
+    ) -> CustomApiResponse:
+        """
+        Create a custom API response containing a listing of transactions.
+
+        Parameters
+        ----------
+        response (ApiResponse): The original API response.
+
+        Returns
+        -------
+        CustomApiResponse: The response containing the list of transactions or warnings.
+
+        """
+        args: dict = {"data": None}
 
         try:
             args["data"] = ListingPager(
@@ -92,4 +236,4 @@ class TransactionManager(AbstractManager):
                 gen_could_not_created_msg("Listing Transaction"),
             )
 
-        return CustomApiResponse(**args)
+        return CustomApiResponse.from_api_response(response, **args)
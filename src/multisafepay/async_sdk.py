@@ -0,0 +1,399 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""MultiSafepay asyncio SDK module providing the awaitable SDK interface."""
+
+import importlib
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Optional, cast
+
+from multisafepay.transport import AsyncHTTPTransport
+from typing_extensions import Self
+
+from .client.async_client import AsyncClient
+from .client.circuit_breaker import CircuitBreaker
+from .client.credential_resolver import CredentialResolver
+from .client.metrics import MetricsRegistry
+from .client.middleware import AsyncMiddleware
+from .client.rate_limiter import RateLimiter
+from .client.response_cache import ResponseCache
+from .client.retry import RetryPolicy
+from .client.single_flight import SingleFlight
+from .util.json_codec import JsonCodec
+
+if TYPE_CHECKING:
+    from multisafepay.api.paths.auth.async_auth_manager import AsyncAuthManager
+    from multisafepay.api.paths.capture.async_capture_manager import (
+        AsyncCaptureManager,
+    )
+    from multisafepay.api.paths.categories.async_category_manager import (
+        AsyncCategoryManager,
+    )
+    from multisafepay.api.paths.gateways.async_gateway_manager import (
+        AsyncGatewayManager,
+    )
+    from multisafepay.api.paths.issuers.async_issuer_manager import (
+        AsyncIssuerManager,
+    )
+    from multisafepay.api.paths.me.async_me_manager import AsyncMeManager
+    from multisafepay.api.paths.orders.async_order_manager import (
+        AsyncOrderManager,
+    )
+    from multisafepay.api.paths.payment_methods.async_payment_method_manager import (
+        AsyncPaymentMethodManager,
+    )
+    from multisafepay.api.paths.recurring.async_recurring_manager import (
+        AsyncRecurringManager,
+    )
+    from multisafepay.api.paths.transactions.async_transaction_manager import (
+        AsyncTransactionManager,
+    )
+    from multisafepay.batch import AsyncBatch
+
+
+# Manager classes by name, imported when the manager is first used.
+_MANAGERS = {
+    "auth": (
+        "multisafepay.api.paths.auth.async_auth_manager",
+        "AsyncAuthManager",
+    ),
+    "capture": (
+        "multisafepay.api.paths.capture.async_capture_manager",
+        "AsyncCaptureManager",
+    ),
+    "category": (
+        "multisafepay.api.paths.categories.async_category_manager",
+        "AsyncCategoryManager",
+    ),
+    "gateway": (
+        "multisafepay.api.paths.gateways.async_gateway_manager",
+        "AsyncGatewayManager",
+    ),
+    "issuer": (
+        "multisafepay.api.paths.issuers.async_issuer_manager",
+        "AsyncIssuerManager",
+    ),
+    "me": (
+        "multisafepay.api.paths.me.async_me_manager",
+        "AsyncMeManager",
+    ),
+    "order": (
+        "multisafepay.api.paths.orders.async_order_manager",
+        "AsyncOrderManager",
+    ),
+    "payment_method": (
+        "multisafepay.api.paths.payment_methods.async_payment_method_manager",
+        "AsyncPaymentMethodManager",
+    ),
+    "recurring": (
+        "multisafepay.api.paths.recurring.async_recurring_manager",
+        "AsyncRecurringManager",
+    ),
+    "transaction": (
+        "multisafepay.api.paths.transactions.async_transaction_manager",
+        "AsyncTransactionManager",
+    ),
+}
+
+
+class AsyncSdk:
+    """
+    Asyncio SDK class for interacting with the MultiSafePay API.
+
+    Mirrors ``Sdk`` but hands out managers whose methods are awaitable. All
+    managers share one AsyncClient and therefore one connection pool, and
+    each is created on first use, then reused by later calls.
+    """
+
+    def __init__(
+        self: "AsyncSdk",
+        api_key: Optional[str] = None,
+        is_production: bool = False,
+        transport: Optional[AsyncHTTPTransport] = None,
+        locale: str = "en_US",
+        base_url: Optional[str] = None,
+        credential_resolver: Optional[CredentialResolver] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        response_cache: Optional[ResponseCache] = None,
+        lean_responses: bool = False,
+        json_codec: Optional[JsonCodec] = None,
+        middlewares: Optional[Sequence[AsyncMiddleware]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        record_timings: bool = False,
+    ) -> None:
+        """
+        Initialize the async SDK with the provided configuration.
+
+        Parameters
+        ----------
+        api_key : Optional[str]
+            The API key for authenticating with the MultiSafePay API.
+            Optional only when `credential_resolver` is provided.
+        is_production : bool
+            Flag indicating whether to use the production environment.
+        transport : Optional[AsyncHTTPTransport], optional
+            The async HTTP transport implementation to use for making requests.
+            If not provided, defaults to HttpxAsyncTransport, by default None.
+        locale : str, optional
+            The locale to use for requests, by default "en_US".
+        base_url : Optional[str], optional
+            Custom API base URL (dev-only guardrails apply), by default None.
+        credential_resolver : Optional[CredentialResolver], optional
+            Strategy for resolving API keys per auth scope, by default None.
+        retry_policy : Optional[RetryPolicy], optional
+            Policy deciding which failed requests are retried, by default None.
+        circuit_breaker : Optional[CircuitBreaker], optional
+            Breaker failing fast on unhealthy endpoint families, by default None.
+        rate_limiter : Optional[RateLimiter], optional
+            Limiter shaping the request rate per credential scope, by default None.
+        single_flight : Optional[SingleFlight], optional
+            Coalescer sharing one in-flight call between identical concurrent
+            GET requests, by default None.
+        response_cache : Optional[ResponseCache], optional
+            Cache of GET responses of reference-data endpoints, by default None.
+        lean_responses : bool, optional
+            Keep neither the response body bytes nor the request headers and
+            body on responses, by default False.
+        json_codec : Optional[JsonCodec], optional
+            Codec encoding request bodies and decoding responses, by default
+            None, which uses orjson when installed and the standard library
+            otherwise.
+        middlewares : Optional[Sequence[AsyncMiddleware]], optional
+            Middlewares wrapped around each transport call, outermost first,
+            by default None.
+        metrics : Optional[MetricsRegistry], optional
+            Registry recording the latency, errors, retries and bytes of
+            every call, by default None.
+        record_timings : bool, optional
+            Record the time spent per phase of every call, see
+            ApiResponse.get_timings(), by default False.
+
+        Raises
+        ------
+        ValueError: If no API key or CredentialResolver is provided.
+
+        """
+        self.client = AsyncClient(
+            api_key=api_key,
+            is_production=is_production,
+            transport=transport,
+            locale=locale,
+            base_url=base_url,
+            credential_resolver=credential_resolver,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            response_cache=response_cache,
+            lean_responses=lean_responses,
+            json_codec=json_codec,
+            middlewares=middlewares,
+            metrics=metrics,
+            record_timings=record_timings,
+        )
+        self._managers: dict[str, object] = {}
+        self._batch: Optional[AsyncBatch] = None
+
+    @property
+    def recurring_manager(self: "AsyncSdk") -> "AsyncRecurringManager":
+        """
+        The recurring manager, kept for backwards compatibility.
+
+        Returns
+        -------
+        AsyncRecurringManager
+            The recurring manager instance.
+
+        """
+        return self.get_recurring_manager()
+
+    def _get_manager(self: "AsyncSdk", name: str) -> object:
+        manager = self._managers.get(name)
+        if manager is None:
+            module, class_name = _MANAGERS[name]
+            manager_class = getattr(
+                importlib.import_module(module),
+                class_name,
+            )
+            # Managers keep no per-call state, so one instance per SDK is
+            # reused; setdefault keeps the first one if threads race here.
+            manager = self._managers.setdefault(
+                name,
+                manager_class(self.client),
+            )
+        return manager
+
+    def get_transaction_manager(self: "AsyncSdk") -> "AsyncTransactionManager":
+        """
+        Get the transaction manager.
+
+        Returns
+        -------
+        AsyncTransactionManager
+            The transaction manager instance.
+
+        """
+        return cast(
+            "AsyncTransactionManager",
+            self._get_manager("transaction"),
+        )
+
+    def get_gateway_manager(self: "AsyncSdk") -> "AsyncGatewayManager":
+        """
+        Get the gateway manager.
+
+        Returns
+        -------
+        AsyncGatewayManager
+            The gateway manager instance.
+
+        """
+        return cast("AsyncGatewayManager", self._get_manager("gateway"))
+
+    def get_payment_method_manager(
+        self: "AsyncSdk",
+    ) -> "AsyncPaymentMethodManager":
+        """
+        Get the payment method manager.
+
+        Returns
+        -------
+        AsyncPaymentMethodManager
+            The payment method manager instance.
+
+        """
+        return cast(
+            "AsyncPaymentMethodManager",
+            self._get_manager("payment_method"),
+        )
+
+    def get_issuer_manager(self: "AsyncSdk") -> "AsyncIssuerManager":
+        """
+        Get the issuer manager.
+
+        Returns
+        -------
+        AsyncIssuerManager
+            The issuer manager instance.
+
+        """
+        return cast("AsyncIssuerManager", self._get_manager("issuer"))
+
+    def get_recurring_manager(self: "AsyncSdk") -> "AsyncRecurringManager":
+        """
+        Get the recurring manager.
+
+        Returns
+        -------
+        AsyncRecurringManager
+            The recurring manager instance.
+
+        """
+        return cast("AsyncRecurringManager", self._get_manager("recurring"))
+
+    def get_auth_manager(self: "AsyncSdk") -> "AsyncAuthManager":
+        """
+        Get the auth manager.
+
+        Returns
+        -------
+        AsyncAuthManager
+            The auth manager instance.
+
+        """
+        return cast("AsyncAuthManager", self._get_manager("auth"))
+
+    def get_me_manager(self: "AsyncSdk") -> "AsyncMeManager":
+        """
+        Get the me manager.
+
+        Returns
+        -------
+        AsyncMeManager
+            The me manager instance.
+
+        """
+        return cast("AsyncMeManager", self._get_manager("me"))
+
+    def get_category_manager(self: "AsyncSdk") -> "AsyncCategoryManager":
+        """
+        Get the category manager.
+
+        Returns
+        -------
+        AsyncCategoryManager
+            The category manager instance.
+
+        """
+        return cast("AsyncCategoryManager", self._get_manager("category"))
+
+    def get_order_manager(self: "AsyncSdk") -> "AsyncOrderManager":
+        """
+        Get the order manager.
+
+        Returns
+        -------
+        AsyncOrderManager
+            The order manager instance.
+
+        """
+        return cast("AsyncOrderManager", self._get_manager("order"))
+
+    def get_capture_manager(self: "AsyncSdk") -> "AsyncCaptureManager":
+        """
+        Get the capture manager.
+
+        Returns
+        -------
+        AsyncCaptureManager
+            The capture manager instance.
+
+        """
+        return cast("AsyncCaptureManager", self._get_manager("capture"))
+
+    def batch(self: "AsyncSdk") -> "AsyncBatch":
+        """
+        Get the batch executor for fan-out calls.
+
+        Returns
+        -------
+        AsyncBatch
+            The batch executor instance, shared by all batches of this SDK.
+
+        """
+        if self._batch is None:
+            from multisafepay.batch import AsyncBatch
+
+            self._batch = AsyncBatch(self.client)
+        return self._batch
+
+    def get_client(self: "AsyncSdk") -> AsyncClient:
+        """
+        Get the client instance.
+
+        Returns
+        -------
+        AsyncClient
+            The client instance.
+
+        """
+        return self.client
+
+    async def aclose(self: "AsyncSdk") -> None:
+        """Close the underlying client and its transport."""
+        await self.client.aclose()
+
+    async def __aenter__(self: Self) -> Self:
+        """Support async context manager protocol."""
+        return self
+
+    async def __aexit__(self: "AsyncSdk", *args: object) -> None:
+        """Close the client when exiting context."""
+        await self.aclose()
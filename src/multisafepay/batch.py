@@ -0,0 +1,566 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Bounded-concurrency batch execution of fan-out API calls."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, TypeVar
+
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.client import Client
+from multisafepay.client.deadline import DeadlineLike
+from typing_extensions import Self
+
+T = TypeVar("T")
+ItemT = TypeVar("ItemT")
+
+
+@dataclass(frozen=True)
+class BatchItemResult(Generic[ItemT, T]):
+    """
+    Outcome of one call of a batch.
+
+    Attributes
+    ----------
+    item (ItemT): The input the call was made for.
+    value (Optional[T]): The result of the call, or None when it failed.
+    error (Optional[Exception]): The exception raised by the call, if any.
+    elapsed (float): Seconds the call took.
+
+    """
+
+    item: ItemT
+    value: Optional[T]
+    error: Optional[Exception]
+    elapsed: float
+
+    @property
+    def ok(self: "BatchItemResult") -> bool:
+        """
+        Whether the call succeeded.
+
+        Returns
+        -------
+        bool: True when the call returned without raising.
+
+        """
+        return self.error is None
+
+    def unwrap(self: "BatchItemResult[ItemT, T]") -> T:
+        """
+        Get the result of the call, re-raising its exception if it failed.
+
+        Returns
+        -------
+        T: The result of the call.
+
+        Raises
+        ------
+        Exception: The exception raised by the call.
+
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """
+    Throughput counters of a finished batch.
+
+    Attributes
+    ----------
+    total (int): Number of calls made.
+    succeeded (int): Calls that returned a result.
+    failed (int): Calls that raised an exception.
+    elapsed (float): Wall-clock seconds the batch took.
+    max_concurrency (int): Largest number of calls of the batch observed
+        running at once, at most the ``max_concurrency`` it was run with.
+
+    """
+
+    total: int
+    succeeded: int
+    failed: int
+    elapsed: float
+    max_concurrency: int
+
+    @property
+    def throughput(self: "BatchStats") -> float:
+        """
+        Calls completed per second.
+
+        Returns
+        -------
+        float: The throughput, or 0.0 for an empty batch.
+
+        """
+        if self.total == 0 or self.elapsed <= 0:
+            return 0.0
+        return self.total / self.elapsed
+
+
+class BatchResult(Generic[ItemT, T]):
+    """
+    Per-item outcomes of a batch, in input order, and its stats.
+
+    Iterating, indexing and ``len()`` work on the item results.
+
+    Attributes
+    ----------
+    results (list[BatchItemResult]): One outcome per input, in input order.
+    stats (BatchStats): Throughput counters of the batch.
+
+    """
+
+    def __init__(
+        self: "BatchResult[ItemT, T]",
+        results: list[BatchItemResult[ItemT, T]],
+        stats: BatchStats,
+    ) -> None:
+        """
+        Initialize the BatchResult.
+
+        Parameters
+        ----------
+        results (list[BatchItemResult]): One outcome per input, in input order.
+        stats (BatchStats): Throughput counters of the batch.
+
+        """
+        self.results = results
+        self.stats = stats
+
+    def __iter__(
+        self: "BatchResult[ItemT, T]",
+    ) -> Iterator[BatchItemResult[ItemT, T]]:
+        """Iterate over the item results in input order."""
+        return iter(self.results)
+
+    def __len__(self: "BatchResult") -> int:
+        """Return the number of item results."""
+        return len(self.results)
+
+    def __getitem__(
+        self: "BatchResult[ItemT, T]",
+        index: int,
+    ) -> BatchItemResult[ItemT, T]:
+        """Return the item result at `index`."""
+        return self.results[index]
+
+    def values(self: "BatchResult[ItemT, T]") -> list[T]:
+        """
+        Get the results of the successful calls.
+
+        Returns
+        -------
+        list[T]: The results, in input order.
+
+        """
+        return [r.value for r in self.results if r.error is None]  # type: ignore[misc]
+
+    def errors(
+        self: "BatchResult[ItemT, T]",
+    ) -> list[tuple[int, ItemT, Exception]]:
+        """
+        Get the exceptions of the failed calls.
+
+        Returns
+        -------
+        list[tuple[int, ItemT, Exception]]: The input index, input item and
+            exception of every failed call, in input order. Items need not
+            be unique nor hashable.
+
+        """
+        return [
+            (index, r.item, r.error)
+            for index, r in enumerate(self.results)
+            if r.error is not None
+        ]
+
+
+class _InFlight:
+    """Counts the running calls of one batch and their peak."""
+
+    __slots__ = ("_lock", "current", "peak")
+
+    def __init__(self: "_InFlight") -> None:
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self: "_InFlight") -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self: "_InFlight", *args: object) -> None:
+        with self._lock:
+            self.current -= 1
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+
+
+def _build_result(
+    results: list[BatchItemResult[ItemT, T]],
+    started: float,
+    in_flight: _InFlight,
+) -> BatchResult[ItemT, T]:
+    failed = sum(1 for r in results if r.error is not None)
+    return BatchResult(
+        results,
+        BatchStats(
+            total=len(results),
+            succeeded=len(results) - failed,
+            failed=failed,
+            elapsed=time.perf_counter() - started,
+            max_concurrency=in_flight.peak,
+        ),
+    )
+
+
+class Batch:
+    """
+    Fan out API calls over a thread pool shared by all batches of an Sdk.
+
+    Every batch keeps at most ``max_concurrency`` calls in flight, returns
+    one outcome per input in input order and never aborts on a failed
+    call. All calls go through the Sdk's Client, so they share its
+    transport and connection pool; size the transport pool to
+    ``max_concurrency`` to avoid opening extra connections.
+
+    Attributes
+    ----------
+    DEFAULT_MAX_WORKERS (int): Default size of the thread pool.
+    DEFAULT_MAX_CONCURRENCY (int): Default number of calls in flight per batch.
+    client (Client): The client the calls are made with.
+    max_workers (int): Size of the thread pool, the upper bound of max_concurrency.
+
+    """
+
+    DEFAULT_MAX_WORKERS = 32
+    DEFAULT_MAX_CONCURRENCY = 10
+
+    def __init__(
+        self: "Batch",
+        client: Client,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """
+        Initialize the Batch.
+
+        Parameters
+        ----------
+        client (Client): The client the calls are made with.
+        max_workers (int): Size of the thread pool, by default 32. The pool
+            is started on the first batch.
+
+        Raises
+        ------
+        ValueError: If max_workers is smaller than 1.
+
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.client = client
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self: "Batch") -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="multisafepay-batch",
+                )
+            return self._pool
+
+    @staticmethod
+    def _call(
+        fn: Callable[[ItemT], T],
+        item: ItemT,
+        in_flight: _InFlight,
+    ) -> BatchItemResult[ItemT, T]:
+        started = time.perf_counter()
+        try:
+            with in_flight:
+                value = fn(item)
+        except Exception as exc:  # noqa: BLE001
+            return BatchItemResult(
+                item,
+                None,
+                exc,
+                time.perf_counter() - started,
+            )
+        return BatchItemResult(
+            item,
+            value,
+            None,
+            time.perf_counter() - started,
+        )
+
+    def map(
+        self: "Batch",
+        fn: Callable[[ItemT], T],
+        items: Iterable[ItemT],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResult[ItemT, T]:
+        """
+        Call `fn` for every item with bounded concurrency.
+
+        Calls are submitted as earlier ones finish, so a batch of any size
+        holds at most ``max_concurrency`` pending calls.
+
+        Parameters
+        ----------
+        fn (Callable[[ItemT], T]): The call to make per item.
+        items (Iterable[ItemT]): The inputs.
+        max_concurrency (int): Maximum number of calls in flight, by default 10.
+
+        Returns
+        -------
+        BatchResult[ItemT, T]: One outcome per item, in input order, and stats.
+
+        Raises
+        ------
+        ValueError: If max_concurrency is smaller than 1 or larger than max_workers.
+
+        """
+        _check_concurrency(max_concurrency)
+        if max_concurrency > self.max_workers:
+            raise ValueError(
+                f"max_concurrency must not exceed max_workers ({self.max_workers}).",
+            )
+        pool = self._get_pool()
+        inputs = list(items)
+        results: list[Optional[BatchItemResult[ItemT, T]]] = [None] * len(
+            inputs,
+        )
+        pending: dict[Future, int] = {}
+        in_flight = _InFlight()
+        started = time.perf_counter()
+        for index, item in enumerate(inputs):
+            if len(pending) >= max_concurrency:
+                self._collect(pending, results)
+            pending[pool.submit(self._call, fn, item, in_flight)] = index
+        while pending:
+            self._collect(pending, results)
+        return _build_result(
+            results,  # type: ignore[arg-type]
+            started,
+            in_flight,
+        )
+
+    @staticmethod
+    def _collect(
+        pending: dict[Future, int],
+        results: list,
+    ) -> None:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[pending.pop(future)] = future.result()
+
+    def get_orders(
+        self: "Batch",
+        order_ids: Iterable[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> BatchResult[str, CustomApiResponse]:
+        """
+        Retrieve many orders by their IDs.
+
+        Parameters
+        ----------
+        order_ids (Iterable[str]): The IDs of the orders to retrieve.
+        max_concurrency (int): Maximum number of requests in flight, by default 10.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds
+            per order, or a Deadline shared by the whole batch. Defaults to None.
+
+        Returns
+        -------
+        BatchResult[str, CustomApiResponse]: One outcome per order ID, in
+            input order, and stats.
+
+        """
+        # Imported here, so creating an Sdk does not import the managers.
+        from multisafepay.api.paths.orders.order_manager import OrderManager
+
+        manager = OrderManager(self.client)
+        return self.map(
+            lambda order_id: manager.get(order_id, deadline=deadline),
+            order_ids,
+            max_concurrency,
+        )
+
+    def close(self: "Batch") -> None:
+        """Shut down the thread pool once running calls have finished."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __enter__(self: Self) -> Self:
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self: "Batch", *args: object) -> None:
+        """Shut down the thread pool when exiting context."""
+        self.close()
+
+
+class AsyncBatch:
+    """
+    Fan out awaitable API calls on the running event loop.
+
+    Every batch runs at most ``max_concurrency`` calls at once, returns one
+    outcome per input in input order and never aborts on a failed call.
+    All calls go through the AsyncSdk's AsyncClient and share its
+    connection pool.
+
+    Attributes
+    ----------
+    DEFAULT_MAX_CONCURRENCY (int): Default number of calls in flight per batch.
+    client (AsyncClient): The client the calls are made with.
+
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 10
+
+    def __init__(self: "AsyncBatch", client: AsyncClient) -> None:
+        """
+        Initialize the AsyncBatch.
+
+        Parameters
+        ----------
+        client (AsyncClient): The client the calls are made with.
+
+        """
+        self.client = client
+
+    @staticmethod
+    async def _call(
+        fn: Callable[[ItemT], Awaitable[T]],
+        item: ItemT,
+        in_flight: _InFlight,
+    ) -> BatchItemResult[ItemT, T]:
+        started = time.perf_counter()
+        try:
+            with in_flight:
+                value = await fn(item)
+        except Exception as exc:  # noqa: BLE001
+            return BatchItemResult(
+                item,
+                None,
+                exc,
+                time.perf_counter() - started,
+            )
+        return BatchItemResult(
+            item,
+            value,
+            None,
+            time.perf_counter() - started,
+        )
+
+    async def map(
+        self: "AsyncBatch",
+        fn: Callable[[ItemT], Awaitable[T]],
+        items: Iterable[ItemT],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> BatchResult[ItemT, T]:
+        """
+        Await `fn` for every item with bounded concurrency.
+
+        A fixed number of worker coroutines take the next item as they
+        finish one, so a batch of any size holds at most
+        ``max_concurrency`` pending calls.
+
+        Parameters
+        ----------
+        fn (Callable[[ItemT], Awaitable[T]]): The call to make per item.
+        items (Iterable[ItemT]): The inputs.
+        max_concurrency (int): Maximum number of calls in flight, by default 10.
+
+        Returns
+        -------
+        BatchResult[ItemT, T]: One outcome per item, in input order, and stats.
+
+        Raises
+        ------
+        ValueError: If max_concurrency is smaller than 1.
+
+        """
+        _check_concurrency(max_concurrency)
+        inputs = list(items)
+        results: list[Optional[BatchItemResult[ItemT, T]]] = [None] * len(
+            inputs,
+        )
+        next_items = iter(enumerate(inputs))
+        in_flight = _InFlight()
+
+        async def worker() -> None:
+            for index, item in next_items:
+                results[index] = await self._call(fn, item, in_flight)
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(worker() for _ in range(min(max_concurrency, len(inputs)))),
+        )
+        return _build_result(
+            results,  # type: ignore[arg-type]
+            started,
+            in_flight,
+        )
+
+    async def get_orders(
+        self: "AsyncBatch",
+        order_ids: Iterable[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> BatchResult[str, CustomApiResponse]:
+        """
+        Retrieve many orders by their IDs.
+
+        Parameters
+        ----------
+        order_ids (Iterable[str]): The IDs of the orders to retrieve.
+        max_concurrency (int): Maximum number of requests in flight, by default 10.
+        deadline (Optional[Union[Deadline, float]]): Time budget in seconds
+            per order, or a Deadline shared by the whole batch. Defaults to None.
+
+        Returns
+        -------
+        BatchResult[str, CustomApiResponse]: One outcome per order ID, in
+            input order, and stats.
+
+        """
+        from multisafepay.api.paths.orders.async_order_manager import (
+            AsyncOrderManager,
+        )
+
+        manager = AsyncOrderManager(self.client)
+        return await self.map(
+            lambda order_id: manager.get(order_id, deadline=deadline),
+            order_ids,
+            max_concurrency,
+        )
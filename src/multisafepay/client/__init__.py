@@ -1,11 +1,37 @@
 """HTTP client components for API communication and authentication."""
 
 from multisafepay.client.api_key import ApiKey
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.circuit_breaker import CircuitBreaker
 from multisafepay.client.client import Client
 from multisafepay.client.credential_resolver import ScopedCredentialResolver
+from multisafepay.client.deadline import Deadline
+from multisafepay.client.metrics import EndpointMetrics, MetricsRegistry
+from multisafepay.client.middleware import (
+    AsyncMiddleware,
+    Middleware,
+    TransportRequest,
+)
+from multisafepay.client.rate_limiter import RateLimiter
+from multisafepay.client.response_cache import CacheStats, ResponseCache
+from multisafepay.client.retry import RetryPolicy
+from multisafepay.client.single_flight import SingleFlight
 
 __all__ = [
     "ApiKey",
+    "AsyncClient",
+    "AsyncMiddleware",
+    "CacheStats",
+    "CircuitBreaker",
     "Client",
+    "Deadline",
+    "EndpointMetrics",
+    "MetricsRegistry",
+    "Middleware",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
     "ScopedCredentialResolver",
+    "SingleFlight",
+    "TransportRequest",
 ]
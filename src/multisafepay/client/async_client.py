@@ -0,0 +1,637 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asyncio HTTP client module for making non-blocking API requests."""
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Optional, Union
+
+from multisafepay.api.base.response.api_response import ApiResponse
+from multisafepay.transport import AsyncHTTPTransport, HttpxAsyncTransport
+from multisafepay.transport.http_transport import HTTPResponse
+from multisafepay.util.json_codec import JsonCodec
+from typing_extensions import Self
+
+from .base_client import BaseClient, RequestState
+from .circuit_breaker import CircuitBreaker
+from .credential_resolver import AuthScope, CredentialResolver
+from .deadline import Deadline, DeadlineLike
+from .metrics import MetricsRegistry
+from .middleware import AsyncMiddleware, TransportRequest, build_chain
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
+
+
+class AsyncClient(BaseClient):
+    """
+    Asyncio client for interacting with the MultiSafepay API.
+
+    Mirrors ``Client`` but every request method is a coroutine, so calls can
+    be awaited from aiohttp/FastAPI services without a thread pool.
+
+    Attributes
+    ----------
+    LIVE_URL (str): The live API URL.
+    TEST_URL (str): The test API URL.
+    METHOD_POST (str): HTTP POST method.
+    METHOD_GET (str): HTTP GET method.
+    METHOD_PATCH (str): HTTP PATCH method.
+    METHOD_DELETE (str): HTTP DELETE method.
+
+    """
+
+    def __init__(
+        self: "AsyncClient",
+        api_key: Optional[str] = None,
+        is_production: bool = False,
+        transport: Optional[AsyncHTTPTransport] = None,
+        locale: str = "en_US",
+        base_url: Optional[str] = None,
+        credential_resolver: Optional[CredentialResolver] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        response_cache: Optional[ResponseCache] = None,
+        lean_responses: bool = False,
+        json_codec: Optional[JsonCodec] = None,
+        middlewares: Optional[Sequence[AsyncMiddleware]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        record_timings: bool = False,
+    ) -> None:
+        """
+        Initialize the AsyncClient.
+
+        Parameters
+        ----------
+        api_key (Optional[str]): The API key for authentication.
+            Optional only when `credential_resolver` is provided.
+        is_production (bool): Flag indicating if the client is in production mode.
+        transport (Optional[AsyncHTTPTransport], optional): Custom async HTTP
+            transport implementation. Defaults to HttpxAsyncTransport if not provided.
+        locale (str, optional): Locale for the requests. Defaults to "en_US".
+        base_url (Optional[str], optional): Custom API base URL.
+            Only allowed when running with `MSP_SDK_BUILD_PROFILE=dev`
+            and `MSP_SDK_ALLOW_CUSTOM_BASE_URL=1`.
+        credential_resolver (Optional[CredentialResolver], optional):
+            Resolver used to derive API keys by auth scope.
+        retry_policy (Optional[RetryPolicy], optional): Policy deciding which
+            failed requests are retried. Defaults to None (no retries).
+        circuit_breaker (Optional[CircuitBreaker], optional): Breaker failing
+            fast on unhealthy endpoint families. Defaults to None.
+        rate_limiter (Optional[RateLimiter], optional): Limiter shaping the
+            request rate per credential scope. Defaults to None.
+        single_flight (Optional[SingleFlight], optional): Coalescer sharing one
+            in-flight call between identical concurrent GET requests.
+            Defaults to None.
+        response_cache (Optional[ResponseCache], optional): Cache of GET
+            responses of reference-data endpoints. Defaults to None.
+        lean_responses (bool, optional): Keep neither the response body bytes
+            nor the request headers and body on responses. Defaults to False.
+        json_codec (Optional[JsonCodec], optional): Codec encoding request
+            bodies and decoding responses. Defaults to None, which uses orjson
+            when installed and the standard library otherwise.
+        middlewares (Optional[Sequence[AsyncMiddleware]], optional):
+            Middlewares wrapped around each transport call, outermost first.
+            Defaults to None.
+        metrics (Optional[MetricsRegistry], optional): Registry recording the
+            latency, errors, retries and bytes of every call. Defaults to None.
+        record_timings (bool, optional): Record the time spent per phase of
+            every call, see ApiResponse.get_timings(). Defaults to False.
+
+        Raises
+        ------
+        ValueError: If no API key or CredentialResolver is provided.
+
+        """
+        super().__init__(
+            api_key=api_key,
+            is_production=is_production,
+            locale=locale,
+            base_url=base_url,
+            credential_resolver=credential_resolver,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            response_cache=response_cache,
+            lean_responses=lean_responses,
+            json_codec=json_codec,
+            metrics=metrics,
+            record_timings=record_timings,
+        )
+        self.transport = transport or HttpxAsyncTransport()
+        self.middlewares = tuple(middlewares or ())
+        self._middleware_chain = build_chain(
+            self.middlewares,
+            self._send_transport_request,
+        )
+        self._refresh_tasks: set[asyncio.Future] = set()
+
+    async def create_get_request(
+        self: "AsyncClient",
+        endpoint: str,
+        params: dict[str, Any] = None,
+        context: Optional[dict[str, Any]] = None,
+        auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> ApiResponse:
+        """
+        Create a GET request.
+
+        Parameters
+        ----------
+        endpoint (str): The API endpoint.
+        params (Dict[str, Any], optional): Query parameters. Defaults to None.
+        context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, as a Deadline or in seconds. Defaults to None (no deadline).
+
+        Returns
+        -------
+        ApiResponse: The API response.
+
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before a response arrives.
+
+        """
+        url = self._build_url(endpoint, params)
+        return await self._create_request(
+            self.METHOD_GET,
+            url,
+            context=context,
+            auth_scope=auth_scope,
+            deadline=Deadline.coerce(deadline),
+            endpoint=endpoint,
+        )
+
+    async def create_post_request(
+        self: "AsyncClient",
+        endpoint: str,
+        params: dict[str, Any] = None,
+        request_body: Optional[Union[str, bytes]] = None,
+        context: Optional[dict[str, Any]] = None,
+        auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> ApiResponse:
+        """
+        Create a POST request.
+
+        Parameters
+        ----------
+        endpoint (str): The API endpoint.
+        params (Dict[str, Any], optional): Query parameters. Defaults to None.
+        request_body (Optional[Union[str, bytes]], optional): The request body.
+            Defaults to None.
+        context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, as a Deadline or in seconds. Defaults to None (no deadline).
+        idempotency_key (Optional[str], optional): Idempotency key that makes the
+            request safe to retry. Defaults to None.
+
+        Returns
+        -------
+        ApiResponse: The API response.
+
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before a response arrives.
+
+        """
+        url = self._build_url(endpoint, params)
+        return await self._create_request(
+            self.METHOD_POST,
+            url,
+            request_body=request_body,
+            context=context,
+            auth_scope=auth_scope,
+            deadline=Deadline.coerce(deadline),
+            endpoint=endpoint,
+            idempotency_key=idempotency_key,
+        )
+
+    async def create_patch_request(
+        self: "AsyncClient",
+        endpoint: str,
+        params: dict[str, Any] = None,
+        request_body: Optional[Union[str, bytes]] = None,
+        context: Optional[dict[str, Any]] = None,
+        auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> ApiResponse:
+        """
+        Create a PATCH request.
+
+        Parameters
+        ----------
+        endpoint (str): The API endpoint.
+        params (Dict[str, Any], optional): Query parameters. Defaults to None.
+        request_body (Optional[Union[str, bytes]], optional): The request body.
+            Defaults to None.
+        context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, as a Deadline or in seconds. Defaults to None (no deadline).
+        idempotency_key (Optional[str], optional): Idempotency key that makes the
+            request safe to retry. Defaults to None.
+
+        Returns
+        -------
+        ApiResponse: The API response.
+
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before a response arrives.
+
+        """
+        url = self._build_url(endpoint, params)
+        return await self._create_request(
+            self.METHOD_PATCH,
+            url,
+            request_body=request_body,
+            context=context,
+            auth_scope=auth_scope,
+            deadline=Deadline.coerce(deadline),
+            endpoint=endpoint,
+            idempotency_key=idempotency_key,
+        )
+
+    async def create_delete_request(
+        self: "AsyncClient",
+        endpoint: str,
+        params: dict[str, Any] = None,
+        context: Optional[dict[str, Any]] = None,
+        auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
+    ) -> ApiResponse:
+        """
+        Create a DELETE request.
+
+        Parameters
+        ----------
+        endpoint (str): The API endpoint.
+        params (Dict[str, Any], optional): Query parameters. Defaults to None.
+        context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, as a Deadline or in seconds. Defaults to None (no deadline).
+
+        Returns
+        -------
+        ApiResponse: The API response.
+
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before a response arrives.
+
+        """
+        url = self._build_url(endpoint, params)
+        return await self._create_request(
+            self.METHOD_DELETE,
+            url,
+            context=context,
+            auth_scope=auth_scope,
+            deadline=Deadline.coerce(deadline),
+            endpoint=endpoint,
+        )
+
+    async def stream_get_request(
+        self: "AsyncClient",
+        endpoint: str,
+        params: dict[str, Any] = None,
+        auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
+        chunk_size: int = BaseClient.DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Send a GET request and stream its response body.
+
+        The request is sent, retried and checked for error statuses when
+        awaited; the body is then read chunk by chunk as the returned async
+        iterator is consumed, without decoding it. The response cache and
+        single-flight coalescing do not apply to streamed requests.
+
+        Parameters
+        ----------
+        endpoint (str): The API endpoint.
+        params (Dict[str, Any], optional): Query parameters. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, including reading the body. Defaults to None (no deadline).
+        chunk_size (int, optional): Maximum number of bytes per chunk.
+            Defaults to 64 KiB.
+
+        Returns
+        -------
+        AsyncIterator[bytes]: The body chunks. The response is closed once
+            the iterator is exhausted or closed.
+
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before or while
+            the body is read.
+
+        """
+        url = self._build_url(endpoint, params)
+        state = self._prepare_request(
+            self.METHOD_GET,
+            url,
+            None,
+            auth_scope,
+            Deadline.coerce(deadline),
+            None,
+            endpoint,
+        )
+        state.stream = True
+        started = self._start_call()
+        response = None
+        try:
+            response = await self._send_with_retries(state)
+            self._raise_for_status(response, state.retries)
+        except Exception:
+            self._record_call(state, started, response, error=True)
+            if response is not None:
+                await self._aclose_response(response)
+            raise
+        self._record_call(state, started, response)
+        return self._stream_body(response, state.deadline, chunk_size)
+
+    async def _stream_body(
+        self: "AsyncClient",
+        response: HTTPResponse,
+        deadline: Optional[Deadline],
+        chunk_size: int,
+    ) -> AsyncIterator[bytes]:
+        try:
+            aiter_bytes = getattr(response, "aiter_bytes", None)
+            if aiter_bytes is None:
+                # The transport cannot stream; the body is already decoded.
+                yield self.json_codec.dumps(response.json())
+                return
+            async for chunk in aiter_bytes(chunk_size):
+                if deadline is not None:
+                    deadline.check()
+                yield chunk
+        finally:
+            await self._aclose_response(response)
+
+    async def _aclose_response(
+        self: "AsyncClient",
+        response: HTTPResponse,
+    ) -> None:
+        aclose = getattr(response, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        else:
+            self._close_response(response)
+
+    async def _create_request(
+        self: "AsyncClient",
+        method: str,
+        url: str,
+        request_body: Optional[Union[str, bytes]] = None,
+        context: Optional[dict[str, Any]] = None,
+        auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+        endpoint: Optional[str] = None,
+    ) -> ApiResponse:
+        """
+        Create and send an HTTP request without blocking the event loop.
+
+        Parameters
+        ----------
+        method (str): The HTTP method.
+        url (str): The full URL.
+        request_body (Optional[Union[str, bytes]], optional): The request body.
+            Defaults to None.
+        context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Deadline], optional): Deadline bounding the transport
+            timeout and the retries.
+        idempotency_key (Optional[str], optional): Idempotency key sent with the
+            request; makes POST and PATCH requests eligible for retries.
+        endpoint (Optional[str], optional): The API endpoint, used to select
+            the circuit of the circuit breaker.
+
+        Returns
+        -------
+        ApiResponse: The API response.
+
+        """
+        state = self._prepare_request(
+            method,
+            url,
+            request_body,
+            auth_scope,
+            deadline,
+            idempotency_key,
+            endpoint,
+        )
+        cache_ttl = self._cache_ttl(state, endpoint)
+        if cache_ttl is None:
+            return await self._fetch(state, context)
+        return await self._fetch_cached(state, context, endpoint, cache_ttl)
+
+    async def _fetch(
+        self: "AsyncClient",
+        state: RequestState,
+        context: Optional[dict[str, Any]],
+    ) -> ApiResponse:
+        if not self._coalesces(state):
+            return await self._execute(state, context)
+        response, shared = await self.single_flight.do_async(
+            self._request_key(state),
+            lambda: self._execute(state, context),
+            state.deadline,
+        )
+        if shared:
+            return self._copy_response(response, context, coalesced=True)
+        # Followers may still copy the shared response after it is returned
+        # here, so the leader gets its own copy to change as it likes.
+        return self._detach(response)
+
+    async def _fetch_cached(
+        self: "AsyncClient",
+        state: RequestState,
+        context: Optional[dict[str, Any]],
+        endpoint: str,
+        ttl: float,
+    ) -> ApiResponse:
+        cached = self.response_cache.get(self._request_key(state))
+        if cached is None:
+            response = await self._fetch(state, context)
+            self._store_in_cache(state, endpoint, response, ttl)
+            return response
+        response, refresh = cached
+        if refresh:
+            task = asyncio.ensure_future(
+                self._refresh_cache(self._refresh_state(state), endpoint, ttl),
+            )
+            # Hold a reference so the task is not garbage collected early.
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        return self._copy_response(response, context, cached=True)
+
+    async def _refresh_cache(
+        self: "AsyncClient",
+        state: RequestState,
+        endpoint: str,
+        ttl: float,
+    ) -> None:
+        try:
+            response = await self._execute(state, None)
+        except Exception:  # noqa: BLE001
+            # Keep serving the stale entry; the next stale hit tries again.
+            self.response_cache.refresh_failed(self._request_key(state))
+            return
+        self._store_in_cache(state, endpoint, response, ttl)
+
+    async def _execute(
+        self: "AsyncClient",
+        state: RequestState,
+        context: Optional[dict[str, Any]],
+    ) -> ApiResponse:
+        started = self._start_call()
+        response = None
+        try:
+            response = await self._send_with_retries(state)
+            self._raise_for_status(response, state.retries)
+            api_response = self._build_api_response(response, state, context)
+        except Exception:
+            self._record_call(state, started, response, error=True)
+            raise
+        self._record_call(state, started, response)
+        return api_response
+
+    async def _send_with_retries(
+        self: "AsyncClient",
+        state: RequestState,
+    ) -> HTTPResponse:
+        """
+        Send the attempts of a call until one is final.
+
+        Parameters
+        ----------
+        state (RequestState): The state of the call.
+
+        Returns
+        -------
+        HTTPResponse: The last transport response.
+
+        """
+        while True:
+            await self._wait_for_rate_limit(state)
+            transport_kwargs = self._build_transport_kwargs(
+                state.deadline,
+                state.stream,
+            )
+            self._before_attempt(state.circuit_key)
+            try:
+                response = await self._send(state, transport_kwargs)
+            except Exception as e:
+                if self._deadline_caused(state.deadline, e):
+                    # The caller's own budget ran out, which says nothing
+                    # about the health of the endpoint.
+                    self._release_attempt(state.circuit_key)
+                    self._check_deadline_after_error(state.deadline, e)
+                    raise
+                self._record_attempt(state.circuit_key, error=e)
+                delay = self._plan_retry(state, error=e)
+                if delay is None:
+                    raise
+            except BaseException:
+                self._release_attempt(state.circuit_key)
+                raise
+            else:
+                self._record_attempt(state.circuit_key, response=response)
+                delay = self._plan_retry(state, response=response)
+                if delay is None:
+                    return response
+                if state.stream:
+                    await self._aclose_response(response)
+            await asyncio.sleep(delay)
+            self._count_retry(state, delay)
+
+    async def _wait_for_rate_limit(
+        self: "AsyncClient",
+        state: RequestState,
+    ) -> None:
+        if self.rate_limiter is not None and state.rate_limit_key is not None:
+            state.rate_limit_wait += await self.rate_limiter.acquire_async(
+                state.rate_limit_key,
+                state.deadline,
+            )
+
+    async def _send(
+        self: "AsyncClient",
+        state: RequestState,
+        transport_kwargs: dict[str, Any],
+    ) -> HTTPResponse:
+        started = self._start_phase(state)
+        # Without middlewares, skip building a TransportRequest per attempt.
+        if not self.middlewares:
+            pending = self.transport.request(
+                method=state.method,
+                url=state.url,
+                headers=state.headers,
+                data=state.body,
+                **transport_kwargs,
+            )
+        else:
+            pending = self._middleware_chain(
+                self._transport_request(state, transport_kwargs),
+            )
+        try:
+            # wait_for bounds the whole exchange, not just each socket read.
+            return await asyncio.wait_for(
+                pending,
+                timeout=transport_kwargs.get("timeout"),
+            )
+        except Exception as e:
+            # A timeout of the transport itself is retried like any other
+            # error unless the budget of the call is spent.
+            self._check_deadline_after_error(state.deadline, e)
+            raise
+        finally:
+            self._end_phase(state, "send", started)
+
+    async def _send_transport_request(
+        self: "AsyncClient",
+        request: TransportRequest,
+    ) -> HTTPResponse:
+        return await self.transport.request(
+            method=request.method,
+            url=request.url,
+            headers=request.headers,
+            data=request.body,
+            **request.options,
+        )
+
+    async def aclose(self: "AsyncClient") -> None:
+        """Cancel pending cache refreshes and close the underlying transport."""
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        aclose = getattr(self.transport, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def __aenter__(self: Self) -> Self:
+        """Support async context manager protocol."""
+        return self
+
+    async def __aexit__(self: "AsyncClient", *args: object) -> None:
+        """Close the transport when exiting context."""
+        await self.aclose()
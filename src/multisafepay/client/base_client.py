@@ -0,0 +1,918 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Transport-agnostic client base shared by the sync and async clients."""
+
+import copy
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Optional, Union
+from urllib.parse import urlencode, urlparse
+
+from multisafepay.api.base.response.api_response import ApiResponse
+from multisafepay.transport.http_transport import HTTPResponse
+from multisafepay.util.json_codec import JsonCodec, default_json_codec
+
+from ..exception.api import ApiException
+from ..exception.deadline_exceeded import DeadlineExceededException
+from .api_key import ApiKey
+from .circuit_breaker import CircuitBreaker
+from .credential_resolver import (
+    AuthScope,
+    CredentialResolver,
+    ScopedCredentialResolver,
+)
+from .deadline import Deadline
+from .metrics import MetricsRegistry
+from .middleware import TransportRequest
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry import IDEMPOTENCY_KEY_HEADER, RetryPolicy
+from .single_flight import SingleFlight
+
+
+@lru_cache(maxsize=512)
+def _encode_query(items: tuple[tuple[str, Any], ...]) -> str:
+    # Most calls repeat the same few queries, e.g. just the locale.
+    return urlencode(items)
+
+
+@dataclass
+class RequestState:
+    """
+    Per-call request data shared by every attempt of a call.
+
+    Attributes
+    ----------
+    method (str): The HTTP method.
+    url (str): The full URL.
+    headers (dict[str, str]): The request headers.
+    body (Optional[Union[str, bytes]]): The request body.
+    deadline (Optional[Deadline]): The deadline of the call, if any.
+    circuit_key (Optional[str]): The circuit breaker key, if breaking is enabled.
+    rate_limit_key (Optional[str]): The rate limiter key, if limiting is enabled.
+    retries (int): Number of retries performed so far.
+    retry_delay (float): Total seconds spent waiting between attempts.
+    rate_limit_wait (float): Total seconds spent waiting for the rate limiter.
+    stream (bool): Whether the response body is streamed instead of decoded.
+    endpoint (Optional[str]): The API endpoint, used to group metrics.
+    timings (Optional[dict[str, float]]): Seconds spent per phase, if
+        timings are recorded.
+
+    """
+
+    method: str
+    url: str
+    headers: dict[str, str]
+    body: Optional[Union[str, bytes]] = None
+    deadline: Optional[Deadline] = None
+    circuit_key: Optional[str] = None
+    rate_limit_key: Optional[str] = None
+    retries: int = 0
+    retry_delay: float = 0.0
+    rate_limit_wait: float = 0.0
+    stream: bool = False
+    endpoint: Optional[str] = None
+    timings: Optional[dict[str, float]] = None
+
+
+class BaseClient:
+    """
+    Shared configuration and request helpers for MultiSafepay API clients.
+
+    This class holds everything that does not depend on how the request is
+    sent: base URL resolution, URL building, API key resolution and the
+    conversion of transport responses into ApiResponse objects.
+
+    Attributes
+    ----------
+    LIVE_URL (str): The live API URL.
+    TEST_URL (str): The test API URL.
+    METHOD_POST (str): HTTP POST method.
+    METHOD_GET (str): HTTP GET method.
+    METHOD_PATCH (str): HTTP PATCH method.
+    METHOD_DELETE (str): HTTP DELETE method.
+    MAX_HEADER_TEMPLATES (int): Number of credentials whose headers are kept.
+
+    """
+
+    LIVE_URL = "https://api.multisafepay.com/v1/"
+    TEST_URL = "https://testapi.multisafepay.com/v1/"
+    BUILD_PROFILE_ENV = "MSP_SDK_BUILD_PROFILE"
+    CUSTOM_BASE_URL_ENV = "MSP_SDK_CUSTOM_BASE_URL"
+    ALLOW_CUSTOM_BASE_URL_ENV = "MSP_SDK_ALLOW_CUSTOM_BASE_URL"
+
+    METHOD_POST = "POST"
+    METHOD_GET = "GET"
+    METHOD_PATCH = "PATCH"
+    METHOD_DELETE = "DELETE"
+
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+    MAX_HEADER_TEMPLATES = 64
+
+    def __init__(
+        self: "BaseClient",
+        api_key: Optional[str] = None,
+        is_production: bool = False,
+        locale: str = "en_US",
+        base_url: Optional[str] = None,
+        credential_resolver: Optional[CredentialResolver] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        response_cache: Optional[ResponseCache] = None,
+        lean_responses: bool = False,
+        json_codec: Optional[JsonCodec] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        record_timings: bool = False,
+    ) -> None:
+        """
+        Initialize the shared client configuration.
+
+        Parameters
+        ----------
+        api_key (Optional[str]): The API key for authentication.
+            Optional only when `credential_resolver` is provided.
+        is_production (bool): Flag indicating if the client is in production mode.
+        locale (str, optional): Locale for the requests. Defaults to "en_US".
+        base_url (Optional[str], optional): Custom API base URL.
+            Only allowed when running with `MSP_SDK_BUILD_PROFILE=dev`
+            and `MSP_SDK_ALLOW_CUSTOM_BASE_URL=1`.
+        credential_resolver (Optional[CredentialResolver], optional):
+            Resolver used to derive API keys by auth scope.
+        retry_policy (Optional[RetryPolicy], optional): Policy deciding which
+            failed requests are retried. Defaults to None (no retries).
+        circuit_breaker (Optional[CircuitBreaker], optional): Breaker failing
+            fast on unhealthy endpoint families. Defaults to None.
+        rate_limiter (Optional[RateLimiter], optional): Limiter shaping the
+            request rate per credential scope. Defaults to None.
+        single_flight (Optional[SingleFlight], optional): Coalescer sharing one
+            in-flight call between identical concurrent GET requests.
+            Defaults to None.
+        response_cache (Optional[ResponseCache], optional): Cache of GET
+            responses of reference-data endpoints. Defaults to None.
+        lean_responses (bool, optional): Keep neither the response body bytes
+            nor the request headers and body on responses. Defaults to False.
+        json_codec (Optional[JsonCodec], optional): Codec encoding request
+            bodies and decoding responses. Defaults to None, which uses orjson
+            when installed and the standard library otherwise.
+        metrics (Optional[MetricsRegistry], optional): Registry recording the
+            latency, errors, retries and bytes of every call. Defaults to None.
+        record_timings (bool, optional): Record the time spent per phase of
+            every call, see ApiResponse.get_timings(). Defaults to False.
+
+        Raises
+        ------
+        ValueError: If no API key or CredentialResolver is provided.
+
+        """
+        if api_key is None and credential_resolver is None:
+            raise ValueError(
+                "api_key is required when credential_resolver is not provided.",
+            )
+
+        self.api_key = ApiKey(api_key=api_key) if api_key is not None else None
+        self.credential_resolver = credential_resolver
+        self.url = self._resolve_base_url(
+            is_production=is_production,
+            explicit_base_url=base_url,
+        )
+        self.locale = locale
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight
+        self.response_cache = response_cache
+        self.lean_responses = lean_responses
+        self.json_codec = (
+            json_codec if json_codec is not None else default_json_codec()
+        )
+        self.metrics = metrics
+        self.record_timings = record_timings
+        self._header_templates: dict[str, dict[str, str]] = {}
+
+    def _resolve_base_url(
+        self: "BaseClient",
+        is_production: bool,
+        explicit_base_url: Optional[str],
+    ) -> str:
+        profile = os.getenv(self.BUILD_PROFILE_ENV, "release").strip().lower()
+        if profile != "dev":
+            profile = "release"
+
+        env_base_url = os.getenv(self.CUSTOM_BASE_URL_ENV, "").strip()
+        requested_base_url = (explicit_base_url or env_base_url or "").strip()
+
+        if not requested_base_url:
+            return self.LIVE_URL if is_production else self.TEST_URL
+
+        allow_custom = os.getenv(
+            self.ALLOW_CUSTOM_BASE_URL_ENV,
+            "0",
+        ).strip().lower() in {"1", "true", "yes"}
+
+        if profile != "dev" or not allow_custom:
+            msg = (
+                "Custom base URL is only allowed in dev profile with "
+                "MSP_SDK_ALLOW_CUSTOM_BASE_URL enabled."
+            )
+            raise ValueError(msg)
+
+        return self._normalize_base_url(requested_base_url)
+
+    @staticmethod
+    def _normalize_base_url(base_url: str) -> str:
+        parsed = urlparse(base_url)
+        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+            raise ValueError("Invalid base URL.")
+
+        if parsed.params or parsed.query or parsed.fragment:
+            raise ValueError("Invalid base URL.")
+
+        path = parsed.path.rstrip("/")
+        path = "/" if not path else path + "/"
+
+        return f"{parsed.scheme}://{parsed.netloc}{path}"
+
+    def _build_url(
+        self: "BaseClient",
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build the full URL for the request.
+
+        The query string is URL-encoded and cached; ``params`` is not
+        modified.
+
+        Parameters
+        ----------
+        endpoint (str): The API endpoint.
+        params (Optional[Dict[str, Any]], optional): Query parameters. Defaults to None.
+
+        Returns
+        -------
+        str: The full URL.
+
+        """
+        items = tuple(params.items()) if params else ()
+        if params is None or "locale" not in params:
+            items += (("locale", self.locale),)
+        try:
+            query_string = _encode_query(items)
+        except TypeError:
+            # Unhashable values, e.g. lists, cannot be cached.
+            query_string = urlencode(items)
+        return f"{self.url}{endpoint}?{query_string}"
+
+    def _resolve_api_key(
+        self: "BaseClient",
+        auth_scope: Optional[AuthScope],
+    ) -> str:
+        if self.credential_resolver is not None:
+            resolved_scope = auth_scope or AuthScope(
+                scope=ScopedCredentialResolver.AUTH_SCOPE_DEFAULT,
+            )
+            return self.credential_resolver.resolve(
+                auth_scope=resolved_scope.scope,
+                group_id=resolved_scope.group_id,
+            )
+
+        if self.api_key is None:
+            raise ValueError(
+                "api_key is required when credential_resolver is not provided.",
+            )
+
+        return self.api_key.get()
+
+    def _build_headers(
+        self: "BaseClient",
+        auth_scope: Optional[AuthScope],
+        idempotency_key: Optional[str] = None,
+    ) -> dict[str, str]:
+        """
+        Build the request headers for the given auth scope.
+
+        The headers of each credential are built once and copied per call,
+        so transports may modify them.
+
+        Parameters
+        ----------
+        auth_scope (Optional[AuthScope]): The auth scope used to resolve the API key.
+        idempotency_key (Optional[str]): Idempotency key to attach, if any.
+
+        Returns
+        -------
+        dict[str, str]: The request headers.
+
+        """
+        api_key = self._resolve_api_key(auth_scope)
+        template = self._header_templates.get(api_key)
+        if template is None:
+            if len(self._header_templates) >= self.MAX_HEADER_TEMPLATES:
+                self._header_templates.clear()
+            template = {
+                "Authorization": f"Bearer {api_key}",
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            }
+            self._header_templates[api_key] = template
+        headers = template.copy()
+        if idempotency_key:
+            headers[IDEMPOTENCY_KEY_HEADER] = idempotency_key
+        return headers
+
+    def _prepare_request(
+        self: "BaseClient",
+        method: str,
+        url: str,
+        request_body: Optional[Union[str, bytes]],
+        auth_scope: Optional[AuthScope],
+        deadline: Optional[Deadline],
+        idempotency_key: Optional[str],
+        endpoint: Optional[str],
+    ) -> RequestState:
+        """
+        Collect everything needed to send the attempts of a call.
+
+        Parameters
+        ----------
+        method (str): The HTTP method.
+        url (str): The full URL.
+        request_body (Optional[Union[str, bytes]]): The request body.
+        auth_scope (Optional[AuthScope]): Auth scope used to resolve the API key.
+        deadline (Optional[Deadline]): The deadline of the call, if any.
+        idempotency_key (Optional[str]): Idempotency key to attach, if any.
+        endpoint (Optional[str]): The API endpoint, used as circuit breaker key.
+
+        Returns
+        -------
+        RequestState: The state shared by all attempts.
+
+        """
+        headers = self._build_headers(auth_scope, idempotency_key)
+        return RequestState(
+            method=method,
+            url=url,
+            headers=headers,
+            body=request_body,
+            deadline=deadline,
+            circuit_key=self._circuit_key(endpoint),
+            rate_limit_key=(
+                RateLimiter.scope_key(auth_scope, headers["Authorization"])
+                if self.rate_limiter is not None
+                else None
+            ),
+            endpoint=endpoint,
+            timings={} if self.record_timings else None,
+        )
+
+    @staticmethod
+    def _transport_request(
+        state: RequestState,
+        transport_kwargs: dict[str, Any],
+    ) -> TransportRequest:
+        """
+        Describe an attempt for the middlewares.
+
+        The headers are copied, so changes made by middlewares do not carry
+        over to the next attempt.
+
+        Parameters
+        ----------
+        state (RequestState): The state of the call.
+        transport_kwargs (dict[str, Any]): Further transport arguments.
+
+        Returns
+        -------
+        TransportRequest: The attempt.
+
+        """
+        return TransportRequest(
+            method=state.method,
+            url=state.url,
+            headers=dict(state.headers),
+            body=state.body,
+            options=transport_kwargs,
+            attempt=state.retries,
+        )
+
+    def _coalesces(self: "BaseClient", state: RequestState) -> bool:
+        return (
+            self.single_flight is not None and state.method == self.METHOD_GET
+        )
+
+    @staticmethod
+    def _request_key(state: RequestState) -> tuple[str, str, str]:
+        """
+        Build the identity of a call for coalescing and caching.
+
+        The resolved Authorization header stands for the credential scope,
+        so calls made with different API keys are never shared.
+
+        Parameters
+        ----------
+        state (RequestState): The state of the call.
+
+        Returns
+        -------
+        tuple[str, str, str]: The method, URL and credential of the call.
+
+        """
+        return (
+            state.method,
+            state.url,
+            state.headers.get("Authorization", ""),
+        )
+
+    def _cache_ttl(
+        self: "BaseClient",
+        state: RequestState,
+        endpoint: Optional[str],
+    ) -> Optional[float]:
+        if (
+            self.response_cache is None
+            or endpoint is None
+            or state.method != self.METHOD_GET
+        ):
+            return None
+        return self.response_cache.ttl_for(endpoint)
+
+    def _store_in_cache(
+        self: "BaseClient",
+        state: RequestState,
+        endpoint: str,
+        response: ApiResponse,
+        ttl: float,
+    ) -> None:
+        if self.response_cache is not None and response.status_code < 300:
+            self.response_cache.put(
+                self._request_key(state),
+                endpoint,
+                self._detach(response),
+                ttl,
+            )
+
+    @staticmethod
+    def _refresh_state(state: RequestState) -> RequestState:
+        """
+        Copy the state of a call for a background cache refresh.
+
+        The refresh is not bound by the deadline of the call that found the
+        stale entry and starts with fresh counters.
+
+        Parameters
+        ----------
+        state (RequestState): The state of the call.
+
+        Returns
+        -------
+        RequestState: The state of the refresh call.
+
+        """
+        return replace(
+            state,
+            deadline=None,
+            retries=0,
+            retry_delay=0.0,
+            rate_limit_wait=0.0,
+            timings=None if state.timings is None else {},
+        )
+
+    @staticmethod
+    def _copy_response(
+        response: ApiResponse,
+        context: Optional[dict[str, Any]],
+        **marks: bool,
+    ) -> ApiResponse:
+        """
+        Hand a shared or cached response to another caller.
+
+        The caller gets its own copy of the decoded body and headers, so
+        changing them does not affect other callers, and its own context.
+        The timings are dropped, since they describe another caller's call.
+
+        Parameters
+        ----------
+        response (ApiResponse): The shared or cached response.
+        context (Optional[Dict[str, Any]]): Additional context of the caller.
+        **marks (bool): Flags describing where the response came from.
+
+        Returns
+        -------
+        ApiResponse: The response with the caller's context.
+
+        """
+        copied_context = {
+            **(response.context or {}),
+            **(context or {}),
+            **marks,
+        }
+        return response.copy(
+            update={
+                "body": copy.deepcopy(response.body),
+                "headers": dict(response.headers),
+                "context": copied_context,
+                "timings": None,
+            },
+        )
+
+    @staticmethod
+    def _detach(response: ApiResponse) -> ApiResponse:
+        """
+        Copy a response before it is kept for other callers.
+
+        Parameters
+        ----------
+        response (ApiResponse): The response returned to the caller.
+
+        Returns
+        -------
+        ApiResponse: A response with its own body and headers, unaffected by
+            changes the caller makes to the original.
+
+        """
+        return response.copy(
+            update={
+                "body": copy.deepcopy(response.body),
+                "headers": dict(response.headers),
+            },
+        )
+
+    def _plan_retry(
+        self: "BaseClient",
+        state: RequestState,
+        response: Optional[HTTPResponse] = None,
+        error: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried and after which delay.
+
+        Parameters
+        ----------
+        state (RequestState): The state of the call.
+        response (Optional[HTTPResponse]): The response of the attempt, if any.
+        error (Optional[BaseException]): The transport error of the attempt, if any.
+
+        Returns
+        -------
+        Optional[float]: The delay in seconds before the next attempt, or None
+            when the attempt must not be retried.
+
+        """
+        policy = self.retry_policy
+        if policy is None or state.retries >= policy.max_retries:
+            return None
+        if not policy.allows_method(state.method, state.headers):
+            return None
+        if error is not None:
+            if not policy.is_retryable_error(error):
+                return None
+        elif response is None or not policy.is_retryable_response(response):
+            return None
+        delay = policy.next_delay(state.retries, response)
+        # A retry that cannot start before the deadline is pointless.
+        if state.deadline is not None and delay >= state.deadline.remaining():
+            return None
+        return delay
+
+    def _circuit_key(
+        self: "BaseClient",
+        endpoint: Optional[str],
+    ) -> Optional[str]:
+        if self.circuit_breaker is None or endpoint is None:
+            return None
+        return CircuitBreaker.endpoint_family(endpoint)
+
+    def _before_attempt(
+        self: "BaseClient",
+        circuit_key: Optional[str],
+    ) -> None:
+        """
+        Let the circuit breaker admit or reject the next attempt.
+
+        Parameters
+        ----------
+        circuit_key (Optional[str]): The endpoint family, if breaking is enabled.
+
+        Raises
+        ------
+        ApiUnavailableException: If the circuit of the endpoint family is open.
+
+        """
+        if self.circuit_breaker is not None and circuit_key is not None:
+            self.circuit_breaker.before_request(circuit_key)
+
+    def _record_attempt(
+        self: "BaseClient",
+        circuit_key: Optional[str],
+        response: Optional[HTTPResponse] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Report the outcome of an attempt to the circuit breaker.
+
+        Transport errors and 5xx responses count as failures; any other
+        response proves the endpoint is reachable.
+
+        Parameters
+        ----------
+        circuit_key (Optional[str]): The endpoint family, if breaking is enabled.
+        response (Optional[HTTPResponse]): The response of the attempt, if any.
+        error (Optional[BaseException]): The transport error of the attempt, if any.
+
+        """
+        if self.circuit_breaker is None or circuit_key is None:
+            return
+        status_code = getattr(response, "status_code", 0)
+        if error is not None or status_code >= 500:
+            self.circuit_breaker.record_failure(circuit_key)
+        else:
+            self.circuit_breaker.record_success(circuit_key)
+
+    def _release_attempt(
+        self: "BaseClient",
+        circuit_key: Optional[str],
+    ) -> None:
+        if self.circuit_breaker is not None and circuit_key is not None:
+            self.circuit_breaker.release(circuit_key)
+
+    def _sleep_before_retry(self: "BaseClient", delay: float) -> None:
+        if self.retry_policy is not None:
+            self.retry_policy.sleep(delay)
+
+    @staticmethod
+    def _count_retry(state: RequestState, delay: float) -> None:
+        state.retries += 1
+        state.retry_delay += delay
+
+    @staticmethod
+    def _start_phase(state: RequestState) -> float:
+        return time.perf_counter() if state.timings is not None else 0.0
+
+    @staticmethod
+    def _end_phase(state: RequestState, phase: str, started: float) -> None:
+        timings = state.timings
+        if timings is not None:
+            timings[phase] = (
+                timings.get(phase, 0.0) + time.perf_counter() - started
+            )
+
+    def _start_call(self: "BaseClient") -> float:
+        return self.metrics.clock() if self.metrics is not None else 0.0
+
+    def _record_call(
+        self: "BaseClient",
+        state: RequestState,
+        started: float,
+        response: Optional[HTTPResponse] = None,
+        error: bool = False,
+    ) -> None:
+        """
+        Record a finished call in the metrics registry, if any.
+
+        Parameters
+        ----------
+        state (RequestState): The state of the call.
+        started (float): Clock reading taken when the call started.
+        response (Optional[HTTPResponse]): The final transport response, if
+            one arrived.
+        error (bool): Whether the call failed, by default False.
+
+        """
+        metrics = self.metrics
+        if metrics is None:
+            return
+        body = state.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        # Reading ``content`` would consume the body of a streamed response.
+        content = None if state.stream else getattr(response, "content", None)
+        if isinstance(content, bytes):
+            received = len(content)
+        else:
+            headers = getattr(response, "headers", None) or {}
+            length = headers.get("Content-Length", "")
+            received = int(length) if str(length).isdigit() else 0
+        metrics.observe(
+            state.method,
+            state.endpoint or "",
+            metrics.clock() - started,
+            error=error,
+            retries=state.retries,
+            bytes_sent=len(body or b"") * (state.retries + 1),
+            bytes_received=received,
+        )
+
+    @staticmethod
+    def _build_transport_kwargs(
+        deadline: Optional[Deadline],
+        stream: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Build the extra keyword arguments passed to the transport.
+
+        Parameters
+        ----------
+        deadline (Optional[Deadline]): The deadline of the call, if any.
+        stream (bool): Whether the response body is streamed, by default False.
+
+        Returns
+        -------
+        dict[str, Any]: A ``timeout`` bounded by the remaining budget when a
+            deadline is set and ``stream=True`` for streamed calls.
+
+        Raises
+        ------
+        DeadlineExceededException: If the deadline has already expired.
+
+        """
+        kwargs: dict[str, Any] = {}
+        if deadline is not None:
+            kwargs["timeout"] = deadline.check()
+        if stream:
+            kwargs["stream"] = True
+        return kwargs
+
+    def _body_chunks(
+        self: "BaseClient",
+        response: HTTPResponse,
+        chunk_size: int,
+    ) -> Iterator[bytes]:
+        """
+        Iterate over the body of a streamed transport response.
+
+        Parameters
+        ----------
+        response (HTTPResponse): The transport response.
+        chunk_size (int): Maximum number of bytes per chunk.
+
+        Returns
+        -------
+        Iterator[bytes]: The body chunks. Responses of transports without
+            ``iter_content()`` or ``iter_bytes()`` yield their decoded JSON
+            body re-encoded as a single chunk.
+
+        """
+        for name in ("iter_content", "iter_bytes"):
+            iter_body = getattr(response, name, None)
+            if iter_body is not None:
+                return iter_body(chunk_size)
+        return iter((self.json_codec.dumps(response.json()),))
+
+    @staticmethod
+    def _close_response(response: HTTPResponse) -> None:
+        close = getattr(response, "close", None)
+        if close is not None:
+            close()
+
+    @staticmethod
+    def _deadline_caused(
+        deadline: Optional[Deadline],
+        error: BaseException,
+    ) -> bool:
+        """
+        Tell whether a failed attempt is due to the caller's deadline.
+
+        Parameters
+        ----------
+        deadline (Optional[Deadline]): The deadline of the call, if any.
+        error (BaseException): The error raised by the attempt.
+
+        Returns
+        -------
+        bool: True when the error is a DeadlineExceededException or the
+            deadline has expired.
+
+        """
+        return isinstance(error, DeadlineExceededException) or (
+            deadline is not None and deadline.expired()
+        )
+
+    @staticmethod
+    def _check_deadline_after_error(
+        deadline: Optional[Deadline],
+        error: BaseException,
+    ) -> None:
+        """
+        Report a transport failure caused by an expired deadline as such.
+
+        Parameters
+        ----------
+        deadline (Optional[Deadline]): The deadline of the call, if any.
+        error (BaseException): The error raised by the transport.
+
+        Raises
+        ------
+        DeadlineExceededException: If the deadline has expired.
+
+        """
+        if deadline is not None and deadline.expired():
+            raise BaseClient._deadline_exceeded(deadline, error) from error
+
+    @staticmethod
+    def _deadline_exceeded(
+        deadline: Deadline,
+        error: BaseException,
+    ) -> DeadlineExceededException:
+        message = f"Deadline of {deadline.budget:g}s exceeded"
+        if str(error):
+            message = f"{message}: {error}"
+        return DeadlineExceededException(message)
+
+    @staticmethod
+    def _raise_for_status(
+        response: HTTPResponse,
+        retries: int = 0,
+    ) -> None:
+        """
+        Raise for HTTP error statuses, wrapping 5xx errors in ApiException.
+
+        Parameters
+        ----------
+        response (HTTPResponse): The transport response.
+        retries (int): Number of retries performed, added to the exception context.
+
+        Raises
+        ------
+        ApiException: If the response has a 5xx status code.
+
+        """
+        try:
+            response.raise_for_status()
+        except Exception as e:
+            if (
+                hasattr(response, "status_code")
+                and 500 <= response.status_code < 600
+            ):
+                raise ApiException(
+                    f"Request failed: {e}",
+                    context={"retries": retries},
+                ) from e
+            raise
+
+    def _build_api_response(
+        self: "BaseClient",
+        response: HTTPResponse,
+        state: RequestState,
+        context: Optional[dict[str, Any]],
+    ) -> ApiResponse:
+        """
+        Convert a successful transport response into an ApiResponse.
+
+        The body bytes are decoded with the JSON codec and kept, not
+        stringified, so the raw text is only decoded when asked for. In lean
+        mode neither they nor the request headers and body are kept.
+        Transports without ``content`` bytes decode the body themselves.
+        When timings are recorded, the decoding is timed and the time to
+        first byte is taken from the ``time_to_first_byte`` attribute of the
+        response, where the transport sets it.
+
+        Parameters
+        ----------
+        response (HTTPResponse): The transport response.
+        state (RequestState): The state of the call.
+        context (Optional[Dict[str, Any]]): Additional context for the request.
+
+        Returns
+        -------
+        ApiResponse: The API response.
+
+        """
+        context = {
+            **(context or {}),
+            "retries": state.retries,
+            "retry_delay": state.retry_delay,
+            "rate_limit_wait": state.rate_limit_wait,
+        }
+        if not self.lean_responses:
+            context["headers"] = state.headers
+            context["request_body"] = state.body
+        content = getattr(response, "content", None)
+        if not isinstance(content, bytes):
+            content = None
+        started = self._start_phase(state)
+        json_data = (
+            self.json_codec.loads(content) if content else response.json()
+        )
+        self._end_phase(state, "decode", started)
+        if state.timings is not None:
+            ttfb = getattr(response, "time_to_first_byte", None)
+            if isinstance(ttfb, float):
+                state.timings["ttfb"] = ttfb
+        return ApiResponse.with_json(
+            status_code=response.status_code,
+            json_data=json_data,
+            headers=response.headers,
+            context=context,
+            content=None if self.lean_responses else content,
+            timings=state.timings,
+        )
@@ -0,0 +1,227 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Per-endpoint circuit breaker that fails fast while an API area is down."""
+
+import threading
+import time
+from typing import Callable
+
+from ..exception.api_unavailable import ApiUnavailableException
+
+
+class _Circuit:
+    """Mutable state of a single endpoint family."""
+
+    __slots__ = ("failures", "half_open_calls", "opened_at", "state")
+
+    def __init__(self: "_Circuit") -> None:
+        self.state = CircuitBreaker.STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker keyed by endpoint family.
+
+    Every endpoint family (``json/orders``, ``json/gateways``, ...) has its own
+    circuit. A circuit opens after ``failure_threshold`` consecutive failures
+    (transport errors or 5xx responses) and rejects calls with
+    ApiUnavailableException until ``recovery_timeout`` seconds have passed.
+    It then turns half-open and lets ``half_open_max_calls`` trial requests
+    through: a success closes the circuit, a failure opens it again.
+
+    Attributes
+    ----------
+    STATE_CLOSED (str): Requests flow normally.
+    STATE_OPEN (str): Requests are rejected without being sent.
+    STATE_HALF_OPEN (str): A limited number of trial requests is allowed.
+    failure_threshold (int): Consecutive failures that open a circuit.
+    recovery_timeout (float): Seconds a circuit stays open before a trial.
+    half_open_max_calls (int): Concurrent trial requests while half-open.
+
+    """
+
+    STATE_CLOSED = "closed"
+    STATE_OPEN = "open"
+    STATE_HALF_OPEN = "half_open"
+
+    def __init__(
+        self: "CircuitBreaker",
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the CircuitBreaker.
+
+        Parameters
+        ----------
+        failure_threshold (int): Consecutive failures that open a circuit, by default 5.
+        recovery_timeout (float): Seconds before an open circuit allows a trial
+            request, by default 30.
+        half_open_max_calls (int): Concurrent trial requests allowed while
+            half-open, by default 1.
+        clock (Callable[[], float]): Monotonic clock, by default time.monotonic.
+
+        Raises
+        ------
+        ValueError: If a threshold is smaller than 1 or the timeout is negative.
+
+        """
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError(
+                "failure_threshold and half_open_max_calls must be at least 1.",
+            )
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout must not be negative.")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_family(endpoint: str) -> str:
+        """
+        Derive the circuit key from an API endpoint.
+
+        Parameters
+        ----------
+        endpoint (str): The endpoint passed to the client, e.g.
+            ``json/orders/123/refunds``.
+
+        Returns
+        -------
+        str: The endpoint family, e.g. ``json/orders``.
+
+        """
+        path = endpoint.split("?", 1)[0].strip("/")
+        segments = path.split("/")
+        if segments[0] == "json" and len(segments) > 1:
+            return f"json/{segments[1]}"
+        return segments[0]
+
+    def get_state(self: "CircuitBreaker", key: str) -> str:
+        """
+        Get the current state of a circuit.
+
+        Parameters
+        ----------
+        key (str): The endpoint family.
+
+        Returns
+        -------
+        str: One of STATE_CLOSED, STATE_OPEN or STATE_HALF_OPEN.
+
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return self.STATE_CLOSED
+            if (
+                circuit.state == self.STATE_OPEN
+                and self._clock() - circuit.opened_at >= self.recovery_timeout
+            ):
+                return self.STATE_HALF_OPEN
+            return circuit.state
+
+    def before_request(self: "CircuitBreaker", key: str) -> None:
+        """
+        Admit a request or fail fast when its circuit is open.
+
+        Parameters
+        ----------
+        key (str): The endpoint family.
+
+        Raises
+        ------
+        ApiUnavailableException: If the circuit is open or the half-open
+            trial slots are taken.
+
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.state == self.STATE_CLOSED:
+                return
+            now = self._clock()
+            if circuit.state == self.STATE_OPEN:
+                retry_in = circuit.opened_at + self.recovery_timeout - now
+                if retry_in > 0:
+                    raise ApiUnavailableException(
+                        f"Circuit for '{key}' is open.",
+                        context={"endpoint": key, "retry_in": retry_in},
+                    )
+                circuit.state = self.STATE_HALF_OPEN
+                circuit.half_open_calls = 0
+            if circuit.half_open_calls >= self.half_open_max_calls:
+                raise ApiUnavailableException(
+                    f"Circuit for '{key}' is half-open and busy.",
+                    context={"endpoint": key, "retry_in": 0.0},
+                )
+            circuit.half_open_calls += 1
+
+    def record_success(self: "CircuitBreaker", key: str) -> None:
+        """
+        Record a successful request and close the circuit.
+
+        Parameters
+        ----------
+        key (str): The endpoint family.
+
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.state = self.STATE_CLOSED
+            circuit.failures = 0
+            circuit.half_open_calls = 0
+
+    def record_failure(self: "CircuitBreaker", key: str) -> None:
+        """
+        Record a failed request, opening the circuit when needed.
+
+        Parameters
+        ----------
+        key (str): The endpoint family.
+
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if (
+                circuit.state == self.STATE_HALF_OPEN
+                or circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = self.STATE_OPEN
+                circuit.opened_at = self._clock()
+                circuit.half_open_calls = 0
+
+    def release(self: "CircuitBreaker", key: str) -> None:
+        """
+        Give back an admitted request that ended without an outcome.
+
+        Used when a request is cancelled, so a half-open trial slot is not
+        held forever.
+
+        Parameters
+        ----------
+        key (str): The endpoint family.
+
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.half_open_calls > 0:
+                circuit.half_open_calls -= 1
+
+    def reset(self: "CircuitBreaker") -> None:
+        """Close all circuits and forget their failure counts."""
+        with self._lock:
+            self._circuits.clear()
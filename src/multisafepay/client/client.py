@@ -7,23 +7,31 @@
 
 """HTTP client module for making API requests to MultiSafepay services."""
 
-import os
-from typing import Any, Optional
-from urllib.parse import urlparse
+import threading
+from collections.abc import Iterator, Sequence
+from typing import Any, Optional, Union
 
 from multisafepay.api.base.response.api_response import ApiResponse
-from multisafepay.transport import HTTPTransport, RequestsTransport
-
-from ..exception.api import ApiException
-from .api_key import ApiKey
-from .credential_resolver import (
-    AuthScope,
-    CredentialResolver,
-    ScopedCredentialResolver,
+from multisafepay.transport import (
+    HTTPResponse,
+    HTTPTransport,
+    RequestsTransport,
 )
+from multisafepay.util.json_codec import JsonCodec
 
+from .base_client import BaseClient, RequestState
+from .circuit_breaker import CircuitBreaker
+from .credential_resolver import AuthScope, CredentialResolver
+from .deadline import Deadline, DeadlineLike
+from .metrics import MetricsRegistry
+from .middleware import Middleware, TransportRequest, build_chain
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
 
-class Client:
+
+class Client(BaseClient):
     """
     Client for interacting with the MultiSafepay API.
 
@@ -38,17 +46,6 @@ class Client:
 
     """
 
-    LIVE_URL = "https://api.multisafepay.com/v1/"
-    TEST_URL = "https://testapi.multisafepay.com/v1/"
-    BUILD_PROFILE_ENV = "MSP_SDK_BUILD_PROFILE"
-    CUSTOM_BASE_URL_ENV = "MSP_SDK_CUSTOM_BASE_URL"
-    ALLOW_CUSTOM_BASE_URL_ENV = "MSP_SDK_ALLOW_CUSTOM_BASE_URL"
-
-    METHOD_POST = "POST"
-    METHOD_GET = "GET"
-    METHOD_PATCH = "PATCH"
-    METHOD_DELETE = "DELETE"
-
     def __init__(
         self: "Client",
         api_key: Optional[str] = None,
@@ -57,6 +54,16 @@ class Client:
         locale: str = "en_US",
         base_url: Optional[str] = None,
         credential_resolver: Optional[CredentialResolver] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        response_cache: Optional[ResponseCache] = None,
+        lean_responses: bool = False,
+        json_codec: Optional[JsonCodec] = None,
+        middlewares: Optional[Sequence[Middleware]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        record_timings: bool = False,
     ) -> None:
         """
         Initialize the Client.
@@ -74,68 +81,57 @@ class Client:
             and `MSP_SDK_ALLOW_CUSTOM_BASE_URL=1`.
         credential_resolver (Optional[CredentialResolver], optional):
             Resolver used to derive API keys by auth scope.
+        retry_policy (Optional[RetryPolicy], optional): Policy deciding which
+            failed requests are retried. Defaults to None (no retries).
+        circuit_breaker (Optional[CircuitBreaker], optional): Breaker failing
+            fast on unhealthy endpoint families. Defaults to None.
+        rate_limiter (Optional[RateLimiter], optional): Limiter shaping the
+            request rate per credential scope. Defaults to None.
+        single_flight (Optional[SingleFlight], optional): Coalescer sharing one
+            in-flight call between identical concurrent GET requests.
+            Defaults to None.
+        response_cache (Optional[ResponseCache], optional): Cache of GET
+            responses of reference-data endpoints. Defaults to None.
+        lean_responses (bool, optional): Keep neither the response body bytes
+            nor the request headers and body on responses. Defaults to False.
+        json_codec (Optional[JsonCodec], optional): Codec encoding request
+            bodies and decoding responses. Defaults to None, which uses orjson
+            when installed and the standard library otherwise.
+        middlewares (Optional[Sequence[Middleware]], optional): Middlewares
+            wrapped around each transport call, outermost first.
+            Defaults to None.
+        metrics (Optional[MetricsRegistry], optional): Registry recording the
+            latency, errors, retries and bytes of every call. Defaults to None.
+        record_timings (bool, optional): Record the time spent per phase of
+            every call, see ApiResponse.get_timings(). Defaults to False.
 
         Raises
         ------
         ValueError: If no API key or CredentialResolver is provided.
 
         """
-        if api_key is None and credential_resolver is None:
-            raise ValueError(
-                "api_key is required when credential_resolver is not provided.",
-            )
-
-        self.api_key = ApiKey(api_key=api_key) if api_key is not None else None
-        self.credential_resolver = credential_resolver
-        self.url = self._resolve_base_url(
+        super().__init__(
+            api_key=api_key,
             is_production=is_production,
-            explicit_base_url=base_url,
+            locale=locale,
+            base_url=base_url,
+            credential_resolver=credential_resolver,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            response_cache=response_cache,
+            lean_responses=lean_responses,
+            json_codec=json_codec,
+            metrics=metrics,
+            record_timings=record_timings,
         )
         self.transport = transport or RequestsTransport()
-        self.locale = locale
-
-    def _resolve_base_url(
-        self: "Client",
-        is_production: bool,
-        explicit_base_url: Optional[str],
-    ) -> str:
-        profile = os.getenv(self.BUILD_PROFILE_ENV, "release").strip().lower()
-        if profile != "dev":
-            profile = "release"
-
-        env_base_url = os.getenv(self.CUSTOM_BASE_URL_ENV, "").strip()
-        requested_base_url = (explicit_base_url or env_base_url or "").strip()
-
-        if not requested_base_url:
-            return self.LIVE_URL if is_production else self.TEST_URL
-
-        allow_custom = os.getenv(
-            self.ALLOW_CUSTOM_BASE_URL_ENV,
-            "0",
-        ).strip().lower() in {"1", "true", "yes"}
-
-        if profile != "dev" or not allow_custom:
-            msg = (
-                "Custom base URL is only allowed in dev profile with "
-                "MSP_SDK_ALLOW_CUSTOM_BASE_URL enabled."
-            )
-            raise ValueError(msg)
-
-        return self._normalize_base_url(requested_base_url)
-
-    @staticmethod
-    def _normalize_base_url(base_url: str) -> str:
-        parsed = urlparse(base_url)
-        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
-            raise ValueError("Invalid base URL.")
-
-        if parsed.params or parsed.query or parsed.fragment:
-            raise ValueError("Invalid base URL.")
-
-        path = parsed.path.rstrip("/")
-        path = "/" if not path else path + "/"
-
-        return f"{parsed.scheme}://{parsed.netloc}{path}"
+        self.middlewares = tuple(middlewares or ())
+        self._middleware_chain = build_chain(
+            self.middlewares,
+            self._send_transport_request,
+        )
 
     def create_get_request(
         self: "Client",
@@ -143,6 +139,7 @@ class Client:
         params: dict[str, Any] = None,
         context: Optional[dict[str, Any]] = None,
         auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
     ) -> ApiResponse:
         """
         Create a GET request.
@@ -152,11 +149,18 @@ class Client:
         endpoint (str): The API endpoint.
         params (Dict[str, Any], optional): Query parameters. Defaults to None.
         context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, as a Deadline or in seconds. Defaults to None (no deadline).
 
         Returns
         -------
         ApiResponse: The API response.
 
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before a response arrives.
+
         """
         url = self._build_url(endpoint, params)
         return self._create_request(
@@ -164,15 +168,19 @@ class Client:
             url,
             context=context,
             auth_scope=auth_scope,
+            deadline=Deadline.coerce(deadline),
+            endpoint=endpoint,
         )
 
     def create_post_request(
         self: "Client",
         endpoint: str,
         params: dict[str, Any] = None,
-        request_body: str = None,
+        request_body: Optional[Union[str, bytes]] = None,
         context: Optional[dict[str, Any]] = None,
         auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
     ) -> ApiResponse:
         """
         Create a POST request.
@@ -181,13 +189,23 @@ class Client:
         ----------
         endpoint (str): The API endpoint.
         params (Dict[str, Any], optional): Query parameters. Defaults to None.
-        request_body (str, optional): The request body. Defaults to None.
+        request_body (Optional[Union[str, bytes]], optional): The request body.
+            Defaults to None.
         context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, as a Deadline or in seconds. Defaults to None (no deadline).
+        idempotency_key (Optional[str], optional): Idempotency key that makes the
+            request safe to retry. Defaults to None.
 
         Returns
         -------
         ApiResponse: The API response.
 
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before a response arrives.
+
         """
         url = self._build_url(endpoint, params)
         return self._create_request(
@@ -196,15 +214,20 @@ class Client:
             request_body=request_body,
             context=context,
             auth_scope=auth_scope,
+            deadline=Deadline.coerce(deadline),
+            endpoint=endpoint,
+            idempotency_key=idempotency_key,
         )
 
     def create_patch_request(
         self: "Client",
         endpoint: str,
         params: dict[str, Any] = None,
-        request_body: str = None,
+        request_body: Optional[Union[str, bytes]] = None,
         context: Optional[dict[str, Any]] = None,
         auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
+        idempotency_key: Optional[str] = None,
     ) -> ApiResponse:
         """
         Create a PATCH request.
@@ -213,13 +236,23 @@ class Client:
         ----------
         endpoint (str): The API endpoint.
         params (Dict[str, Any], optional): Query parameters. Defaults to None.
-        request_body (Optional[RequestBodyInterface], optional): The request body. Defaults to None.
+        request_body (Optional[Union[str, bytes]], optional): The request body.
+            Defaults to None.
         context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, as a Deadline or in seconds. Defaults to None (no deadline).
+        idempotency_key (Optional[str], optional): Idempotency key that makes the
+            request safe to retry. Defaults to None.
 
         Returns
         -------
         ApiResponse: The API response.
 
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before a response arrives.
+
         """
         url = self._build_url(endpoint, params)
         return self._create_request(
@@ -228,6 +261,9 @@ class Client:
             request_body=request_body,
             context=context,
             auth_scope=auth_scope,
+            deadline=Deadline.coerce(deadline),
+            endpoint=endpoint,
+            idempotency_key=idempotency_key,
         )
 
     def create_delete_request(
@@ -236,6 +272,7 @@ class Client:
         params: dict[str, Any] = None,
         context: Optional[dict[str, Any]] = None,
         auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
     ) -> ApiResponse:
         """
         Create a DELETE request.
@@ -245,11 +282,18 @@ class Client:
         endpoint (str): The API endpoint.
         params (Dict[str, Any], optional): Query parameters. Defaults to None.
         context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, as a Deadline or in seconds. Defaults to None (no deadline).
 
         Returns
         -------
         ApiResponse: The API response.
 
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before a response arrives.
+
         """
         url = self._build_url(endpoint, params)
         return self._create_request(
@@ -257,62 +301,95 @@ class Client:
             url,
             context=context,
             auth_scope=auth_scope,
+            deadline=Deadline.coerce(deadline),
+            endpoint=endpoint,
         )
 
-    def _build_url(
+    def stream_get_request(
         self: "Client",
         endpoint: str,
-        params: Optional[dict[str, Any]] = None,
-    ) -> str:
+        params: dict[str, Any] = None,
+        auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[DeadlineLike] = None,
+        chunk_size: int = BaseClient.DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
         """
-        Build the full URL for the request.
+        Send a GET request and stream its response body.
+
+        The request is sent, retried and checked for error statuses right
+        away; the body is then read chunk by chunk as the returned iterator
+        is consumed, without decoding it. The response cache and
+        single-flight coalescing do not apply to streamed requests.
 
         Parameters
         ----------
         endpoint (str): The API endpoint.
-        params (Optional[Dict[str, Any]], optional): Query parameters. Defaults to None.
+        params (Dict[str, Any], optional): Query parameters. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Union[Deadline, float]], optional): Time budget for the
+            call, including reading the body. Defaults to None (no deadline).
+        chunk_size (int, optional): Maximum number of bytes per chunk.
+            Defaults to 64 KiB.
 
         Returns
         -------
-        str: The full URL.
+        Iterator[bytes]: The body chunks. The response is closed once the
+            iterator is exhausted or closed.
+
+        Raises
+        ------
+        DeadlineExceededException: If the deadline expires before or while
+            the body is read.
 
         """
-        if params is None:
-            params = {}
-        if "locale" not in params:
-            params["locale"] = self.locale
-        query_string = "&".join(
-            f"{key}={value}" for key, value in params.items()
+        url = self._build_url(endpoint, params)
+        state = self._prepare_request(
+            self.METHOD_GET,
+            url,
+            None,
+            auth_scope,
+            Deadline.coerce(deadline),
+            None,
+            endpoint,
         )
-        return f"{self.url}{endpoint}?{query_string}"
+        state.stream = True
+        started = self._start_call()
+        response = None
+        try:
+            response = self._send_with_retries(state)
+            self._raise_for_status(response, state.retries)
+        except Exception:
+            self._record_call(state, started, response, error=True)
+            if response is not None:
+                self._close_response(response)
+            raise
+        self._record_call(state, started, response)
+        return self._stream_body(response, state.deadline, chunk_size)
 
-    def _resolve_api_key(
+    def _stream_body(
         self: "Client",
-        auth_scope: Optional[AuthScope],
-    ) -> str:
-        if self.credential_resolver is not None:
-            resolved_scope = auth_scope or AuthScope(
-                scope=ScopedCredentialResolver.AUTH_SCOPE_DEFAULT,
-            )
-            return self.credential_resolver.resolve(
-                auth_scope=resolved_scope.scope,
-                group_id=resolved_scope.group_id,
-            )
-
-        if self.api_key is None:
-            raise ValueError(
-                "api_key is required when credential_resolver is not provided.",
-            )
-
-        return self.api_key.get()
+        response: HTTPResponse,
+        deadline: Optional[Deadline],
+        chunk_size: int,
+    ) -> Iterator[bytes]:
+        try:
+            for chunk in self._body_chunks(response, chunk_size):
+                if deadline is not None:
+                    deadline.check()
+                yield chunk
+        finally:
+            self._close_response(response)
 
     def _create_request(
         self: "Client",
         method: str,
         url: str,
-        request_body: Optional[dict[str, Any]] = None,
+        request_body: Optional[Union[str, bytes]] = None,
         context: Optional[dict[str, Any]] = None,
         auth_scope: Optional[AuthScope] = None,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None,
+        endpoint: Optional[str] = None,
     ) -> ApiResponse:
         """
         Create and send an HTTP request.
@@ -321,47 +398,193 @@ class Client:
         ----------
         method (str): The HTTP method.
         url (str): The full URL.
-        request_body (Optional[Dict[str, Any]], optional): The request body. Defaults to None.
+        request_body (Optional[Union[str, bytes]], optional): The request body.
+            Defaults to None.
         context (Dict[str, Any], optional): Additional context for the request. Defaults to None.
+        auth_scope (Optional[AuthScope], optional): Auth scope used to resolve the API key.
+        deadline (Optional[Deadline], optional): Deadline bounding the transport
+            timeout and the retries.
+        idempotency_key (Optional[str], optional): Idempotency key sent with the
+            request; makes POST and PATCH requests eligible for retries.
+        endpoint (Optional[str], optional): The API endpoint, used to select
+            the circuit of the circuit breaker.
 
         Returns
         -------
         ApiResponse: The API response.
 
         """
-        api_key = self._resolve_api_key(auth_scope)
-        headers = {
-            "Authorization": "Bearer " + api_key,
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        state = self._prepare_request(
+            method,
+            url,
+            request_body,
+            auth_scope,
+            deadline,
+            idempotency_key,
+            endpoint,
+        )
+        cache_ttl = self._cache_ttl(state, endpoint)
+        if cache_ttl is None:
+            return self._fetch(state, context)
+        return self._fetch_cached(state, context, endpoint, cache_ttl)
+
+    def _fetch(
+        self: "Client",
+        state: RequestState,
+        context: Optional[dict[str, Any]],
+    ) -> ApiResponse:
+        if not self._coalesces(state):
+            return self._execute(state, context)
+        response, shared = self.single_flight.do(
+            self._request_key(state),
+            lambda: self._execute(state, context),
+            state.deadline,
+        )
+        if shared:
+            return self._copy_response(response, context, coalesced=True)
+        # Followers may still copy the shared response after it is returned
+        # here, so the leader gets its own copy to change as it likes.
+        return self._detach(response)
 
+    def _fetch_cached(
+        self: "Client",
+        state: RequestState,
+        context: Optional[dict[str, Any]],
+        endpoint: str,
+        ttl: float,
+    ) -> ApiResponse:
+        cached = self.response_cache.get(self._request_key(state))
+        if cached is None:
+            response = self._fetch(state, context)
+            self._store_in_cache(state, endpoint, response, ttl)
+            return response
+        response, refresh = cached
+        if refresh:
+            threading.Thread(
+                target=self._refresh_cache,
+                args=(self._refresh_state(state), endpoint, ttl),
+                name="multisafepay-cache-refresh",
+                daemon=True,
+            ).start()
+        return self._copy_response(response, context, cached=True)
+
+    def _refresh_cache(
+        self: "Client",
+        state: RequestState,
+        endpoint: str,
+        ttl: float,
+    ) -> None:
         try:
-            response = self.transport.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=request_body,
-            )
-            response.raise_for_status()
-        except Exception as e:
-            if (
-                hasattr(response, "status_code")
-                and 500 <= response.status_code < 600
-            ):
-                raise ApiException(f"Request failed: {e}") from e
+            response = self._execute(state, None)
+        except Exception:  # noqa: BLE001
+            # Keep serving the stale entry; the next stale hit tries again.
+            self.response_cache.refresh_failed(self._request_key(state))
+            return
+        self._store_in_cache(state, endpoint, response, ttl)
+
+    def _execute(
+        self: "Client",
+        state: RequestState,
+        context: Optional[dict[str, Any]],
+    ) -> ApiResponse:
+        started = self._start_call()
+        response = None
+        try:
+            response = self._send_with_retries(state)
+            self._raise_for_status(response, state.retries)
+            api_response = self._build_api_response(response, state, context)
+        except Exception:
+            self._record_call(state, started, response, error=True)
             raise
+        self._record_call(state, started, response)
+        return api_response
 
-        context = context or {}
-        context.update(
-            {
-                "headers": headers,
-                "request_body": request_body,
-            },
-        )
-        return ApiResponse.with_json(
-            status_code=response.status_code,
-            json_data=response.json(),
-            headers=response.headers,
-            context=context,
+    def _send_with_retries(
+        self: "Client",
+        state: RequestState,
+    ) -> HTTPResponse:
+        """
+        Send the attempts of a call until one is final.
+
+        Parameters
+        ----------
+        state (RequestState): The state of the call.
+
+        Returns
+        -------
+        HTTPResponse: The last transport response.
+
+        """
+        while True:
+            self._wait_for_rate_limit(state)
+            transport_kwargs = self._build_transport_kwargs(
+                state.deadline,
+                state.stream,
+            )
+            self._before_attempt(state.circuit_key)
+            try:
+                response = self._send(state, transport_kwargs)
+            except Exception as e:
+                if self._deadline_caused(state.deadline, e):
+                    # The caller's own budget ran out, which says nothing
+                    # about the health of the endpoint.
+                    self._release_attempt(state.circuit_key)
+                    self._check_deadline_after_error(state.deadline, e)
+                    raise
+                self._record_attempt(state.circuit_key, error=e)
+                delay = self._plan_retry(state, error=e)
+                if delay is None:
+                    raise
+            except BaseException:
+                self._release_attempt(state.circuit_key)
+                raise
+            else:
+                self._record_attempt(state.circuit_key, response=response)
+                delay = self._plan_retry(state, response=response)
+                if delay is None:
+                    return response
+                if state.stream:
+                    self._close_response(response)
+            self._sleep_before_retry(delay)
+            self._count_retry(state, delay)
+
+    def _send(
+        self: "Client",
+        state: RequestState,
+        transport_kwargs: dict[str, Any],
+    ) -> HTTPResponse:
+        started = self._start_phase(state)
+        try:
+            # Without middlewares, skip building a TransportRequest per attempt.
+            if not self.middlewares:
+                return self.transport.request(
+                    method=state.method,
+                    url=state.url,
+                    headers=state.headers,
+                    data=state.body,
+                    **transport_kwargs,
+                )
+            return self._middleware_chain(
+                self._transport_request(state, transport_kwargs),
+            )
+        finally:
+            self._end_phase(state, "send", started)
+
+    def _send_transport_request(
+        self: "Client",
+        request: TransportRequest,
+    ) -> HTTPResponse:
+        return self.transport.request(
+            method=request.method,
+            url=request.url,
+            headers=request.headers,
+            data=request.body,
+            **request.options,
         )
+
+    def _wait_for_rate_limit(self: "Client", state: RequestState) -> None:
+        if self.rate_limiter is not None and state.rate_limit_key is not None:
+            state.rate_limit_wait += self.rate_limiter.acquire(
+                state.rate_limit_key,
+                state.deadline,
+            )
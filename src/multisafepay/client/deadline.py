@@ -0,0 +1,115 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Per-call deadline budgets shared by the client, transports and retries."""
+
+import time
+from typing import Optional, Union
+
+from ..exception.deadline_exceeded import DeadlineExceededException
+
+
+class Deadline:
+    """
+    An absolute point in time by which a call must have completed.
+
+    A deadline is created from a budget in seconds and measured on the
+    monotonic clock, so it is unaffected by wall-clock adjustments. The same
+    instance can be handed to every attempt of a call: each attempt only gets
+    the time that is left.
+
+    Attributes
+    ----------
+    budget (float): The total budget in seconds the deadline was created with.
+    expires_at (float): Monotonic timestamp at which the deadline expires.
+
+    """
+
+    def __init__(self: "Deadline", budget: float) -> None:
+        """
+        Initialize a Deadline that expires `budget` seconds from now.
+
+        Parameters
+        ----------
+        budget (float): The time budget in seconds.
+
+        Raises
+        ------
+        ValueError: If the budget is negative.
+
+        """
+        if budget < 0:
+            raise ValueError("Deadline budget must not be negative.")
+        self.budget = float(budget)
+        self.expires_at = time.monotonic() + self.budget
+
+    @classmethod
+    def coerce(
+        cls: type["Deadline"],
+        deadline: Optional[Union["Deadline", float]],
+    ) -> Optional["Deadline"]:
+        """
+        Normalize a deadline argument accepted by the public API.
+
+        Parameters
+        ----------
+        deadline (Optional[Union[Deadline, float]]): A Deadline instance, a
+            budget in seconds, or None for no deadline.
+
+        Returns
+        -------
+        Optional[Deadline]: The Deadline to enforce, or None.
+
+        """
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(deadline)
+
+    def remaining(self: "Deadline") -> float:
+        """
+        Get the number of seconds left before the deadline expires.
+
+        Returns
+        -------
+        float: The remaining seconds, never below zero.
+
+        """
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self: "Deadline") -> bool:
+        """
+        Check whether the deadline has passed.
+
+        Returns
+        -------
+        bool: True when no time is left.
+
+        """
+        return time.monotonic() >= self.expires_at
+
+    def check(self: "Deadline") -> float:
+        """
+        Ensure time is left and return it.
+
+        Returns
+        -------
+        float: The remaining seconds.
+
+        Raises
+        ------
+        DeadlineExceededException: If the deadline has already expired.
+
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededException(
+                f"Deadline of {self.budget:g}s exceeded.",
+            )
+        return remaining
+
+
+DeadlineLike = Union[Deadline, float]
@@ -0,0 +1,432 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Per-endpoint call metrics with latency histograms."""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+# Resources followed by an identifier, e.g. json/orders/<order_id>, and the
+# actions of a resource followed by one, e.g. json/recurring/<reference>/
+# token/<token>. Other segments, such as json/auth/api_token, are kept.
+_IDENTIFIED_RESOURCES = frozenset(
+    {
+        "capture",
+        "gateways",
+        "issuers",
+        "orders",
+        "payment-methods",
+        "recurring",
+    },
+)
+_IDENTIFIED_ACTIONS = frozenset({"remove", "token"})
+
+
+@lru_cache(maxsize=1024)
+def _endpoint_template(endpoint: str) -> str:
+    path = endpoint.split("?", 1)[0].strip("/")
+    segments = path.split("/")
+    if segments[0] != "json" or len(segments) < 3:
+        return path
+    if segments[1] in _IDENTIFIED_RESOURCES:
+        segments[2] = "{id}"
+        if len(segments) > 4 and segments[3] in _IDENTIFIED_ACTIONS:
+            segments[4] = "{id}"
+    return "/".join(segments)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+@dataclass(frozen=True)
+class EndpointMetrics:
+    """
+    Snapshot of the calls to one endpoint.
+
+    Attributes
+    ----------
+    method (str): The HTTP method.
+    endpoint (str): The endpoint template, e.g. ``json/orders/{id}/refunds``.
+    calls (int): Number of calls, each counting all of its attempts once.
+    errors (int): Calls that raised or ended with an error status.
+    retries (int): Retries performed by the calls.
+    bytes_sent (int): Request body bytes sent, over all attempts.
+    bytes_received (int): Response body bytes received by the final attempts.
+    latency_sum (float): Total duration of the calls in seconds.
+    buckets (tuple[tuple[float, int], ...]): Cumulative number of calls per
+        upper latency bound in seconds, ending with ``inf``.
+
+    """
+
+    method: str
+    endpoint: str
+    calls: int
+    errors: int
+    retries: int
+    bytes_sent: int
+    bytes_received: int
+    latency_sum: float
+    buckets: tuple[tuple[float, int], ...]
+
+    @property
+    def error_rate(self: "EndpointMetrics") -> float:
+        """
+        Share of calls that failed.
+
+        Returns
+        -------
+        float: A value between 0.0 and 1.0.
+
+        """
+        if self.calls == 0:
+            return 0.0
+        return self.errors / self.calls
+
+    @property
+    def p50(self: "EndpointMetrics") -> float:
+        """
+        Estimated median latency in seconds.
+
+        Returns
+        -------
+        float: The 0.5 quantile, see quantile().
+
+        """
+        return self.quantile(0.5)
+
+    @property
+    def p95(self: "EndpointMetrics") -> float:
+        """
+        Estimated 95th percentile latency in seconds.
+
+        Returns
+        -------
+        float: The 0.95 quantile, see quantile().
+
+        """
+        return self.quantile(0.95)
+
+    @property
+    def p99(self: "EndpointMetrics") -> float:
+        """
+        Estimated 99th percentile latency in seconds.
+
+        Returns
+        -------
+        float: The 0.99 quantile, see quantile().
+
+        """
+        return self.quantile(0.99)
+
+    def quantile(self: "EndpointMetrics", q: float) -> float:
+        """
+        Estimate a latency quantile from the histogram.
+
+        Like Prometheus' ``histogram_quantile()``, the value is interpolated
+        linearly within the bucket holding the quantile. Quantiles falling in
+        the last, unbounded bucket return the highest finite bound.
+
+        Parameters
+        ----------
+        q (float): The quantile, between 0.0 and 1.0.
+
+        Returns
+        -------
+        float: The estimated latency in seconds, 0.0 without calls.
+
+        Raises
+        ------
+        ValueError: If q is outside 0.0 to 1.0.
+
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0.0 and 1.0.")
+        if self.calls == 0:
+            return 0.0
+        rank = q * self.calls
+        lower, below = 0.0, 0
+        for bound, cumulative in self.buckets:
+            if cumulative >= rank and cumulative > below:
+                if bound == float("inf"):
+                    return lower
+                share = (rank - below) / (cumulative - below)
+                return lower + (bound - lower) * share
+            lower, below = bound, cumulative
+        return lower
+
+
+class _Series:
+    """Mutable counters of one endpoint, guarded by the registry lock."""
+
+    __slots__ = (
+        "bytes_received",
+        "bytes_sent",
+        "calls",
+        "counts",
+        "errors",
+        "latency_sum",
+        "retries",
+    )
+
+    def __init__(self: "_Series", size: int) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        self.counts = [0] * size
+
+
+class MetricsRegistry:
+    """
+    Counters and latency histograms of API calls, per endpoint.
+
+    A Client with a registry records every call that reaches the API, once
+    the call is final: its duration including retries and waits, whether it
+    failed, its retries and the body bytes sent and received. Calls are
+    grouped by HTTP method and endpoint template, with the identifiers in
+    the path replaced by ``{id}``, so every manager method has its own
+    series and order ids do not inflate the number of series. Streamed
+    calls are recorded when the response headers arrive. Answers from the
+    response cache are not calls to the API and are not recorded.
+
+    Histograms have fixed buckets, so recording is cheap and the memory per
+    endpoint is constant; quantiles are estimated from the buckets.
+
+    Attributes
+    ----------
+    DEFAULT_BUCKETS (tuple[float, ...]): Upper bounds in seconds used when
+        none are given.
+    buckets (tuple[float, ...]): Upper latency bounds in seconds, ascending.
+    clock (Callable[[], float]): Monotonic clock timing the calls.
+
+    """
+
+    DEFAULT_BUCKETS = (
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.075,
+        0.1,
+        0.15,
+        0.25,
+        0.35,
+        0.5,
+        0.75,
+        1.0,
+        1.5,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+        60.0,
+    )
+
+    def __init__(
+        self: "MetricsRegistry",
+        buckets: Optional[Sequence[float]] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Initialize the MetricsRegistry.
+
+        Parameters
+        ----------
+        buckets (Optional[Sequence[float]]): Upper latency bounds in seconds,
+            by default DEFAULT_BUCKETS. An unbounded bucket is always added.
+        clock (Callable[[], float]): Monotonic clock, by default
+            time.perf_counter.
+
+        Raises
+        ------
+        ValueError: If the bounds are empty, not positive or not ascending.
+
+        """
+        bounds = tuple(
+            float(b)
+            for b in (self.DEFAULT_BUCKETS if buckets is None else buckets)
+        )
+        if (
+            not bounds
+            or bounds[0] <= 0
+            or any(a >= b for a, b in zip(bounds, bounds[1:]))
+        ):
+            raise ValueError(
+                "buckets must be positive and strictly ascending.",
+            )
+        self.buckets = bounds
+        self.clock = clock
+        self._bounds = (*bounds, float("inf"))
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_template(endpoint: str) -> str:
+        """
+        Derive the series name from an API endpoint.
+
+        Parameters
+        ----------
+        endpoint (str): The endpoint passed to the client, e.g.
+            ``json/orders/123/refunds``.
+
+        Returns
+        -------
+        str: The endpoint template, e.g. ``json/orders/{id}/refunds``.
+
+        """
+        return _endpoint_template(endpoint)
+
+    def observe(
+        self: "MetricsRegistry",
+        method: str,
+        endpoint: str,
+        duration: float,
+        error: bool = False,
+        retries: int = 0,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """
+        Record a finished call.
+
+        Parameters
+        ----------
+        method (str): The HTTP method.
+        endpoint (str): The API endpoint; identifiers are replaced by ``{id}``.
+        duration (float): Duration of the call in seconds.
+        error (bool): Whether the call failed, by default False.
+        retries (int): Retries performed, by default 0.
+        bytes_sent (int): Request body bytes sent, by default 0.
+        bytes_received (int): Response body bytes received, by default 0.
+
+        """
+        key = (method, _endpoint_template(endpoint))
+        index = bisect_left(self._bounds, duration)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self._bounds))
+            series.calls += 1
+            series.errors += error
+            series.retries += retries
+            series.bytes_sent += bytes_sent
+            series.bytes_received += bytes_received
+            series.latency_sum += duration
+            series.counts[index] += 1
+
+    def snapshot(
+        self: "MetricsRegistry",
+    ) -> dict[tuple[str, str], EndpointMetrics]:
+        """
+        Get the metrics recorded so far.
+
+        Returns
+        -------
+        dict[tuple[str, str], EndpointMetrics]: The metrics by HTTP method
+            and endpoint template.
+
+        """
+        result = {}
+        with self._lock:
+            for (method, endpoint), series in self._series.items():
+                cumulative, buckets = 0, []
+                for bound, count in zip(self._bounds, series.counts):
+                    cumulative += count
+                    buckets.append((bound, cumulative))
+                result[(method, endpoint)] = EndpointMetrics(
+                    method=method,
+                    endpoint=endpoint,
+                    calls=series.calls,
+                    errors=series.errors,
+                    retries=series.retries,
+                    bytes_sent=series.bytes_sent,
+                    bytes_received=series.bytes_received,
+                    latency_sum=series.latency_sum,
+                    buckets=tuple(buckets),
+                )
+        return result
+
+    def reset(self: "MetricsRegistry") -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._series.clear()
+
+    def render_prometheus(
+        self: "MetricsRegistry",
+        prefix: str = "multisafepay",
+    ) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix (str): Prefix of the metric names, by default "multisafepay".
+
+        Returns
+        -------
+        str: The exposition, ready to be served on a metrics endpoint.
+
+        """
+        snapshot = sorted(self.snapshot().items())
+        counters = (
+            ("requests_total", "API calls.", "calls"),
+            ("request_errors_total", "Failed API calls.", "errors"),
+            ("request_retries_total", "Retries of API calls.", "retries"),
+            (
+                "request_bytes_sent_total",
+                "Request body bytes sent.",
+                "bytes_sent",
+            ),
+            (
+                "response_bytes_received_total",
+                "Response body bytes received.",
+                "bytes_received",
+            ),
+        )
+        lines = []
+        for name, description, attribute in counters:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.extend(
+                f"{prefix}_{name}{{{self._labels(m)}}} {getattr(m, attribute)}"
+                for _, m in snapshot
+            )
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(
+            f"# HELP {name} Duration of API calls, including retries.",
+        )
+        lines.append(f"# TYPE {name} histogram")
+        for _, metrics in snapshot:
+            labels = self._labels(metrics)
+            lines.extend(
+                f'{name}_bucket{{{labels},le="{_format_bound(bound)}"}} '
+                f"{cumulative}"
+                for bound, cumulative in metrics.buckets
+            )
+            lines.append(f"{name}_sum{{{labels}}} {metrics.latency_sum!r}")
+            lines.append(f"{name}_count{{{labels}}} {metrics.calls}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _labels(metrics: EndpointMetrics) -> str:
+        return (
+            f'method="{_escape_label(metrics.method)}",'
+            f'endpoint="{_escape_label(metrics.endpoint)}"'
+        )
@@ -0,0 +1,142 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Middleware chains wrapped around the transport call of a client."""
+
+from collections.abc import Awaitable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Protocol, TypeVar, Union
+
+from multisafepay.transport.http_transport import HTTPResponse
+
+T = TypeVar("T")
+
+
+@dataclass
+class TransportRequest:
+    """
+    An attempt of a call, as handed to the middlewares.
+
+    Middlewares may change the request before passing it on, e.g. to add a
+    tracing header; the transport receives the request as it arrives at
+    the end of the chain.
+
+    Attributes
+    ----------
+    method (str): The HTTP method.
+    url (str): The full URL, including the query string.
+    headers (dict[str, str]): The request headers.
+    body (Optional[Union[str, bytes]]): The request body.
+    options (dict[str, Any]): Further transport arguments, e.g. ``timeout``
+        and ``stream``.
+    attempt (int): Number of earlier attempts of the same call.
+
+    """
+
+    method: str
+    url: str
+    headers: dict[str, str]
+    body: Optional[Union[str, bytes]] = None
+    options: dict[str, Any] = field(default_factory=dict)
+    attempt: int = 0
+
+
+class Middleware(Protocol):
+    """
+    Protocol for middlewares of a Client.
+
+    A middleware receives each attempt and the next handler of the chain.
+    It may observe or change the request, call ``call_next`` and observe or
+    replace the response, or return a response without calling it to
+    short-circuit the transport. Exceptions propagate to the client like
+    transport errors, so they are subject to the retry policy.
+    """
+
+    def __call__(
+        self: "Middleware",
+        request: TransportRequest,
+        call_next: Callable[[TransportRequest], HTTPResponse],
+    ) -> HTTPResponse:
+        """
+        Handle an attempt.
+
+        Parameters
+        ----------
+        request (TransportRequest): The attempt.
+        call_next (Callable[[TransportRequest], HTTPResponse]): The next
+            middleware, or the transport at the end of the chain.
+
+        Returns
+        -------
+        HTTPResponse: The response of the attempt.
+
+        """
+
+
+class AsyncMiddleware(Protocol):
+    """Protocol for middlewares of an AsyncClient, see Middleware."""
+
+    def __call__(
+        self: "AsyncMiddleware",
+        request: TransportRequest,
+        call_next: Callable[[TransportRequest], Awaitable[HTTPResponse]],
+    ) -> Awaitable[HTTPResponse]:
+        """
+        Handle an attempt.
+
+        Parameters
+        ----------
+        request (TransportRequest): The attempt.
+        call_next (Callable[[TransportRequest], Awaitable[HTTPResponse]]):
+            The next middleware, or the transport at the end of the chain.
+
+        Returns
+        -------
+        Awaitable[HTTPResponse]: The response of the attempt.
+
+        """
+
+
+def _bind(
+    middleware: Callable[
+        [TransportRequest, Callable[[TransportRequest], T]],
+        T,
+    ],
+    call_next: Callable[[TransportRequest], T],
+) -> Callable[[TransportRequest], T]:
+    def handle(request: TransportRequest) -> T:
+        return middleware(request, call_next)
+
+    return handle
+
+
+def build_chain(
+    middlewares: Sequence[
+        Callable[[TransportRequest, Callable[[TransportRequest], T]], T]
+    ],
+    send: Callable[[TransportRequest], T],
+) -> Callable[[TransportRequest], T]:
+    """
+    Compose middlewares around a send function.
+
+    The chain is built once; the first middleware is the outermost and
+    sees the request first and the response last.
+
+    Parameters
+    ----------
+    middlewares (Sequence[Callable]): The middlewares, outermost first.
+    send (Callable[[TransportRequest], T]): Sends a request to the transport.
+
+    Returns
+    -------
+    Callable[[TransportRequest], T]: The entry point of the chain.
+
+    """
+    handler = send
+    for middleware in reversed(middlewares):
+        handler = _bind(middleware, handler)
+    return handler
@@ -0,0 +1,294 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Client-side token-bucket rate limiting per credential scope."""
+
+import asyncio
+import hashlib
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Optional
+
+from ..exception.deadline_exceeded import DeadlineExceededException
+from .credential_resolver import AuthScope, ScopedCredentialResolver
+from .deadline import Deadline
+
+
+@lru_cache(maxsize=1024)
+def _credential_id(credential: str) -> str:
+    # A short digest identifies the account without keeping the key itself.
+    return hashlib.sha256(credential.encode()).hexdigest()[:16]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. A
+    caller that finds the bucket empty reserves the next token and is told
+    how long to wait for it, so waiting callers are served in arrival order.
+
+    Attributes
+    ----------
+    rate (float): Tokens added per second.
+    burst (int): Maximum number of tokens the bucket holds.
+
+    """
+
+    def __init__(
+        self: "TokenBucket",
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a full TokenBucket.
+
+        Parameters
+        ----------
+        rate (float): Tokens added per second.
+        burst (int): Maximum number of tokens the bucket holds.
+        clock (Callable[[], float]): Monotonic clock, by default time.monotonic.
+
+        Raises
+        ------
+        ValueError: If the rate is not positive or the burst is smaller than 1.
+
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1.")
+        self.rate = float(rate)
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(
+        self: "TokenBucket",
+        max_wait: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Take one token, possibly from the future.
+
+        Parameters
+        ----------
+        max_wait (Optional[float]): Longest acceptable wait in seconds. When
+            the token would only be available later, nothing is reserved.
+
+        Returns
+        -------
+        Optional[float]: Seconds to wait before using the token, or None when
+            the wait would exceed `max_wait`.
+
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = max(now - self._updated, 0.0)
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            wait = max(1.0 - self._tokens, 0.0) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1.0
+            return wait
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter keyed by credential scope.
+
+    Each scope (``default_account``, ``partner_affiliate`` and
+    ``terminal_group:<group_id>``) of each API key gets its own bucket, so
+    background jobs on one terminal group cannot starve live traffic on
+    another, and clients of different accounts sharing one limiter do not
+    throttle each other. Limits can be
+    set per scope key, per scope name (applies to every terminal group) or
+    fall back to the default rate and burst.
+
+    Attributes
+    ----------
+    rate (float): Default requests per second per scope.
+    burst (int): Default burst size per scope.
+    limits (dict[str, tuple[float, int]]): Rate and burst overrides by scope
+        key or scope name.
+
+    """
+
+    def __init__(
+        self: "RateLimiter",
+        rate: float = 10.0,
+        burst: int = 20,
+        limits: Optional[dict[str, tuple[float, int]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the RateLimiter.
+
+        Parameters
+        ----------
+        rate (float): Default requests per second per scope, by default 10.
+        burst (int): Default burst size per scope, by default 20.
+        limits (Optional[dict[str, tuple[float, int]]]): Overrides as
+            ``{"terminal_group:shop-1": (2.0, 5), "partner_affiliate": (5.0, 10)}``.
+        clock (Callable[[], float]): Monotonic clock, by default time.monotonic.
+        sleep (Callable[[float], None]): Function used to block sync callers,
+            by default time.sleep.
+
+        Raises
+        ------
+        ValueError: If a rate is not positive or a burst is smaller than 1.
+
+        """
+        self.rate = rate
+        self.burst = burst
+        self.limits = dict(limits or {})
+        for limit_rate, limit_burst in [(rate, burst), *self.limits.values()]:
+            if limit_rate <= 0 or limit_burst < 1:
+                raise ValueError("rate must be positive and burst at least 1.")
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def scope_key(
+        auth_scope: Optional[AuthScope],
+        credential: Optional[str] = None,
+    ) -> str:
+        """
+        Derive the bucket key of an auth scope.
+
+        Parameters
+        ----------
+        auth_scope (Optional[AuthScope]): The auth scope of the request.
+        credential (Optional[str]): The resolved credential of the request,
+            e.g. its Authorization header, by default None. When given, a
+            digest of it is appended so that clients sharing the limiter
+            with different API keys get separate buckets.
+
+        Returns
+        -------
+        str: ``terminal_group:<group_id>`` for terminal groups, otherwise
+            the scope name, followed by ``@<digest>`` when a credential is
+            given. Requests without a scope use the default account.
+
+        """
+        if auth_scope is None:
+            key = ScopedCredentialResolver.AUTH_SCOPE_DEFAULT
+        elif (
+            auth_scope.scope
+            == ScopedCredentialResolver.AUTH_SCOPE_TERMINAL_GROUP
+            and auth_scope.group_id
+        ):
+            key = f"{auth_scope.scope}:{auth_scope.group_id}"
+        else:
+            key = auth_scope.scope
+        if credential is None:
+            return key
+        return f"{key}@{_credential_id(credential)}"
+
+    def get_bucket(self: "RateLimiter", key: str) -> TokenBucket:
+        """
+        Get or create the bucket of a scope key.
+
+        Parameters
+        ----------
+        key (str): The scope key.
+
+        Returns
+        -------
+        TokenBucket: The bucket shared by all requests of the scope.
+
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                scope = key.rpartition("@")[0] or key
+                scope_name = scope.split(":", 1)[0]
+                rate, burst = self.limits.get(
+                    scope,
+                    self.limits.get(scope_name, (self.rate, self.burst)),
+                )
+                bucket = TokenBucket(rate, burst, clock=self._clock)
+                self._buckets[key] = bucket
+            return bucket
+
+    def clear(self: "RateLimiter") -> None:
+        """Drop all buckets, e.g. once the clients using them are gone."""
+        with self._lock:
+            self._buckets.clear()
+
+    def _reserve(
+        self: "RateLimiter",
+        key: str,
+        deadline: Optional[Deadline],
+    ) -> float:
+        max_wait = deadline.remaining() if deadline is not None else None
+        wait = self.get_bucket(key).reserve(max_wait)
+        if wait is None:
+            raise DeadlineExceededException(
+                f"Rate limit for '{key}' cannot be met within the deadline.",
+                context={"rate_limit_key": key},
+            )
+        return wait
+
+    def acquire(
+        self: "RateLimiter",
+        key: str,
+        deadline: Optional[Deadline] = None,
+    ) -> float:
+        """
+        Block until the scope may send a request.
+
+        Parameters
+        ----------
+        key (str): The scope key.
+        deadline (Optional[Deadline]): Deadline of the call, if any.
+
+        Returns
+        -------
+        float: Seconds spent waiting.
+
+        Raises
+        ------
+        DeadlineExceededException: If the wait would outlast the deadline.
+
+        """
+        wait = self._reserve(key, deadline)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    async def acquire_async(
+        self: "RateLimiter",
+        key: str,
+        deadline: Optional[Deadline] = None,
+    ) -> float:
+        """
+        Wait without blocking the event loop until the scope may send a request.
+
+        Parameters
+        ----------
+        key (str): The scope key.
+        deadline (Optional[Deadline]): Deadline of the call, if any.
+
+        Returns
+        -------
+        float: Seconds spent waiting.
+
+        Raises
+        ------
+        DeadlineExceededException: If the wait would outlast the deadline.
+
+        """
+        wait = self._reserve(key, deadline)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
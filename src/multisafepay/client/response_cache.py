@@ -0,0 +1,318 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""TTL/LRU response cache for rarely changing reference-data endpoints."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from multisafepay.api.base.response.api_response import ApiResponse
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Snapshot of response cache usage.
+
+    Attributes
+    ----------
+    hits (int): Lookups answered with a fresh entry.
+    stale_hits (int): Lookups answered with a stale entry while it is refreshed.
+    misses (int): Lookups that had to go to the API.
+    refreshes (int): Background refreshes started for stale entries.
+    evictions (int): Entries dropped to respect the size bound.
+    size (int): Number of entries currently cached.
+
+    """
+
+    hits: int
+    stale_hits: int
+    misses: int
+    refreshes: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_ratio(self: "CacheStats") -> float:
+        """
+        Share of lookups answered from the cache, fresh or stale.
+
+        Returns
+        -------
+        float: A value between 0.0 and 1.0.
+
+        """
+        lookups = self.hits + self.stale_hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return (self.hits + self.stale_hits) / lookups
+
+
+class _Entry:
+    """A cached response and its lifetime."""
+
+    __slots__ = (
+        "endpoint",
+        "fresh_until",
+        "refreshing",
+        "response",
+        "stale_until",
+    )
+
+    def __init__(
+        self: "_Entry",
+        endpoint: str,
+        response: ApiResponse,
+        fresh_until: float,
+        stale_until: float,
+    ) -> None:
+        self.endpoint = endpoint
+        self.response = response
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+        self.refreshing = False
+
+
+class ResponseCache:
+    """
+    Cache of successful GET responses with per-endpoint TTLs.
+
+    Only endpoints with a TTL are cached. A TTL is looked up by endpoint
+    path, most specific first, so ``json/gateways`` covers
+    ``json/gateways/IDEAL`` unless that path has its own TTL. Entries are
+    keyed by the full URL, which includes the locale and query options, and
+    by the credential, so accounts never see each other's data.
+
+    An expired entry is still served for ``stale_while_revalidate`` seconds
+    while one background request refreshes it. The cache holds at most
+    ``max_entries`` entries and evicts the least recently used one first.
+
+    Attributes
+    ----------
+    DEFAULT_TTLS (dict[str, float]): TTLs in seconds used when none are given.
+    ttls (dict[str, float]): TTLs in seconds by endpoint path.
+    max_entries (int): Maximum number of cached responses.
+    stale_while_revalidate (float): Seconds an expired entry may still be served.
+
+    """
+
+    DEFAULT_TTLS = {
+        "json/gateways": 300.0,
+        "json/payment-methods": 300.0,
+        "json/issuers": 300.0,
+        "json/categories": 3600.0,
+        "json/me": 300.0,
+    }
+
+    def __init__(
+        self: "ResponseCache",
+        ttls: Optional[dict[str, float]] = None,
+        max_entries: int = 256,
+        stale_while_revalidate: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the ResponseCache.
+
+        Parameters
+        ----------
+        ttls (Optional[dict[str, float]]): TTLs in seconds by endpoint path,
+            by default DEFAULT_TTLS. Endpoints without a TTL are not cached.
+        max_entries (int): Maximum number of cached responses, by default 256.
+        stale_while_revalidate (float): Seconds an expired entry may still be
+            served while it is refreshed in the background, by default 0.
+        clock (Callable[[], float]): Monotonic clock, by default time.monotonic.
+
+        Raises
+        ------
+        ValueError: If max_entries is smaller than 1 or a duration is negative.
+
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        if stale_while_revalidate < 0 or any(
+            t < 0 for t in self.ttls.values()
+        ):
+            raise ValueError(
+                "TTLs and stale_while_revalidate must not be negative.",
+            )
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _path(endpoint: str) -> str:
+        return endpoint.split("?", 1)[0].strip("/")
+
+    def ttl_for(self: "ResponseCache", endpoint: str) -> Optional[float]:
+        """
+        Look up the TTL of an endpoint.
+
+        Parameters
+        ----------
+        endpoint (str): The endpoint passed to the client, e.g.
+            ``json/issuers/IDEAL``.
+
+        Returns
+        -------
+        Optional[float]: The TTL in seconds, or None when the endpoint is not
+            cached.
+
+        """
+        segments = self._path(endpoint).split("/")
+        for length in range(len(segments), 0, -1):
+            ttl = self.ttls.get("/".join(segments[:length]))
+            if ttl is not None:
+                return ttl if ttl > 0 else None
+        return None
+
+    def get(
+        self: "ResponseCache",
+        key: Hashable,
+    ) -> Optional[tuple[ApiResponse, bool]]:
+        """
+        Look up a cached response.
+
+        Parameters
+        ----------
+        key (Hashable): The cache key of the request.
+
+        Returns
+        -------
+        Optional[tuple[ApiResponse, bool]]: The response and whether the
+            caller must refresh it in the background, or None on a miss.
+            Only the first caller to see a stale entry is asked to refresh it.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self._clock()
+            if entry is None or now >= entry.stale_until:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                self._hits += 1
+                return entry.response, False
+            self._stale_hits += 1
+            refresh = not entry.refreshing
+            if refresh:
+                entry.refreshing = True
+                self._refreshes += 1
+            return entry.response, refresh
+
+    def put(
+        self: "ResponseCache",
+        key: Hashable,
+        endpoint: str,
+        response: ApiResponse,
+        ttl: float,
+    ) -> None:
+        """
+        Store a response.
+
+        Parameters
+        ----------
+        key (Hashable): The cache key of the request.
+        endpoint (str): The endpoint of the request, used by invalidate().
+        response (ApiResponse): The response to cache.
+        ttl (float): Seconds the response stays fresh.
+
+        """
+        now = self._clock()
+        entry = _Entry(
+            self._path(endpoint),
+            response,
+            now + ttl,
+            now + ttl + self.stale_while_revalidate,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def refresh_failed(self: "ResponseCache", key: Hashable) -> None:
+        """
+        Allow a new refresh of a stale entry after a failed one.
+
+        Parameters
+        ----------
+        key (Hashable): The cache key of the request.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refreshing = False
+
+    def invalidate(
+        self: "ResponseCache",
+        endpoint: Optional[str] = None,
+    ) -> int:
+        """
+        Drop cached responses.
+
+        Parameters
+        ----------
+        endpoint (Optional[str]): Endpoint path whose responses, including
+            those of its sub-paths, are dropped. Drops everything when None.
+
+        Returns
+        -------
+        int: The number of dropped entries.
+
+        """
+        with self._lock:
+            if endpoint is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            path = self._path(endpoint)
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if entry.endpoint == path
+                or entry.endpoint.startswith(path + "/")
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def get_stats(self: "ResponseCache") -> CacheStats:
+        """
+        Get a snapshot of the cache counters.
+
+        Returns
+        -------
+        CacheStats: The hit, miss, refresh and eviction counters.
+
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                refreshes=self._refreshes,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
@@ -0,0 +1,284 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Retry policy with exponential backoff, full jitter and Retry-After support."""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+from multisafepay.transport.http_transport import HTTPResponse
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+def _default_retry_exceptions() -> tuple[type[BaseException], ...]:
+    exceptions: list[type[BaseException]] = [ConnectionError, TimeoutError]
+    try:
+        from requests.exceptions import ConnectionError as RequestsConnError
+        from requests.exceptions import Timeout as RequestsTimeout
+
+        exceptions.extend([RequestsConnError, RequestsTimeout])
+    except ImportError:  # pragma: no cover
+        pass
+    try:
+        from urllib3.exceptions import (
+            ConnectTimeoutError,
+            NewConnectionError,
+            ProtocolError,
+            ReadTimeoutError,
+        )
+
+        exceptions.extend(
+            [
+                ConnectTimeoutError,
+                NewConnectionError,
+                ProtocolError,
+                ReadTimeoutError,
+            ],
+        )
+    except ImportError:  # pragma: no cover
+        pass
+    try:
+        from httpx import TransportError
+
+        exceptions.append(TransportError)
+    except ImportError:  # pragma: no cover
+        pass
+    return tuple(exceptions)
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed request is sent again.
+
+    Requests are retried on connection errors and on the configured status
+    codes. GET and DELETE are retried automatically; POST and PATCH are only
+    retried when the request carries an ``Idempotency-Key`` header, so a
+    payment is never submitted twice by accident.
+
+    The delay before retry ``n`` (starting at 0) is drawn uniformly from
+    ``[0, min(backoff_max, backoff_base * 2 ** n)]`` ("full jitter"). When the
+    server sends ``Retry-After``, that value is used instead, capped at
+    ``retry_after_max``.
+
+    Attributes
+    ----------
+    max_retries (int): Maximum number of retries after the first attempt.
+    backoff_base (float): Base delay in seconds for the exponential backoff.
+    backoff_max (float): Upper bound in seconds for a single backoff delay.
+    retry_statuses (frozenset[int]): HTTP status codes that trigger a retry.
+    idempotent_methods (frozenset[str]): Methods retried without an idempotency key.
+    respect_retry_after (bool): Whether to honor the Retry-After header.
+    retry_after_max (float): Upper bound in seconds for a Retry-After delay.
+    retry_exceptions (tuple[type[BaseException], ...]): Transport errors that
+        trigger a retry.
+
+    """
+
+    DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    DEFAULT_IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+
+    def __init__(
+        self: "RetryPolicy",
+        max_retries: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 10.0,
+        retry_statuses: Optional[frozenset[int]] = None,
+        idempotent_methods: Optional[frozenset[str]] = None,
+        respect_retry_after: bool = True,
+        retry_after_max: float = 30.0,
+        retry_exceptions: Optional[tuple[type[BaseException], ...]] = None,
+        rng: Optional[Callable[[float, float], float]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the RetryPolicy.
+
+        Parameters
+        ----------
+        max_retries (int): Maximum number of retries, by default 3.
+        backoff_base (float): Base backoff delay in seconds, by default 0.2.
+        backoff_max (float): Maximum backoff delay in seconds, by default 10.
+        retry_statuses (Optional[frozenset[int]]): Status codes to retry,
+            by default 429, 502, 503 and 504.
+        idempotent_methods (Optional[frozenset[str]]): Methods retried without
+            an idempotency key, by default GET and DELETE.
+        respect_retry_after (bool): Honor Retry-After headers, by default True.
+        retry_after_max (float): Maximum Retry-After delay in seconds, by default 30.
+        retry_exceptions (Optional[tuple[type[BaseException], ...]]): Transport
+            errors to retry, by default connection errors and timeouts of the
+            standard library, requests, urllib3 and httpx.
+        rng (Optional[Callable[[float, float], float]]): Function drawing the
+            jittered delay, by default random.uniform.
+        sleep (Callable[[float], None]): Function used by the sync client to
+            wait between attempts, by default time.sleep.
+
+        Raises
+        ------
+        ValueError: If a numeric setting is negative.
+
+        """
+        if max_retries < 0 or backoff_base < 0 or backoff_max < 0:
+            raise ValueError("Retry settings must not be negative.")
+        if retry_after_max < 0:
+            raise ValueError("retry_after_max must not be negative.")
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = (
+            self.DEFAULT_RETRY_STATUSES
+            if retry_statuses is None
+            else frozenset(retry_statuses)
+        )
+        self.idempotent_methods = (
+            self.DEFAULT_IDEMPOTENT_METHODS
+            if idempotent_methods is None
+            else frozenset(m.upper() for m in idempotent_methods)
+        )
+        self.respect_retry_after = respect_retry_after
+        self.retry_after_max = retry_after_max
+        self.retry_exceptions = (
+            _default_retry_exceptions()
+            if retry_exceptions is None
+            else retry_exceptions
+        )
+        self.rng = rng or random.uniform
+        self.sleep = sleep
+
+    def allows_method(
+        self: "RetryPolicy",
+        method: str,
+        headers: Optional[dict[str, str]] = None,
+    ) -> bool:
+        """
+        Check whether a request with this method and headers may be retried.
+
+        Parameters
+        ----------
+        method (str): The HTTP method.
+        headers (Optional[dict[str, str]]): The request headers.
+
+        Returns
+        -------
+        bool: True for idempotent methods or requests with an idempotency key.
+
+        """
+        if method.upper() in self.idempotent_methods:
+            return True
+        return bool(headers and headers.get(IDEMPOTENCY_KEY_HEADER))
+
+    def is_retryable_response(
+        self: "RetryPolicy",
+        response: HTTPResponse,
+    ) -> bool:
+        """
+        Check whether a response status should be retried.
+
+        Parameters
+        ----------
+        response (HTTPResponse): The transport response.
+
+        Returns
+        -------
+        bool: True if the status code is one of the retry statuses.
+
+        """
+        return getattr(response, "status_code", None) in self.retry_statuses
+
+    def is_retryable_error(
+        self: "RetryPolicy",
+        error: BaseException,
+    ) -> bool:
+        """
+        Check whether a transport error should be retried.
+
+        Parameters
+        ----------
+        error (BaseException): The error raised by the transport.
+
+        Returns
+        -------
+        bool: True if the error is one of the retry exceptions.
+
+        """
+        return isinstance(error, self.retry_exceptions)
+
+    def backoff(self: "RetryPolicy", retry_number: int) -> float:
+        """
+        Draw the full-jitter backoff delay for a retry.
+
+        Parameters
+        ----------
+        retry_number (int): Zero-based number of the retry.
+
+        Returns
+        -------
+        float: The delay in seconds.
+
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2**retry_number))
+        return self.rng(0.0, ceiling)
+
+    def retry_after(
+        self: "RetryPolicy",
+        response: Optional[HTTPResponse],
+    ) -> Optional[float]:
+        """
+        Read the Retry-After delay of a response.
+
+        Parameters
+        ----------
+        response (Optional[HTTPResponse]): The transport response, if any.
+
+        Returns
+        -------
+        Optional[float]: The capped delay in seconds, or None when the header
+            is missing, unparsable or ignored.
+
+        """
+        if not self.respect_retry_after or response is None:
+            return None
+        headers = getattr(response, "headers", None) or {}
+        value = headers.get("Retry-After")
+        if value is None:
+            return None
+        value = str(value).strip()
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            delay = retry_at.timestamp() - time.time()
+        return min(max(delay, 0.0), self.retry_after_max)
+
+    def next_delay(
+        self: "RetryPolicy",
+        retry_number: int,
+        response: Optional[HTTPResponse] = None,
+    ) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Parameters
+        ----------
+        retry_number (int): Zero-based number of the upcoming retry.
+        response (Optional[HTTPResponse]): The response that triggered the
+            retry, if any.
+
+        Returns
+        -------
+        float: The delay in seconds.
+
+        """
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(retry_number)
@@ -0,0 +1,214 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Single-flight coalescing of identical concurrent calls."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Hashable
+from typing import Any, Callable, Optional, TypeVar
+
+from ..exception.deadline_exceeded import DeadlineExceededException
+from .deadline import Deadline
+
+T = TypeVar("T")
+
+
+class _Call:
+    """A call in flight and, once done, its outcome."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self: "_Call") -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between identical concurrent callers.
+
+    The first caller of a key (the leader) runs the call; callers arriving
+    with the same key while it is in flight wait for it and receive the same
+    result, or the same exception. The leader's DeadlineExceededException
+    is not shared: it only reflects the leader's own time budget, so the
+    waiting callers try again instead. Once the call has finished the key is
+    forgotten, so nothing is cached beyond the lifetime of the call.
+
+    Threads use ``do`` and coroutines use ``do_async``; both may share one
+    instance.
+
+    Attributes
+    ----------
+    coalesced_calls (int): Number of calls served by another caller's call.
+
+    """
+
+    def __init__(self: "SingleFlight") -> None:
+        """Initialize an empty SingleFlight."""
+        self.coalesced_calls = 0
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[int, Hashable], asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self: "SingleFlight") -> int:
+        """
+        Count the distinct calls currently in flight.
+
+        Returns
+        -------
+        int: The number of keys with a running call.
+
+        """
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+    def do(
+        self: "SingleFlight",
+        key: Hashable,
+        fn: Callable[[], T],
+        deadline: Optional[Deadline] = None,
+    ) -> tuple[T, bool]:
+        """
+        Run `fn` or join the identical call already in flight.
+
+        Parameters
+        ----------
+        key (Hashable): Identity of the call.
+        fn (Callable[[], T]): The call, only run by the leader.
+        deadline (Optional[Deadline]): Deadline bounding how long a follower
+            waits for the leader.
+
+        Returns
+        -------
+        tuple[T, bool]: The result and whether it was shared with another
+            caller's call.
+
+        Raises
+        ------
+        DeadlineExceededException: If a follower's deadline expires first.
+
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                shared = call is not None
+                if call is None:
+                    call = _Call()
+                    self._calls[key] = call
+                else:
+                    self.coalesced_calls += 1
+
+            if not shared:
+                return self._lead(key, call, fn), False
+
+            timeout = deadline.remaining() if deadline is not None else None
+            if not call.done.wait(timeout):
+                raise self._deadline_exceeded(deadline)
+            if not isinstance(call.error, DeadlineExceededException):
+                break
+            # The leader ran out of its own time budget, which says nothing
+            # about this caller's: try again, leading a new call if needed.
+        if call.error is not None:
+            raise call.error
+        return call.result, True
+
+    def _lead(
+        self: "SingleFlight",
+        key: Hashable,
+        call: _Call,
+        fn: Callable[[], T],
+    ) -> T:
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(
+        self: "SingleFlight",
+        key: Hashable,
+        fn: Callable[[], Awaitable[T]],
+        deadline: Optional[Deadline] = None,
+    ) -> tuple[T, bool]:
+        """
+        Await `fn` or join the identical call already in flight.
+
+        The call runs as its own task, so cancelling one caller, including
+        the one that started it, does not cancel it for the others.
+
+        Parameters
+        ----------
+        key (Hashable): Identity of the call.
+        fn (Callable[[], Awaitable[T]]): The call, only started by the leader.
+        deadline (Optional[Deadline]): Deadline bounding how long a caller
+            waits for the call.
+
+        Returns
+        -------
+        tuple[T, bool]: The result and whether it was shared with another
+            caller's call.
+
+        Raises
+        ------
+        DeadlineExceededException: If the caller's deadline expires first.
+
+        """
+        # Tasks are bound to their event loop, so keys are too.
+        task_key = (id(asyncio.get_running_loop()), key)
+        while True:
+            with self._lock:
+                running = self._tasks.get(task_key)
+                shared = running is not None and not running.done()
+                if running is not None and shared:
+                    task = running
+                    self.coalesced_calls += 1
+                else:
+                    task = asyncio.ensure_future(fn())
+                    self._tasks[task_key] = task
+                    task.add_done_callback(
+                        lambda done: self._forget_task(task_key, done),
+                    )
+
+            timeout = deadline.remaining() if deadline is not None else None
+            done, _ = await asyncio.wait({task}, timeout=timeout)
+            if not done:
+                raise self._deadline_exceeded(deadline)
+            if not shared or task.cancelled():
+                break
+            if not isinstance(task.exception(), DeadlineExceededException):
+                break
+            # The leader ran out of its own time budget, which says nothing
+            # about this caller's: try again, leading a new call if needed.
+        return task.result(), shared
+
+    def _forget_task(
+        self: "SingleFlight",
+        task_key: tuple[int, Hashable],
+        task: asyncio.Future,
+    ) -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller gave up.
+            task.exception()
+
+    @staticmethod
+    def _deadline_exceeded(
+        deadline: Optional[Deadline],
+    ) -> DeadlineExceededException:
+        budget = deadline.budget if deadline is not None else 0.0
+        return DeadlineExceededException(
+            f"Deadline of {budget:g}s exceeded while waiting for a shared call.",
+        )
@@ -2,6 +2,9 @@
 
 from multisafepay.exception.api import ApiException
 from multisafepay.exception.api_unavailable import ApiUnavailableException
+from multisafepay.exception.deadline_exceeded import (
+    DeadlineExceededException,
+)
 from multisafepay.exception.invalid_api_key import InvalidApiKeyException
 from multisafepay.exception.invalid_argument import InvalidArgumentException
 from multisafepay.exception.invalid_total_amount import (
@@ -14,6 +17,7 @@ from multisafepay.exception.missing_plugin_version import (
 __all__ = [
     "ApiException",
     "ApiUnavailableException",
+    "DeadlineExceededException",
     "InvalidApiKeyException",
     "InvalidArgumentException",
     "InvalidTotalAmountException",
@@ -0,0 +1,19 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Deadline exceeded exception for requests that ran out of time budget."""
+
+from multisafepay.exception.api import ApiException
+
+
+class DeadlineExceededException(ApiException):
+    """
+    Exception raised when a request deadline has expired.
+
+    This exception is raised when the time budget passed to a manager method
+    runs out before a response was received.
+    """
@@ -7,26 +7,89 @@
 
 """MultiSafepay SDK main module providing the primary SDK interface."""
 
-from typing import Optional
-
-from multisafepay.api.paths.auth.auth_manager import AuthManager
-from multisafepay.api.paths.categories.category_manager import CategoryManager
-from multisafepay.api.paths.gateways.gateway_manager import GatewayManager
-from multisafepay.api.paths.issuers.issuer_manager import IssuerManager
-from multisafepay.api.paths.orders.order_manager import OrderManager
-from multisafepay.api.paths.payment_methods.payment_method_manager import (
-    PaymentMethodManager,
-)
-from multisafepay.api.paths.transactions.transaction_manager import (
-    TransactionManager,
-)
+import importlib
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Optional, cast
+
 from multisafepay.transport import HTTPTransport
+from typing_extensions import Self
 
-from .api.paths.capture.capture_manager import CaptureManager
-from .api.paths.me.me_manager import MeManager
-from .api.paths.recurring.recurring_manager import RecurringManager
+from .client.circuit_breaker import CircuitBreaker
 from .client.client import Client
 from .client.credential_resolver import CredentialResolver
+from .client.metrics import MetricsRegistry
+from .client.middleware import Middleware
+from .client.rate_limiter import RateLimiter
+from .client.response_cache import ResponseCache
+from .client.retry import RetryPolicy
+from .client.single_flight import SingleFlight
+from .util.json_codec import JsonCodec
+
+if TYPE_CHECKING:
+    from multisafepay.api.paths.auth.auth_manager import AuthManager
+    from multisafepay.api.paths.capture.capture_manager import CaptureManager
+    from multisafepay.api.paths.categories.category_manager import (
+        CategoryManager,
+    )
+    from multisafepay.api.paths.gateways.gateway_manager import GatewayManager
+    from multisafepay.api.paths.issuers.issuer_manager import IssuerManager
+    from multisafepay.api.paths.me.me_manager import MeManager
+    from multisafepay.api.paths.orders.order_manager import OrderManager
+    from multisafepay.api.paths.payment_methods.payment_method_manager import (
+        PaymentMethodManager,
+    )
+    from multisafepay.api.paths.recurring.recurring_manager import (
+        RecurringManager,
+    )
+    from multisafepay.api.paths.transactions.transaction_manager import (
+        TransactionManager,
+    )
+    from multisafepay.batch import Batch
+
+
+# Manager classes by name, imported when the manager is first used.
+_MANAGERS = {
+    "auth": (
+        "multisafepay.api.paths.auth.auth_manager",
+        "AuthManager",
+    ),
+    "capture": (
+        "multisafepay.api.paths.capture.capture_manager",
+        "CaptureManager",
+    ),
+    "category": (
+        "multisafepay.api.paths.categories.category_manager",
+        "CategoryManager",
+    ),
+    "gateway": (
+        "multisafepay.api.paths.gateways.gateway_manager",
+        "GatewayManager",
+    ),
+    "issuer": (
+        "multisafepay.api.paths.issuers.issuer_manager",
+        "IssuerManager",
+    ),
+    "me": (
+        "multisafepay.api.paths.me.me_manager",
+        "MeManager",
+    ),
+    "order": (
+        "multisafepay.api.paths.orders.order_manager",
+        "OrderManager",
+    ),
+    "payment_method": (
+        "multisafepay.api.paths.payment_methods.payment_method_manager",
+        "PaymentMethodManager",
+    ),
+    "recurring": (
+        "multisafepay.api.paths.recurring.recurring_manager",
+        "RecurringManager",
+    ),
+    "transaction": (
+        "multisafepay.api.paths.transactions.transaction_manager",
+        "TransactionManager",
+    ),
+}
 
 
 class Sdk:
@@ -34,7 +97,8 @@ class Sdk:
     SDK class for interacting with the MultiSafePay API.
 
     This class provides methods to manage various resources such as transactions,
-    gateways, payment methods, issuers, orders, and more.
+    gateways, payment methods, issuers, orders, and more. Each manager is
+    imported and created on first use, then reused by later calls.
     """
 
     def __init__(
@@ -45,6 +109,16 @@ class Sdk:
         locale: str = "en_US",
         base_url: Optional[str] = None,
         credential_resolver: Optional[CredentialResolver] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        response_cache: Optional[ResponseCache] = None,
+        lean_responses: bool = False,
+        json_codec: Optional[JsonCodec] = None,
+        middlewares: Optional[Sequence[Middleware]] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        record_timings: bool = False,
     ) -> None:
         """
         Initialize the SDK with the provided configuration.
@@ -65,6 +139,33 @@ class Sdk:
             Custom API base URL (dev-only guardrails apply), by default None.
         credential_resolver : Optional[CredentialResolver], optional
             Strategy for resolving API keys per auth scope, by default None.
+        retry_policy : Optional[RetryPolicy], optional
+            Policy deciding which failed requests are retried, by default None.
+        circuit_breaker : Optional[CircuitBreaker], optional
+            Breaker failing fast on unhealthy endpoint families, by default None.
+        rate_limiter : Optional[RateLimiter], optional
+            Limiter shaping the request rate per credential scope, by default None.
+        single_flight : Optional[SingleFlight], optional
+            Coalescer sharing one in-flight call between identical concurrent
+            GET requests, by default None.
+        response_cache : Optional[ResponseCache], optional
+            Cache of GET responses of reference-data endpoints, by default None.
+        lean_responses : bool, optional
+            Keep neither the response body bytes nor the request headers and
+            body on responses, by default False.
+        json_codec : Optional[JsonCodec], optional
+            Codec encoding request bodies and decoding responses, by default
+            None, which uses orjson when installed and the standard library
+            otherwise.
+        middlewares : Optional[Sequence[Middleware]], optional
+            Middlewares wrapped around each transport call, outermost first,
+            by default None.
+        metrics : Optional[MetricsRegistry], optional
+            Registry recording the latency, errors, retries and bytes of
+            every call, by default None.
+        record_timings : bool, optional
+            Record the time spent per phase of every call, see
+            ApiResponse.get_timings(), by default False.
 
         Raises
         ------
@@ -78,10 +179,50 @@ class Sdk:
             locale=locale,
             base_url=base_url,
             credential_resolver=credential_resolver,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            response_cache=response_cache,
+            lean_responses=lean_responses,
+            json_codec=json_codec,
+            middlewares=middlewares,
+            metrics=metrics,
+            record_timings=record_timings,
         )
-        self.recurring_manager = RecurringManager(self.client)
+        self._managers: dict[str, object] = {}
+        self._batch: Optional[Batch] = None
 
-    def get_transaction_manager(self: "Sdk") -> TransactionManager:
+    @property
+    def recurring_manager(self: "Sdk") -> "RecurringManager":
+        """
+        The recurring manager, kept for backwards compatibility.
+
+        Returns
+        -------
+        RecurringManager
+            The recurring manager instance.
+
+        """
+        return self.get_recurring_manager()
+
+    def _get_manager(self: "Sdk", name: str) -> object:
+        manager = self._managers.get(name)
+        if manager is None:
+            module, class_name = _MANAGERS[name]
+            manager_class = getattr(
+                importlib.import_module(module),
+                class_name,
+            )
+            # Managers keep no per-call state, so one instance per SDK is
+            # reused; setdefault keeps the first one if threads race here.
+            manager = self._managers.setdefault(
+                name,
+                manager_class(self.client),
+            )
+        return manager
+
+    def get_transaction_manager(self: "Sdk") -> "TransactionManager":
         """
         Get the transaction manager.
 
@@ -91,9 +232,9 @@ class Sdk:
             The transaction manager instance.
 
         """
-        return TransactionManager(self.client)
+        return cast("TransactionManager", self._get_manager("transaction"))
 
-    def get_gateway_manager(self: "Sdk") -> GatewayManager:
+    def get_gateway_manager(self: "Sdk") -> "GatewayManager":
         """
         Get the gateway manager.
 
@@ -103,9 +244,9 @@ class Sdk:
             The gateway manager instance.
 
         """
-        return GatewayManager(self.client)
+        return cast("GatewayManager", self._get_manager("gateway"))
 
-    def get_payment_method_manager(self: "Sdk") -> PaymentMethodManager:
+    def get_payment_method_manager(self: "Sdk") -> "PaymentMethodManager":
         """
         Get the payment method manager.
 
@@ -115,9 +256,12 @@ class Sdk:
             The payment method manager instance.
 
         """
-        return PaymentMethodManager(self.client)
+        return cast(
+            "PaymentMethodManager",
+            self._get_manager("payment_method"),
+        )
 
-    def get_issuer_manager(self: "Sdk") -> IssuerManager:
+    def get_issuer_manager(self: "Sdk") -> "IssuerManager":
         """
         Get the issuer manager.
 
@@ -127,9 +271,9 @@ class Sdk:
             The issuer manager instance.
 
         """
-        return IssuerManager(self.client)
+        return cast("IssuerManager", self._get_manager("issuer"))
 
-    def get_recurring_manager(self: "Sdk") -> RecurringManager:
+    def get_recurring_manager(self: "Sdk") -> "RecurringManager":
         """
         Get the recurring manager.
 
@@ -139,9 +283,9 @@ class Sdk:
             The recurring manager instance.
 
         """
-        return self.recurring_manager
+        return cast("RecurringManager", self._get_manager("recurring"))
 
-    def get_auth_manager(self: "Sdk") -> AuthManager:
+    def get_auth_manager(self: "Sdk") -> "AuthManager":
         """
         Get the auth manager.
 
@@ -151,9 +295,9 @@ class Sdk:
             The auth manager instance.
 
         """
-        return AuthManager(self.client)
+        return cast("AuthManager", self._get_manager("auth"))
 
-    def get_me_manager(self: "Sdk") -> MeManager:
+    def get_me_manager(self: "Sdk") -> "MeManager":
         """
         Get the me manager.
 
@@ -163,9 +307,9 @@ class Sdk:
             The me manager instance.
 
         """
-        return MeManager(self.client)
+        return cast("MeManager", self._get_manager("me"))
 
-    def get_category_manager(self: "Sdk") -> CategoryManager:
+    def get_category_manager(self: "Sdk") -> "CategoryManager":
         """
         Get the category manager.
 
@@ -175,9 +319,9 @@ class Sdk:
             The category manager instance.
 
         """
-        return CategoryManager(self.client)
+        return cast("CategoryManager", self._get_manager("category"))
 
-    def get_order_manager(self: "Sdk") -> OrderManager:
+    def get_order_manager(self: "Sdk") -> "OrderManager":
         """
         Get the order manager.
 
@@ -187,9 +331,9 @@ class Sdk:
             The order manager instance.
 
         """
-        return OrderManager(self.client)
+        return cast("OrderManager", self._get_manager("order"))
 
-    def get_capture_manager(self: "Sdk") -> CaptureManager:
+    def get_capture_manager(self: "Sdk") -> "CaptureManager":
         """
         Get the capture manager.
 
@@ -199,7 +343,43 @@ class Sdk:
             The capture manager instance.
 
         """
-        return CaptureManager(self.client)
+        return cast("CaptureManager", self._get_manager("capture"))
+
+    def batch(self: "Sdk") -> "Batch":
+        """
+        Get the batch executor for fan-out calls.
+
+        The executor and its thread pool are created on first use and shared
+        by all later batches of this SDK.
+
+        Returns
+        -------
+        Batch
+            The batch executor instance.
+
+        """
+        if self._batch is None:
+            from multisafepay.batch import Batch
+
+            self._batch = Batch(self.client)
+        return self._batch
+
+    def close(self: "Sdk") -> None:
+        """
+        Shut down the thread pool of batch(), if it was started.
+
+        The transport is left open, as it may be shared with other SDKs.
+        """
+        if self._batch is not None:
+            self._batch.close()
+
+    def __enter__(self: Self) -> Self:
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self: "Sdk", *args: object) -> None:
+        """Shut down the batch thread pool when exiting context."""
+        self.close()
 
     def get_client(self: "Sdk") -> Client:
         """
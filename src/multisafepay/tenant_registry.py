@@ -0,0 +1,331 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Registry of per-tenant SDK instances sharing one HTTP transport."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from multisafepay.sdk import Sdk
+from multisafepay.transport import HTTPTransport, RequestsTransport
+from typing_extensions import Self
+
+# Sdk options keeping state about the calls of one tenant. A shared
+# instance would let one merchant's errors or budget affect the others and
+# would keep the state of evicted tenants, so they are built per tenant.
+_PER_TENANT_OPTIONS = frozenset(
+    {"circuit_breaker", "rate_limiter", "response_cache", "single_flight"},
+)
+# Sdk options set by the registry itself.
+_REGISTRY_OPTIONS = frozenset({"api_key", "transport"})
+
+
+@dataclass(frozen=True)
+class TenantRegistryStats:
+    """
+    Snapshot of tenant registry usage.
+
+    Attributes
+    ----------
+    hits (int): Lookups answered with a kept SDK.
+    misses (int): Lookups that had to create an SDK.
+    evictions (int): SDKs dropped to respect the size bound or idle timeout.
+    size (int): Number of SDKs currently kept.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class _Tenant:
+    """A kept SDK, the API key it was built with and its last use."""
+
+    __slots__ = ("api_key", "last_used", "sdk")
+
+    def __init__(
+        self: "_Tenant",
+        sdk: Sdk,
+        api_key: str,
+        last_used: float,
+    ) -> None:
+        self.sdk = sdk
+        self.api_key = api_key
+        self.last_used = last_used
+
+
+class TenantRegistry:
+    """
+    Hands out one SDK per tenant, all backed by the same HTTP transport.
+
+    Every tenant gets its own Sdk, configured with its API key, but all of
+    them send their requests through one transport, so the connections to
+    the API are pooled and kept warm across tenants instead of opening a
+    session per merchant. Stateless options given to the registry, such as
+    a RetryPolicy or MetricsRegistry, are shared as well. A CircuitBreaker,
+    RateLimiter, ResponseCache or SingleFlight keeps state about the calls
+    of one tenant instead, so ``tenant_options`` builds those per tenant.
+
+    The registry keeps at most ``max_tenants`` SDKs and evicts the least
+    recently used one first, and SDKs unused for ``idle_timeout`` seconds.
+    Evicting a tenant drops its cached responses and rate limiter buckets
+    and shuts down the thread pool of its batch executor. An evicted SDK
+    keeps working for callers still holding it; the next lookup of its
+    tenant builds a new one.
+
+    Attributes
+    ----------
+    transport (HTTPTransport): The transport shared by all tenants.
+    max_tenants (int): Maximum number of kept SDKs.
+    idle_timeout (Optional[float]): Seconds after which an unused SDK is
+        evicted, or None to only evict on size.
+
+    """
+
+    def __init__(
+        self: "TenantRegistry",
+        transport: Optional[HTTPTransport] = None,
+        api_keys: Optional[Callable[[str], str]] = None,
+        tenant_options: Optional[Callable[[str], dict[str, Any]]] = None,
+        max_tenants: int = 1024,
+        idle_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        **sdk_options: Any,  # noqa: ANN401
+    ) -> None:
+        """
+        Initialize the TenantRegistry.
+
+        Parameters
+        ----------
+        transport (Optional[HTTPTransport]): Transport shared by all tenants,
+            by default a RequestsTransport owned and closed by the registry.
+        api_keys (Optional[Callable[[str], str]]): Looks up the API key of a
+            tenant id when get() is called without one, by default None.
+        tenant_options (Optional[Callable[[str], dict[str, Any]]]): Builds
+            further Sdk arguments of a tenant id each time its SDK is
+            created, e.g. ``lambda _: {"response_cache": ResponseCache()}``.
+            It must return new instances. By default None.
+        max_tenants (int): Maximum number of kept SDKs, by default 1024.
+        idle_timeout (Optional[float]): Seconds after which an unused SDK is
+            evicted, by default None (no idle eviction).
+        clock (Callable[[], float]): Monotonic clock, by default time.monotonic.
+        **sdk_options (Any): Further Sdk arguments, e.g. is_production,
+            locale or retry_policy, passed to the SDK of every tenant.
+
+        Raises
+        ------
+        ValueError: If max_tenants is smaller than 1, idle_timeout is not
+            positive, or sdk_options contains api_key, transport or a
+            component that must be built per tenant.
+
+        """
+        self._check_options(sdk_options, shared=True)
+        if max_tenants < 1:
+            raise ValueError("max_tenants must be at least 1.")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be positive.")
+        self._owned_transport: Optional[RequestsTransport] = None
+        if transport is None:
+            transport = self._owned_transport = RequestsTransport()
+        self.transport = transport
+        self.max_tenants = max_tenants
+        self.idle_timeout = idle_timeout
+        self._api_keys = api_keys
+        self._tenant_options = tenant_options
+        self._sdk_options = sdk_options
+        self._clock = clock
+        self._tenants: OrderedDict[str, _Tenant] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self: "TenantRegistry",
+        tenant_id: str,
+        api_key: Optional[str] = None,
+    ) -> Sdk:
+        """
+        Get the SDK of a tenant, creating it on first use.
+
+        Parameters
+        ----------
+        tenant_id (str): The tenant, e.g. a merchant id.
+        api_key (Optional[str]): The API key of the tenant. When it differs
+            from the key the kept SDK was built with, e.g. after a key
+            rotation, the SDK is replaced. By default None, which looks the
+            key up with ``api_keys`` unless an SDK is kept.
+
+        Returns
+        -------
+        Sdk: The SDK of the tenant.
+
+        Raises
+        ------
+        ValueError: If no API key is given and none can be looked up.
+
+        """
+        evicted: list[_Tenant] = []
+        try:
+            with self._lock:
+                now = self._clock()
+                self._evict_idle(now, evicted)
+                tenant = self._tenants.get(tenant_id)
+                if tenant is not None and api_key in (None, tenant.api_key):
+                    tenant.last_used = now
+                    self._tenants.move_to_end(tenant_id)
+                    self._hits += 1
+                    return tenant.sdk
+                self._misses += 1
+            # Look the key up and build the SDK outside the lock, so a slow
+            # secret store does not block the lookups of other tenants.
+            api_key = api_key or self._lookup_api_key(tenant_id)
+            sdk = Sdk(
+                api_key=api_key,
+                transport=self.transport,
+                **{**self._sdk_options, **self._options_of(tenant_id)},
+            )
+            with self._lock:
+                replaced = self._tenants.pop(tenant_id, None)
+                if replaced is not None:
+                    evicted.append(replaced)
+                self._tenants[tenant_id] = _Tenant(
+                    sdk,
+                    api_key,
+                    self._clock(),
+                )
+                while len(self._tenants) > self.max_tenants:
+                    evicted.append(self._tenants.popitem(last=False)[1])
+                    self._evictions += 1
+            return sdk
+        finally:
+            # Release the state of evicted tenants outside the lock, as
+            # shutting a batch pool down waits for its running calls.
+            for tenant in evicted:
+                self._release(tenant)
+
+    @staticmethod
+    def _check_options(options: dict[str, Any], shared: bool) -> None:
+        for name in options:
+            if name in _REGISTRY_OPTIONS:
+                raise ValueError(
+                    f"{name} is set by the registry: pass the API key to get() "
+                    "or api_keys and the transport to the registry.",
+                )
+            if shared and name in _PER_TENANT_OPTIONS:
+                raise ValueError(
+                    f"{name} keeps per-tenant state and cannot be shared by "
+                    "all tenants; build it per tenant with tenant_options.",
+                )
+
+    def _options_of(self: "TenantRegistry", tenant_id: str) -> dict[str, Any]:
+        if self._tenant_options is None:
+            return {}
+        options = self._tenant_options(tenant_id)
+        self._check_options(options, shared=False)
+        return options
+
+    @staticmethod
+    def _release(tenant: _Tenant) -> None:
+        client = tenant.sdk.get_client()
+        if client.response_cache is not None:
+            client.response_cache.invalidate()
+        if client.rate_limiter is not None:
+            client.rate_limiter.clear()
+        tenant.sdk.close()
+
+    def _lookup_api_key(self: "TenantRegistry", tenant_id: str) -> str:
+        if self._api_keys is None:
+            raise ValueError(
+                f"No API key given for tenant {tenant_id!r} and no api_keys "
+                "lookup configured.",
+            )
+        return self._api_keys(tenant_id)
+
+    def _evict_idle(
+        self: "TenantRegistry",
+        now: float,
+        evicted: list[_Tenant],
+    ) -> None:
+        if self.idle_timeout is None:
+            return
+        # The least recently used tenants come first, so stop at the first
+        # one still in use.
+        while self._tenants:
+            tenant = next(iter(self._tenants.values()))
+            if now - tenant.last_used < self.idle_timeout:
+                return
+            evicted.append(self._tenants.popitem(last=False)[1])
+            self._evictions += 1
+
+    def evict(self: "TenantRegistry", tenant_id: str) -> bool:
+        """
+        Drop the SDK of a tenant, e.g. after revoking its API key.
+
+        Parameters
+        ----------
+        tenant_id (str): The tenant.
+
+        Returns
+        -------
+        bool: Whether an SDK was kept for the tenant.
+
+        """
+        with self._lock:
+            tenant = self._tenants.pop(tenant_id, None)
+        if tenant is None:
+            return False
+        self._release(tenant)
+        return True
+
+    def get_stats(self: "TenantRegistry") -> TenantRegistryStats:
+        """
+        Get a snapshot of the registry counters.
+
+        Returns
+        -------
+        TenantRegistryStats: The hit, miss and eviction counters.
+
+        """
+        with self._lock:
+            return TenantRegistryStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._tenants),
+            )
+
+    def __len__(self: "TenantRegistry") -> int:
+        """Return the number of kept SDKs."""
+        return len(self._tenants)
+
+    def __contains__(self: "TenantRegistry", tenant_id: object) -> bool:
+        """Return whether an SDK is kept for the tenant."""
+        return tenant_id in self._tenants
+
+    def close(self: "TenantRegistry") -> None:
+        """Drop all SDKs and close the transport if the registry created it."""
+        with self._lock:
+            tenants = list(self._tenants.values())
+            self._tenants.clear()
+        for tenant in tenants:
+            self._release(tenant)
+        if self._owned_transport is not None:
+            self._owned_transport.close()
+
+    def __enter__(self: Self) -> Self:
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self: "TenantRegistry", *args: object) -> None:
+        """Close the registry when exiting context."""
+        self.close()
@@ -7,11 +7,47 @@
 
 """Transport layer module for HTTP communication abstraction."""
 
+from .async_http_transport import AsyncHTTPTransport
+from .cassette import (
+    AsyncReplayTransport,
+    CassetteError,
+    CassetteHTTPError,
+    CassetteResponse,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+    read_cassette,
+)
+from .http2_transport import Http2Transport
 from .http_transport import HTTPResponse, HTTPTransport
+from .httpx_async_transport import HttpxAsyncTransport
+from .httpx_transport import HttpxTransport
+from .pool_stats import PoolStats
 from .requests_transport import RequestsTransport
+from .urllib3_transport import (
+    Urllib3HTTPError,
+    Urllib3Response,
+    Urllib3Transport,
+)
 
 __all__ = [
+    "AsyncHTTPTransport",
+    "AsyncReplayTransport",
+    "CassetteError",
+    "CassetteHTTPError",
+    "CassetteResponse",
     "HTTPTransport",
     "HTTPResponse",
+    "Http2Transport",
+    "HttpxAsyncTransport",
+    "HttpxTransport",
+    "Interaction",
+    "PoolStats",
+    "RecordingTransport",
+    "ReplayTransport",
     "RequestsTransport",
+    "Urllib3HTTPError",
+    "Urllib3Response",
+    "Urllib3Transport",
+    "read_cassette",
 ]
@@ -0,0 +1,60 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Asynchronous HTTP transport abstraction for asyncio-based integrations."""
+
+from typing import Optional, Protocol, Union
+
+from .http_transport import HTTPResponse
+
+
+class AsyncHTTPTransport(Protocol):
+    """
+    Protocol defining the interface for asynchronous HTTP transports.
+
+    This is the asyncio counterpart of ``HTTPTransport``: the request is
+    awaited instead of blocking the calling thread, so many requests can be
+    in flight on a single event loop. The returned object must already hold
+    the full response body and implement the ``HTTPResponse`` protocol.
+    """
+
+    async def request(
+        self: "AsyncHTTPTransport",
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        data: Optional[Union[str, bytes]] = None,
+        **kwargs: object,
+    ) -> HTTPResponse:
+        """
+        Execute an HTTP request without blocking the event loop.
+
+        Parameters
+        ----------
+        method (str):
+            The HTTP method (GET, POST, PATCH, DELETE, etc.).
+        url (str):
+            The full URL for the request.
+        headers (Optional[dict[str, str]]):
+            HTTP headers to include in the request, by default None.
+        data (Optional[Union[str, bytes]]):
+            Request body data, by default None.
+        **kwargs (object):
+            Additional keyword arguments for transport-specific options.
+
+        Returns
+        -------
+        HTTPResponse
+            The HTTP response object.
+
+        Raises
+        ------
+        Exception
+            If the request fails or encounters an error.
+
+        """
+        raise NotImplementedError
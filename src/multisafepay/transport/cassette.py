@@ -0,0 +1,719 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Transports recording API traffic to a cassette file and replaying it."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import IO, TYPE_CHECKING, Any, Callable, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from typing_extensions import Self
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+    from .http_transport import HTTPResponse, HTTPTransport
+
+CassetteSource = Union[str, "os.PathLike[str]", "Iterable[Interaction]"]
+
+REDACTED = "REDACTED"
+DEFAULT_REDACTED_HEADERS = ("authorization", "api_key", "x-api-key")
+DEFAULT_REDACTED_PARAMS = ("api_key",)
+
+
+def _open(path: str | os.PathLike[str], mode: str) -> IO[bytes]:
+    if os.fspath(path).endswith(".gz"):
+        return gzip.open(path, mode)  # type: ignore[return-value]
+    return open(path, mode)  # noqa: SIM115
+
+
+def _body_text(data: str | bytes | None) -> str | None:
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    return data
+
+
+def _redact_url(url: str, params: tuple[str, ...]) -> str:
+    parts = urlsplit(url)
+    pairs = parse_qsl(parts.query, keep_blank_values=True)
+    # Names are matched once decoded and lowercased, so API_KEY= and
+    # api%5Fkey= are redacted as well; other URLs are left as they are.
+    if not any(name.lower() in params for name, _ in pairs):
+        return url
+    query = urlencode(
+        [
+            (name, REDACTED if name.lower() in params else value)
+            for name, value in pairs
+        ],
+    )
+    return urlunsplit(parts._replace(query=query))
+
+
+@dataclass
+class Interaction:
+    """
+    A recorded request and the response it received.
+
+    Attributes
+    ----------
+    method (str): The HTTP method.
+    url (str): The full URL, with credentials in the query redacted.
+    status_code (int): The status code of the response.
+    content (bytes): The response body.
+    headers (dict[str, str]): The response headers.
+    request_headers (dict[str, str]): The request headers, with credentials
+        redacted.
+    request_body (str | None): The request body.
+    elapsed (float): Seconds the wrapped transport took to answer.
+
+    """
+
+    method: str
+    url: str
+    status_code: int
+    content: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+    request_headers: dict[str, str] = field(default_factory=dict)
+    request_body: str | None = None
+    elapsed: float = 0.0
+
+    def to_dict(self: Interaction) -> dict[str, Any]:
+        """
+        Convert the interaction to a JSON-serializable dictionary.
+
+        Text bodies are stored as is, other bodies base64-encoded.
+
+        Returns
+        -------
+        dict[str, Any]: The interaction as a cassette line.
+
+        """
+        line: dict[str, Any] = {
+            "method": self.method,
+            "url": self.url,
+            "request_headers": self.request_headers,
+            "request_body": self.request_body,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "elapsed": round(self.elapsed, 6),
+        }
+        try:
+            line["body"] = self.content.decode("utf-8")
+        except UnicodeDecodeError:
+            line["body_base64"] = base64.b64encode(self.content).decode()
+        return line
+
+    @classmethod
+    def from_dict(cls: type[Interaction], line: dict[str, Any]) -> Interaction:
+        """
+        Create an interaction from a cassette line.
+
+        Parameters
+        ----------
+        line (dict[str, Any]): The interaction as written by to_dict().
+
+        Returns
+        -------
+        Interaction: The interaction.
+
+        """
+        if "body_base64" in line:
+            content = base64.b64decode(line["body_base64"])
+        else:
+            content = line.get("body", "").encode("utf-8")
+        return cls(
+            method=line["method"],
+            url=line["url"],
+            status_code=line["status_code"],
+            content=content,
+            headers=line.get("headers", {}),
+            request_headers=line.get("request_headers", {}),
+            request_body=line.get("request_body"),
+            elapsed=line.get("elapsed", 0.0),
+        )
+
+
+def read_cassette(path: str | os.PathLike[str]) -> list[Interaction]:
+    """
+    Read the interactions of a cassette file.
+
+    Parameters
+    ----------
+    path (str | os.PathLike[str]): The cassette file, gzip-compressed if its
+        name ends with ``.gz``.
+
+    Returns
+    -------
+    list[Interaction]: The interactions in the order they were recorded.
+
+    """
+    with _open(path, "rb") as file:
+        return [
+            Interaction.from_dict(json.loads(line))
+            for line in file
+            if line.strip()
+        ]
+
+
+class CassetteError(LookupError):
+    """Raised when a request has no recorded interaction to replay."""
+
+
+class CassetteHTTPError(Exception):
+    """
+    Raised by CassetteResponse.raise_for_status() for error status codes.
+
+    Attributes
+    ----------
+    response (CassetteResponse): The response with the error status.
+
+    """
+
+    def __init__(
+        self: CassetteHTTPError,
+        message: str,
+        response: CassetteResponse,
+    ) -> None:
+        """
+        Initialize the CassetteHTTPError.
+
+        Parameters
+        ----------
+        message (str): The error message.
+        response (CassetteResponse): The response with the error status.
+
+        """
+        super().__init__(message)
+        self.response = response
+
+
+class CassetteResponse:
+    """
+    HTTPResponse replaying a recorded interaction.
+
+    Attributes
+    ----------
+    interaction (Interaction): The replayed interaction.
+    time_to_first_byte (float): The recorded latency of the interaction.
+
+    """
+
+    __slots__ = ("interaction", "time_to_first_byte")
+
+    def __init__(self: CassetteResponse, interaction: Interaction) -> None:
+        """
+        Initialize the CassetteResponse.
+
+        Parameters
+        ----------
+        interaction (Interaction): The interaction to replay.
+
+        """
+        self.interaction = interaction
+        self.time_to_first_byte = interaction.elapsed
+
+    @property
+    def status_code(self: CassetteResponse) -> int:
+        """
+        Get the recorded HTTP status code.
+
+        Returns
+        -------
+        int: The status code of the response.
+
+        """
+        return self.interaction.status_code
+
+    @property
+    def headers(self: CassetteResponse) -> dict[str, str]:
+        """
+        Get the recorded response headers.
+
+        Returns
+        -------
+        dict[str, str]: The response headers.
+
+        """
+        return self.interaction.headers
+
+    @property
+    def content(self: CassetteResponse) -> bytes:
+        """
+        Get the recorded response body.
+
+        Returns
+        -------
+        bytes: The response body.
+
+        """
+        return self.interaction.content
+
+    def iter_content(
+        self: CassetteResponse,
+        chunk_size: int = 65536,
+    ) -> Iterator[bytes]:
+        """
+        Iterate over the response body in chunks.
+
+        Parameters
+        ----------
+        chunk_size (int): Maximum number of bytes per chunk, by default 64 KiB.
+
+        Returns
+        -------
+        Iterator[bytes]: The body chunks.
+
+        """
+        content = self.content
+        return iter(
+            [
+                content[i : i + chunk_size]
+                for i in range(0, len(content), chunk_size)
+            ],
+        )
+
+    def close(self: CassetteResponse) -> None:
+        """Release the response; replayed responses hold no connection."""
+
+    def json(self: CassetteResponse) -> Any:  # noqa: ANN401
+        """
+        Decode the response body as JSON.
+
+        Returns
+        -------
+        Any: The decoded body, or an empty dict for an empty body.
+
+        """
+        content = self.content
+        return json.loads(content) if content else {}
+
+    def raise_for_status(self: CassetteResponse) -> None:
+        """
+        Raise for 4xx and 5xx status codes.
+
+        Raises
+        ------
+        CassetteHTTPError: If the status code is 400 or higher.
+
+        """
+        if self.status_code >= 400:
+            raise CassetteHTTPError(
+                f"HTTP Error {self.status_code} for url: "
+                f"{self.interaction.url}",
+                response=self,
+            )
+
+
+class RecordingTransport:
+    """
+    HTTPTransport writing the traffic of another transport to a cassette.
+
+    Every answered request is appended to the cassette file as one JSON
+    line, with the credentials in the configured headers and query
+    parameters replaced by ``REDACTED``; the response is returned to the
+    caller unchanged. Requests failing without a response are not recorded.
+    Streamed requests are read in full so the body can be recorded.
+
+    Attributes
+    ----------
+    transport (HTTPTransport): The wrapped transport.
+    path (str | os.PathLike[str]): The cassette file.
+    redact_headers (tuple[str, ...]): Lowercase names of redacted headers.
+    redact_params (tuple[str, ...]): Lowercase names of redacted query
+        parameters.
+    recorded (int): Number of interactions written.
+
+    """
+
+    def __init__(
+        self: RecordingTransport,
+        transport: HTTPTransport,
+        path: str | os.PathLike[str],
+        redact_headers: Iterable[str] = DEFAULT_REDACTED_HEADERS,
+        redact_params: Iterable[str] = DEFAULT_REDACTED_PARAMS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Initialize the RecordingTransport.
+
+        Parameters
+        ----------
+        transport (HTTPTransport): The transport sending the requests.
+        path (str | os.PathLike[str]): The cassette file, appended to and
+            gzip-compressed if its name ends with ``.gz``.
+        redact_headers (Iterable[str]): Request headers whose values are
+            redacted, by default Authorization and the API key headers.
+        redact_params (Iterable[str]): Query parameters whose values are
+            redacted, by default ``api_key``.
+        clock (Callable[[], float]): Monotonic clock timing the requests, by
+            default time.perf_counter.
+
+        """
+        self.transport = transport
+        self.path = path
+        self.redact_headers = tuple(name.lower() for name in redact_headers)
+        self.redact_params = tuple(name.lower() for name in redact_params)
+        self.clock = clock
+        self.recorded = 0
+        self._file = _open(path, "ab")
+        self._lock = threading.Lock()
+
+    def request(
+        self: RecordingTransport,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        data: str | bytes | None = None,
+        **kwargs: object,
+    ) -> HTTPResponse:
+        """
+        Send the request with the wrapped transport and record it.
+
+        Parameters
+        ----------
+        method (str): The HTTP method.
+        url (str): The full URL for the request.
+        headers (dict[str, str] | None): HTTP headers to include in the
+            request, by default None.
+        data (str | bytes | None): Request body data, by default None.
+        **kwargs (object): Options passed to the wrapped transport, except
+            ``stream``.
+
+        Returns
+        -------
+        HTTPResponse: The response of the wrapped transport.
+
+        """
+        kwargs.pop("stream", None)
+        started = self.clock()
+        response = self.transport.request(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            **kwargs,
+        )
+        elapsed = self.clock() - started
+        content = getattr(response, "content", None)
+        if not isinstance(content, bytes):
+            content = json.dumps(response.json()).encode("utf-8")
+        self.record(
+            Interaction(
+                method=method,
+                url=_redact_url(url, self.redact_params),
+                status_code=response.status_code,
+                content=content,
+                headers=dict(response.headers),
+                request_headers={
+                    name: (
+                        REDACTED
+                        if name.lower() in self.redact_headers
+                        else value
+                    )
+                    for name, value in (headers or {}).items()
+                },
+                request_body=_body_text(data),
+                elapsed=elapsed,
+            ),
+        )
+        return response
+
+    def record(self: RecordingTransport, interaction: Interaction) -> None:
+        """
+        Append an interaction to the cassette.
+
+        Parameters
+        ----------
+        interaction (Interaction): The interaction, already redacted.
+
+        """
+        line = json.dumps(interaction.to_dict(), separators=(",", ":"))
+        with self._lock:
+            self._file.write(line.encode("utf-8") + b"\n")
+            self.recorded += 1
+
+    def close(self: RecordingTransport) -> None:
+        """Flush and close the cassette, then close the wrapped transport."""
+        with self._lock:
+            self._file.close()
+        close = getattr(self.transport, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self: Self) -> Self:
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self: RecordingTransport, *args: object) -> None:
+        """Close the cassette when exiting context."""
+        self.close()
+
+
+class _Replayer:
+    """Matches requests to recorded interactions, shared by the replayers."""
+
+    def __init__(
+        self: _Replayer,
+        cassette: CassetteSource,
+        speed: float | None = None,
+        match_body: bool = True,
+        repeat: bool = True,
+        redact_params: Iterable[str] = DEFAULT_REDACTED_PARAMS,
+    ) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive.")
+        if isinstance(cassette, (str, os.PathLike)):
+            cassette = read_cassette(cassette)
+        self.speed = speed
+        self.match_body = match_body
+        self.repeat = repeat
+        self.redact_params = tuple(name.lower() for name in redact_params)
+        self.replayed = 0
+        self._interactions: dict[
+            tuple[str, str, str | None],
+            list[Interaction],
+        ] = {}
+        for interaction in cassette:
+            key = self._key(
+                interaction.method,
+                interaction.url,
+                interaction.request_body,
+            )
+            self._interactions.setdefault(key, []).append(interaction)
+        self._positions = dict.fromkeys(self._interactions, 0)
+        self._lock = threading.Lock()
+
+    def _key(
+        self: _Replayer,
+        method: str,
+        url: str,
+        data: str | bytes | None,
+    ) -> tuple[str, str, str | None]:
+        body = _body_text(data) if self.match_body else None
+        return method.upper(), _redact_url(url, self.redact_params), body
+
+    def _next(
+        self: _Replayer,
+        method: str,
+        url: str,
+        data: str | bytes | None,
+    ) -> tuple[CassetteResponse, float]:
+        key = self._key(method, url, data)
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if interactions is None:
+                raise CassetteError(
+                    f"No recorded interaction for {method} {url}",
+                )
+            position = self._positions[key]
+            if position == len(interactions):
+                if not self.repeat:
+                    raise CassetteError(
+                        f"Recorded interactions for {method} {url} "
+                        "are used up",
+                    )
+                position = 0
+            self._positions[key] = position + 1
+            self.replayed += 1
+        interaction = interactions[position]
+        delay = 0.0 if self.speed is None else interaction.elapsed / self.speed
+        return CassetteResponse(interaction), delay
+
+
+class ReplayTransport(_Replayer):
+    """
+    HTTPTransport answering requests from a cassette.
+
+    Requests are matched to recorded interactions by method, URL and, by
+    default, body; requests matching several interactions get them in
+    recorded order. Nothing is sent over the network, so replaying a
+    recorded hour of traffic benchmarks the SDK deterministically.
+
+    Attributes
+    ----------
+    speed (float | None): Replay speed relative to the recorded latencies;
+        None answers without delay.
+    match_body (bool): Whether request bodies must match.
+    repeat (bool): Whether used up interactions are replayed again.
+    replayed (int): Number of requests answered.
+    sleep (Callable[[float], None]): Function waiting for a delay.
+
+    """
+
+    def __init__(
+        self: ReplayTransport,
+        cassette: CassetteSource,
+        speed: float | None = None,
+        match_body: bool = True,
+        repeat: bool = True,
+        redact_params: Iterable[str] = DEFAULT_REDACTED_PARAMS,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the ReplayTransport.
+
+        Parameters
+        ----------
+        cassette (str | os.PathLike[str] | Iterable[Interaction]): The
+            cassette file written by RecordingTransport, or the interactions.
+        speed (float | None): Replay speed relative to the recorded
+            latencies: 1.0 waits as long as the recorded requests took, 2.0
+            half as long. By default None, answering without delay.
+        match_body (bool): Whether request bodies must match, by default
+            True. Disable it for bodies with generated values.
+        repeat (bool): Whether to start over with the first matching
+            interaction once all were replayed, by default True. When False,
+            further requests raise CassetteError.
+        redact_params (Iterable[str]): Query parameters redacted while
+            recording, by default ``api_key``.
+        sleep (Callable[[float], None]): Function waiting for a delay, by
+            default time.sleep.
+
+        Raises
+        ------
+        ValueError: If speed is not positive.
+
+        """
+        super().__init__(cassette, speed, match_body, repeat, redact_params)
+        self.sleep = sleep
+
+    def request(
+        self: ReplayTransport,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,  # noqa: ARG002
+        data: str | bytes | None = None,
+        **kwargs: object,  # noqa: ARG002
+    ) -> CassetteResponse:
+        """
+        Answer a request with its recorded response.
+
+        Parameters
+        ----------
+        method (str): The HTTP method.
+        url (str): The full URL for the request.
+        headers (dict[str, str] | None): Ignored, by default None.
+        data (str | bytes | None): Request body data, by default None.
+        **kwargs (object): Ignored transport options.
+
+        Returns
+        -------
+        CassetteResponse: The recorded response.
+
+        Raises
+        ------
+        CassetteError: If no recorded interaction matches the request.
+
+        """
+        response, delay = self._next(method, url, data)
+        if delay > 0:
+            self.sleep(delay)
+        return response
+
+    def close(self: ReplayTransport) -> None:
+        """Close the transport; replaying holds no resources."""
+
+    def __enter__(self: Self) -> Self:
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self: ReplayTransport, *args: object) -> None:
+        """Close the transport when exiting context."""
+        self.close()
+
+
+class AsyncReplayTransport(_Replayer):
+    """
+    AsyncHTTPTransport answering requests from a cassette.
+
+    The asyncio counterpart of ReplayTransport: delays are awaited, so
+    replayed requests overlap on the event loop like real ones.
+
+    Attributes
+    ----------
+    speed (float | None): Replay speed relative to the recorded latencies;
+        None answers without delay.
+    match_body (bool): Whether request bodies must match.
+    repeat (bool): Whether used up interactions are replayed again.
+    replayed (int): Number of requests answered.
+
+    """
+
+    def __init__(
+        self: AsyncReplayTransport,
+        cassette: CassetteSource,
+        speed: float | None = None,
+        match_body: bool = True,
+        repeat: bool = True,
+        redact_params: Iterable[str] = DEFAULT_REDACTED_PARAMS,
+    ) -> None:
+        """
+        Initialize the AsyncReplayTransport.
+
+        Parameters
+        ----------
+        cassette (str | os.PathLike[str] | Iterable[Interaction]): The
+            cassette file written by RecordingTransport, or the interactions.
+        speed (float | None): Replay speed relative to the recorded
+            latencies, by default None, answering without delay.
+        match_body (bool): Whether request bodies must match, by default True.
+        repeat (bool): Whether to start over with the first matching
+            interaction once all were replayed, by default True.
+        redact_params (Iterable[str]): Query parameters redacted while
+            recording, by default ``api_key``.
+
+        Raises
+        ------
+        ValueError: If speed is not positive.
+
+        """
+        super().__init__(cassette, speed, match_body, repeat, redact_params)
+
+    async def request(
+        self: AsyncReplayTransport,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,  # noqa: ARG002
+        data: str | bytes | None = None,
+        **kwargs: object,  # noqa: ARG002
+    ) -> CassetteResponse:
+        """
+        Answer a request with its recorded response.
+
+        Parameters
+        ----------
+        method (str): The HTTP method.
+        url (str): The full URL for the request.
+        headers (dict[str, str] | None): Ignored, by default None.
+        data (str | bytes | None): Request body data, by default None.
+        **kwargs (object): Ignored transport options.
+
+        Returns
+        -------
+        CassetteResponse: The recorded response.
+
+        Raises
+        ------
+        CassetteError: If no recorded interaction matches the request.
+
+        """
+        response, delay = self._next(method, url, data)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
+
+    async def aclose(self: AsyncReplayTransport) -> None:
+        """Close the transport; replaying holds no resources."""
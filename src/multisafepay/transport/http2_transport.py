@@ -0,0 +1,294 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""HTTP/2 implementation of HTTPTransport using httpx and h2."""
+
+from __future__ import annotations
+
+import threading
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, cast
+
+from typing_extensions import Self
+
+from .pool_stats import PoolStats
+
+_HTTP2_IMPORT_ERROR: ImportError | None = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from httpx import Client, Limits, PoolTimeout, Response, Timeout
+
+try:
+    from httpx import Client, Limits, PoolTimeout, Response, Timeout
+
+    # httpx imports `h2` lazily, only once an HTTP/2 client is created.
+    _HAS_HTTP2 = find_spec("h2") is not None
+except ImportError as exc:  # pragma: no cover
+    # `httpx` and `h2` are optional dependencies, only needed for HTTP/2.
+    _HAS_HTTP2 = False
+    _HTTP2_IMPORT_ERROR = exc
+
+
+def _raise_http2_missing() -> None:
+    raise ModuleNotFoundError(
+        "Optional dependencies 'httpx' and 'h2' are required for Http2Transport. "
+        "Install them via 'pip install multisafepay[http2]' or 'pip install httpx h2', "
+        "or pass a custom HTTPTransport implementation to Sdk(..., transport=...).",
+    ) from _HTTP2_IMPORT_ERROR
+
+
+def _cap(timeout: float | None, budget: float) -> float:
+    return budget if timeout is None else min(timeout, budget)
+
+
+class Http2Transport:
+    """
+    HTTP/2 implementation of HTTPTransport using httpx.Client.
+
+    HTTP/2 multiplexes concurrent requests as streams over a few long-lived
+    connections, so a transport shared by many worker threads needs a
+    handful of TCP+TLS handshakes instead of one per concurrent request.
+    The protocol is negotiated per connection and falls back to HTTP/1.1
+    when a server does not offer HTTP/2.
+
+    At most ``max_concurrent_streams`` requests are in flight at once;
+    further callers wait for a free stream, bounded by their time budget.
+
+    Attributes
+    ----------
+    client (Client): The underlying httpx Client, shared by all threads.
+    max_connections (int): Maximum number of open connections.
+    max_concurrent_streams (int): Maximum number of requests in flight.
+    keep_alive_timeout (float | None): Idle seconds after which a connection is closed.
+    connect_timeout (float | None): Seconds allowed to establish a connection.
+    read_timeout (float | None): Seconds allowed between bytes of the response.
+
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 4
+    DEFAULT_MAX_CONCURRENT_STREAMS = 100
+    DEFAULT_KEEP_ALIVE_TIMEOUT = 30.0
+    DEFAULT_CONNECT_TIMEOUT = 10.0
+    DEFAULT_READ_TIMEOUT = 60.0
+
+    def __init__(
+        self: Http2Transport,
+        client: Client | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_concurrent_streams: int = DEFAULT_MAX_CONCURRENT_STREAMS,
+        keep_alive_timeout: float | None = DEFAULT_KEEP_ALIVE_TIMEOUT,
+        http1: bool = True,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the Http2Transport.
+
+        Parameters
+        ----------
+        client (Client | None): An existing httpx Client to use. If not
+            provided, an HTTP/2 enabled Client is created, by default None.
+            A provided Client keeps its own limits and timeouts.
+        max_connections (int): Maximum number of open connections, by default 4.
+        max_concurrent_streams (int): Maximum number of requests in flight
+            across all connections, by default 100.
+        keep_alive_timeout (float | None): Close connections idle for this
+            many seconds, by default 30. None keeps them open.
+        http1 (bool): Allow falling back to HTTP/1.1, by default True. Set to
+            False to speak HTTP/2 with prior knowledge to plain ``http://``
+            endpoints such as local test servers.
+        connect_timeout (float | None): Seconds allowed to establish a
+            connection, by default 10. None waits forever.
+        read_timeout (float | None): Seconds allowed between bytes of the
+            response, by default 60. None waits forever.
+
+        Raises
+        ------
+        ValueError: If a limit is smaller than 1 or a timeout is negative.
+
+        """
+        if not _HAS_HTTP2:  # pragma: no cover
+            _raise_http2_missing()
+        if max_connections < 1 or max_concurrent_streams < 1:
+            raise ValueError(
+                "max_connections and max_concurrent_streams must be at least 1.",
+            )
+        for name, value in (
+            ("keep_alive_timeout", keep_alive_timeout),
+            ("connect_timeout", connect_timeout),
+            ("read_timeout", read_timeout),
+        ):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative.")
+
+        self.max_connections = max_connections
+        self.max_concurrent_streams = max_concurrent_streams
+        self.keep_alive_timeout = keep_alive_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.client = (
+            client
+            if client is not None
+            else Client(
+                http1=http1,
+                http2=True,
+                limits=Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=keep_alive_timeout,
+                ),
+                timeout=Timeout(read_timeout, connect=connect_timeout),
+            )
+        )
+
+        self._streams = threading.BoundedSemaphore(max_concurrent_streams)
+        self._lock = threading.Lock()
+        self._requests_sent = 0
+        self._connections_opened = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._saturated_requests = 0
+
+    def request(
+        self: Http2Transport,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        data: str | bytes | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+        **kwargs: object,
+    ) -> Response:
+        """
+        Execute an HTTP request over a shared HTTP/2 connection.
+
+        Parameters
+        ----------
+        method (str): The HTTP method (GET, POST, PATCH, DELETE, etc.).
+        url (str): The full URL for the request.
+        headers (dict[str, str] | None): HTTP headers to include in the request, by default None.
+        data (str | bytes | None): Request body data, by default None.
+        timeout (float | None): Remaining time budget in seconds for this
+            call, by default None. It bounds the wait for a free stream and
+            caps the connect and read timeouts configured on the transport.
+        stream (bool): Defer reading the body until ``iter_bytes()`` is
+            called, by default False. The caller must close the response.
+        **kwargs (object): Additional keyword arguments passed to httpx.
+
+        Returns
+        -------
+        Response: The httpx Response object.
+
+        Raises
+        ------
+        PoolTimeout: If no stream becomes available within the time budget.
+        HTTPError: If the request fails or encounters an error.
+
+        """
+        if not _HAS_HTTP2:  # pragma: no cover
+            _raise_http2_missing()
+        client = cast("Client", self.client)
+        if timeout is not None:
+            kwargs["timeout"] = Timeout(
+                _cap(self.read_timeout, timeout),
+                connect=_cap(self.connect_timeout, timeout),
+                pool=timeout,
+            )
+        extensions = dict(
+            cast("dict[str, object]", kwargs.pop("extensions", None) or {}),
+        )
+        extensions.setdefault("trace", self._trace)
+        self._acquire_stream(timeout)
+        try:
+            if stream:
+                # The stream slot covers the exchange up to the headers.
+                request = client.build_request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    content=data,
+                    extensions=extensions,
+                    **kwargs,
+                )
+                return client.send(request, stream=True)
+            return client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                content=data,
+                extensions=extensions,
+                **kwargs,
+            )
+        finally:
+            self._release_stream()
+
+    def get_pool_stats(self: Http2Transport) -> PoolStats:
+        """
+        Return a snapshot of connection and stream usage.
+
+        ``pool_maxsize`` reports ``max_connections``; ``saturated_requests``
+        counts requests that had to wait for a free stream.
+
+        Returns
+        -------
+        PoolStats: Request, connection and concurrency counters.
+
+        """
+        with self._lock:
+            return PoolStats(
+                pool_maxsize=self.max_connections,
+                requests_sent=self._requests_sent,
+                connections_opened=self._connections_opened,
+                in_flight=self._in_flight,
+                peak_in_flight=self._peak_in_flight,
+                saturated_requests=self._saturated_requests,
+            )
+
+    def _acquire_stream(self: Http2Transport, timeout: float | None) -> None:
+        with self._lock:
+            if self._in_flight >= self.max_concurrent_streams:
+                self._saturated_requests += 1
+        # The slot is released in request(), after the response is read.
+        if not self._streams.acquire(  # pylint: disable=consider-using-with
+            timeout=timeout,
+        ):
+            raise PoolTimeout("No HTTP/2 stream became available in time.")
+        with self._lock:
+            self._in_flight += 1
+            self._requests_sent += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _release_stream(self: Http2Transport) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._streams.release()
+
+    def _trace(self: Http2Transport, event_name: str, _info: dict) -> None:
+        # httpcore reports a TCP connect only to the request that opened it.
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self._connections_opened += 1
+
+    def close(self: Http2Transport) -> None:
+        """
+        Close the underlying client and its connections.
+
+        This method should be called when the transport is no longer needed
+        to properly clean up resources.
+        """
+        if not _HAS_HTTP2:  # pragma: no cover
+            _raise_http2_missing()
+        client = cast("Client", self.client)
+        client.close()
+
+    def __enter__(self: Self) -> Self:
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self: Http2Transport, *args: object) -> None:
+        """Close client when exiting context."""
+        self.close()
@@ -7,7 +7,7 @@
 
 """HTTP Transport layer abstraction for decoupling network communication."""
 
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Union
 
 
 class HTTPTransport(Protocol):
@@ -27,7 +27,7 @@ class HTTPTransport(Protocol):
         method: str,
         url: str,
         headers: Optional[dict[str, str]] = None,
-        data: Optional[str] = None,
+        data: Optional[Union[str, bytes]] = None,
         **kwargs: object,
     ) -> "HTTPResponse":
         """
@@ -41,11 +41,14 @@ class HTTPTransport(Protocol):
             The full URL for the request.
         headers (Optional[dict[str, str]]):
             HTTP headers to include in the request, by default None.
-        data (Optional[str]):
+        data (Optional[Union[str, bytes]]):
             Request body data, by default None.
         **kwargs (object):
             Additional keyword arguments for transport-specific options,
-            such as query params, timeout, SSL options, etc.
+            such as query params, timeout, SSL options, etc. Streamed calls
+            pass ``stream=True``; transports supporting it return a response
+            with ``iter_content(chunk_size)`` or ``iter_bytes(chunk_size)``
+            and ``close()``, others may ignore it.
 
         Returns
         -------
@@ -66,7 +69,9 @@ class HTTPResponse(Protocol):
     Protocol defining the interface for HTTP response objects.
 
     This abstraction ensures that different transport implementations
-    return responses with a consistent interface.
+    return responses with a consistent interface. Responses may also carry
+    a ``time_to_first_byte`` attribute, the seconds until the response
+    headers arrived, reported in the timings of the client.
     """
 
     @property
@@ -0,0 +1,182 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Concrete implementation of AsyncHTTPTransport using httpx."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from typing_extensions import Self
+
+_HTTPX_IMPORT_ERROR: ImportError | None = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from httpx import AsyncClient, Response, Timeout
+
+try:
+    from httpx import AsyncClient, Response, Timeout
+
+    _HAS_HTTPX = True
+except ImportError as exc:  # pragma: no cover
+    # `httpx` is an optional dependency, only needed for the async stack.
+    _HAS_HTTPX = False
+    _HTTPX_IMPORT_ERROR = exc
+
+
+def _raise_httpx_missing() -> None:
+    raise ModuleNotFoundError(
+        "Optional dependency 'httpx' is required for HttpxAsyncTransport. "
+        "Install it via 'pip install multisafepay[httpx]' or 'pip install httpx', "
+        "or pass a custom AsyncHTTPTransport implementation to AsyncSdk(..., transport=...).",
+    ) from _HTTPX_IMPORT_ERROR
+
+
+def _cap(timeout: float | None, budget: float) -> float:
+    return budget if timeout is None else min(timeout, budget)
+
+
+class HttpxAsyncTransport:
+    """
+    Concrete implementation of AsyncHTTPTransport using httpx.AsyncClient.
+
+    This is the default transport of the async stack. A single instance keeps
+    one connection pool that is shared by every coroutine running on the
+    event loop.
+
+    Attributes
+    ----------
+    client (AsyncClient): The underlying httpx AsyncClient used for
+        connection pooling and request execution.
+    connect_timeout (float | None): Seconds allowed to establish a connection.
+    read_timeout (float | None): Seconds allowed between bytes of the response.
+
+    """
+
+    DEFAULT_CONNECT_TIMEOUT = 10.0
+    DEFAULT_READ_TIMEOUT = 60.0
+
+    def __init__(
+        self: HttpxAsyncTransport,
+        client: AsyncClient | None = None,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the HttpxAsyncTransport.
+
+        Parameters
+        ----------
+        client (AsyncClient | None): An existing httpx AsyncClient to use. If
+            not provided, a new AsyncClient will be created, by default None.
+        connect_timeout (float | None): Seconds allowed to establish a
+            connection, by default 10. None waits forever.
+        read_timeout (float | None): Seconds allowed between bytes of the
+            response, by default 60. None waits forever.
+
+        Raises
+        ------
+        ValueError: If a timeout is negative.
+
+        """
+        if not _HAS_HTTPX:  # pragma: no cover
+            _raise_httpx_missing()
+        for name, value in (
+            ("connect_timeout", connect_timeout),
+            ("read_timeout", read_timeout),
+        ):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative.")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.client = (
+            client
+            if client is not None
+            else AsyncClient(
+                timeout=Timeout(read_timeout, connect=connect_timeout),
+            )
+        )
+
+    async def request(
+        self: HttpxAsyncTransport,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        data: str | bytes | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+        **kwargs: object,
+    ) -> Response:
+        """
+        Execute an HTTP request using httpx.
+
+        Parameters
+        ----------
+        method (str): The HTTP method (GET, POST, PATCH, DELETE, etc.).
+        url (str): The full URL for the request.
+        headers (dict[str, str] | None): HTTP headers to include in the request, by default None.
+        data (str | bytes | None): Request body data, by default None.
+        timeout (float | None): Remaining time budget in seconds for this
+            call, by default None. It caps both the connect and read timeouts
+            configured on the transport.
+        stream (bool): Defer reading the body until ``iter_bytes()`` is
+            called, by default False. The caller must close the response.
+        **kwargs (object): Additional keyword arguments passed to httpx.
+
+        Returns
+        -------
+        Response: The httpx Response object.
+
+        Raises
+        ------
+        HTTPError: If the request fails or encounters an error.
+
+        """
+        if not _HAS_HTTPX:  # pragma: no cover
+            _raise_httpx_missing()
+        client = cast("AsyncClient", self.client)
+        if timeout is not None:
+            kwargs["timeout"] = Timeout(
+                _cap(self.read_timeout, timeout),
+                connect=_cap(self.connect_timeout, timeout),
+            )
+        if stream:
+            request = client.build_request(
+                method=method,
+                url=url,
+                headers=headers,
+                content=data,
+                **kwargs,
+            )
+            return await client.send(request, stream=True)
+        return await client.request(
+            method=method,
+            url=url,
+            headers=headers,
+            content=data,
+            **kwargs,
+        )
+
+    async def aclose(self: HttpxAsyncTransport) -> None:
+        """
+        Close the underlying client.
+
+        This method should be awaited when the transport is no longer needed
+        to properly release pooled connections.
+        """
+        if not _HAS_HTTPX:  # pragma: no cover
+            _raise_httpx_missing()
+        client = cast("AsyncClient", self.client)
+        await client.aclose()
+
+    async def __aenter__(self: Self) -> Self:
+        """Support async context manager protocol."""
+        return self
+
+    async def __aexit__(self: HttpxAsyncTransport, *args: object) -> None:
+        """Close client when exiting context."""
+        await self.aclose()
@@ -0,0 +1,205 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Concrete implementation of HTTPTransport using httpx."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from typing_extensions import Self
+
+_HTTPX_IMPORT_ERROR: ImportError | None = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from httpx import Client, HTTPTransport, Limits, Response, Timeout
+
+try:
+    from httpx import Client, HTTPTransport, Limits, Response, Timeout
+
+    _HAS_HTTPX = True
+except ImportError as exc:  # pragma: no cover
+    # `httpx` is an optional dependency, only needed for this transport.
+    _HAS_HTTPX = False
+    _HTTPX_IMPORT_ERROR = exc
+
+
+def _raise_httpx_missing() -> None:
+    raise ModuleNotFoundError(
+        "Optional dependency 'httpx' is required for HttpxTransport. "
+        "Install it via 'pip install multisafepay[httpx]' or 'pip install httpx', "
+        "or pass a custom HTTPTransport implementation to Sdk(..., transport=...).",
+    ) from _HTTPX_IMPORT_ERROR
+
+
+def _cap(timeout: float | None, budget: float) -> float:
+    return budget if timeout is None else min(timeout, budget)
+
+
+class HttpxTransport:
+    """
+    Concrete implementation of HTTPTransport using httpx.Client.
+
+    httpx responses already offer ``status_code``, ``headers``, ``json()`` and
+    ``raise_for_status()``, so they are returned unchanged. Connection
+    retries and redirects are disabled at this layer so the client's
+    RetryPolicy stays in control; the connection pool is shared across
+    threads.
+
+    Attributes
+    ----------
+    client (Client): The underlying httpx Client.
+    connect_timeout (float | None): Seconds allowed to establish a connection.
+    read_timeout (float | None): Seconds allowed between bytes of the response.
+
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 10
+    DEFAULT_KEEP_ALIVE_TIMEOUT = 30.0
+    DEFAULT_CONNECT_TIMEOUT = 10.0
+    DEFAULT_READ_TIMEOUT = 60.0
+
+    def __init__(
+        self: HttpxTransport,
+        client: Client | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keep_alive_timeout: float | None = DEFAULT_KEEP_ALIVE_TIMEOUT,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the HttpxTransport.
+
+        Parameters
+        ----------
+        client (Client | None): An existing httpx Client to use. If not
+            provided, a new Client is created, by default None. A provided
+            Client keeps its own limits and timeouts.
+        max_connections (int): Maximum number of pooled connections, by
+            default 10. Size this to the number of threads sharing the transport.
+        keep_alive_timeout (float | None): Close connections idle for this
+            many seconds, by default 30. None keeps them open.
+        connect_timeout (float | None): Seconds allowed to establish a
+            connection, by default 10. None waits forever.
+        read_timeout (float | None): Seconds allowed between bytes of the
+            response, by default 60. None waits forever.
+
+        Raises
+        ------
+        ValueError: If max_connections is smaller than 1 or a timeout is negative.
+
+        """
+        if not _HAS_HTTPX:  # pragma: no cover
+            _raise_httpx_missing()
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1.")
+        for name, value in (
+            ("keep_alive_timeout", keep_alive_timeout),
+            ("connect_timeout", connect_timeout),
+            ("read_timeout", read_timeout),
+        ):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative.")
+
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.client = (
+            client
+            if client is not None
+            else Client(
+                transport=HTTPTransport(
+                    limits=Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_connections,
+                        keepalive_expiry=keep_alive_timeout,
+                    ),
+                    retries=0,
+                ),
+                timeout=Timeout(read_timeout, connect=connect_timeout),
+                follow_redirects=False,
+            )
+        )
+
+    def request(
+        self: HttpxTransport,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        data: str | bytes | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+        **kwargs: object,
+    ) -> Response:
+        """
+        Execute an HTTP request using httpx.
+
+        Parameters
+        ----------
+        method (str): The HTTP method (GET, POST, PATCH, DELETE, etc.).
+        url (str): The full URL for the request, including the query string.
+        headers (dict[str, str] | None): HTTP headers to include in the request, by default None.
+        data (str | bytes | None): Request body data, by default None.
+        timeout (float | None): Remaining time budget in seconds for this
+            call, by default None. It caps both the connect and read timeouts
+            configured on the transport.
+        stream (bool): Defer reading the body until ``iter_bytes()`` is
+            called, by default False. The caller must close the response.
+        **kwargs (object): Additional keyword arguments passed to httpx.
+
+        Returns
+        -------
+        Response: The httpx Response object.
+
+        Raises
+        ------
+        HTTPError: If the request fails or encounters an error.
+
+        """
+        if not _HAS_HTTPX:  # pragma: no cover
+            _raise_httpx_missing()
+        client = cast("Client", self.client)
+        if timeout is not None:
+            kwargs["timeout"] = Timeout(
+                _cap(self.read_timeout, timeout),
+                connect=_cap(self.connect_timeout, timeout),
+            )
+        if stream:
+            request = client.build_request(
+                method=method,
+                url=url,
+                headers=headers,
+                content=data,
+                **kwargs,
+            )
+            return client.send(request, stream=True)
+        return client.request(
+            method=method,
+            url=url,
+            headers=headers,
+            content=data,
+            **kwargs,
+        )
+
+    def close(self: HttpxTransport) -> None:
+        """
+        Close the underlying client and its connections.
+
+        This method should be called when the transport is no longer needed
+        to properly clean up resources.
+        """
+        if not _HAS_HTTPX:  # pragma: no cover
+            _raise_httpx_missing()
+        client = cast("Client", self.client)
+        client.close()
+
+    def __enter__(self: Self) -> Self:
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self: HttpxTransport, *args: object) -> None:
+        """Close client when exiting context."""
+        self.close()
@@ -0,0 +1,67 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Connection pool counters exposed by pooling transports."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Snapshot of connection pool usage for a transport.
+
+    Attributes
+    ----------
+    pool_maxsize (int): Maximum number of connections kept per host.
+    requests_sent (int): Number of requests sent through the transport.
+    connections_opened (int): Number of new connections opened by the pools.
+    in_flight (int): Number of requests currently in progress.
+    peak_in_flight (int): Highest number of concurrent requests observed.
+    saturated_requests (int): Requests started while every pooled
+        connection was already in use.
+
+    """
+
+    pool_maxsize: int
+    requests_sent: int
+    connections_opened: int
+    in_flight: int
+    peak_in_flight: int
+    saturated_requests: int
+
+    @property
+    def reuse_ratio(self: "PoolStats") -> float:
+        """
+        Share of requests that were served on an already open connection.
+
+        Returns
+        -------
+        float: A value between 0.0 and 1.0.
+
+        """
+        if self.requests_sent == 0:
+            return 0.0
+        reused = max(self.requests_sent - self.connections_opened, 0)
+        return reused / self.requests_sent
+
+    @property
+    def saturation(self: "PoolStats") -> float:
+        """
+        Peak concurrency relative to the pool size.
+
+        Values above 1.0 mean callers had to wait for, or open, connections
+        beyond what the pool keeps alive.
+
+        Returns
+        -------
+        float: The peak in-flight requests divided by pool_maxsize.
+
+        """
+        if self.pool_maxsize <= 0:
+            return 0.0
+        return self.peak_in_flight / self.pool_maxsize
@@ -9,19 +9,30 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+import functools
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 from typing_extensions import Self
 
+from .pool_stats import PoolStats
+
 _REQUESTS_IMPORT_ERROR: ImportError | None = None
 
 if TYPE_CHECKING:  # pragma: no cover
     from requests import Request, Session
+    from requests.adapters import HTTPAdapter
     from requests.models import Response
+    from urllib3._base_connection import BaseHTTPConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 try:
     from requests import Request, Session
+    from requests.adapters import HTTPAdapter
     from requests.models import Response
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
     _HAS_REQUESTS = True
 except ImportError as exc:  # pragma: no cover
@@ -39,6 +50,74 @@ def _raise_requests_missing() -> None:
     ) from _REQUESTS_IMPORT_ERROR
 
 
+def _cap(timeout: float | None, budget: float) -> float:
+    return budget if timeout is None else min(timeout, budget)
+
+
+class _IdleExpiry:
+    """
+    Connection pool mixin closing connections that sat idle for too long.
+
+    Every connection put back into the pool is stamped. A connection taken
+    out again after more than ``keep_alive_timeout`` seconds is closed first,
+    so urllib3 reconnects it instead of writing to a socket the server may
+    already have dropped. Other connections in the pool are not affected.
+    """
+
+    def __init__(
+        self: _IdleExpiry,
+        *args: object,
+        keep_alive_timeout: float,
+        on_expire: Callable[[], None],
+        **kwargs: object,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._keep_alive_timeout = keep_alive_timeout
+        self._on_expire = on_expire
+        self._idle_since: weakref.WeakKeyDictionary[
+            BaseHTTPConnection,
+            float,
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_conn(
+        self: _IdleExpiry,
+        timeout: float | None = None,
+    ) -> BaseHTTPConnection:
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        idle_since = self._idle_since.pop(conn, None)
+        if (
+            idle_since is not None
+            and conn.is_connected
+            and time.monotonic() - idle_since > self._keep_alive_timeout
+        ):
+            conn.close()
+            self._on_expire()
+        return conn
+
+    def _put_conn(self: _IdleExpiry, conn: BaseHTTPConnection | None) -> None:
+        if conn is not None:
+            self._idle_since[conn] = time.monotonic()
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+if _HAS_REQUESTS:
+
+    class _ExpiringHTTPConnectionPool(_IdleExpiry, HTTPConnectionPool):
+        """HTTP connection pool closing connections idle for too long."""
+
+    class _ExpiringHTTPSConnectionPool(_IdleExpiry, HTTPSConnectionPool):
+        """HTTPS connection pool closing connections idle for too long."""
+
+
+def _adapter_pool_maxsize(session: object, default: int) -> int:
+    adapters = getattr(session, "adapters", None)
+    adapter = adapters.get("https://") if isinstance(adapters, dict) else None
+    manager = getattr(adapter, "poolmanager", None)
+    pool_kw = getattr(manager, "connection_pool_kw", None)
+    maxsize = pool_kw.get("maxsize") if isinstance(pool_kw, dict) else None
+    return maxsize if isinstance(maxsize, int) else default
+
+
 class RequestsTransport:
     """
     Concrete implementation of HTTPTransport using the requests library.
@@ -46,16 +125,41 @@ class RequestsTransport:
     This is the default transport implementation that wraps the requests library,
     providing a standardized interface for making HTTP requests.
 
+    When the transport creates its own Session, an HTTPAdapter sized with the
+    given pool settings is mounted for both ``http://`` and ``https://`` so a
+    single transport can be shared by many worker threads without opening a
+    new TLS connection per call.
+
     Attributes
     ----------
     session (Session): The underlying requests Session object used for
         connection pooling and request execution.
+    pool_connections (int): Number of per-host connection pools to cache.
+    pool_maxsize (int): Maximum number of connections kept alive per host,
+        read from the ``https://`` adapter of a provided Session.
+    pool_block (bool): Whether callers wait for a free connection when the
+        pool is exhausted instead of opening a throwaway one.
+    keep_alive_timeout (float | None): Idle seconds after which a pooled
+        connection is closed instead of reused.
+    connect_timeout (float | None): Seconds allowed to establish a connection.
+    read_timeout (float | None): Seconds allowed between bytes of the response.
 
     """
 
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    DEFAULT_CONNECT_TIMEOUT = 10.0
+    DEFAULT_READ_TIMEOUT = 60.0
+
     def __init__(
         self: RequestsTransport,
         session: Session | None = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive_timeout: float | None = None,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
     ) -> None:
         """
         Initialize the RequestsTransport.
@@ -64,18 +168,82 @@ class RequestsTransport:
         ----------
         session (Session | None): An existing requests Session to use. If not
             provided, a new Session will be created, by default None.
+            A provided Session keeps its own adapters; the pool settings
+            below only apply to a Session created by the transport.
+        pool_connections (int): Number of per-host pools to cache, by default 10.
+        pool_maxsize (int): Maximum connections kept alive per host, by default 10.
+            Size this to the number of threads sharing the transport.
+        pool_block (bool): Block when the pool is exhausted, by default False.
+        keep_alive_timeout (float | None): Close a pooled connection that
+            has been idle for more than this many seconds instead of reusing
+            it, by default None (never). Each connection expires on its own,
+            also while other requests are in flight.
+        connect_timeout (float | None): Seconds allowed to establish a
+            connection, by default 10. None waits forever.
+        read_timeout (float | None): Seconds allowed between bytes of the
+            response, by default 60. None waits forever.
+
+        Raises
+        ------
+        ValueError: If a pool size is smaller than 1, a timeout is negative
+            or ``keep_alive_timeout`` is given together with a ``session``.
 
         """
         if not _HAS_REQUESTS:  # pragma: no cover
             _raise_requests_missing()
-        self.session = session if session is not None else Session()
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("Pool sizes must be at least 1.")
+        for name, value in (
+            ("keep_alive_timeout", keep_alive_timeout),
+            ("connect_timeout", connect_timeout),
+            ("read_timeout", read_timeout),
+        ):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative.")
+        if session is not None and keep_alive_timeout is not None:
+            raise ValueError(
+                "keep_alive_timeout only applies to a Session created by the transport.",
+            )
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = (
+            pool_maxsize
+            if session is None
+            else _adapter_pool_maxsize(session, pool_maxsize)
+        )
+        self.pool_block = pool_block
+        self.keep_alive_timeout = keep_alive_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+        self._lock = threading.Lock()
+        self._requests_sent = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._saturated_requests = 0
+        self._connections_dropped = 0
+
+        if session is None:
+            session = Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+            if keep_alive_timeout is not None:
+                self._expire_idle_connections(adapter, keep_alive_timeout)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
 
     def request(
         self: RequestsTransport,
         method: str,
         url: str,
         headers: dict[str, str] | None = None,
-        data: str | None = None,
+        data: str | bytes | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
         **kwargs: object,
     ) -> Response:
         """
@@ -86,12 +254,17 @@ class RequestsTransport:
         method (str): The HTTP method (GET, POST, PATCH, DELETE, etc.).
         url (str): The full URL for the request.
         headers (dict[str, str] | None): HTTP headers to include in the request, by default None.
-        data (str | None): Request body data, by default None.
+        data (str | bytes | None): Request body data, by default None.
+        timeout (float | None): Remaining time budget in seconds for this
+            call, by default None. It caps both the connect and read timeouts
+            configured on the transport.
+        stream (bool): Defer reading the body until ``iter_content()`` is
+            called, by default False. The caller must close the response.
         **kwargs (object): Additional keyword arguments passed to requests.
 
         Returns
         -------
-        Response: The requests Response object.
+        Response: The requests Response object, with `time_to_first_byte` set.
 
         Raises
         ------
@@ -109,7 +282,120 @@ class RequestsTransport:
             **kwargs,
         )
         prepared_request = session.prepare_request(request)
-        return session.send(prepared_request)
+        send_kwargs: dict[str, Any] = {"stream": True} if stream else {}
+        self._acquire_slot()
+        try:
+            response = session.send(
+                prepared_request,
+                timeout=self._resolve_timeout(timeout),
+                **send_kwargs,
+            )
+        finally:
+            self._release_slot()
+        # requests measures ``elapsed`` up to the arrival of the headers.
+        elapsed = getattr(response, "elapsed", None)
+        if elapsed is not None:
+            response.time_to_first_byte = elapsed.total_seconds()  # type: ignore[attr-defined]
+        return response
+
+    def get_pool_stats(self: RequestsTransport) -> PoolStats:
+        """
+        Return a snapshot of connection pool usage.
+
+        Returns
+        -------
+        PoolStats: Request, connection and concurrency counters.
+
+        """
+        opened = self._connections_dropped + self._count_open_connections()
+        with self._lock:
+            return PoolStats(
+                pool_maxsize=self.pool_maxsize,
+                requests_sent=self._requests_sent,
+                connections_opened=opened,
+                in_flight=self._in_flight,
+                peak_in_flight=self._peak_in_flight,
+                saturated_requests=self._saturated_requests,
+            )
+
+    def _resolve_timeout(
+        self: RequestsTransport,
+        budget: float | None,
+    ) -> tuple[float | None, float | None]:
+        if budget is None:
+            return (self.connect_timeout, self.read_timeout)
+        return (
+            _cap(self.connect_timeout, budget),
+            _cap(self.read_timeout, budget),
+        )
+
+    def _expire_idle_connections(
+        self: RequestsTransport,
+        adapter: HTTPAdapter,
+        keep_alive_timeout: float,
+    ) -> None:
+        options = {
+            "keep_alive_timeout": keep_alive_timeout,
+            "on_expire": self._count_expired,
+        }
+        # urllib3 calls the pool class with the host, port and pool
+        # settings, so a partial stands in for the class.
+        pool_classes = {
+            "http": functools.partial(_ExpiringHTTPConnectionPool, **options),
+            "https": functools.partial(
+                _ExpiringHTTPSConnectionPool,
+                **options,
+            ),
+        }
+        adapter.poolmanager.pool_classes_by_scheme = cast(
+            "dict[str, type]",
+            pool_classes,
+        )
+
+    def _count_expired(self: RequestsTransport) -> None:
+        # The pool reconnects the closed connection without counting it as
+        # new, so it is added to the opened connections here.
+        with self._lock:
+            self._connections_dropped += 1
+
+    def _acquire_slot(self: RequestsTransport) -> None:
+        with self._lock:
+            if self._in_flight >= self.pool_maxsize:
+                self._saturated_requests += 1
+            self._in_flight += 1
+            self._requests_sent += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _release_slot(self: RequestsTransport) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _iter_managers(self: RequestsTransport) -> list[Any]:
+        adapters = getattr(self.session, "adapters", None)
+        if not isinstance(adapters, dict):
+            return []
+        unique = {id(adapter): adapter for adapter in adapters.values()}
+        return [
+            adapter.poolmanager
+            for adapter in unique.values()
+            if getattr(adapter, "poolmanager", None) is not None
+        ]
+
+    def _iter_pools(self: RequestsTransport) -> list[Any]:
+        pools = []
+        for manager in self._iter_managers():
+            container = manager.pools
+            # urllib3's RecentlyUsedContainer refuses plain iteration.
+            for key in container.keys():  # noqa: SIM118
+                pool = container.get(key)
+                if pool is not None:
+                    pools.append(pool)
+        return pools
+
+    def _count_open_connections(self: RequestsTransport) -> int:
+        return sum(
+            getattr(pool, "num_connections", 0) for pool in self._iter_pools()
+        )
 
     def close(self: RequestsTransport) -> None:
         """
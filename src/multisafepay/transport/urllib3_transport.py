@@ -0,0 +1,365 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Concrete implementation of HTTPTransport using urllib3."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, cast
+
+from typing_extensions import Self
+
+_URLLIB3_IMPORT_ERROR: ImportError | None = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+    from urllib3 import BaseHTTPResponse, PoolManager, Timeout
+
+try:
+    from urllib3 import BaseHTTPResponse, PoolManager, Timeout
+
+    _HAS_URLLIB3 = True
+except ImportError as exc:  # pragma: no cover
+    # `urllib3` is an optional dependency, only needed for this transport.
+    _HAS_URLLIB3 = False
+    _URLLIB3_IMPORT_ERROR = exc
+
+
+def _raise_urllib3_missing() -> None:
+    raise ModuleNotFoundError(
+        "Optional dependency 'urllib3' is required for Urllib3Transport. "
+        "Install it via 'pip install multisafepay[urllib3]' or 'pip install urllib3', "
+        "or pass a custom HTTPTransport implementation to Sdk(..., transport=...).",
+    ) from _URLLIB3_IMPORT_ERROR
+
+
+def _cap(timeout: float | None, budget: float) -> float:
+    return budget if timeout is None else min(timeout, budget)
+
+
+class Urllib3HTTPError(Exception):
+    """
+    Raised by Urllib3Response.raise_for_status() for error status codes.
+
+    Attributes
+    ----------
+    response (Urllib3Response): The response with the error status.
+
+    """
+
+    def __init__(
+        self: Urllib3HTTPError,
+        message: str,
+        response: Urllib3Response,
+    ) -> None:
+        """
+        Initialize the Urllib3HTTPError.
+
+        Parameters
+        ----------
+        message (str): The error message.
+        response (Urllib3Response): The response with the error status.
+
+        """
+        super().__init__(message)
+        self.response = response
+
+
+class Urllib3Response:
+    """
+    HTTPResponse adapter around a urllib3 response.
+
+    urllib3 exposes ``status`` and raw ``data`` bytes; this adapter offers
+    the ``status_code``, ``headers``, ``json()`` and ``raise_for_status()``
+    interface the client expects.
+
+    Attributes
+    ----------
+    response (BaseHTTPResponse): The wrapped urllib3 response.
+    streamed (bool): Whether the body is read on demand rather than preloaded.
+
+    """
+
+    __slots__ = ("_headers", "response", "streamed")
+
+    def __init__(
+        self: Urllib3Response,
+        response: BaseHTTPResponse,
+        streamed: bool = False,
+    ) -> None:
+        """
+        Initialize the Urllib3Response.
+
+        Parameters
+        ----------
+        response (BaseHTTPResponse): The urllib3 response to wrap.
+        streamed (bool): Whether the body is read on demand rather than
+            preloaded, by default False.
+
+        """
+        self.response = response
+        self.streamed = streamed
+        self._headers: dict[str, str] | None = None
+
+    @property
+    def status_code(self: Urllib3Response) -> int:
+        """
+        Get the HTTP status code.
+
+        Returns
+        -------
+        int: The status code of the response.
+
+        """
+        return int(self.response.status)
+
+    @property
+    def headers(self: Urllib3Response) -> dict[str, str]:
+        """
+        Get the response headers, built on first access.
+
+        Returns
+        -------
+        dict[str, str]: The response headers.
+
+        """
+        if self._headers is None:
+            self._headers = dict(self.response.headers.items())
+        return self._headers
+
+    @property
+    def content(self: Urllib3Response) -> bytes:
+        """
+        Get the raw response body.
+
+        Returns
+        -------
+        bytes: The response body.
+
+        """
+        return self.response.data or b""
+
+    def iter_content(
+        self: Urllib3Response,
+        chunk_size: int = 65536,
+    ) -> Iterator[bytes]:
+        """
+        Iterate over the response body in chunks.
+
+        Parameters
+        ----------
+        chunk_size (int): Maximum number of bytes per chunk, by default 64 KiB.
+
+        Returns
+        -------
+        Iterator[bytes]: The body chunks, read from the socket when streamed.
+
+        """
+        if self.streamed:
+            return self.response.stream(chunk_size)
+        content = self.content
+        return iter(
+            [
+                content[i : i + chunk_size]
+                for i in range(0, len(content), chunk_size)
+            ],
+        )
+
+    def close(self: Urllib3Response) -> None:
+        """
+        Release the connection of a streamed response.
+
+        A fully read body returns the connection to the pool; a partially
+        read one closes it, since it can no longer be reused.
+        """
+        if not self.response.closed:
+            self.response.close()
+        self.response.release_conn()
+
+    def json(self: Urllib3Response) -> Any:  # noqa: ANN401
+        """
+        Decode the response body as JSON.
+
+        Returns
+        -------
+        Any: The decoded body, or an empty dict for an empty body.
+
+        """
+        content = self.content
+        return json.loads(content) if content else {}
+
+    def raise_for_status(self: Urllib3Response) -> None:
+        """
+        Raise for 4xx and 5xx status codes.
+
+        Raises
+        ------
+        Urllib3HTTPError: If the status code is 400 or higher.
+
+        """
+        if self.status_code >= 400:
+            raise Urllib3HTTPError(
+                f"HTTP Error {self.status_code} for url: "
+                f"{self.response.url}",
+                response=self,
+            )
+
+
+class Urllib3Transport:
+    """
+    Concrete implementation of HTTPTransport using urllib3.PoolManager.
+
+    urllib3 skips the session, cookie and hook machinery of requests, which
+    makes it the leanest built-in transport per request. Retries and
+    redirects are disabled at this layer so the client's RetryPolicy stays
+    in control; connections are pooled per host and shared across threads.
+
+    Attributes
+    ----------
+    pool_manager (PoolManager): The underlying urllib3 PoolManager.
+    connect_timeout (float | None): Seconds allowed to establish a connection.
+    read_timeout (float | None): Seconds allowed between bytes of the response.
+
+    """
+
+    DEFAULT_NUM_POOLS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    DEFAULT_CONNECT_TIMEOUT = 10.0
+    DEFAULT_READ_TIMEOUT = 60.0
+
+    def __init__(
+        self: Urllib3Transport,
+        pool_manager: PoolManager | None = None,
+        num_pools: int = DEFAULT_NUM_POOLS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the Urllib3Transport.
+
+        Parameters
+        ----------
+        pool_manager (PoolManager | None): An existing urllib3 PoolManager to
+            use. If not provided, a new one is created, by default None.
+            A provided PoolManager keeps its own pool settings.
+        num_pools (int): Number of per-host pools to cache, by default 10.
+        pool_maxsize (int): Maximum connections kept alive per host, by default 10.
+            Size this to the number of threads sharing the transport.
+        pool_block (bool): Block when the pool is exhausted, by default False.
+        connect_timeout (float | None): Seconds allowed to establish a
+            connection, by default 10. None waits forever.
+        read_timeout (float | None): Seconds allowed between bytes of the
+            response, by default 60. None waits forever.
+
+        Raises
+        ------
+        ValueError: If a pool size is smaller than 1 or a timeout is negative.
+
+        """
+        if not _HAS_URLLIB3:  # pragma: no cover
+            _raise_urllib3_missing()
+        if num_pools < 1 or pool_maxsize < 1:
+            raise ValueError("Pool sizes must be at least 1.")
+        for name, value in (
+            ("connect_timeout", connect_timeout),
+            ("read_timeout", read_timeout),
+        ):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative.")
+
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_manager = (
+            pool_manager
+            if pool_manager is not None
+            else PoolManager(
+                num_pools=num_pools,
+                maxsize=pool_maxsize,
+                block=pool_block,
+                retries=False,
+                timeout=Timeout(connect=connect_timeout, read=read_timeout),
+            )
+        )
+
+    def request(
+        self: Urllib3Transport,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        data: str | bytes | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+        **kwargs: object,
+    ) -> Urllib3Response:
+        """
+        Execute an HTTP request using urllib3.
+
+        Parameters
+        ----------
+        method (str): The HTTP method (GET, POST, PATCH, DELETE, etc.).
+        url (str): The full URL for the request, including the query string.
+        headers (dict[str, str] | None): HTTP headers to include in the request, by default None.
+        data (str | bytes | None): Request body data, by default None.
+        timeout (float | None): Remaining time budget in seconds for this
+            call, by default None. It caps both the connect and read timeouts
+            configured on the transport.
+        stream (bool): Defer reading the body until ``iter_content()`` is
+            called, by default False. The caller must close the response.
+        **kwargs (object): Additional keyword arguments passed to urllib3.
+
+        Returns
+        -------
+        Urllib3Response: The adapted urllib3 response.
+
+        Raises
+        ------
+        HTTPError: If the request fails or encounters an error.
+
+        """
+        if not _HAS_URLLIB3:  # pragma: no cover
+            _raise_urllib3_missing()
+        pool_manager = cast("PoolManager", self.pool_manager)
+        if timeout is not None:
+            kwargs["timeout"] = Timeout(
+                connect=_cap(self.connect_timeout, timeout),
+                read=_cap(self.read_timeout, timeout),
+            )
+        body = data.encode("utf-8") if isinstance(data, str) else data
+        response = pool_manager.request(
+            method,
+            url,
+            body=body,
+            headers=headers,
+            retries=False,
+            preload_content=not stream,
+            **kwargs,
+        )
+        return Urllib3Response(response, streamed=stream)
+
+    def close(self: Urllib3Transport) -> None:
+        """
+        Close all pooled connections.
+
+        This method should be called when the transport is no longer needed
+        to properly clean up resources.
+        """
+        if not _HAS_URLLIB3:  # pragma: no cover
+            _raise_urllib3_missing()
+        pool_manager = cast("PoolManager", self.pool_manager)
+        pool_manager.clear()
+
+    def __enter__(self: Self) -> Self:
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self: Urllib3Transport, *args: object) -> None:
+        """Close pooled connections when exiting context."""
+        self.close()
@@ -0,0 +1,202 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""JSON codecs used to encode request bodies and decode responses."""
+
+import json
+from decimal import Decimal
+from typing import Any, Optional, Protocol, Union
+
+_ORJSON_IMPORT_ERROR: Optional[ImportError] = None
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError as exc:  # pragma: no cover
+    # `orjson` is an optional dependency, only needed for OrjsonCodec.
+    _HAS_ORJSON = False
+    _ORJSON_IMPORT_ERROR = exc
+
+
+def _raise_orjson_missing() -> None:
+    raise ModuleNotFoundError(
+        "Optional dependency 'orjson' is required for OrjsonCodec. "
+        "Install it via 'pip install multisafepay[orjson]' or 'pip install orjson', "
+        "or use StdlibJsonCodec.",
+    ) from _ORJSON_IMPORT_ERROR
+
+
+def _default(o: object) -> object:
+    # Decimal amounts are sent as numbers, like DecimalEncoder does.
+    if isinstance(o, Decimal):
+        return float(o)
+    raise TypeError(
+        f"Object of type {type(o).__name__} is not JSON serializable",
+    )
+
+
+class JsonCodec(Protocol):
+    """
+    Protocol for JSON codecs.
+
+    A codec encodes request bodies to compact UTF-8 JSON, converting
+    ``Decimal`` values to numbers, and decodes response bodies.
+    """
+
+    def dumps(self: "JsonCodec", obj: object) -> bytes:
+        """
+        Encode an object as compact UTF-8 JSON.
+
+        Parameters
+        ----------
+        obj (object): The object to encode.
+
+        Returns
+        -------
+        bytes: The encoded JSON.
+
+        """
+
+    def loads(
+        self: "JsonCodec",
+        data: Union[str, bytes],
+    ) -> Any:  # noqa: ANN401
+        """
+        Decode a JSON document.
+
+        Parameters
+        ----------
+        data (Union[str, bytes]): The JSON document.
+
+        Returns
+        -------
+        Any: The decoded value.
+
+        Raises
+        ------
+        ValueError: If the document is not valid JSON.
+
+        """
+
+
+class StdlibJsonCodec:
+    """JSON codec using the standard library ``json`` module."""
+
+    @staticmethod
+    def dumps(obj: object) -> bytes:
+        """
+        Encode an object as compact UTF-8 JSON.
+
+        Parameters
+        ----------
+        obj (object): The object to encode.
+
+        Returns
+        -------
+        bytes: The encoded JSON.
+
+        """
+        return json.dumps(
+            obj,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_default,
+        ).encode("utf-8")
+
+    @staticmethod
+    def loads(data: Union[str, bytes]) -> Any:  # noqa: ANN401
+        """
+        Decode a JSON document.
+
+        Parameters
+        ----------
+        data (Union[str, bytes]): The JSON document.
+
+        Returns
+        -------
+        Any: The decoded value.
+
+        Raises
+        ------
+        ValueError: If the document is not valid JSON.
+
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """
+    JSON codec using ``orjson``.
+
+    orjson encodes and decodes several times faster than the standard
+    library and produces compact UTF-8 output directly.
+    """
+
+    def __init__(self: "OrjsonCodec") -> None:
+        """
+        Initialize the OrjsonCodec.
+
+        Raises
+        ------
+        ModuleNotFoundError: If orjson is not installed.
+
+        """
+        if not _HAS_ORJSON:  # pragma: no cover
+            _raise_orjson_missing()
+
+    @staticmethod
+    def dumps(obj: object) -> bytes:
+        """
+        Encode an object as compact UTF-8 JSON.
+
+        Parameters
+        ----------
+        obj (object): The object to encode.
+
+        Returns
+        -------
+        bytes: The encoded JSON.
+
+        """
+        return orjson.dumps(obj, default=_default)
+
+    @staticmethod
+    def loads(data: Union[str, bytes]) -> Any:  # noqa: ANN401
+        """
+        Decode a JSON document.
+
+        Parameters
+        ----------
+        data (Union[str, bytes]): The JSON document.
+
+        Returns
+        -------
+        Any: The decoded value.
+
+        Raises
+        ------
+        ValueError: If the document is not valid JSON.
+
+        """
+        return orjson.loads(data)
+
+
+_DEFAULT_CODEC: JsonCodec = OrjsonCodec() if _HAS_ORJSON else StdlibJsonCodec()
+
+
+def default_json_codec() -> JsonCodec:
+    """
+    Get the codec used when none is configured.
+
+    Returns
+    -------
+    JsonCodec: An OrjsonCodec when orjson is installed, a StdlibJsonCodec
+        otherwise.
+
+    """
+    return _DEFAULT_CODEC
@@ -0,0 +1,284 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Incremental decoding of the items of a JSON response envelope."""
+
+import codecs
+import json
+import re
+from collections.abc import Iterator
+from typing import Any, Optional
+
+_WHITESPACE = " \t\n\r"
+
+# Parser states: what the next token of the envelope must be.
+_OPEN = "open"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_ITEMS = "items"
+_ITEM = "item"
+_ITEM_SEP = "item_sep"
+_MEMBER_SEP = "member_sep"
+_DONE = "done"
+_VALUE_STATES = (_KEY, _VALUE, _ITEM)
+
+# Values a truncated "Expecting value" error may be the start of.
+_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_STRUCTURE = re.compile(r'[][{}"]')
+_STRING_END = re.compile(r'["\\]')
+
+
+def _is_truncated(error: json.JSONDecodeError) -> bool:
+    """
+    Tell whether a decode error is due to the end of the buffer.
+
+    Parameters
+    ----------
+    error (json.JSONDecodeError): The error raised for the buffer.
+
+    Returns
+    -------
+    bool: True when more data may complete the value, False for a syntax
+        error that no further data can fix.
+
+    """
+    tail = error.doc[error.pos :]
+    if error.msg.startswith("Unterminated string"):
+        return True
+    if error.msg.startswith("Invalid \\uXXXX escape"):
+        # The decoder also needs the character after the four hex digits.
+        return len(tail) <= 5
+    # A number cut short, e.g. "2." or "1e", is reported after its digits.
+    if all(char in _NUMBER_CHARS for char in tail):
+        return True
+    return any(literal.startswith(tail) for literal in _LITERALS)
+
+
+class JsonItemStream:
+    """
+    Push parser yielding the items of one array member of a JSON object.
+
+    Body chunks are fed as they arrive. Items of the ``items_key`` array,
+    e.g. ``data`` in ``{"success": true, "data": [...], "pager": {...}}``,
+    are decoded and yielded one by one, while the other members of the
+    envelope are collected in ``envelope``. Only the undecoded remainder is
+    buffered, so memory stays bounded by the largest item rather than the
+    size of the body.
+
+    Attributes
+    ----------
+    items_key (str): Name of the top-level member whose items are streamed.
+    envelope (dict[str, Any]): The other top-level members decoded so far.
+
+    """
+
+    def __init__(self: "JsonItemStream", items_key: str = "data") -> None:
+        """
+        Initialize the JsonItemStream.
+
+        Parameters
+        ----------
+        items_key (str): Name of the top-level array member whose items are
+            streamed, by default "data".
+
+        """
+        self.items_key = items_key
+        self.envelope: dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = _OPEN
+        self._key = ""
+        self._first = True
+        # Scan of a string or container value split across chunks: where
+        # to resume, the nesting depth, whether inside a string, and the
+        # buffer size at the last decode attempt.
+        self._scan_offset = 0
+        self._scan_depth = 0
+        self._scan_in_string = False
+        self._probe_size = 0
+
+    def feed(self: "JsonItemStream", chunk: bytes) -> Iterator[Any]:
+        """
+        Add a body chunk and yield the items it completes.
+
+        Parameters
+        ----------
+        chunk (bytes): The next chunk of the response body.
+
+        Returns
+        -------
+        Iterator[Any]: The decoded items completed by this chunk.
+
+        Raises
+        ------
+        ValueError: If the body is not a JSON object.
+
+        """
+        self._buffer += self._text.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self: "JsonItemStream") -> Iterator[Any]:
+        """
+        Mark the end of the body and yield the remaining items.
+
+        Returns
+        -------
+        Iterator[Any]: The decoded items left in the buffer.
+
+        Raises
+        ------
+        ValueError: If the body is truncated or is not a JSON object.
+
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        yield from self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Unexpected end of JSON response body.")
+
+    def _parse(self: "JsonItemStream", final: bool) -> Iterator[Any]:
+        buffer = self._buffer
+        pos = 0
+        try:
+            while self._state != _DONE:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos == len(buffer):
+                    return
+                char = buffer[pos]
+                if self._state in _VALUE_STATES and not (
+                    self._first and char in "}]"
+                ):
+                    decoded = self._decode(buffer, pos, final)
+                    if decoded is None:
+                        return
+                    value, pos = decoded
+                    if self._accept(value):
+                        yield value
+                else:
+                    pos += self._step(char)
+        finally:
+            self._buffer = buffer[pos:]
+
+    def _accept(self: "JsonItemStream", value: Any) -> bool:  # noqa: ANN401
+        # Returns whether the decoded value is an item to yield.
+        state, self._first = self._state, False
+        if state == _ITEM:
+            self._state = _ITEM_SEP
+            return True
+        if state == _VALUE:
+            self.envelope[self._key] = value
+            self._state = _MEMBER_SEP
+        elif isinstance(value, str):
+            self._key, self._state = value, _COLON
+        else:
+            raise ValueError("JSON object keys must be strings.")
+        return False
+
+    def _step(self: "JsonItemStream", char: str) -> int:
+        # Returns the number of characters consumed.
+        state = self._state
+        if state == _ITEMS:
+            # Stream the items of an array; decode anything else whole.
+            if char != "[":
+                self._state = _VALUE
+                return 0
+            self._state, self._first = _ITEM, True
+        elif state == _OPEN and char == "{":
+            self._state = _KEY
+        elif state == _KEY and char == "}":
+            self._state = _DONE
+        elif state == _ITEM and char == "]":
+            self._state, self._first = _MEMBER_SEP, False
+        elif state == _COLON and char == ":":
+            self._state = _ITEMS if self._key == self.items_key else _VALUE
+        elif state == _ITEM_SEP and char in ",]":
+            self._state = _ITEM if char == "," else _MEMBER_SEP
+        elif state == _MEMBER_SEP and char in ",}":
+            self._state = _KEY if char == "," else _DONE
+        else:
+            raise ValueError(f"Unexpected {char!r} in JSON response body.")
+        return 1
+
+    def _decode(
+        self: "JsonItemStream",
+        buffer: str,
+        pos: int,
+        final: bool,
+    ) -> Optional[tuple[Any, int]]:
+        # A split value is only decoded again once the scan finds its end,
+        # or once the buffer has doubled to catch syntax errors early, so
+        # large values are not re-parsed from their start for every chunk.
+        if (
+            self._scan_offset
+            and not final
+            and not self._scan(buffer, pos)
+            and len(buffer) - pos < 2 * self._probe_size
+        ):
+            return None
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if final or not _is_truncated(e):
+                raise
+            if not self._scan_offset and buffer[pos] in '[{"':
+                self._scan(buffer, pos)
+            self._probe_size = len(buffer) - pos
+            return None
+        # A number at the end of the buffer may continue in the next chunk.
+        if not final and self._may_continue(value, buffer, end):
+            return None
+        self._scan_offset = self._scan_depth = self._probe_size = 0
+        self._scan_in_string = False
+        return value, end
+
+    @staticmethod
+    def _may_continue(
+        value: object,
+        buffer: str,
+        end: int,
+    ) -> bool:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return all(char in _NUMBER_CHARS for char in buffer[end:])
+
+    def _scan(self: "JsonItemStream", buffer: str, pos: int) -> bool:
+        # Returns whether the string or container starting at pos ends in
+        # the buffer. Only quotes, escapes and brackets are looked at.
+        index = pos + self._scan_offset
+        depth, in_string = self._scan_depth, self._scan_in_string
+        while True:
+            if in_string:
+                match = _STRING_END.search(buffer, index)
+                if match is None:
+                    index = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() == len(buffer):
+                        index = match.start()
+                        break
+                    index = match.end() + 1
+                    continue
+                in_string = False
+            else:
+                match = _STRUCTURE.search(buffer, index)
+                if match is None:
+                    index = len(buffer)
+                    break
+                char = match.group()
+                if char == '"':
+                    in_string = True
+                else:
+                    depth += 1 if char in "[{" else -1
+            index = match.end()
+            if depth <= 0 and not in_string:
+                return True
+        self._scan_offset = max(index - pos, 1)
+        self._scan_depth, self._scan_in_string = depth, in_string
+        return False
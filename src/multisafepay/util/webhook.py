@@ -52,6 +52,9 @@ class Webhook:
                 "Request can only be a string or TransactionResponse with raw data",
             )
 
+        # The signature covers the standard library's compact encoding, so
+        # the request is re-encoded with it whatever JSON codec the SDK uses;
+        # orjson formats floats and large integers differently.
         try:
             transaction_json = json.loads(request)
             transaction_compact_json = json.dumps(
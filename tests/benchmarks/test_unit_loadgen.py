@@ -0,0 +1,138 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the load generator."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.loadgen import (
+    Options,
+    WorkerResult,
+    _percentile,
+    main,
+    parse_mix,
+    summarize,
+)
+
+
+@pytest.mark.parametrize(
+    ("q", "expected"),
+    [(0.0, 1.0), (0.5, 50.0), (0.95, 95.0), (0.99, 99.0), (1.0, 100.0)],
+)
+def test_percentiles_use_the_nearest_rank(q: float, expected: float):
+    """Pick the smallest value covering the share of sorted values."""
+    ordered = [float(value) for value in range(1, 101)]
+
+    assert _percentile(ordered, q) == expected
+
+
+def test_percentile_of_a_single_value_is_that_value():
+    """Return the only value for every percentile."""
+    assert _percentile([0.25], 0.5) == _percentile([0.25], 0.99) == 0.25
+
+
+def test_summary_counts_requests_and_latencies_per_step():
+    """Count API requests without local steps and convert to milliseconds."""
+    result = WorkerResult(flows=3, failed_flows=1, cpu_seconds=0.004)
+    for duration in (0.001, 0.002, 0.003, 0.010):
+        result.add("create", duration)
+    result.add("webhook", 0.0005)
+    result.errors["create"] = 1
+
+    summary = summarize(result, Options(mode="async"), wall=2.0)
+
+    assert summary["requests"] == 4
+    assert summary["requests_per_sec"] == 2.0
+    assert summary["flows_per_sec"] == 1.5
+    assert summary["cpu_us_per_request"] == pytest.approx(1000.0)
+    assert summary["transport"] == "httpx"
+    create = summary["steps"]["create"]
+    assert create["count"] == 4
+    assert create["errors"] == 1
+    assert create["mean_ms"] == pytest.approx(4.0)
+    assert create["p50_ms"] == pytest.approx(2.0)
+    assert create["p99_ms"] == create["max_ms"] == pytest.approx(10.0)
+    assert summary["steps"]["webhook"]["count"] == 1
+
+
+def test_summary_names_the_transport_of_the_mode():
+    """Report the transport each mode actually uses."""
+    result = WorkerResult()
+
+    assert summarize(result, Options(), 1.0)["transport"] == "requests"
+    assert (
+        summarize(result, Options(transport="urllib3"), 1.0)["transport"]
+        == "urllib3"
+    )
+    assert (
+        summarize(result, Options(cassette="run.jsonl"), 1.0)["transport"]
+        == "cassette"
+    )
+
+
+def test_merged_results_add_up():
+    """Combine the latencies and counters of several workers."""
+    first, second = WorkerResult(flows=1), WorkerResult(flows=2)
+    first.add("get", 0.1)
+    second.add("get", 0.2)
+    second.errors["get"] = 1
+
+    first.merge(second)
+
+    assert first.latencies == {"get": [0.1, 0.2]}
+    assert first.errors == {"get": 1}
+    assert first.flows == 3
+
+
+def test_mix_weights_are_parsed_and_validated():
+    """Parse scenario weights and reject unknown or non-positive ones."""
+    assert parse_mix("checkout=6, refund") == {"checkout": 6, "refund": 1}
+    with pytest.raises(ValueError, match="Unknown scenario"):
+        parse_mix("checkout=1,shipping=2")
+    with pytest.raises(ValueError, match="positive"):
+        parse_mix("checkout=0")
+
+
+@pytest.mark.parametrize("mode", ["thread", "async"])
+def test_simulator_smoke_run(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    mode: str,
+):
+    """Run every scenario against the simulator without failed flows."""
+    # main() points the SDK at the simulator through these variables;
+    # setting them here restores them after the test.
+    for name in (
+        "MSP_SDK_BUILD_PROFILE",
+        "MSP_SDK_ALLOW_CUSTOM_BASE_URL",
+        "MSP_SDK_CUSTOM_BASE_URL",
+    ):
+        monkeypatch.setenv(name, "")
+    output = tmp_path / "summary.json"
+
+    status = main(
+        [
+            "--simulator",
+            "--mode",
+            mode,
+            "--concurrency",
+            "2",
+            "--duration",
+            "0.5",
+            "--output",
+            str(output),
+        ],
+    )
+
+    summary = json.loads(output.read_text())
+    assert status == 0
+    assert summary["flows"] > 0
+    assert summary["failed_flows"] == 0
+    assert {"create", "get", "webhook"} <= summary["steps"].keys()
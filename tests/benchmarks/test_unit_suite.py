@@ -0,0 +1,86 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for comparing benchmark results to a baseline."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.suite import compare, main
+
+
+def _results(**benchmarks: tuple[float, int]) -> dict:
+    return {
+        "sdk_version": "1.0.0",
+        "python": "3.11.0",
+        "benchmarks": {
+            name: {"min_us": min_us, "peak_bytes": peak_bytes}
+            for name, (min_us, peak_bytes) in benchmarks.items()
+        },
+    }
+
+
+def test_slower_or_larger_benchmarks_are_regressions():
+    """Report benchmarks whose time or peak allocation grew too much."""
+    baseline = _results(
+        fast=(10.0, 1000),
+        slower=(10.0, 1000),
+        larger=(10.0, 1000),
+        faster=(10.0, 1000),
+    )
+    current = _results(
+        fast=(10.5, 1050),
+        slower=(12.0, 1000),
+        larger=(10.0, 1500),
+        faster=(5.0, 500),
+    )
+
+    assert compare(baseline, current) == ["larger", "slower"]
+
+
+def test_threshold_sets_the_tolerated_increase():
+    """Tolerate increases up to the threshold and report larger ones."""
+    baseline = _results(a=(100.0, 0))
+    current = _results(a=(120.0, 0))
+
+    assert compare(baseline, current, threshold=0.25) == []
+    assert compare(baseline, current, threshold=0.1) == ["a"]
+
+
+def test_peak_of_zero_bytes_does_not_divide_by_zero():
+    """Compare benchmarks that allocated nothing in the baseline."""
+    baseline = _results(a=(1.0, 0))
+
+    assert compare(baseline, _results(a=(1.0, 0))) == []
+    assert compare(baseline, _results(a=(1.0, 100))) == ["a"]
+
+
+def test_benchmarks_missing_on_one_side_are_reported_not_compared(
+    capsys: pytest.CaptureFixture,
+):
+    """List benchmarks found in only one of the results."""
+    regressions = compare(_results(old=(1.0, 0)), _results(new=(9.0, 0)))
+
+    output = capsys.readouterr().out
+    assert regressions == []
+    assert "old" in output
+    assert "missing from the current results" in output
+    assert "not in the baseline" in output
+
+
+def test_compare_command_exit_status(tmp_path: Path):
+    """Exit with 1 on regressions and 2 without a baseline."""
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_results(a=(1.0, 0))))
+    current.write_text(json.dumps(_results(a=(2.0, 0))))
+
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert main(["compare", str(current), str(baseline)]) == 0
+    assert main(["compare", str(tmp_path / "missing.json"), str(current)]) == 2
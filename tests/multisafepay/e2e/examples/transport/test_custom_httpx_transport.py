@@ -32,7 +32,7 @@ from multisafepay.api.base.response.custom_api_response import (
     CustomApiResponse,
 )
 from multisafepay.api.paths.gateways.response.gateway import Gateway
-from tests.support.alt_http_transports import HttpxTransport
+from multisafepay.transport import HttpxTransport
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -20,8 +20,8 @@ What this validates
 Why an adapter is needed
 ------------------------
 `urllib3` does not expose the same response interface as requests/httpx (e.g.
-`.json()` / `.raise_for_status()` / `status_code`), so we use a small adapter
-transport from `tests/support`.
+`.json()` / `.raise_for_status()` / `status_code`), so the packaged
+`Urllib3Transport` wraps responses in `Urllib3Response`.
 """
 
 from __future__ import annotations
@@ -34,7 +34,7 @@ from multisafepay.api.base.response.custom_api_response import (
     CustomApiResponse,
 )
 from multisafepay.api.paths.gateways.response.gateway import Gateway
-from tests.support.alt_http_transports import Urllib3Transport
+from multisafepay.transport import Urllib3Transport
 
 if TYPE_CHECKING:
     from collections.abc import Callable
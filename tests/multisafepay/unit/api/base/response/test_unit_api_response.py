@@ -33,7 +33,8 @@ def test_with_json_creates_response():
     assert response.body == json_data
     assert response.headers == headers
     assert response.context == context
-    assert response.raw == str(json_data)
+    assert response.raw is None
+    assert response.get_raw() is None
 
 
 def test_get_body_data_returns_data():
@@ -197,3 +198,26 @@ def test_get_raw_returns_raw():
         raw=raw,
     )
     assert response.get_raw() == raw
+
+
+def test_get_raw_decodes_content_on_demand():
+    """
+    Test that get_raw decodes the kept response body when no raw text is set.
+
+    Raises
+    ------
+    AssertionError
+        If the decoded raw data does not match the original body.
+
+    """
+    content = b'{"key": "caf\xc3\xa9"}'
+    response = ApiResponse.with_json(
+        200,
+        {"key": "caf\u00e9"},
+        {},
+        content=content,
+    )
+
+    assert response.raw is None
+    assert response.get_content() == content
+    assert response.get_raw() == '{"key": "caf\u00e9"}'
@@ -0,0 +1,72 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+
+"""Unit tests for the custom API response wrapper."""
+
+from multisafepay.api.base.response.api_response import ApiResponse
+from multisafepay.api.base.response.custom_api_response import (
+    CustomApiResponse,
+)
+from multisafepay.util.message import MessageList
+
+
+def _api_response() -> ApiResponse:
+    return ApiResponse.with_json(
+        status_code=200,
+        json_data={"success": True, "data": {"id": "IDEAL"}},
+        headers={"Content-Type": "application/json"},
+        context={"retries": 1},
+        content=b'{"success": true, "data": {"id": "IDEAL"}}',
+    )
+
+
+def test_from_api_response_shares_fields_without_copying():
+    """
+    Test that from_api_response wraps the response instead of copying it.
+
+    Raises
+    ------
+    AssertionError
+        If the wrapped fields are copies or differ from the original.
+
+    """
+    response = _api_response()
+    data = {"id": "IDEAL"}
+
+    custom = CustomApiResponse.from_api_response(response, data=data)
+
+    assert custom.get_data() is data
+    assert custom.body is response.body
+    assert custom.headers is response.headers
+    assert custom.context is response.context
+    assert custom.get_status_code() == 200
+    assert custom.get_body_data() == {"id": "IDEAL"}
+    assert custom.get_raw() == response.get_raw()
+
+
+def test_from_api_response_matches_copying_constructor():
+    """
+    Test that from_api_response builds the same response as the constructor.
+
+    Raises
+    ------
+    AssertionError
+        If the two construction paths disagree.
+
+    """
+    response = _api_response()
+    warnings = MessageList()
+
+    custom = CustomApiResponse.from_api_response(response, warnings=warnings)
+    copied = CustomApiResponse(
+        **{**response.dict(), "data": None, "warnings": warnings},
+    )
+
+    assert custom.dict() == copied.dict()
+    assert custom.get_data() is None
+    assert custom.warnings is warnings
@@ -0,0 +1,243 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for streaming transactions with the transaction manager."""
+
+import asyncio
+import json
+import threading
+import tracemalloc
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from multisafepay import AsyncSdk, Sdk
+from multisafepay.api.paths.transactions.response.transaction import (
+    Transaction,
+)
+from multisafepay.client import RetryPolicy
+from multisafepay.transport import (
+    HttpxAsyncTransport,
+    HttpxTransport,
+    RequestsTransport,
+    Urllib3Transport,
+)
+from multisafepay.util.message import MessageList
+from tests.support.mock_transport import MockResponse, MockTransport
+
+PAGES = {"": "page-2", "page-2": None}
+
+
+def _page_chunks(after: str, limit: int) -> Iterator[bytes]:
+    yield b'{"success": true, "data": ['
+    for i in range(limit):
+        item = {
+            "transaction_id": f"{after or 'page-1'}-{i}",
+            "amount": 1000 + i,
+            "description": "x" * 200,
+        }
+        yield (b"," if i else b"") + json.dumps(item).encode()
+    pager = {"limit": limit, "cursor": {"after": PAGES.get(after)}}
+    yield b'], "pager": ' + json.dumps(pager).encode() + b"}"
+
+
+class _TransactionsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_left = 0
+
+    def do_GET(self: "_TransactionsHandler") -> None:  # noqa: N802
+        """Serve transaction pages as chunked, lazily generated bodies."""
+        if _TransactionsHandler.failures_left:
+            _TransactionsHandler.failures_left -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        query = parse_qs(urlparse(self.path).query)
+        after = query.get("after", [""])[0]
+        limit = int(query.get("limit", ["3"])[0])
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in _page_chunks(after, limit):
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self: "_TransactionsHandler", *args: object) -> None:
+        """Silence request logging."""
+
+
+@pytest.fixture()
+def local_url():
+    """Serve paged transactions on localhost."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TransactionsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    _TransactionsHandler.failures_left = 0
+    server.shutdown()
+    server.server_close()
+
+
+def _sdk(transport: object, url: str, **kwargs: object) -> Sdk:
+    sdk = Sdk(api_key="test_key", transport=transport, **kwargs)
+    sdk.get_client().url = url
+    return sdk
+
+
+@pytest.mark.parametrize(
+    "transport_class",
+    [RequestsTransport, Urllib3Transport, HttpxTransport],
+)
+def test_streams_transactions_over_each_transport(
+    local_url: str,
+    transport_class: type,
+):
+    """Yield Transaction objects decoded from the streamed body."""
+    with transport_class() as transport:
+        manager = _sdk(transport, local_url).get_transaction_manager()
+
+        transactions = list(
+            manager.stream_transactions({"limit": 3}, chunk_size=16),
+        )
+
+    assert all(isinstance(t, Transaction) for t in transactions)
+    assert [t.transaction_id for t in transactions] == [
+        "page-1-0",
+        "page-1-1",
+        "page-1-2",
+    ]
+    assert transactions[2].amount == 1002
+
+
+def test_follows_cursors_across_pages(local_url: str):
+    """Request the next page with the after cursor until the last page."""
+    manager = _sdk(RequestsTransport(), local_url).get_transaction_manager()
+
+    ids = [
+        t.transaction_id
+        for t in manager.stream_transactions(
+            {"limit": 2, "unknown": "dropped"},
+            all_pages=True,
+        )
+    ]
+
+    assert ids == ["page-1-0", "page-1-1", "page-2-0", "page-2-1"]
+
+
+def test_retries_before_streaming(local_url: str):
+    """Retry error statuses before the body is streamed."""
+    _TransactionsHandler.failures_left = 1
+    sleeps: list[float] = []
+    manager = _sdk(
+        RequestsTransport(),
+        local_url,
+        retry_policy=RetryPolicy(max_retries=1, sleep=sleeps.append),
+    ).get_transaction_manager()
+
+    transactions = list(manager.stream_transactions({"limit": 1}))
+
+    assert len(transactions) == 1
+    assert len(sleeps) == 1
+
+
+def test_peak_memory_does_not_grow_with_page_size(local_url: str):
+    """Keep peak memory flat while streaming a multi-megabyte page."""
+    manager = _sdk(RequestsTransport(), local_url).get_transaction_manager()
+
+    def peak_while_streaming(limit: int) -> int:
+        tracemalloc.start()
+        try:
+            count = sum(
+                1 for _ in manager.stream_transactions({"limit": limit})
+            )
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            assert count == limit
+
+    small = peak_while_streaming(500)
+    large = peak_while_streaming(10_000)  # about 2.5 MB of JSON
+
+    assert large < 512 * 1024
+    assert large < small * 2
+
+
+def test_falls_back_to_decoded_bodies_of_other_transports():
+    """Stream from transports whose responses cannot stream."""
+    transport = MockTransport(
+        response_factory=lambda _method, _url, _kwargs: MockResponse(
+            json_data={
+                "success": True,
+                "data": [{"transaction_id": "tx-1"}],
+                "pager": {"cursor": {"after": "ignored"}},
+            },
+        ),
+    )
+    sdk = Sdk(api_key="test_key", transport=transport)
+
+    transactions = list(sdk.get_transaction_manager().stream_transactions())
+
+    assert [t.transaction_id for t in transactions] == ["tx-1"]
+    assert transport.request_history[0]["kwargs"]["stream"] is True
+
+
+def test_skips_invalid_items_and_reports_them_as_warnings():
+    """Collect a warning for items that are not valid transactions."""
+    transport = MockTransport(
+        response_factory=lambda _method, _url, _kwargs: MockResponse(
+            json_data={
+                "success": True,
+                "data": [
+                    {"transaction_id": "tx-1"},
+                    {"transaction_id": "tx-2", "amount": "not a number"},
+                    {"transaction_id": "tx-3"},
+                ],
+            },
+        ),
+    )
+    sdk = Sdk(api_key="test_key", transport=transport)
+    warnings = MessageList()
+
+    transactions = list(
+        sdk.get_transaction_manager().stream_transactions(
+            warnings=warnings,
+        ),
+    )
+
+    assert [t.transaction_id for t in transactions] == ["tx-1", "tx-3"]
+    assert len(warnings) == 1
+
+
+def test_async_streams_transactions_across_pages(local_url: str):
+    """Stream pages with the async manager over httpx."""
+
+    async def run() -> list:
+        async with AsyncSdk(
+            api_key="test_key",
+            transport=HttpxAsyncTransport(),
+        ) as sdk:
+            sdk.get_client().url = local_url
+            manager = sdk.get_transaction_manager()
+            return [
+                t.transaction_id
+                async for t in manager.stream_transactions(
+                    {"limit": 2},
+                    all_pages=True,
+                    chunk_size=32,
+                )
+            ]
+
+    assert asyncio.run(run()) == [
+        "page-1-0",
+        "page-1-1",
+        "page-2-0",
+        "page-2-1",
+    ]
@@ -0,0 +1,128 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+
+"""Unit tests for the asyncio client."""
+
+import asyncio
+
+import pytest
+
+from multisafepay.api.base.response.api_response import ApiResponse
+from multisafepay.client.async_client import AsyncClient
+from multisafepay.client.credential_resolver import ScopedCredentialResolver
+from multisafepay.exception.api import ApiException
+from multisafepay.transport import HttpxAsyncTransport
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockHTTPError,
+    MockResponse,
+)
+
+
+def _build_client(transport: AsyncMockTransport) -> AsyncClient:
+    return AsyncClient(
+        api_key="test_key",
+        is_production=False,
+        transport=transport,
+    )
+
+
+def test_defaults_to_httpx_async_transport():
+    """Use HttpxAsyncTransport when no transport is injected."""
+    pytest.importorskip("httpx")
+    client = AsyncClient(api_key="mock_api_key", is_production=False)
+    assert isinstance(client.transport, HttpxAsyncTransport)
+    asyncio.run(client.aclose())
+
+
+def test_defaults_to_test_url():
+    """Share the base URL resolution with the sync client."""
+    client = _build_client(AsyncMockTransport())
+    assert client.url == AsyncClient.TEST_URL
+
+
+def test_requires_api_key_or_resolver():
+    """Reject construction without api_key and resolver."""
+    with pytest.raises(ValueError, match="api_key is required"):
+        AsyncClient(api_key=None, transport=AsyncMockTransport())
+
+
+def test_create_get_request_returns_api_response():
+    """Await the transport and wrap the JSON body in an ApiResponse."""
+    transport = AsyncMockTransport()
+    transport.add_response(
+        MockResponse(json_data={"success": True, "data": {"id": 1}}),
+    )
+    client = _build_client(transport)
+
+    response = asyncio.run(client.create_get_request("json/orders/1"))
+
+    assert isinstance(response, ApiResponse)
+    assert response.get_body_data() == {"id": 1}
+    request = transport.get_last_request()
+    assert request["method"] == "GET"
+    assert (
+        request["url"] == f"{AsyncClient.TEST_URL}json/orders/1?locale=en_US"
+    )
+    assert request["headers"]["Authorization"] == "Bearer test_key"
+
+
+def test_write_requests_send_body_with_method():
+    """POST, PATCH and DELETE forward the method and request body."""
+    transport = AsyncMockTransport()
+    for _ in range(3):
+        transport.add_response(MockResponse(json_data={"success": True}))
+    client = _build_client(transport)
+
+    async def run() -> None:
+        await client.create_post_request("json/orders", request_body="{}")
+        await client.create_patch_request("json/orders/1", request_body="{}")
+        await client.create_delete_request("json/recurring/1")
+
+    asyncio.run(run())
+
+    methods = [entry["method"] for entry in transport.request_history]
+    assert methods == ["POST", "PATCH", "DELETE"]
+    assert transport.request_history[0]["data"] == "{}"
+
+
+def test_uses_credential_resolver():
+    """Resolve the Authorization header through the resolver."""
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(json_data={"success": True}))
+    client = AsyncClient(
+        transport=transport,
+        credential_resolver=ScopedCredentialResolver(
+            default_api_key="resolver_key",
+        ),
+    )
+
+    asyncio.run(client.create_get_request("json/orders"))
+
+    headers = transport.get_last_request()["headers"]
+    assert headers["Authorization"] == "Bearer resolver_key"
+
+
+def test_server_errors_raise_api_exception():
+    """Wrap 5xx responses in ApiException like the sync client."""
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(status_code=503))
+    client = _build_client(transport)
+
+    with pytest.raises(ApiException):
+        asyncio.run(client.create_get_request("json/orders"))
+
+
+def test_client_errors_are_reraised():
+    """Propagate the transport error for 4xx responses."""
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(status_code=404))
+    client = _build_client(transport)
+
+    with pytest.raises(MockHTTPError):
+        asyncio.run(client.create_get_request("json/orders"))
@@ -0,0 +1,229 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the per-endpoint circuit breaker."""
+
+import asyncio
+import time
+
+import pytest
+
+from multisafepay.client import AsyncClient, CircuitBreaker, Client
+from multisafepay.exception.api import ApiException
+from multisafepay.exception.api_unavailable import ApiUnavailableException
+from multisafepay.exception.deadline_exceeded import (
+    DeadlineExceededException,
+)
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockResponse,
+    MockTransport,
+)
+
+OK_BODY = {"success": True, "data": {}}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self: "FakeClock") -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self: "FakeClock") -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "family"),
+    [
+        ("json/orders/123/refunds", "json/orders"),
+        ("json/orders", "json/orders"),
+        ("/json/gateways/IDEAL?include=x", "json/gateways"),
+        ("json", "json"),
+    ],
+)
+def test_endpoint_family(endpoint: str, family: str):
+    """Group endpoints by their first path segment after json/."""
+    assert CircuitBreaker.endpoint_family(endpoint) == family
+
+
+def test_circuit_opens_after_threshold_and_recovers():
+    """Walk through closed, open, half-open and closed again."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        recovery_timeout=10,
+        clock=clock,
+    )
+
+    breaker.before_request("json/orders")
+    breaker.record_failure("json/orders")
+    assert breaker.get_state("json/orders") == CircuitBreaker.STATE_CLOSED
+    breaker.record_failure("json/orders")
+    assert breaker.get_state("json/orders") == CircuitBreaker.STATE_OPEN
+
+    with pytest.raises(ApiUnavailableException) as exc_info:
+        breaker.before_request("json/orders")
+    assert exc_info.value.get_context_value("retry_in") == 10
+
+    clock.now = 10
+    assert breaker.get_state("json/orders") == CircuitBreaker.STATE_HALF_OPEN
+    breaker.before_request("json/orders")
+    with pytest.raises(ApiUnavailableException, match="half-open"):
+        breaker.before_request("json/orders")
+
+    breaker.record_success("json/orders")
+    assert breaker.get_state("json/orders") == CircuitBreaker.STATE_CLOSED
+
+
+def test_failed_trial_reopens_circuit():
+    """Open the circuit again when the half-open trial fails."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout=5,
+        clock=clock,
+    )
+    breaker.record_failure("json/orders")
+    clock.now = 5
+
+    breaker.before_request("json/orders")
+    breaker.record_failure("json/orders")
+
+    assert breaker.get_state("json/orders") == CircuitBreaker.STATE_OPEN
+    with pytest.raises(ApiUnavailableException):
+        breaker.before_request("json/orders")
+
+
+def test_released_trial_frees_half_open_slot():
+    """Free the trial slot of a cancelled request."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout=0,
+        clock=clock,
+    )
+    breaker.record_failure("json/orders")
+
+    breaker.before_request("json/orders")
+    breaker.release("json/orders")
+
+    breaker.before_request("json/orders")
+
+
+def test_client_fails_fast_per_endpoint_family():
+    """Reject calls to a broken family while others keep working."""
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+    def respond(_method: str, url: str, _kwargs: dict) -> MockResponse:
+        if "json/orders" in url:
+            return MockResponse(status_code=503)
+        return MockResponse(json_data=OK_BODY)
+
+    transport = MockTransport(response_factory=respond)
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        circuit_breaker=breaker,
+    )
+
+    for _ in range(2):
+        with pytest.raises(ApiException):
+            client.create_get_request("json/orders/1")
+    with pytest.raises(ApiUnavailableException):
+        client.create_get_request("json/orders/2")
+
+    assert len(transport.request_history) == 2
+    assert client.create_get_request("json/gateways").status_code == 200
+
+
+def test_client_errors_do_not_trip_the_breaker():
+    """Treat 4xx responses as proof the endpoint is reachable."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    transport = MockTransport(
+        response_factory=lambda *_: MockResponse(status_code=404),
+    )
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        circuit_breaker=breaker,
+    )
+
+    for _ in range(3):
+        with pytest.raises(Exception, match="404"):
+            client.create_get_request("json/orders/missing")
+
+    assert breaker.get_state("json/orders") == CircuitBreaker.STATE_CLOSED
+
+
+def test_caller_deadlines_do_not_trip_the_breaker():
+    """Release the attempt when the caller's own deadline caused the error."""
+    breaker = CircuitBreaker(failure_threshold=1, half_open_max_calls=1)
+
+    def respond(_method: str, _url: str, _kwargs: dict) -> MockResponse:
+        time.sleep(0.02)
+        raise TimeoutError("read timed out")
+
+    client = Client(
+        api_key="test_key",
+        transport=MockTransport(response_factory=respond),
+        circuit_breaker=breaker,
+    )
+
+    for _ in range(2):
+        with pytest.raises(DeadlineExceededException):
+            client.create_get_request("json/orders/1", deadline=0.01)
+
+    assert breaker.get_state("json/orders") == CircuitBreaker.STATE_CLOSED
+    with pytest.raises(TimeoutError):
+        client.create_get_request("json/orders/1")
+    assert breaker.get_state("json/orders") == CircuitBreaker.STATE_OPEN
+
+
+def test_async_caller_deadlines_do_not_trip_the_breaker():
+    """Release the async attempt when the caller's deadline expired."""
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    class _SlowTransport:
+        async def request(self: "_SlowTransport", **_kwargs: object) -> None:
+            await asyncio.sleep(1)
+
+    client = AsyncClient(
+        api_key="test_key",
+        transport=_SlowTransport(),
+        circuit_breaker=breaker,
+    )
+
+    async def run() -> None:
+        with pytest.raises(DeadlineExceededException):
+            await client.create_get_request("json/orders/1", deadline=0.01)
+
+    asyncio.run(run())
+    assert breaker.get_state("json/orders") == CircuitBreaker.STATE_CLOSED
+
+
+def test_async_client_uses_circuit_breaker():
+    """Fail fast from the async client as well."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(status_code=502))
+    client = AsyncClient(
+        api_key="test_key",
+        transport=transport,
+        circuit_breaker=breaker,
+    )
+
+    async def run() -> None:
+        with pytest.raises(ApiException):
+            await client.create_get_request("json/orders/1")
+        with pytest.raises(ApiUnavailableException):
+            await client.create_get_request("json/orders/1")
+
+    asyncio.run(run())
+    assert len(transport.request_history) == 1
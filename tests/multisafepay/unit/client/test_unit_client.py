@@ -10,6 +10,7 @@
 
 import pytest
 
+from multisafepay.api.paths.orders.order_manager import OrderManager
 from multisafepay.client.client import Client
 from multisafepay.client.credential_resolver import (
     ScopedCredentialResolver,
@@ -30,6 +31,7 @@ class _FakeResponse:
 
     status_code = 200
     headers = {}
+    content = b'{"success": true, "data": {}}'
 
     @staticmethod
     def json() -> dict:
@@ -48,9 +50,11 @@ class _CaptureTransport:
 
     def __init__(self: "_CaptureTransport") -> None:
         self.headers = {}
+        self.url = None
 
     def request(self: "_CaptureTransport", **kwargs: dict) -> _FakeResponse:
         self.headers = kwargs.get("headers", {})
+        self.url = kwargs.get("url")
         return _FakeResponse()
 
 
@@ -330,3 +334,120 @@ def test_resolve_api_key_raises_without_key_or_resolver() -> None:
             transport=_CaptureTransport(),
             credential_resolver=None,
         )
+
+
+def test_response_keeps_body_bytes_and_request_context() -> None:
+    """Responses keep the body bytes and decode the raw text on demand."""
+    client = Client(
+        api_key="test_key",
+        is_production=False,
+        transport=_CaptureTransport(),
+    )
+    response = client.create_post_request(
+        "json/orders",
+        request_body='{"foo":"bar"}',
+    )
+    assert response.raw is None
+    assert response.get_content() == _FakeResponse.content
+    assert response.get_raw() == '{"success": true, "data": {}}'
+    assert response.context["request_body"] == '{"foo":"bar"}'
+    assert response.context["headers"]["Authorization"] == "Bearer test_key"
+
+
+def test_lean_responses_drop_body_bytes_and_request_context() -> None:
+    """Lean responses keep only the decoded body and retry accounting."""
+    client = Client(
+        api_key="test_key",
+        is_production=False,
+        transport=_CaptureTransport(),
+        lean_responses=True,
+    )
+    response = client.create_post_request(
+        "json/orders",
+        request_body='{"foo":"bar"}',
+    )
+    assert response.body == {"success": True, "data": {}}
+    assert response.get_content() is None
+    assert response.get_raw() is None
+    assert "request_body" not in response.context
+    assert "headers" not in response.context
+    assert response.context["retries"] == 0
+
+
+def test_build_url_encodes_query_without_mutating_params() -> None:
+    """Encode the query string and leave the caller's params untouched."""
+    transport = _CaptureTransport()
+    client = Client(
+        api_key="test_key",
+        is_production=False,
+        transport=transport,
+    )
+    params = {"created_from": "2026-01-01T00:00:00+01:00", "limit": 10}
+
+    client.create_get_request("json/transactions", params)
+    client.create_get_request("json/transactions", params)
+
+    assert params == {"created_from": "2026-01-01T00:00:00+01:00", "limit": 10}
+    assert transport.url == (
+        f"{Client.TEST_URL}json/transactions"
+        "?created_from=2026-01-01T00%3A00%3A00%2B01%3A00&limit=10&locale=en_US"
+    )
+
+
+def test_headers_are_copied_from_the_credential_template() -> None:
+    """Give every call its own headers, so transports may modify them."""
+    transport = _CaptureTransport()
+    client = Client(
+        api_key="test_key",
+        is_production=False,
+        transport=transport,
+    )
+
+    client.create_get_request("json/orders")
+    transport.headers["X-Signed"] = "1"
+    client.create_post_request("json/orders", idempotency_key="key-1")
+    assert "X-Signed" not in transport.headers
+    assert transport.headers["Idempotency-Key"] == "key-1"
+
+    client.create_get_request("json/orders")
+    assert transport.headers == {
+        "Authorization": "Bearer test_key",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
+
+def test_caller_context_is_not_modified() -> None:
+    """Build the response context without writing into the caller's dict."""
+    client = Client(
+        api_key="test_key",
+        is_production=False,
+        transport=_CaptureTransport(),
+    )
+    context = {"order_id": "order-1"}
+
+    response = client.create_get_request(
+        "json/orders/order-1",
+        context=context,
+    )
+
+    assert context == {"order_id": "order-1"}
+    assert response.context["order_id"] == "order-1"
+    assert response.context["retries"] == 0
+
+
+def test_order_manager_get_sends_only_the_locale_query() -> None:
+    """Pass the order context as context, not as query parameters."""
+    transport = _CaptureTransport()
+    client = Client(
+        api_key="test_key",
+        is_production=False,
+        transport=transport,
+    )
+
+    response = OrderManager(client).get("order-1")
+
+    assert (
+        transport.url == f"{Client.TEST_URL}json/orders/order-1?locale=en_US"
+    )
+    assert response.context["order_id"] == "order-1"
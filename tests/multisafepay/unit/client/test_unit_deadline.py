@@ -0,0 +1,183 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for per-call deadline budgets."""
+
+import asyncio
+import time
+
+import pytest
+
+from multisafepay.api.paths.orders.async_order_manager import (
+    AsyncOrderManager,
+)
+from multisafepay.api.paths.orders.order_manager import OrderManager
+from multisafepay.client import AsyncClient, Client, Deadline, RetryPolicy
+from multisafepay.exception.deadline_exceeded import (
+    DeadlineExceededException,
+)
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockResponse,
+    MockTransport,
+)
+
+ORDER_BODY = {"success": True, "data": {"order_id": "order-1"}}
+
+
+def test_deadline_tracks_remaining_budget():
+    """Count the budget down on the monotonic clock."""
+    deadline = Deadline(5)
+
+    assert deadline.budget == 5.0
+    assert 4.9 < deadline.remaining() <= 5.0
+    assert not deadline.expired()
+    assert deadline.check() <= 5.0
+
+
+def test_expired_deadline_check_raises():
+    """Raise DeadlineExceededException once no time is left."""
+    deadline = Deadline(0)
+
+    assert deadline.expired()
+    assert deadline.remaining() == 0.0
+    with pytest.raises(DeadlineExceededException, match="0s exceeded"):
+        deadline.check()
+
+
+def test_negative_budget_is_rejected():
+    """Reject negative budgets."""
+    with pytest.raises(ValueError):
+        Deadline(-1)
+
+
+def test_coerce_accepts_seconds_and_instances():
+    """Convert seconds to a Deadline and pass instances through."""
+    deadline = Deadline(1)
+
+    assert Deadline.coerce(None) is None
+    assert Deadline.coerce(deadline) is deadline
+    assert Deadline.coerce(2.5).budget == 2.5
+
+
+def test_client_without_deadline_passes_no_timeout():
+    """Leave the transport timeout to the transport defaults."""
+    transport = MockTransport()
+    transport.add_response(MockResponse(json_data=ORDER_BODY))
+    client = Client(api_key="test_key", transport=transport)
+
+    client.create_get_request("json/orders/order-1")
+
+    assert "timeout" not in transport.get_last_request()["kwargs"]
+
+
+def test_manager_deadline_is_propagated_as_transport_timeout():
+    """Pass the remaining budget of a manager call to the transport."""
+    transport = MockTransport()
+    transport.add_response(MockResponse(json_data=ORDER_BODY))
+    client = Client(api_key="test_key", transport=transport)
+
+    OrderManager(client).get("order-1", deadline=2.0)
+
+    timeout = transport.get_last_request()["kwargs"]["timeout"]
+    assert 0 < timeout <= 2.0
+
+
+def test_expired_deadline_skips_the_transport():
+    """Fail fast without sending when the budget is already spent."""
+    transport = MockTransport()
+    client = Client(api_key="test_key", transport=transport)
+
+    with pytest.raises(DeadlineExceededException):
+        client.create_get_request("json/orders/order-1", deadline=Deadline(0))
+
+    assert transport.request_history == []
+
+
+def test_transport_error_after_deadline_is_reported_as_exceeded():
+    """Translate transport errors raised past the deadline."""
+
+    def slow_failure(*_args: object) -> MockResponse:
+        time.sleep(0.02)
+        raise TimeoutError("read timed out")
+
+    client = Client(
+        api_key="test_key",
+        transport=MockTransport(response_factory=slow_failure),
+    )
+
+    with pytest.raises(DeadlineExceededException, match="read timed out"):
+        client.create_get_request("json/orders/order-1", deadline=0.01)
+
+
+def test_transport_error_within_deadline_is_not_translated():
+    """Keep transport errors unchanged while budget remains."""
+
+    def failure(*_args: object) -> MockResponse:
+        raise ConnectionError("connection refused")
+
+    client = Client(
+        api_key="test_key",
+        transport=MockTransport(response_factory=failure),
+    )
+
+    with pytest.raises(ConnectionError):
+        client.create_get_request("json/orders/order-1", deadline=10)
+
+
+def test_async_deadline_bounds_the_whole_request():
+    """Cancel a slow async transport once the budget runs out."""
+
+    class SlowTransport:
+        async def request(self: "SlowTransport", **_kwargs: object) -> None:
+            """Never answer within the budget."""
+            await asyncio.sleep(1)
+
+    client = AsyncClient(api_key="test_key", transport=SlowTransport())
+
+    async def run() -> None:
+        await AsyncOrderManager(client).get("order-1", deadline=0.01)
+
+    with pytest.raises(DeadlineExceededException):
+        asyncio.run(run())
+
+
+def test_async_transport_timeout_within_budget_is_retried():
+    """Retry a timeout of the transport itself while budget is left."""
+    calls = []
+
+    def respond(*_args: object) -> MockResponse:
+        calls.append(1)
+        if len(calls) == 1:
+            raise TimeoutError("read timed out")
+        return MockResponse(json_data=ORDER_BODY)
+
+    client = AsyncClient(
+        api_key="test_key",
+        transport=AsyncMockTransport(response_factory=respond),
+        retry_policy=RetryPolicy(backoff_base=0.001),
+    )
+
+    response = asyncio.run(
+        client.create_get_request("json/orders/order-1", deadline=10),
+    )
+
+    assert response.status_code == 200
+    assert response.context["retries"] == 1
+    assert len(calls) == 2
+
+
+def test_async_manager_deadline_is_propagated_as_transport_timeout():
+    """Pass the remaining budget of an async manager call to the transport."""
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(json_data=ORDER_BODY))
+    client = AsyncClient(api_key="test_key", transport=transport)
+
+    asyncio.run(AsyncOrderManager(client).get("order-1", deadline=2.0))
+
+    timeout = transport.get_last_request()["kwargs"]["timeout"]
+    assert 0 < timeout <= 2.0
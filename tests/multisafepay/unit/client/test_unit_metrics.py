@@ -0,0 +1,193 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the metrics registry and its use by the clients."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from multisafepay import Sdk
+from multisafepay.client import (
+    AsyncClient,
+    Client,
+    MetricsRegistry,
+    RetryPolicy,
+)
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockHTTPError,
+    MockResponse,
+    MockTransport,
+)
+
+OK_BODY = {"success": True, "data": {"order_id": "order-1"}}
+
+
+def _ticking_clock(step: float) -> MetricsRegistry:
+    return MetricsRegistry(clock=itertools.count(0.0, step).__next__)
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "template"),
+    [
+        ("json/orders", "json/orders"),
+        ("json/orders/order-1", "json/orders/{id}"),
+        ("/json/orders/order-1/refunds?x=1", "json/orders/{id}/refunds"),
+        (
+            "json/recurring/ref-1/token/tok-1",
+            "json/recurring/{id}/token/{id}",
+        ),
+        ("json/gateways/IDEAL", "json/gateways/{id}"),
+        ("json/auth/api_token", "json/auth/api_token"),
+        ("json/orders/order-1/capture", "json/orders/{id}/capture"),
+        (
+            "json/recurring/ref-1/remove/tok-1",
+            "json/recurring/{id}/remove/{id}",
+        ),
+    ],
+)
+def test_endpoint_template_replaces_identifiers(
+    endpoint: str,
+    template: str,
+) -> None:
+    """Replace the identifiers in endpoint paths by placeholders."""
+    assert MetricsRegistry.endpoint_template(endpoint) == template
+
+
+def test_snapshot_counts_calls_per_method_and_template() -> None:
+    """Group calls by method and template and sum their counters."""
+    registry = MetricsRegistry(buckets=[0.1, 0.5, 1.0])
+    registry.observe("GET", "json/orders/a", 0.05, bytes_received=100)
+    registry.observe(
+        "GET",
+        "json/orders/b",
+        0.3,
+        error=True,
+        retries=2,
+        bytes_received=20,
+    )
+    registry.observe("POST", "json/orders", 2.0, bytes_sent=50)
+
+    snapshot = registry.snapshot()
+
+    get = snapshot[("GET", "json/orders/{id}")]
+    assert (get.calls, get.errors, get.retries) == (2, 1, 2)
+    assert get.bytes_received == 120
+    assert get.error_rate == 0.5
+    assert get.latency_sum == pytest.approx(0.35)
+    assert get.buckets == ((0.1, 1), (0.5, 2), (1.0, 2), (float("inf"), 2))
+    post = snapshot[("POST", "json/orders")]
+    assert (post.calls, post.bytes_sent) == (1, 50)
+    assert post.buckets[-1] == (float("inf"), 1)
+
+
+def test_quantiles_interpolate_within_buckets() -> None:
+    """Estimate quantiles linearly within the bucket holding them."""
+    registry = MetricsRegistry(buckets=[0.1, 0.2, 0.4])
+    for duration in [0.05] * 50 + [0.15] * 40 + [0.3] * 9 + [9.0]:
+        registry.observe("GET", "json/gateways", duration)
+
+    metrics = registry.snapshot()[("GET", "json/gateways")]
+
+    assert metrics.p50 == pytest.approx(0.1)
+    assert metrics.quantile(0.25) == pytest.approx(0.05)
+    assert metrics.p95 == pytest.approx(0.2 + 0.2 * 5 / 9)
+    assert metrics.p99 == pytest.approx(0.4)
+    assert metrics.quantile(1.0) == pytest.approx(0.4)
+    with pytest.raises(ValueError):
+        metrics.quantile(1.5)
+
+
+def test_invalid_buckets_are_rejected() -> None:
+    """Reject empty, non-positive and unordered bucket bounds."""
+    for buckets in ([], [0.0, 1.0], [1.0, 0.5], [1.0, 1.0]):
+        with pytest.raises(ValueError):
+            MetricsRegistry(buckets=buckets)
+
+
+def test_render_prometheus_exposes_counters_and_histograms() -> None:
+    """Render counters and cumulative histogram buckets with labels."""
+    registry = MetricsRegistry(buckets=[0.1, 1.0])
+    registry.observe("GET", "json/orders/1", 0.5, retries=1)
+    registry.observe("GET", "json/orders/2", 0.05, error=True)
+
+    text = registry.render_prometheus()
+
+    labels = 'method="GET",endpoint="json/orders/{id}"'
+    assert "# TYPE multisafepay_requests_total counter" in text
+    assert f"multisafepay_requests_total{{{labels}}} 2" in text
+    assert f"multisafepay_request_errors_total{{{labels}}} 1" in text
+    assert f"multisafepay_request_retries_total{{{labels}}} 1" in text
+    assert "# TYPE multisafepay_request_duration_seconds histogram" in text
+    bucket = "multisafepay_request_duration_seconds_bucket"
+    assert f'{bucket}{{{labels},le="0.1"}} 1' in text
+    assert f'{bucket}{{{labels},le="1.0"}} 2' in text
+    assert f'{bucket}{{{labels},le="+Inf"}} 2' in text
+    assert f"multisafepay_request_duration_seconds_count{{{labels}}} 2" in text
+    assert text.endswith("\n")
+
+
+def test_client_records_successful_calls_with_retries() -> None:
+    """Record the duration, retries and bytes of a retried call."""
+    registry = _ticking_clock(0.2)
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=503))
+    transport.add_response(
+        MockResponse(json_data=OK_BODY, headers={"Content-Length": "42"}),
+    )
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        retry_policy=RetryPolicy(sleep=lambda _delay: None),
+        metrics=registry,
+    )
+
+    client.create_post_request(
+        "json/orders/order-1/refunds",
+        request_body="{}",
+        idempotency_key="refund-1",
+    )
+
+    metrics = registry.snapshot()[("POST", "json/orders/{id}/refunds")]
+    assert (metrics.calls, metrics.errors, metrics.retries) == (1, 0, 1)
+    assert metrics.bytes_sent == 4
+    assert metrics.bytes_received == 42
+    assert metrics.latency_sum == pytest.approx(0.2)
+
+
+def test_client_records_failed_calls() -> None:
+    """Count calls ending with an error status as errors."""
+    registry = MetricsRegistry()
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=404))
+    client = Client(api_key="test_key", transport=transport, metrics=registry)
+
+    with pytest.raises(MockHTTPError):
+        client.create_get_request("json/orders/missing")
+
+    metrics = registry.snapshot()[("GET", "json/orders/{id}")]
+    assert (metrics.calls, metrics.errors, metrics.error_rate) == (1, 1, 1.0)
+
+
+def test_sdk_and_async_client_record_into_the_registry() -> None:
+    """Pass the registry through the Sdk and record async calls."""
+    registry = MetricsRegistry()
+    sdk = Sdk(api_key="test_key", transport=MockTransport(), metrics=registry)
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(json_data=OK_BODY))
+    client = AsyncClient(
+        api_key="test_key",
+        transport=transport,
+        metrics=registry,
+    )
+
+    asyncio.run(client.create_get_request("json/gateways"))
+
+    assert sdk.get_client().metrics is registry
+    assert registry.snapshot()[("GET", "json/gateways")].calls == 1
@@ -0,0 +1,216 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the client middleware chains."""
+
+import asyncio
+from typing import Callable
+from collections.abc import Awaitable
+
+import pytest
+
+from multisafepay import Sdk
+from multisafepay.client import (
+    AsyncClient,
+    Client,
+    RetryPolicy,
+    TransportRequest,
+)
+from multisafepay.client.middleware import build_chain
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockResponse,
+    MockTransport,
+)
+
+OK_BODY = {"success": True, "data": {"order_id": "order-1"}}
+
+Next = Callable[[TransportRequest], MockResponse]
+AsyncNext = Callable[[TransportRequest], Awaitable[MockResponse]]
+
+
+def _recorder(name: str, events: list[str]) -> Callable:
+    def middleware(request: TransportRequest, call_next: Next) -> MockResponse:
+        events.append(f"{name} >")
+        response = call_next(request)
+        events.append(f"{name} <")
+        return response
+
+    return middleware
+
+
+def test_build_chain_without_middlewares_is_the_send_function() -> None:
+    """Return the send function itself for an empty chain."""
+
+    def send(request: TransportRequest) -> str:
+        return request.url
+
+    assert build_chain([], send) is send
+
+
+def test_middlewares_run_in_order_around_the_transport() -> None:
+    """Run the first middleware outermost, around the transport call."""
+    events: list[str] = []
+    transport = MockTransport(
+        response_factory=lambda *_: events.append("transport")
+        or MockResponse(json_data=OK_BODY),
+    )
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        middlewares=[_recorder("outer", events), _recorder("inner", events)],
+    )
+
+    response = client.create_get_request("json/orders/order-1")
+
+    assert response.get_body_data() == OK_BODY["data"]
+    assert events == ["outer >", "inner >", "transport", "inner <", "outer <"]
+
+
+def test_middleware_changes_reach_the_transport() -> None:
+    """Send the request as changed by the middlewares."""
+
+    def tracing(request: TransportRequest, call_next: Next) -> MockResponse:
+        request.headers["traceparent"] = "00-trace-span-01"
+        request.options["verify"] = False
+        return call_next(request)
+
+    transport = MockTransport()
+    transport.add_response(MockResponse(json_data=OK_BODY))
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        middlewares=[tracing],
+    )
+
+    client.create_post_request("json/orders", request_body=b"{}")
+
+    sent = transport.get_last_request()
+    assert sent["method"] == "POST"
+    assert sent["data"] == b"{}"
+    assert sent["headers"]["traceparent"] == "00-trace-span-01"
+    assert sent["headers"]["Authorization"] == "Bearer test_key"
+    assert sent["kwargs"]["verify"] is False
+
+
+def test_middleware_can_short_circuit_the_transport() -> None:
+    """Return a response without calling the transport."""
+
+    def stub(request: TransportRequest, _call_next: Next) -> MockResponse:
+        return MockResponse(json_data={"success": True, "data": request.url})
+
+    transport = MockTransport()
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        middlewares=[stub],
+    )
+
+    response = client.create_get_request("json/gateways")
+
+    assert (
+        response.get_body_data()
+        == f"{Client.TEST_URL}json/gateways?locale=en_US"
+    )
+    assert transport.request_history == []
+
+
+def test_middlewares_see_every_attempt_with_fresh_headers() -> None:
+    """Run the chain per attempt, without carrying over header changes."""
+    seen: list[tuple[int, bool]] = []
+
+    def marker(request: TransportRequest, call_next: Next) -> MockResponse:
+        seen.append((request.attempt, "X-Marked" in request.headers))
+        request.headers["X-Marked"] = "1"
+        return call_next(request)
+
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=503))
+    transport.add_response(MockResponse(json_data=OK_BODY))
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        retry_policy=RetryPolicy(sleep=lambda _delay: None),
+        middlewares=[marker],
+    )
+
+    response = client.create_get_request("json/orders/order-1")
+
+    assert seen == [(0, False), (1, False)]
+    assert response.context["retries"] == 1
+
+
+def test_middleware_errors_propagate_to_the_caller() -> None:
+    """Raise exceptions of middlewares from the call."""
+
+    def failing(_request: TransportRequest, _call_next: Next) -> MockResponse:
+        raise RuntimeError("blocked by middleware")
+
+    client = Client(
+        api_key="test_key",
+        transport=MockTransport(),
+        middlewares=[failing],
+    )
+
+    with pytest.raises(RuntimeError, match="blocked by middleware"):
+        client.create_get_request("json/orders/order-1")
+
+
+def test_sdk_passes_middlewares_to_the_client() -> None:
+    """Configure the middlewares of the Sdk client."""
+    events: list[str] = []
+    middleware = _recorder("sdk", events)
+
+    sdk = Sdk(
+        api_key="test_key",
+        transport=MockTransport(),
+        middlewares=[middleware],
+    )
+
+    assert sdk.get_client().middlewares == (middleware,)
+
+
+def test_async_middlewares_run_in_order_and_can_short_circuit() -> None:
+    """Await async middlewares in order, and let them skip the transport."""
+    events: list[str] = []
+
+    async def outer(
+        request: TransportRequest,
+        call_next: AsyncNext,
+    ) -> MockResponse:
+        events.append("outer >")
+        response = await call_next(request)
+        events.append("outer <")
+        return response
+
+    async def cache(
+        request: TransportRequest,
+        call_next: AsyncNext,
+    ) -> MockResponse:
+        if request.url.endswith("cached?locale=en_US"):
+            return MockResponse(json_data={"success": True, "data": "cached"})
+        return await call_next(request)
+
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(json_data=OK_BODY))
+    client = AsyncClient(
+        api_key="test_key",
+        transport=transport,
+        middlewares=[outer, cache],
+    )
+
+    async def run() -> tuple:
+        cached = await client.create_get_request("json/cached")
+        fetched = await client.create_get_request("json/orders/order-1")
+        return cached, fetched
+
+    cached, fetched = asyncio.run(run())
+
+    assert cached.get_body_data() == "cached"
+    assert fetched.get_body_data() == OK_BODY["data"]
+    assert len(transport.request_history) == 1
+    assert events == ["outer >", "outer <", "outer >", "outer <"]
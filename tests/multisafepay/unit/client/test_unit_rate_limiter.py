@@ -0,0 +1,223 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the per-scope token-bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from multisafepay.client import AsyncClient, Client, Deadline, RateLimiter
+from multisafepay.client.credential_resolver import (
+    AuthScope,
+    ScopedCredentialResolver,
+)
+from multisafepay.client.rate_limiter import TokenBucket
+from multisafepay.exception.deadline_exceeded import (
+    DeadlineExceededException,
+)
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockResponse,
+    MockTransport,
+)
+
+OK_BODY = {"success": True, "data": {}}
+
+
+class FakeClock:
+    """Clock advanced by the fake sleep."""
+
+    def __init__(self: "FakeClock") -> None:
+        """Start at zero with no recorded sleeps."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self: "FakeClock") -> float:
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self: "FakeClock", seconds: float) -> None:
+        """Record the sleep and advance the clock."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    """Serve the burst immediately and queue the rest at the refill rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+
+
+def test_bucket_refills_over_time_up_to_burst():
+    """Refill tokens with elapsed time without exceeding the burst."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now = 100
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+
+def test_bucket_does_not_reserve_beyond_max_wait():
+    """Leave the bucket untouched when the wait is too long."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, burst=1, clock=clock)
+    bucket.reserve()
+
+    assert bucket.reserve(max_wait=0.5) is None
+    assert bucket.reserve(max_wait=1.0) == 1.0
+
+
+@pytest.mark.parametrize(
+    ("auth_scope", "key"),
+    [
+        (None, "default_account"),
+        (AuthScope(scope="partner_affiliate"), "partner_affiliate"),
+        (
+            AuthScope(scope="terminal_group", group_id="shop-1"),
+            "terminal_group:shop-1",
+        ),
+    ],
+)
+def test_scope_key(auth_scope: AuthScope, key: str):
+    """Key buckets by scope and terminal group id."""
+    assert RateLimiter.scope_key(auth_scope) == key
+
+
+def test_scope_key_identifies_the_credential():
+    """Append a stable digest of the credential, never the key itself."""
+    key = RateLimiter.scope_key(None, "Bearer secret_key")
+
+    assert key.startswith("default_account@")
+    assert "secret_key" not in key
+    assert key == RateLimiter.scope_key(None, "Bearer secret_key")
+    assert key != RateLimiter.scope_key(None, "Bearer other_key")
+
+
+def test_limits_resolve_by_key_then_scope_then_default():
+    """Pick the most specific configured limit."""
+    limiter = RateLimiter(
+        rate=10,
+        burst=20,
+        limits={
+            "terminal_group": (2.0, 4),
+            "terminal_group:vip": (50.0, 100),
+        },
+    )
+
+    assert limiter.get_bucket("terminal_group:vip").burst == 100
+    assert limiter.get_bucket("terminal_group:shop-1").burst == 4
+    assert limiter.get_bucket("default_account").burst == 20
+    assert limiter.get_bucket("terminal_group:vip@0123abcd").burst == 100
+    assert limiter.get_bucket("terminal_group:x@0123abcd").burst == 4
+
+
+def test_invalid_limits_are_rejected():
+    """Reject non-positive rates and empty bursts."""
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(limits={"partner_affiliate": (1.0, 0)})
+
+
+def test_client_blocks_per_scope_and_reports_wait():
+    """Throttle one terminal group without slowing another."""
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1.0, burst=1, clock=clock, sleep=clock.sleep)
+    transport = MockTransport(
+        response_factory=lambda *_: MockResponse(json_data=OK_BODY),
+    )
+    client = Client(
+        credential_resolver=ScopedCredentialResolver(
+            default_api_key="default_key",
+            terminal_group_api_keys={"a": "group_a_key", "b": "group_b_key"},
+        ),
+        transport=transport,
+        rate_limiter=limiter,
+    )
+    group_a = AuthScope(scope="terminal_group", group_id="a")
+    group_b = AuthScope(scope="terminal_group", group_id="b")
+
+    client.create_get_request("json/orders/1", auth_scope=group_a)
+    client.create_get_request("json/orders/1", auth_scope=group_b)
+    throttled = client.create_get_request("json/orders/2", auth_scope=group_a)
+
+    assert clock.sleeps == [1.0]
+    assert throttled.context["rate_limit_wait"] == 1.0
+
+
+def test_api_keys_sharing_a_limiter_get_separate_buckets():
+    """Throttle one account without slowing another on the same limiter."""
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1.0, burst=1, clock=clock, sleep=clock.sleep)
+    transport = MockTransport(
+        response_factory=lambda *_: MockResponse(json_data=OK_BODY),
+    )
+    merchant_a, merchant_b = (
+        Client(api_key=api_key, transport=transport, rate_limiter=limiter)
+        for api_key in ("merchant_a_key", "merchant_b_key")
+    )
+
+    first_a = merchant_a.create_get_request("json/orders/1")
+    first_b = merchant_b.create_get_request("json/orders/1")
+    throttled = merchant_b.create_get_request("json/orders/2")
+
+    assert first_a.context["rate_limit_wait"] == 0.0
+    assert first_b.context["rate_limit_wait"] == 0.0
+    assert throttled.context["rate_limit_wait"] == 1.0
+    assert clock.sleeps == [1.0]
+
+
+def test_rate_limit_wait_beyond_deadline_raises():
+    """Fail instead of waiting past the call deadline."""
+    limiter = RateLimiter(rate=0.1, burst=1)
+    transport = MockTransport(
+        response_factory=lambda *_: MockResponse(json_data=OK_BODY),
+    )
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        rate_limiter=limiter,
+    )
+    client.create_get_request("json/orders/1")
+
+    with pytest.raises(DeadlineExceededException, match="Rate limit"):
+        client.create_get_request("json/orders/1", deadline=Deadline(1))
+
+    assert len(transport.request_history) == 1
+
+
+def test_async_client_waits_without_blocking():
+    """Await the rate limiter in the async client."""
+    limiter = RateLimiter(rate=100.0, burst=1)
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(json_data=OK_BODY))
+    transport.add_response(MockResponse(json_data=OK_BODY))
+    client = AsyncClient(
+        api_key="test_key",
+        transport=transport,
+        rate_limiter=limiter,
+    )
+
+    async def run() -> list[float]:
+        first = await client.create_get_request("json/orders/1")
+        second = await client.create_get_request("json/orders/2")
+        return [
+            first.context["rate_limit_wait"],
+            second.context["rate_limit_wait"],
+        ]
+
+    first_wait, second_wait = asyncio.run(run())
+
+    assert first_wait == 0.0
+    assert 0 < second_wait <= 0.01
@@ -0,0 +1,319 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the TTL/LRU response cache."""
+
+import asyncio
+import time
+
+import pytest
+
+from multisafepay.api.base.response.api_response import ApiResponse
+from multisafepay.api.paths.gateways.async_gateway_manager import (
+    AsyncGatewayManager,
+)
+from multisafepay.api.paths.gateways.gateway_manager import GatewayManager
+from multisafepay.client import AsyncClient, Client, ResponseCache
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockResponse,
+    MockTransport,
+)
+
+GATEWAYS_BODY = {"success": True, "data": [{"id": "IDEAL"}]}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self: "FakeClock") -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self: "FakeClock") -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+def _response(marker: str = "a") -> ApiResponse:
+    return ApiResponse.with_json(
+        status_code=200,
+        json_data={"success": True, "data": marker},
+        headers={},
+    )
+
+
+def _counting_transport() -> MockTransport:
+    return MockTransport(
+        response_factory=lambda *_: MockResponse(json_data=GATEWAYS_BODY),
+    )
+
+
+def test_ttl_lookup_prefers_the_most_specific_path():
+    """Resolve TTLs by endpoint path, most specific first."""
+    cache = ResponseCache(
+        ttls={"json/issuers": 60, "json/issuers/IDEAL": 5, "json/me": 0},
+    )
+
+    assert cache.ttl_for("json/issuers/IDEAL") == 5
+    assert cache.ttl_for("json/issuers/MYBANK") == 60
+    assert cache.ttl_for("json/me") is None
+    assert cache.ttl_for("json/orders/1") is None
+
+
+def test_default_ttls_cover_reference_data_endpoints():
+    """Cache gateways, payment methods, issuers, categories and me by default."""
+    cache = ResponseCache()
+
+    for endpoint in (
+        "json/gateways",
+        "json/payment-methods/IDEAL",
+        "json/issuers/IDEAL",
+        "json/categories",
+        "json/me",
+    ):
+        assert cache.ttl_for(endpoint) is not None
+
+
+def test_invalid_settings_are_rejected():
+    """Reject empty caches and negative durations."""
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=0)
+    with pytest.raises(ValueError):
+        ResponseCache(stale_while_revalidate=-1)
+
+
+def test_entries_expire_after_their_ttl():
+    """Serve an entry until its TTL has passed."""
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    cache.put("key", "json/gateways", _response(), ttl=10)
+
+    clock.now = 9.9
+    assert cache.get("key") is not None
+    clock.now = 10
+    assert cache.get("key") is None
+
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 0)
+    assert stats.hit_ratio == 0.5
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Keep at most max_entries entries, dropping the least recently used."""
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", "json/gateways", _response("a"), ttl=60)
+    cache.put("b", "json/gateways", _response("b"), ttl=60)
+    cache.get("a")
+    cache.put("c", "json/gateways", _response("c"), ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get_stats().evictions == 1
+
+
+def test_stale_entry_is_refreshed_once():
+    """Ask only the first caller of a stale entry to refresh it."""
+    clock = FakeClock()
+    cache = ResponseCache(stale_while_revalidate=30, clock=clock)
+    cache.put("key", "json/gateways", _response(), ttl=10)
+    clock.now = 15
+
+    assert cache.get("key")[1] is True
+    assert cache.get("key")[1] is False
+    cache.refresh_failed("key")
+    assert cache.get("key")[1] is True
+    assert cache.get_stats().stale_hits == 3
+
+
+def test_invalidate_drops_an_endpoint_and_its_sub_paths():
+    """Drop the entries of an endpoint path only."""
+    cache = ResponseCache()
+    cache.put("a", "json/gateways", _response(), ttl=60)
+    cache.put("b", "json/gateways/IDEAL", _response(), ttl=60)
+    cache.put("c", "json/issuers/IDEAL", _response(), ttl=60)
+
+    assert cache.invalidate("json/gateways") == 2
+    assert cache.get_stats().size == 1
+    assert cache.invalidate() == 1
+
+
+def test_client_serves_repeated_gets_from_the_cache():
+    """Send one request for repeated reference-data lookups."""
+    transport = _counting_transport()
+    cache = ResponseCache()
+    manager = GatewayManager(
+        Client(api_key="test_key", transport=transport, response_cache=cache),
+    )
+
+    first = manager.get_gateways()
+    second = manager.get_gateways()
+
+    assert len(transport.request_history) == 1
+    assert second.get_data() == first.get_data()
+    assert cache.get_stats().hits == 1
+
+
+def test_cache_key_includes_locale_query_and_credential():
+    """Keep separate entries per locale, query options and API key."""
+    transport = _counting_transport()
+    cache = ResponseCache()
+    client = Client(api_key="key_a", transport=transport, response_cache=cache)
+    other = Client(
+        api_key="key_b",
+        transport=transport,
+        response_cache=cache,
+        locale="nl_NL",
+    )
+
+    client.create_get_request("json/gateways")
+    client.create_get_request("json/gateways", params={"country": "NL"})
+    client.create_get_request("json/gateways", params={"locale": "nl_NL"})
+    other.create_get_request("json/gateways", params={"locale": "nl_NL"})
+
+    assert len(transport.request_history) == 4
+
+
+def test_uncached_endpoints_and_errors_are_not_stored():
+    """Only cache successful GETs of endpoints with a TTL."""
+    transport = MockTransport(
+        response_factory=lambda _method, url, _: MockResponse(
+            status_code=404 if "missing" in url else 200,
+            json_data=GATEWAYS_BODY,
+        ),
+    )
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        response_cache=ResponseCache(),
+    )
+
+    client.create_get_request("json/orders/1")
+    client.create_get_request("json/orders/1")
+    for _ in range(2):
+        with pytest.raises(Exception, match="404"):
+            client.create_get_request("json/gateways/missing")
+
+    assert len(transport.request_history) == 4
+
+
+def test_cached_response_carries_the_callers_context():
+    """Mark cached responses without changing the stored entry."""
+    client = Client(
+        api_key="test_key",
+        transport=_counting_transport(),
+        response_cache=ResponseCache(),
+    )
+
+    miss = client.create_get_request("json/gateways")
+    hit = client.create_get_request("json/gateways", context={"page": 2})
+
+    assert "cached" not in miss.context
+    assert hit.context["cached"] is True
+    assert hit.context["page"] == 2
+
+
+def test_changing_a_returned_body_does_not_change_the_cache():
+    """Give every caller its own copy of the cached body."""
+    transport = MockTransport(
+        response_factory=lambda *_: MockResponse(
+            json_data={"success": True, "data": [{"description": "iDEAL"}]},
+        ),
+    )
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        response_cache=ResponseCache(),
+    )
+
+    miss = client.create_get_request("json/gateways")
+    miss.body["data"][0]["description"] = "MUTATED"
+    hit = client.create_get_request("json/gateways")
+    hit.body["data"].append({"description": "ADDED"})
+    again = client.create_get_request("json/gateways")
+
+    assert len(transport.request_history) == 1
+    assert again.body["data"] == [{"description": "iDEAL"}]
+
+
+def test_stale_entry_is_served_while_refreshed_in_background():
+    """Answer from the stale entry and replace it in the background."""
+    clock = FakeClock()
+    bodies = iter(
+        [
+            {"success": True, "data": "old"},
+            {"success": True, "data": "new"},
+        ],
+    )
+    transport = MockTransport(
+        response_factory=lambda *_: MockResponse(json_data=next(bodies)),
+    )
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        response_cache=ResponseCache(stale_while_revalidate=60, clock=clock),
+    )
+    client.create_get_request("json/gateways")
+    clock.now = 301
+
+    stale = client.create_get_request("json/gateways")
+    limit = time.monotonic() + 5
+    fresh = stale
+    while fresh.get_body_data() != "new":
+        assert time.monotonic() < limit, "entry was not refreshed in time"
+        time.sleep(0.001)
+        fresh = client.create_get_request("json/gateways")
+
+    assert stale.get_body_data() == "old"
+    assert len(transport.request_history) == 2
+
+
+def test_async_client_uses_the_cache():
+    """Serve repeated async reference-data lookups from the cache."""
+    transport = AsyncMockTransport(
+        response_factory=lambda *_: MockResponse(json_data=GATEWAYS_BODY),
+    )
+    client = AsyncClient(
+        api_key="test_key",
+        transport=transport,
+        response_cache=ResponseCache(),
+    )
+    manager = AsyncGatewayManager(client)
+
+    async def run() -> None:
+        await manager.get_gateways()
+        await manager.get_gateways()
+
+    asyncio.run(run())
+
+    assert len(transport.request_history) == 1
+
+
+def test_async_stale_entry_is_refreshed_in_background():
+    """Refresh a stale entry in a background task."""
+    clock = FakeClock()
+    transport = AsyncMockTransport(
+        response_factory=lambda *_: MockResponse(json_data=GATEWAYS_BODY),
+    )
+    client = AsyncClient(
+        api_key="test_key",
+        transport=transport,
+        response_cache=ResponseCache(stale_while_revalidate=60, clock=clock),
+    )
+
+    async def run() -> None:
+        await client.create_get_request("json/gateways")
+        clock.now = 301
+        await client.create_get_request("json/gateways")
+        await asyncio.sleep(0.01)
+        clock.now = 302
+        await client.create_get_request("json/gateways")
+
+    asyncio.run(run())
+
+    assert len(transport.request_history) == 2
+    assert client.response_cache.get_stats().refreshes == 1
@@ -0,0 +1,234 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the client retry policy."""
+
+import asyncio
+
+import pytest
+
+from multisafepay.api.paths.orders.order_manager import OrderManager
+from multisafepay.client import AsyncClient, Client, RetryPolicy
+from multisafepay.exception.api import ApiException
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockHTTPError,
+    MockResponse,
+    MockTransport,
+)
+
+OK_BODY = {"success": True, "data": {"order_id": "order-1"}}
+
+
+def _policy(**kwargs: object) -> tuple[RetryPolicy, list[float]]:
+    slept: list[float] = []
+    kwargs.setdefault("rng", lambda _low, high: high)
+    policy = RetryPolicy(sleep=slept.append, **kwargs)
+    return policy, slept
+
+
+def _client(transport: MockTransport, policy: RetryPolicy) -> Client:
+    return Client(
+        api_key="test_key",
+        transport=transport,
+        retry_policy=policy,
+    )
+
+
+def test_backoff_uses_full_jitter_with_exponential_ceiling():
+    """Draw delays between zero and the capped exponential ceiling."""
+    bounds = []
+    policy = RetryPolicy(
+        backoff_base=0.5,
+        backoff_max=3.0,
+        rng=lambda low, high: bounds.append((low, high)) or high,
+    )
+
+    delays = [policy.backoff(n) for n in range(4)]
+
+    assert delays == [0.5, 1.0, 2.0, 3.0]
+    assert all(low == 0.0 for low, _ in bounds)
+
+
+def test_retry_after_seconds_and_http_date_are_honored():
+    """Parse Retry-After as seconds or HTTP date and cap it."""
+    policy = RetryPolicy(retry_after_max=5.0)
+
+    assert policy.retry_after(MockResponse(headers={"Retry-After": "2"})) == 2
+    assert policy.retry_after(MockResponse(headers={"Retry-After": "99"})) == 5
+    past = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert policy.retry_after(MockResponse(headers={"Retry-After": past})) == 0
+    assert (
+        policy.retry_after(MockResponse(headers={"Retry-After": "x"})) is None
+    )
+    assert policy.retry_after(MockResponse()) is None
+
+
+def test_post_is_only_retryable_with_idempotency_key():
+    """Allow retrying POST and PATCH only with an idempotency key."""
+    policy = RetryPolicy()
+
+    assert policy.allows_method("GET")
+    assert policy.allows_method("delete")
+    assert not policy.allows_method("POST", {})
+    assert policy.allows_method("POST", {"Idempotency-Key": "abc"})
+
+
+@pytest.mark.parametrize("status", [429, 502, 503, 504])
+def test_get_is_retried_on_retryable_status(status: int):
+    """Retry GET requests until a successful response arrives."""
+    policy, slept = _policy()
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=status))
+    transport.add_response(MockResponse(json_data=OK_BODY))
+
+    response = OrderManager(_client(transport, policy)).get("order-1")
+
+    assert response.status_code == 200
+    assert len(transport.request_history) == 2
+    assert slept == [0.2]
+    assert response.context["retries"] == 1
+    assert response.context["retry_delay"] == pytest.approx(0.2)
+
+
+def test_retry_after_header_overrides_backoff():
+    """Wait for the Retry-After delay instead of the backoff."""
+    policy, slept = _policy()
+    transport = MockTransport()
+    transport.add_response(
+        MockResponse(status_code=429, headers={"Retry-After": "1.5"}),
+    )
+    transport.add_response(MockResponse(json_data=OK_BODY))
+
+    _client(transport, policy).create_get_request("json/orders/order-1")
+
+    assert slept == [1.5]
+
+
+def test_connection_errors_are_retried():
+    """Retry transport connection errors."""
+    policy, _ = _policy()
+    attempts = []
+
+    def flaky(*_args: object) -> MockResponse:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("connection reset")
+        return MockResponse(json_data=OK_BODY)
+
+    client = _client(MockTransport(response_factory=flaky), policy)
+
+    response = client.create_get_request("json/orders/order-1")
+
+    assert len(attempts) == 3
+    assert response.context["retries"] == 2
+
+
+def test_exhausted_retries_raise_with_retry_count():
+    """Raise ApiException carrying the retry count once retries run out."""
+    policy, slept = _policy(max_retries=2)
+    transport = MockTransport(
+        response_factory=lambda *_: MockResponse(status_code=503),
+    )
+
+    with pytest.raises(ApiException) as exc_info:
+        _client(transport, policy).create_get_request("json/orders/order-1")
+
+    assert len(transport.request_history) == 3
+    assert slept == [0.2, 0.4]
+    assert exc_info.value.get_context_value("retries") == 2
+
+
+def test_post_without_idempotency_key_is_not_retried():
+    """Send POST requests once when no idempotency key is attached."""
+    policy, slept = _policy()
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=503))
+
+    with pytest.raises(ApiException):
+        _client(transport, policy).create_post_request(
+            "json/orders",
+            request_body="{}",
+        )
+
+    assert len(transport.request_history) == 1
+    assert slept == []
+
+
+def test_post_with_idempotency_key_is_retried():
+    """Retry POST requests that carry an idempotency key."""
+    policy, _ = _policy()
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=502))
+    transport.add_response(MockResponse(json_data=OK_BODY))
+
+    response = _client(transport, policy).create_post_request(
+        "json/orders",
+        request_body="{}",
+        idempotency_key="order-1-create",
+    )
+
+    assert response.context["retries"] == 1
+    for request in transport.request_history:
+        assert request["headers"]["Idempotency-Key"] == "order-1-create"
+
+
+def test_client_errors_are_not_retried():
+    """Leave 4xx responses other than 429 to the caller."""
+    policy, _ = _policy()
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=404))
+
+    with pytest.raises(MockHTTPError):
+        _client(transport, policy).create_get_request("json/orders/missing")
+
+    assert len(transport.request_history) == 1
+
+
+def test_retry_is_skipped_when_delay_exceeds_deadline():
+    """Give up instead of sleeping past the deadline."""
+    policy, slept = _policy(backoff_base=5.0)
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=503))
+
+    with pytest.raises(ApiException):
+        _client(transport, policy).create_get_request(
+            "json/orders/order-1",
+            deadline=1.0,
+        )
+
+    assert slept == []
+
+
+def test_no_policy_keeps_single_attempt():
+    """Send exactly one attempt without a retry policy."""
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=503))
+    client = Client(api_key="test_key", transport=transport)
+
+    with pytest.raises(ApiException):
+        client.create_get_request("json/orders/order-1")
+
+    assert len(transport.request_history) == 1
+
+
+def test_async_client_retries_with_policy():
+    """Apply the same policy to the async client."""
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(status_code=503))
+    transport.add_response(MockResponse(json_data=OK_BODY))
+    client = AsyncClient(
+        api_key="test_key",
+        transport=transport,
+        retry_policy=RetryPolicy(backoff_base=0.001),
+    )
+
+    response = asyncio.run(client.create_get_request("json/orders/order-1"))
+
+    assert response.status_code == 200
+    assert response.context["retries"] == 1
+    assert len(transport.request_history) == 2
@@ -0,0 +1,331 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for single-flight coalescing of identical GET requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from multisafepay.api.base.response.api_response import ApiResponse
+from multisafepay.client import AsyncClient, Client, Deadline, SingleFlight
+from multisafepay.exception.deadline_exceeded import (
+    DeadlineExceededException,
+)
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockResponse,
+    MockTransport,
+)
+
+ORDER_BODY = {"success": True, "data": {"order_id": "order-1"}}
+
+
+def _wait_for_followers(single_flight: SingleFlight, count: int) -> None:
+    limit = time.monotonic() + 5
+    while single_flight.coalesced_calls < count:
+        assert time.monotonic() < limit, "followers did not join in time"
+        time.sleep(0.001)
+
+
+def _wait_until_in_flight(single_flight: SingleFlight) -> None:
+    limit = time.monotonic() + 5
+    while single_flight.in_flight() == 0:
+        assert time.monotonic() < limit, "leader did not start in time"
+        time.sleep(0.001)
+
+
+def _gated_transport(gate: threading.Event) -> MockTransport:
+    def respond(*_args: object) -> MockResponse:
+        assert gate.wait(5)
+        return MockResponse(json_data=ORDER_BODY)
+
+    return MockTransport(response_factory=respond)
+
+
+def test_concurrent_identical_gets_share_one_call():
+    """Send one request for identical GETs issued at the same time."""
+    gate = threading.Event()
+    transport = _gated_transport(gate)
+    single_flight = SingleFlight()
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        single_flight=single_flight,
+    )
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [
+            pool.submit(client.create_get_request, "json/orders/order-1")
+            for _ in range(5)
+        ]
+        _wait_for_followers(single_flight, 4)
+        gate.set()
+        responses = [future.result() for future in futures]
+
+    assert len(transport.request_history) == 1
+    assert all(r.get_body_data() == ORDER_BODY["data"] for r in responses)
+    assert sum(bool(r.context.get("coalesced")) for r in responses) == 4
+    assert single_flight.in_flight() == 0
+
+
+def test_followers_keep_their_own_context():
+    """Give every caller its own context on a shared response."""
+    gate = threading.Event()
+    single_flight = SingleFlight()
+    client = Client(
+        api_key="test_key",
+        transport=_gated_transport(gate),
+        single_flight=single_flight,
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(
+            client.create_get_request,
+            "json/orders/order-1",
+            context={"caller": "leader"},
+        )
+        _wait_until_in_flight(single_flight)
+        follower = pool.submit(
+            client.create_get_request,
+            "json/orders/order-1",
+            context={"caller": "follower"},
+        )
+        _wait_for_followers(single_flight, 1)
+        gate.set()
+        leader_response, follower_response = leader.result(), follower.result()
+
+    assert leader_response.context["caller"] == "leader"
+    assert "coalesced" not in leader_response.context
+    assert follower_response.context["caller"] == "follower"
+    assert follower_response.context["coalesced"] is True
+    assert follower_response.body == leader_response.body
+    assert follower_response.body is not leader_response.body
+
+
+def test_different_urls_and_credentials_are_not_shared():
+    """Key calls by method, URL and credential."""
+    single_flight = SingleFlight()
+    calls = []
+
+    def call(key: tuple) -> str:
+        return single_flight.do(key, lambda: calls.append(key) or "ok")[0]
+
+    call(("GET", "https://api/orders/1", "Bearer a"))
+    call(("GET", "https://api/orders/1", "Bearer b"))
+    call(("GET", "https://api/orders/2", "Bearer a"))
+
+    assert len(calls) == 3
+    assert single_flight.coalesced_calls == 0
+
+
+def test_sequential_gets_are_not_cached():
+    """Forget the key once the call has finished."""
+    transport = MockTransport(
+        response_factory=lambda *_: MockResponse(json_data=ORDER_BODY),
+    )
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        single_flight=SingleFlight(),
+    )
+
+    client.create_get_request("json/orders/order-1")
+    client.create_get_request("json/orders/order-1")
+
+    assert len(transport.request_history) == 2
+
+
+def test_post_requests_are_never_coalesced():
+    """Send every POST even when identical POSTs are in flight."""
+    gate = threading.Event()
+    transport = _gated_transport(gate)
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        single_flight=SingleFlight(),
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(client.create_post_request, "json/orders", None, "{}")
+            for _ in range(2)
+        ]
+        limit = time.monotonic() + 5
+        while len(transport.request_history) < 2:
+            assert time.monotonic() < limit
+            time.sleep(0.001)
+        gate.set()
+        for future in futures:
+            future.result()
+
+    assert len(transport.request_history) == 2
+
+
+def test_leader_error_is_raised_in_every_caller():
+    """Propagate the error of the shared call to all callers."""
+    single_flight = SingleFlight()
+    gate = threading.Event()
+
+    def failing() -> None:
+        assert gate.wait(5)
+        raise ConnectionError("connection refused")
+
+    def call() -> None:
+        single_flight.do("key", failing)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(call) for _ in range(3)]
+        _wait_for_followers(single_flight, 2)
+        gate.set()
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result()
+
+
+def test_leader_deadline_is_not_shared_with_followers():
+    """Let a follower run its own call when the leader's deadline expired."""
+    single_flight = SingleFlight()
+    gate = threading.Event()
+
+    def impatient() -> str:
+        assert gate.wait(5)
+        raise DeadlineExceededException("Deadline of 0.01s exceeded")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(single_flight.do, "key", impatient)
+        _wait_until_in_flight(single_flight)
+        follower = pool.submit(single_flight.do, "key", lambda: "order")
+        _wait_for_followers(single_flight, 1)
+        gate.set()
+
+        with pytest.raises(DeadlineExceededException):
+            leader.result()
+        assert follower.result() == ("order", False)
+    assert single_flight.in_flight() == 0
+
+
+def test_async_leader_deadline_is_not_shared_with_followers():
+    """Start a new call for async followers of a leader that ran out of time."""
+    single_flight = SingleFlight()
+    calls: list[str] = []
+
+    async def call(name: str, delay: float, error: bool) -> str:
+        calls.append(name)
+        await asyncio.sleep(delay)
+        if error:
+            raise DeadlineExceededException("Deadline of 0.01s exceeded")
+        return name
+
+    async def run() -> tuple[BaseException, tuple[str, bool]]:
+        leader = asyncio.ensure_future(
+            single_flight.do_async("key", lambda: call("leader", 0.01, True)),
+        )
+        await asyncio.sleep(0)
+        follower = single_flight.do_async(
+            "key",
+            lambda: call("follower", 0.0, False),
+        )
+        return await asyncio.gather(leader, follower, return_exceptions=True)
+
+    leader_outcome, follower_outcome = asyncio.run(run())
+
+    assert isinstance(leader_outcome, DeadlineExceededException)
+    assert follower_outcome == ("follower", False)
+    assert calls == ["leader", "follower"]
+    assert single_flight.coalesced_calls == 1
+
+
+def test_follower_deadline_bounds_the_wait():
+    """Stop waiting for the leader once the follower's deadline expires."""
+    single_flight = SingleFlight()
+    gate = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(single_flight.do, "key", gate.wait)
+        _wait_until_in_flight(single_flight)
+        with pytest.raises(DeadlineExceededException, match="shared call"):
+            single_flight.do("key", gate.wait, Deadline(0.01))
+        gate.set()
+        assert leader.result() == (True, False)
+
+
+def test_async_concurrent_identical_gets_share_one_call():
+    """Await one request for identical concurrent async GETs."""
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(json_data=ORDER_BODY))
+    single_flight = SingleFlight()
+    client = AsyncClient(
+        api_key="test_key",
+        transport=transport,
+        single_flight=single_flight,
+    )
+
+    async def run() -> list[ApiResponse]:
+        return await asyncio.gather(
+            *(
+                client.create_get_request("json/orders/order-1")
+                for _ in range(5)
+            ),
+        )
+
+    responses = asyncio.run(run())
+
+    assert len(transport.request_history) == 1
+    assert all(r.get_body_data() == ORDER_BODY["data"] for r in responses)
+    assert single_flight.coalesced_calls == 4
+    assert single_flight.in_flight() == 0
+
+
+def test_changes_to_a_shared_response_stay_with_the_caller():
+    """Give every coalesced caller its own copy of the decoded body."""
+    transport = AsyncMockTransport()
+    transport.add_response(
+        MockResponse(json_data={"success": True, "data": {"items": [1]}}),
+    )
+    client = AsyncClient(
+        api_key="test_key",
+        transport=transport,
+        single_flight=SingleFlight(),
+    )
+
+    async def get_and_change() -> ApiResponse:
+        response = await client.create_get_request("json/orders/order-1")
+        response.body["data"]["items"].append("MUTATED")
+        return response
+
+    async def run() -> list[ApiResponse]:
+        return await asyncio.gather(*(get_and_change() for _ in range(3)))
+
+    responses = asyncio.run(run())
+
+    assert len(transport.request_history) == 1
+    assert [r.body["data"]["items"] for r in responses] == [
+        [1, "MUTATED"],
+    ] * 3
+
+
+def test_async_cancelled_leader_does_not_cancel_followers():
+    """Keep the shared call running when the caller that started it leaves."""
+    single_flight = SingleFlight()
+
+    async def slow() -> str:
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    async def run() -> tuple[str, bool]:
+        leader = asyncio.ensure_future(single_flight.do_async("key", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do_async("key", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == ("ok", True)
@@ -0,0 +1,108 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the phase timings of responses."""
+
+import asyncio
+from dataclasses import dataclass
+
+from multisafepay import AsyncSdk, Sdk
+from multisafepay.client import Client, ResponseCache, RetryPolicy
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockResponse,
+    MockTransport,
+)
+
+ORDER_BODY = {
+    "success": True,
+    "data": {"order_id": "order-1", "amount": 1000, "currency": "EUR"},
+}
+
+
+@dataclass
+class _TimedResponse(MockResponse):
+    """Mock response reporting its time to first byte."""
+
+    time_to_first_byte: float = 0.25
+
+
+def test_timings_are_not_recorded_by_default() -> None:
+    """Leave the timings empty unless they are enabled."""
+    transport = MockTransport()
+    transport.add_response(MockResponse(json_data=ORDER_BODY))
+    sdk = Sdk(api_key="test_key", transport=transport)
+
+    response = sdk.get_order_manager().get("order-1")
+
+    assert response.get_timings() is None
+
+
+def test_manager_responses_report_every_phase() -> None:
+    """Report the send, ttfb, decode and model phases of a call."""
+    transport = MockTransport()
+    transport.add_response(_TimedResponse(json_data=ORDER_BODY))
+    sdk = Sdk(api_key="test_key", transport=transport, record_timings=True)
+
+    response = sdk.get_order_manager().get("order-1")
+
+    timings = response.get_timings()
+    assert set(timings) == {"send", "ttfb", "decode", "model"}
+    assert timings["ttfb"] == 0.25
+    assert all(value >= 0 for value in timings.values())
+    assert response.get_data().order_id == "order-1"
+
+
+def test_send_covers_every_attempt() -> None:
+    """Sum the transport time of all attempts, without ttfb if unknown."""
+    transport = MockTransport()
+    transport.add_response(MockResponse(status_code=503))
+    transport.add_response(MockResponse(json_data=ORDER_BODY))
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        retry_policy=RetryPolicy(sleep=lambda _delay: None),
+        record_timings=True,
+    )
+
+    response = client.create_get_request("json/orders/order-1")
+
+    assert set(response.get_timings()) == {"send", "decode"}
+    assert response.context["retries"] == 1
+
+
+def test_cached_responses_carry_no_timings() -> None:
+    """Drop the timings of responses answered from the cache."""
+    transport = MockTransport()
+    transport.add_response(MockResponse(json_data={"success": True}))
+    client = Client(
+        api_key="test_key",
+        transport=transport,
+        response_cache=ResponseCache(),
+        record_timings=True,
+    )
+
+    fetched = client.create_get_request("json/gateways")
+    cached = client.create_get_request("json/gateways")
+
+    assert fetched.get_timings() is not None
+    assert cached.get_timings() is None
+
+
+def test_async_responses_report_timings() -> None:
+    """Record the timings of async calls as well."""
+    transport = AsyncMockTransport()
+    transport.add_response(MockResponse(json_data=ORDER_BODY))
+    sdk = AsyncSdk(
+        api_key="test_key",
+        transport=transport,
+        record_timings=True,
+    )
+
+    response = asyncio.run(sdk.get_order_manager().get("order-1"))
+
+    assert set(response.get_timings()) == {"send", "decode", "model"}
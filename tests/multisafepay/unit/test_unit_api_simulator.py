@@ -0,0 +1,137 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the local API simulator used in throughput tests."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from multisafepay import Sdk
+from multisafepay.api.paths.orders.order_id.refund.request.refund_request import (
+    RefundOrderRequest,
+)
+from multisafepay.api.paths.orders.request.order_request import OrderRequest
+from multisafepay.exception.api import ApiException
+from multisafepay.transport import Urllib3Transport
+from tests.support.api_simulator import ApiSimulator, SimulatorState
+
+pytest.importorskip("urllib3")
+
+
+@pytest.fixture()
+def simulator(monkeypatch: pytest.MonkeyPatch) -> Iterator[ApiSimulator]:
+    """Serve a simulator the SDK is pointed at by the environment."""
+    with ApiSimulator(transactions=25, seed=1) as running:
+        for name, value in running.environ().items():
+            monkeypatch.setenv(name, value)
+        yield running
+
+
+def _sdk() -> Sdk:
+    return Sdk(
+        api_key="simulator-key",
+        is_production=False,
+        transport=Urllib3Transport(),
+    )
+
+
+def test_checkout_flow_keeps_order_state(simulator: ApiSimulator) -> None:
+    """Create, fetch and refund an order through the Sdk."""
+    orders = _sdk().get_order_manager()
+    request = (
+        OrderRequest()
+        .add_type("direct")
+        .add_order_id("sim-1")
+        .add_amount(1000)
+        .add_currency("EUR")
+        .add_gateway("IDEAL")
+        .add_description("Simulated order")
+    )
+
+    created = orders.create(request).get_data()
+    refund = orders.refund(
+        "sim-1",
+        RefundOrderRequest().add_amount(400).add_currency("EUR"),
+    ).get_data()
+    fetched = orders.get("sim-1").get_data()
+
+    assert (created.order_id, created.status) == ("sim-1", "completed")
+    assert refund.refund_id is not None
+    assert fetched.amount_refunded == 400
+    assert simulator.requests == 3
+
+
+def test_transactions_are_paged_with_cursors(simulator: ApiSimulator) -> None:
+    """Follow the after cursors through all seeded transactions."""
+    transactions = _sdk().get_transaction_manager()
+
+    first = transactions.get_transactions({"limit": 10}).get_data()
+    streamed = list(
+        transactions.stream_transactions({"limit": 10}, all_pages=True),
+    )
+
+    assert len(first.data) == 10
+    assert first.get_pager().after is not None
+    assert len(streamed) == 25
+    assert len({t.transaction_id for t in streamed}) == 25
+    assert simulator.requests == 4
+
+
+def test_unknown_orders_and_missing_keys_are_errors() -> None:
+    """Answer unknown orders with 404 and unauthenticated calls with 401."""
+    state = SimulatorState()
+    simulator = ApiSimulator()
+
+    status, body = state.handle("GET", "json/orders/missing", {}, {})
+
+    assert (status, body["success"]) == (404, False)
+    assert simulator.environ()["MSP_SDK_BUILD_PROFILE"] == "dev"
+    with ApiSimulator() as running:
+        transport = Urllib3Transport()
+        response = transport.request("GET", f"{running.base_url}json/gateways")
+        assert response.status_code == 401
+
+
+def test_refunds_cannot_exceed_the_order_amount() -> None:
+    """Reject refunds above the amount left to refund."""
+    state = SimulatorState()
+    state.handle(
+        "POST",
+        "json/orders",
+        {},
+        {"order_id": "o-1", "amount": 500, "currency": "EUR"},
+    )
+
+    ok, _ = state.handle(
+        "POST",
+        "json/orders/o-1/refunds",
+        {},
+        {"amount": 300},
+    )
+    too_much, _ = state.handle(
+        "POST",
+        "json/orders/o-1/refunds",
+        {},
+        {"amount": 300},
+    )
+
+    assert (ok, too_much) == (200, 422)
+
+
+def test_injected_errors_reach_the_sdk(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Answer every request with the injected error status."""
+    with ApiSimulator(error_rate=1.0, latency=0.001) as running:
+        for name, value in running.environ().items():
+            monkeypatch.setenv(name, value)
+
+        with pytest.raises(ApiException):
+            _sdk().get_gateway_manager().get_gateways()
+
+        assert running.requests == 1
@@ -0,0 +1,131 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the asyncio SDK entry point."""
+
+import asyncio
+
+from multisafepay import AsyncSdk
+from multisafepay.api.paths import (
+    AsyncAuthManager,
+    AsyncCaptureManager,
+    AsyncCategoryManager,
+    AsyncGatewayManager,
+    AsyncIssuerManager,
+    AsyncMeManager,
+    AsyncOrderManager,
+    AsyncPaymentMethodManager,
+    AsyncRecurringManager,
+    AsyncTransactionManager,
+)
+from multisafepay.api.paths.orders.response.order_response import Order
+from multisafepay.api.paths.transactions.response.transaction import (
+    Transaction,
+)
+from tests.support.mock_transport import AsyncMockTransport, MockResponse
+
+
+def _build_sdk(transport: AsyncMockTransport) -> AsyncSdk:
+    return AsyncSdk(
+        api_key="test_api_key",
+        is_production=False,
+        transport=transport,
+    )
+
+
+def test_managers_share_the_async_client():
+    """Every manager is bound to the SDK's AsyncClient."""
+    sdk = _build_sdk(AsyncMockTransport())
+    managers = {
+        sdk.get_auth_manager(): AsyncAuthManager,
+        sdk.get_capture_manager(): AsyncCaptureManager,
+        sdk.get_category_manager(): AsyncCategoryManager,
+        sdk.get_gateway_manager(): AsyncGatewayManager,
+        sdk.get_issuer_manager(): AsyncIssuerManager,
+        sdk.get_me_manager(): AsyncMeManager,
+        sdk.get_order_manager(): AsyncOrderManager,
+        sdk.get_payment_method_manager(): AsyncPaymentMethodManager,
+        sdk.get_recurring_manager(): AsyncRecurringManager,
+        sdk.get_transaction_manager(): AsyncTransactionManager,
+    }
+    for manager, manager_class in managers.items():
+        assert isinstance(manager, manager_class)
+        assert manager.client is sdk.get_client()
+    assert sdk.get_order_manager() is sdk.get_order_manager()
+    assert sdk.recurring_manager is sdk.get_recurring_manager()
+
+
+def test_order_manager_get_is_awaitable():
+    """Decode the order through the same builder as the sync manager."""
+    transport = AsyncMockTransport()
+    transport.add_response(
+        MockResponse(
+            json_data={"success": True, "data": {"order_id": "abc"}},
+        ),
+    )
+    sdk = _build_sdk(transport)
+
+    response = asyncio.run(sdk.get_order_manager().get("abc"))
+
+    assert isinstance(response.get_data(), Order)
+    assert response.get_data().order_id == "abc"
+    assert "json/orders/abc" in transport.get_last_request()["url"]
+
+
+def test_concurrent_requests_share_one_event_loop():
+    """Run many manager calls concurrently through asyncio.gather."""
+
+    def factory(_method: str, _url: str, _kwargs: dict) -> MockResponse:
+        return MockResponse(
+            json_data={
+                "success": True,
+                "data": [{"transaction_id": "tx"}],
+                "pager": {},
+            },
+        )
+
+    transport = AsyncMockTransport(response_factory=factory)
+    sdk = _build_sdk(transport)
+    manager = sdk.get_transaction_manager()
+
+    async def run() -> list:
+        return await asyncio.gather(
+            *(
+                manager.get_transactions({"limit": index})
+                for index in range(20)
+            ),
+        )
+
+    responses = asyncio.run(run())
+
+    assert len(responses) == 20
+    assert len(transport.request_history) == 20
+    assert all(
+        isinstance(response.get_data()[0], Transaction)
+        for response in responses
+    )
+
+
+def test_async_context_manager_closes_transport():
+    """Close the transport when leaving the async context."""
+
+    class _ClosableTransport(AsyncMockTransport):
+        closed = False
+
+        async def aclose(self: "_ClosableTransport") -> None:
+            """Record that the transport was closed."""
+            self.closed = True
+
+    transport = _ClosableTransport()
+
+    async def run() -> None:
+        async with _build_sdk(transport):
+            pass
+
+    asyncio.run(run())
+
+    assert transport.closed
@@ -0,0 +1,214 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the batch executors."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from multisafepay import AsyncSdk, Batch, Sdk
+from tests.support.mock_transport import (
+    AsyncMockTransport,
+    MockHTTPError,
+    MockResponse,
+    MockTransport,
+)
+
+
+class _Tracker:
+    """Count requests in flight inside the mock transport."""
+
+    def __init__(self: "_Tracker", delay: float = 0.0) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __call__(
+        self: "_Tracker",
+        _method: str,
+        url: str,
+        _kwargs: dict,
+    ) -> MockResponse:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        order_id = url.split("?")[0].rsplit("/", 1)[-1]
+        if order_id.startswith("missing"):
+            return MockResponse(
+                status_code=404,
+                json_data={"success": False, "error_code": 1006},
+            )
+        return MockResponse(
+            json_data={"success": True, "data": {"order_id": order_id}},
+        )
+
+
+def test_get_orders_preserves_input_order_and_isolates_failures():
+    """Return one outcome per id, in order, without aborting on errors."""
+    sdk = Sdk(api_key="test_key", transport=MockTransport(_Tracker()))
+    ids = ["o-1", "missing-1", "o-2", "o-3"]
+
+    result = sdk.batch().get_orders(ids, max_concurrency=3)
+
+    assert [r.item for r in result] == ids
+    assert [r.ok for r in result] == [True, False, True, True]
+    assert result[2].unwrap().get_data().order_id == "o-2"
+    assert [r.get_data().order_id for r in result.values()] == [
+        "o-1",
+        "o-2",
+        "o-3",
+    ]
+    [(index, item, error)] = result.errors()
+    assert (index, item) == (1, "missing-1")
+    assert isinstance(error, MockHTTPError)
+    with pytest.raises(MockHTTPError):
+        result[1].unwrap()
+    assert result.stats.total == 4
+    assert result.stats.succeeded == 3
+    assert result.stats.failed == 1
+
+
+def test_get_orders_bounds_concurrency_on_the_shared_pool():
+    """Keep at most max_concurrency requests in flight on pool threads."""
+    tracker = _Tracker(delay=0.01)
+    transport = MockTransport(tracker)
+    sdk = Sdk(api_key="test_key", transport=transport)
+
+    result = sdk.batch().get_orders(
+        [f"o-{i}" for i in range(40)],
+        max_concurrency=4,
+    )
+
+    assert len(result) == 40
+    assert 1 < tracker.peak <= 4
+    assert all(
+        name.startswith("multisafepay-batch") for name in tracker.threads
+    )
+    assert len(transport.request_history) == 40
+    assert tracker.peak <= result.stats.max_concurrency <= 4
+    assert result.stats.throughput > 0
+
+
+def test_sdk_reuses_one_batch_executor():
+    """Share one executor, and so one thread pool, across batches."""
+    sdk = Sdk(api_key="test_key", transport=MockTransport(_Tracker()))
+
+    assert sdk.batch() is sdk.batch()
+    assert sdk.batch().client is sdk.get_client()
+
+
+def test_map_runs_any_call_and_records_its_errors():
+    """Batch arbitrary callables and keep their exceptions per item."""
+
+    def half(value: int) -> float:
+        if value == 0:
+            raise ZeroDivisionError("zero")
+        return 1 / value
+
+    with Batch(Sdk(api_key="test_key").get_client(), max_workers=2) as batch:
+        result = batch.map(half, [1, 0, 4], max_concurrency=2)
+
+    assert result.values() == [1.0, 0.25]
+    assert isinstance(result.errors()[0][2], ZeroDivisionError)
+    assert all(r.elapsed >= 0 for r in result)
+
+
+def test_errors_keep_duplicate_and_unhashable_items():
+    """List every failure with its index, whatever the items are."""
+
+    def fail(item: object) -> None:
+        raise ValueError(item)
+
+    with Batch(Sdk(api_key="test_key").get_client(), max_workers=2) as batch:
+        result = batch.map(fail, ["o-1", "o-1", ["o-2"]], max_concurrency=1)
+
+    assert [(index, item) for index, item, _ in result.errors()] == [
+        (0, "o-1"),
+        (1, "o-1"),
+        (2, ["o-2"]),
+    ]
+    assert result.stats.max_concurrency == 1
+
+
+def test_sdk_close_shuts_down_the_batch_pool():
+    """Stop the batch threads when the SDK is closed."""
+    sdk = Sdk(api_key="test_key", transport=MockTransport(_Tracker()))
+    sdk.close()
+    before = set(threading.enumerate())
+
+    with sdk:
+        sdk.batch().get_orders(["o-1", "o-2"], max_concurrency=2)
+        threads = set(threading.enumerate()) - before
+
+    assert threads
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_empty_batch_has_zero_throughput():
+    """Return an empty result for an empty input."""
+    sdk = Sdk(api_key="test_key", transport=MockTransport(_Tracker()))
+
+    result = sdk.batch().get_orders([])
+
+    assert len(result) == 0
+    assert result.stats.throughput == 0.0
+
+
+@pytest.mark.parametrize("max_concurrency", [0, Batch.DEFAULT_MAX_WORKERS + 1])
+def test_rejects_concurrency_outside_the_pool(max_concurrency: int):
+    """Reject concurrency below 1 or above the pool size."""
+    sdk = Sdk(api_key="test_key", transport=MockTransport(_Tracker()))
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        sdk.batch().get_orders(["o-1"], max_concurrency=max_concurrency)
+
+
+def test_async_get_orders_preserves_order_and_bounds_concurrency():
+    """Run the async batch on the event loop with bounded concurrency."""
+    in_flight = 0
+    peak = 0
+
+    async def run() -> list:
+        nonlocal in_flight, peak
+        transport = AsyncMockTransport(_Tracker())
+        original = transport.request
+
+        async def tracked(*args: object, **kwargs: object) -> MockResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                in_flight -= 1
+
+        transport.request = tracked
+        sdk = AsyncSdk(api_key="test_key", transport=transport)
+        assert sdk.batch() is sdk.batch()
+        return await sdk.batch().get_orders(
+            ["o-1", "missing-1", *[f"o-{i}" for i in range(2, 20)]],
+            max_concurrency=5,
+        )
+
+    result = asyncio.run(run())
+
+    assert result[0].unwrap().get_data().order_id == "o-1"
+    assert not result[1].ok
+    assert [r.item for r in result][2:4] == ["o-2", "o-3"]
+    assert result.stats.failed == 1
+    assert 1 < peak <= 5
+    assert peak <= result.stats.max_concurrency <= 5
@@ -7,9 +7,13 @@
 
 """Unit tests for SDK-level environment/base URL guardrails."""
 
+import subprocess
+import sys
+
 import pytest
 
 from multisafepay import Sdk
+from multisafepay.api.paths import OrderManager, RecurringManager
 from multisafepay.client.client import Client
 from multisafepay.client.credential_resolver import ScopedCredentialResolver
 
@@ -137,3 +141,76 @@ def test_sdk_uses_credential_resolver_with_custom_transport() -> None:
 
     assert sdk.get_client().transport is transport
     assert transport.headers["Authorization"] == f"Bearer {DEFAULT_API_KEY}"
+
+
+def test_sdk_creates_each_manager_once() -> None:
+    """Reuse the manager created by the first call of its getter."""
+    sdk = Sdk(api_key="mock_api_key", transport=_CaptureTransport())
+
+    orders = sdk.get_order_manager()
+
+    assert isinstance(orders, OrderManager)
+    assert orders.client is sdk.get_client()
+    assert sdk.get_order_manager() is orders
+    assert sdk.get_gateway_manager() is sdk.get_gateway_manager()
+    assert isinstance(sdk.recurring_manager, RecurringManager)
+    assert sdk.recurring_manager is sdk.get_recurring_manager()
+
+
+def test_sdk_imports_managers_on_first_use() -> None:
+    """Import a manager module only once its manager is requested."""
+    code = (
+        "import sys\n"
+        "from multisafepay import Sdk\n"
+        "sdk = Sdk(api_key='mock_api_key')\n"
+        "managers = [\n"
+        "    name for name in sys.modules\n"
+        "    if name.startswith('multisafepay.api.paths.')\n"
+        "    and name.endswith('_manager')\n"
+        "]\n"
+        "me = 'multisafepay.api.paths.me.me_manager'\n"
+        "sdk.get_me_manager()\n"
+        "print(len(managers), me in sys.modules)\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],  # noqa: S603
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.split() == ["0", "True"]
+
+
+@pytest.mark.parametrize(
+    ("getter", "module"),
+    [
+        ("get_order_manager", "orders.order_manager"),
+        ("get_transaction_manager", "transactions.transaction_manager"),
+    ],
+)
+def test_manager_getters_import_only_their_manager(
+    getter: str,
+    module: str,
+) -> None:
+    """Import neither the async nor any other manager with a sync one."""
+    code = (
+        "import sys\n"
+        "from multisafepay import Sdk\n"
+        f"getattr(Sdk(api_key='mock_api_key'), {getter!r})()\n"
+        "print(*sorted(\n"
+        "    name for name in sys.modules\n"
+        "    if name.startswith('multisafepay.api.paths.')\n"
+        "    and name.endswith('_manager')\n"
+        "))\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],  # noqa: S603
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.split() == [f"multisafepay.api.paths.{module}"]
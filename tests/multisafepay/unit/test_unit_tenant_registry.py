@@ -0,0 +1,198 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the tenant registry."""
+
+import threading
+
+import pytest
+
+from multisafepay import TenantRegistry
+from multisafepay.client import (
+    CircuitBreaker,
+    RateLimiter,
+    ResponseCache,
+    SingleFlight,
+)
+from tests.support.mock_transport import MockResponse, MockTransport
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self: "_Clock") -> None:
+        self.now = 0.0
+
+    def __call__(self: "_Clock") -> float:
+        return self.now
+
+
+def _transport() -> MockTransport:
+    return MockTransport(
+        response_factory=lambda *_: MockResponse(
+            json_data={"success": True, "data": [{"id": "IDEAL"}]},
+        ),
+    )
+
+
+def test_tenants_share_the_transport_with_their_own_keys():
+    """Send every tenant's calls through one transport with its own key."""
+    transport = _transport()
+    registry = TenantRegistry(
+        transport=transport,
+        tenant_options=lambda _: {"response_cache": ResponseCache()},
+    )
+
+    first = registry.get("merchant-1", "merchant_one_key")
+    second = registry.get("merchant-2", "merchant_two_key")
+    for sdk in (first, second, registry.get("merchant-1")):
+        sdk.get_gateway_manager().get_gateways()
+
+    assert registry.get("merchant-1") is first
+    assert first.get_client().transport is second.get_client().transport
+    assert [
+        request["headers"]["Authorization"]
+        for request in transport.request_history
+    ] == ["Bearer merchant_one_key", "Bearer merchant_two_key"]
+    stats = registry.get_stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+
+
+def test_least_recently_used_tenants_are_evicted_first():
+    """Keep at most max_tenants SDKs, dropping the least recently used."""
+    registry = TenantRegistry(
+        transport=_transport(),
+        api_keys=lambda tenant_id: f"{tenant_id}_api_key",
+        max_tenants=2,
+    )
+
+    registry.get("a")
+    registry.get("b")
+    registry.get("a")
+    registry.get("c")
+
+    assert "a" in registry
+    assert "b" not in registry
+    assert len(registry) == 2
+    assert registry.get_stats().evictions == 1
+
+
+def test_idle_tenants_are_evicted_after_the_timeout():
+    """Drop SDKs that were not used within idle_timeout seconds."""
+    clock = _Clock()
+    registry = TenantRegistry(
+        transport=_transport(),
+        api_keys=lambda tenant_id: f"{tenant_id}_api_key",
+        idle_timeout=60.0,
+        clock=clock,
+    )
+    idle = registry.get("idle")
+    registry.get("busy")
+
+    clock.now = 45.0
+    registry.get("busy")
+    clock.now = 90.0
+    busy = registry.get("busy")
+
+    assert "idle" not in registry
+    assert registry.get("busy") is busy
+    assert registry.get("idle") is not idle
+
+
+def test_rotated_keys_replace_the_tenant_sdk():
+    """Build a new SDK when a tenant's API key changes."""
+    registry = TenantRegistry(transport=_transport())
+
+    old = registry.get("merchant", "old_merchant_key")
+    new = registry.get("merchant", "new_merchant_key")
+
+    assert new is not old
+    assert new.get_client().api_key.get() == "new_merchant_key"
+    assert registry.evict("merchant")
+    assert not registry.evict("merchant")
+    with pytest.raises(ValueError, match="No API key"):
+        registry.get("merchant")
+
+
+def test_invalid_bounds_are_rejected_and_close_drops_tenants():
+    """Reject invalid bounds and keep a given transport open on close."""
+    with pytest.raises(ValueError):
+        TenantRegistry(max_tenants=0)
+    with pytest.raises(ValueError):
+        TenantRegistry(idle_timeout=0)
+
+    with TenantRegistry(transport=_transport()) as registry:
+        registry.get("merchant", "merchant_api_key")
+
+    assert len(registry) == 0
+
+
+@pytest.mark.parametrize(
+    "option",
+    [
+        {"circuit_breaker": CircuitBreaker()},
+        {"rate_limiter": RateLimiter()},
+        {"response_cache": ResponseCache()},
+        {"single_flight": SingleFlight()},
+        {"api_key": "shared_api_key"},
+    ],
+)
+def test_shared_per_tenant_components_are_rejected(option: dict):
+    """Refuse options that would mix the state of different tenants."""
+    with pytest.raises(ValueError, match=next(iter(option))):
+        TenantRegistry(transport=_transport(), **option)
+
+
+def test_tenant_options_build_components_per_tenant():
+    """Give every tenant its own components built by tenant_options."""
+    registry = TenantRegistry(
+        transport=_transport(),
+        tenant_options=lambda tenant_id: {
+            "rate_limiter": RateLimiter(),
+            "locale": "nl_NL" if tenant_id == "dutch" else "en_US",
+        },
+        locale="de_DE",
+    )
+
+    dutch = registry.get("dutch", "dutch_api_key").get_client()
+    other = registry.get("other", "other_api_key").get_client()
+
+    assert dutch.rate_limiter is not other.rate_limiter
+    assert (dutch.locale, other.locale) == ("nl_NL", "en_US")
+    with pytest.raises(ValueError, match="transport"):
+        TenantRegistry(
+            transport=_transport(),
+            tenant_options=lambda _: {"transport": _transport()},
+        ).get("merchant", "merchant_api_key")
+
+
+def test_eviction_releases_the_tenant_state():
+    """Drop cached responses and buckets and stop the batch pool."""
+    limiter = RateLimiter()
+    cache = ResponseCache()
+    registry = TenantRegistry(
+        transport=_transport(),
+        tenant_options=lambda _: {
+            "rate_limiter": limiter,
+            "response_cache": cache,
+        },
+        max_tenants=1,
+    )
+    evicted = registry.get("evicted", "evicted_api_key")
+    evicted.get_gateway_manager().get_gateways()
+    bucket = limiter.get_bucket("default_account")
+    before = set(threading.enumerate())
+    evicted.batch().map(str, [1, 2], max_concurrency=2)
+    batch_threads = set(threading.enumerate()) - before
+
+    registry.get("next", "next_api_key")
+
+    assert "evicted" not in registry
+    assert cache.get_stats().size == 0
+    assert limiter.get_bucket("default_account") is not bucket
+    assert batch_threads
+    assert not any(thread.is_alive() for thread in batch_threads)
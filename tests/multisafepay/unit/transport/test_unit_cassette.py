@@ -0,0 +1,203 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the cassette recording and replay transports."""
+
+import asyncio
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from multisafepay import AsyncSdk, Sdk
+from multisafepay.client import Client
+from multisafepay.transport import (
+    AsyncReplayTransport,
+    CassetteError,
+    CassetteHTTPError,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+    read_cassette,
+)
+from tests.support.mock_transport import MockResponse, MockTransport
+
+ORDER_BODY = {
+    "success": True,
+    "data": {"order_id": "order-1", "amount": 1000, "currency": "EUR"},
+}
+ORDER_URL = f"{Client.TEST_URL}json/orders/order-1?locale=en_US"
+
+
+def _record_order(path: Path) -> MockTransport:
+    transport = MockTransport()
+    transport.add_response(MockResponse(json_data=ORDER_BODY))
+    transport.add_response(
+        MockResponse(status_code=404, json_data={"success": False}),
+    )
+    recorder = RecordingTransport(
+        transport,
+        path,
+        clock=itertools.count(0.0, 0.125).__next__,
+    )
+    with recorder:
+        recorder.request(
+            "GET",
+            ORDER_URL,
+            headers={"Authorization": "Bearer secret", "Accept": "*/*"},
+            stream=True,
+        )
+        recorder.request(
+            "POST",
+            f"{ORDER_URL}&api_key=secret",
+            data=b'{"a":1}',
+        )
+    return transport
+
+
+def test_recording_writes_redacted_interactions(tmp_path: Path) -> None:
+    """Write one line per request with the credentials redacted."""
+    path = tmp_path / "orders.jsonl"
+
+    transport = _record_order(path)
+
+    assert "stream" not in transport.request_history[0]["kwargs"]
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    assert "secret" not in path.read_text()
+    first, second = read_cassette(path)
+    assert first.url == ORDER_URL
+    assert first.request_headers == {
+        "Authorization": "REDACTED",
+        "Accept": "*/*",
+    }
+    assert json.loads(first.content) == ORDER_BODY
+    assert first.elapsed == 0.125
+    assert (second.method, second.status_code) == ("POST", 404)
+    assert second.url == f"{ORDER_URL}&api_key=REDACTED"
+    assert second.request_body == '{"a":1}'
+
+
+@pytest.mark.parametrize("name", ["API_KEY", "Api_Key", "api%5Fkey"])
+def test_recording_redacts_query_names_in_any_spelling(
+    tmp_path: Path,
+    name: str,
+) -> None:
+    """Redact credentials whatever the case or encoding of the name."""
+    path = tmp_path / "orders.jsonl"
+    transport = MockTransport()
+    transport.add_response(MockResponse(json_data=ORDER_BODY))
+
+    with RecordingTransport(transport, path) as recorder:
+        recorder.request("GET", f"{ORDER_URL}&{name}=secret")
+
+    assert "secret" not in path.read_text()
+    assert read_cassette(path)[0].url.endswith("=REDACTED")
+
+
+def test_gzip_cassettes_round_trip_binary_bodies(tmp_path: Path) -> None:
+    """Compress .gz cassettes and keep non-text bodies intact."""
+    path = tmp_path / "binary.jsonl.gz"
+    interaction = Interaction(
+        method="GET",
+        url=ORDER_URL,
+        status_code=200,
+        content=b"\xff\x00binary",
+    )
+
+    with RecordingTransport(MockTransport(), path) as recorder:
+        recorder.record(interaction)
+
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert read_cassette(path) == [interaction]
+
+
+def test_replay_serves_sdk_calls_from_the_cassette(tmp_path: Path) -> None:
+    """Answer manager calls from the cassette, whatever the API key."""
+    path = tmp_path / "orders.jsonl"
+    _record_order(path)
+    replay = ReplayTransport(path)
+    sdk = Sdk(api_key="another_key", transport=replay)
+
+    response = sdk.get_order_manager().get("order-1")
+
+    assert response.get_data().order_id == "order-1"
+    assert response.get_data().amount == 1000
+    assert replay.replayed == 1
+    failed = replay.request(
+        "POST",
+        f"{ORDER_URL}&api_key=other",
+        data='{"a":1}',
+    )
+    assert failed.status_code == 404
+
+
+def test_replay_matches_method_url_and_body() -> None:
+    """Replay matching requests in order, and reject unknown ones."""
+    interactions = [
+        Interaction("POST", ORDER_URL, 200, b"1", request_body="a"),
+        Interaction("POST", ORDER_URL, 200, b"2", request_body="a"),
+        Interaction("POST", ORDER_URL, 500, b"3", request_body="b"),
+    ]
+    replay = ReplayTransport(interactions, repeat=False)
+
+    assert replay.request("POST", ORDER_URL, data=b"a").content == b"1"
+    assert replay.request("POST", ORDER_URL, data="a").content == b"2"
+    failed = replay.request("POST", ORDER_URL, data="b")
+    with pytest.raises(CassetteHTTPError):
+        failed.raise_for_status()
+    with pytest.raises(CassetteError, match="used up"):
+        replay.request("POST", ORDER_URL, data="a")
+    with pytest.raises(CassetteError, match="No recorded interaction"):
+        replay.request("GET", ORDER_URL)
+
+
+def test_replay_without_body_matching_repeats_interactions() -> None:
+    """Ignore bodies when asked, and start over once all were replayed."""
+    interactions = [
+        Interaction("POST", ORDER_URL, 200, b"1", request_body="a"),
+        Interaction("POST", ORDER_URL, 200, b"2", request_body="b"),
+    ]
+    replay = ReplayTransport(interactions, match_body=False)
+
+    contents = [
+        replay.request("POST", ORDER_URL, data="generated").content
+        for _ in range(3)
+    ]
+
+    assert contents == [b"1", b"2", b"1"]
+
+
+def test_replay_waits_the_recorded_latency_scaled_by_speed() -> None:
+    """Wait the recorded latencies divided by the speed, if set."""
+    interactions = [Interaction("GET", ORDER_URL, 200, elapsed=0.5)]
+    delays: list[float] = []
+
+    ReplayTransport(interactions).request("GET", ORDER_URL)
+    fast = ReplayTransport(interactions, speed=2.0, sleep=delays.append)
+    response = fast.request("GET", ORDER_URL)
+
+    assert delays == [0.25]
+    assert response.time_to_first_byte == 0.5
+    with pytest.raises(ValueError):
+        ReplayTransport(interactions, speed=0)
+
+
+def test_async_replay_serves_async_sdk_calls() -> None:
+    """Answer async manager calls from the cassette."""
+    body = json.dumps(ORDER_BODY).encode()
+    replay = AsyncReplayTransport(
+        [Interaction("GET", ORDER_URL, 200, body, elapsed=0.01)],
+        speed=10.0,
+    )
+    sdk = AsyncSdk(api_key="test_key", transport=replay)
+
+    response = asyncio.run(sdk.get_order_manager().get("order-1"))
+
+    assert response.get_data().order_id == "order-1"
+    assert replay.replayed == 1
@@ -0,0 +1,204 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Test module for the HTTP/2 transport."""
+
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from multisafepay.sdk import Sdk
+from multisafepay.transport import Http2Transport
+
+pytest.importorskip("httpx")
+h2_connection = pytest.importorskip("h2.connection")
+h2_config = pytest.importorskip("h2.config")
+h2_events = pytest.importorskip("h2.events")
+
+BODY = b'{"success": true, "data": []}'
+
+
+def _serve_h2_connection(conn: socket.socket, delay: float) -> None:
+    h2 = h2_connection.H2Connection(
+        config=h2_config.H2Configuration(client_side=False),
+    )
+    h2.initiate_connection()
+    conn.sendall(h2.data_to_send())
+    with conn:
+        while True:
+            data = conn.recv(65535)
+            if not data:
+                return
+            for event in h2.receive_data(data):
+                if isinstance(event, h2_events.StreamEnded):
+                    time.sleep(delay)
+                    h2.send_headers(
+                        event.stream_id,
+                        [
+                            (":status", "200"),
+                            ("content-type", "application/json"),
+                            ("content-length", str(len(BODY))),
+                        ],
+                    )
+                    h2.send_data(event.stream_id, BODY, end_stream=True)
+            conn.sendall(h2.data_to_send())
+
+
+@pytest.fixture()
+def h2c_url():
+    """Serve HTTP/2 with prior knowledge (h2c) on localhost."""
+    server = socket.create_server(("127.0.0.1", 0))
+    accepted: list[socket.socket] = []
+
+    def accept() -> None:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            accepted.append(conn)
+            threading.Thread(
+                target=_serve_h2_connection,
+                args=(conn, 0.01),
+                daemon=True,
+            ).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+    yield f"http://127.0.0.1:{server.getsockname()[1]}/json/gateways"
+    server.close()
+
+
+def test_concurrent_requests_share_one_connection(h2c_url: str) -> None:
+    """Multiplex requests from many threads over a single connection."""
+    transport = Http2Transport(http1=False, max_connections=1)
+
+    with transport, ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(
+            pool.map(lambda _: transport.request("GET", h2c_url), range(16)),
+        )
+
+    assert {response.http_version for response in responses} == {"HTTP/2"}
+    assert all(response.json()["success"] for response in responses)
+    stats = transport.get_pool_stats()
+    assert stats.requests_sent == 16
+    assert stats.connections_opened == 1
+    assert stats.in_flight == 0
+    assert stats.reuse_ratio == pytest.approx(15 / 16)
+
+
+def test_sdk_runs_over_http2(h2c_url: str) -> None:
+    """Use the HTTP/2 transport as the Sdk transport."""
+    transport = Http2Transport(http1=False)
+    sdk = Sdk(api_key="test_key", transport=transport)
+    sdk.client.url = h2c_url.rsplit("json/", 1)[0]
+
+    response = sdk.client.create_get_request("json/gateways")
+
+    assert response.get_body_success() is True
+    transport.close()
+
+
+def test_stream_limit_bounds_requests_in_flight() -> None:
+    """Queue callers beyond max_concurrent_streams."""
+    release = threading.Event()
+    client = Mock()
+    client.request.side_effect = lambda **_kwargs: release.wait(5)
+    transport = Http2Transport(client=client, max_concurrent_streams=2)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(transport.request, "GET", "https://api.example.com")
+            for _ in range(4)
+        ]
+        limit = time.monotonic() + 5
+        while transport.get_pool_stats().saturated_requests < 2:
+            assert time.monotonic() < limit
+            time.sleep(0.001)
+        assert transport.get_pool_stats().in_flight == 2
+        release.set()
+        for future in futures:
+            future.result()
+
+    stats = transport.get_pool_stats()
+    assert stats.peak_in_flight == 2
+    assert stats.requests_sent == 4
+
+
+def test_stream_wait_is_bounded_by_the_budget() -> None:
+    """Raise PoolTimeout when no stream frees up within the budget."""
+    httpx = pytest.importorskip("httpx")
+    release = threading.Event()
+    client = Mock()
+    client.request.side_effect = lambda **_kwargs: release.wait(5)
+    transport = Http2Transport(client=client, max_concurrent_streams=1)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        busy = pool.submit(transport.request, "GET", "https://api.example.com")
+        while transport.get_pool_stats().in_flight == 0:
+            time.sleep(0.001)
+        with pytest.raises(httpx.PoolTimeout):
+            transport.request("GET", "https://api.example.com", timeout=0.01)
+        release.set()
+        busy.result()
+
+    assert transport.get_pool_stats().in_flight == 0
+
+
+def test_budget_caps_configured_timeouts() -> None:
+    """Cap connect, read and pool timeouts by the remaining budget."""
+    client = Mock()
+    transport = Http2Transport(client=client, connect_timeout=3.0)
+
+    transport.request(
+        "POST",
+        "https://api.example.com",
+        data="{}",
+        timeout=1.5,
+    )
+
+    kwargs = client.request.call_args.kwargs
+    assert kwargs["content"] == "{}"
+    assert kwargs["timeout"].connect == 1.5
+    assert kwargs["timeout"].read == 1.5
+    assert kwargs["timeout"].pool == 1.5
+    assert callable(kwargs["extensions"]["trace"])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_connections": 0},
+        {"max_concurrent_streams": 0},
+        {"keep_alive_timeout": -1},
+        {"read_timeout": -1},
+    ],
+)
+def test_rejects_invalid_settings(kwargs: dict) -> None:
+    """Reject non-positive limits and negative timeouts."""
+    with pytest.raises(ValueError):
+        Http2Transport(**kwargs)
+
+
+def test_own_client_enables_http2(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Create an HTTP/2 enabled client sized by max_connections."""
+    from multisafepay.transport import http2_transport
+
+    client_factory = Mock()
+    monkeypatch.setattr(http2_transport, "Client", client_factory)
+
+    transport = Http2Transport(max_connections=2, keep_alive_timeout=5)
+
+    kwargs = client_factory.call_args.kwargs
+    assert transport.client is client_factory.return_value
+    assert kwargs["http2"] is True
+    assert kwargs["http1"] is True
+    assert kwargs["limits"].max_connections == 2
+    assert kwargs["limits"].keepalive_expiry == 5
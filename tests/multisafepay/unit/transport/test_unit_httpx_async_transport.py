@@ -0,0 +1,104 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Unit tests for the httpx-based async transport."""
+
+import asyncio
+
+import pytest
+
+from multisafepay.transport import HttpxAsyncTransport
+
+httpx = pytest.importorskip("httpx")
+
+
+def test_request_forwards_method_headers_and_body():
+    """Send the request through the wrapped httpx.AsyncClient."""
+    seen = {}
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        seen["method"] = request.method
+        seen["url"] = str(request.url)
+        seen["auth"] = request.headers["Authorization"]
+        seen["body"] = request.content
+        return httpx.Response(200, json={"success": True})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    transport = HttpxAsyncTransport(client=client)
+
+    async def run() -> "httpx.Response":
+        async with transport:
+            return await transport.request(
+                method="POST",
+                url="https://api.example.com/json/orders?locale=en_US",
+                headers={"Authorization": "Bearer test"},
+                data='{"foo":"bar"}',
+            )
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert response.json() == {"success": True}
+    assert seen == {
+        "method": "POST",
+        "url": "https://api.example.com/json/orders?locale=en_US",
+        "auth": "Bearer test",
+        "body": b'{"foo":"bar"}',
+    }
+    assert client.is_closed
+
+
+def test_default_client_uses_configured_timeouts():
+    """Create the httpx client with the connect and read timeouts."""
+    transport = HttpxAsyncTransport(connect_timeout=2.0, read_timeout=7.0)
+
+    timeout = transport.client.timeout
+    assert timeout.connect == 2.0
+    assert timeout.read == 7.0
+    asyncio.run(transport.aclose())
+
+
+def test_request_budget_caps_configured_timeouts():
+    """Cap the httpx timeouts by the remaining call budget."""
+    seen = {}
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        seen.update(request.extensions["timeout"])
+        return httpx.Response(200, json={"success": True})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    transport = HttpxAsyncTransport(client=client, connect_timeout=2.0)
+
+    async def run() -> None:
+        async with transport:
+            await transport.request(
+                "GET",
+                "https://api.example.com",
+                timeout=0.5,
+            )
+
+    asyncio.run(run())
+
+    assert seen["connect"] == 0.5
+    assert seen["read"] == 0.5
+
+
+def test_raises_clear_error_when_httpx_missing(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Raise an actionable error when httpx is unavailable."""
+    from multisafepay.transport import httpx_async_transport
+
+    monkeypatch.setattr(httpx_async_transport, "_HAS_HTTPX", False)
+    monkeypatch.setattr(
+        httpx_async_transport,
+        "_HTTPX_IMPORT_ERROR",
+        ModuleNotFoundError("No module named 'httpx'"),
+    )
+
+    with pytest.raises(ModuleNotFoundError, match="multisafepay\\[httpx\\]"):
+        HttpxAsyncTransport()
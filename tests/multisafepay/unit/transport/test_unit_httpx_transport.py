@@ -0,0 +1,98 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Test module for the sync httpx transport."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from multisafepay.client import Client
+from multisafepay.transport import HttpxTransport
+
+httpx = pytest.importorskip("httpx")
+
+
+def _mock_client(handler: object) -> "httpx.Client":
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_request_returns_httpx_response_unchanged():
+    """Send the request through httpx and return its response."""
+    seen = []
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        seen.append(request)
+        return httpx.Response(200, json={"success": True, "data": {}})
+
+    with HttpxTransport(client=_mock_client(handler)) as transport:
+        response = transport.request(
+            "POST",
+            "https://api.example.com/json/orders?locale=en_US",
+            headers={"Authorization": "Bearer key"},
+            data='{"order_id": "1"}',
+        )
+
+    assert isinstance(response, httpx.Response)
+    assert response.json()["success"] is True
+    assert seen[0].content == b'{"order_id": "1"}'
+    assert seen[0].headers["Authorization"] == "Bearer key"
+    assert seen[0].url.params["locale"] == "en_US"
+
+
+def test_client_works_over_httpx():
+    """Run a client call over the httpx transport."""
+    transport = HttpxTransport(
+        client=_mock_client(
+            lambda _request: httpx.Response(200, json={"success": True}),
+        ),
+    )
+    client = Client(api_key="test_key", transport=transport)
+
+    assert client.create_get_request("json/me").get_body_success() is True
+
+
+def test_budget_caps_configured_timeouts():
+    """Cap connect and read timeouts by the remaining call budget."""
+    client = Mock()
+    transport = HttpxTransport(client=client, read_timeout=None)
+
+    transport.request("GET", "https://api.example.com", timeout=1.5)
+
+    timeout = client.request.call_args.kwargs["timeout"]
+    assert timeout.connect == 1.5
+    assert timeout.read == 1.5
+
+
+def test_own_client_disables_retries_and_redirects(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Create a pooled client that leaves retries and redirects to the SDK."""
+    from multisafepay.transport import httpx_transport
+
+    client_factory = Mock()
+    pool_factory = Mock()
+    monkeypatch.setattr(httpx_transport, "Client", client_factory)
+    monkeypatch.setattr(httpx_transport, "HTTPTransport", pool_factory)
+
+    HttpxTransport(max_connections=25, keep_alive_timeout=5)
+
+    pool_kwargs = pool_factory.call_args.kwargs
+    assert pool_kwargs["retries"] == 0
+    assert pool_kwargs["limits"].max_connections == 25
+    assert pool_kwargs["limits"].keepalive_expiry == 5
+    assert client_factory.call_args.kwargs["follow_redirects"] is False
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_connections": 0}, {"keep_alive_timeout": -1}],
+)
+def test_rejects_invalid_settings(kwargs: dict):
+    """Reject empty pools and negative timeouts."""
+    with pytest.raises(ValueError):
+        HttpxTransport(**kwargs)
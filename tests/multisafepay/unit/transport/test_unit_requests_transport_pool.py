@@ -0,0 +1,220 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Test module for RequestsTransport connection pooling."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from multisafepay.transport import PoolStats, RequestsTransport
+
+requests = pytest.importorskip("requests")
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    slow_started = threading.Event()
+
+    def do_GET(self: "_OkHandler") -> None:  # noqa: N802
+        """Answer every GET with a small keep-alive JSON body."""
+        if self.path == "/slow":
+            self.slow_started.set()
+            time.sleep(0.5)
+        body = b'{"success": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self: "_OkHandler", *args: object) -> None:
+        """Silence request logging."""
+
+
+@pytest.fixture()
+def local_url():
+    """Serve a keep-alive HTTP endpoint on localhost."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_own_session_mounts_sized_adapter() -> None:
+    """Mount an adapter with the configured pool settings."""
+    transport = RequestsTransport(
+        pool_connections=4,
+        pool_maxsize=64,
+        pool_block=True,
+    )
+
+    adapter = transport.session.get_adapter("https://api.multisafepay.com")
+
+    pool_kw = adapter.poolmanager.connection_pool_kw
+    assert pool_kw["maxsize"] == 64
+    assert pool_kw["block"] is True
+
+
+def test_custom_session_is_left_untouched() -> None:
+    """Keep the adapters of a caller-provided session."""
+    session = Mock()
+
+    transport = RequestsTransport(session=session, pool_maxsize=50)
+
+    session.mount.assert_not_called()
+    assert transport.get_pool_stats().connections_opened == 0
+
+
+def test_custom_session_reports_its_adapter_pool_size() -> None:
+    """Report the pool size of the adapter mounted on a provided session."""
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=32))
+
+    transport = RequestsTransport(session=session)
+
+    assert transport.pool_maxsize == 32
+    assert transport.get_pool_stats().pool_maxsize == 32
+
+
+def test_keep_alive_timeout_with_custom_session_raises() -> None:
+    """Reject an idle timeout the provided session would never apply."""
+    with pytest.raises(ValueError, match="keep_alive_timeout"):
+        RequestsTransport(session=requests.Session(), keep_alive_timeout=5)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"pool_connections": 0},
+        {"pool_maxsize": 0},
+        {"keep_alive_timeout": -1},
+    ],
+)
+def test_invalid_pool_settings_raise(kwargs: dict) -> None:
+    """Reject pool sizes below one and negative keep-alive timeouts."""
+    with pytest.raises(ValueError):
+        RequestsTransport(**kwargs)
+
+
+def test_sequential_requests_reuse_connection(local_url: str) -> None:
+    """Serve sequential requests over a single kept-alive connection."""
+    with RequestsTransport() as transport:
+        for _ in range(5):
+            transport.request("GET", local_url).close()
+
+        stats = transport.get_pool_stats()
+
+    assert stats.requests_sent == 5
+    assert stats.connections_opened == 1
+    assert stats.reuse_ratio == pytest.approx(0.8)
+    assert stats.in_flight == 0
+    assert stats.saturated_requests == 0
+
+
+def test_keep_alive_timeout_drops_idle_connections(local_url: str) -> None:
+    """Open a fresh connection once the idle timeout has passed."""
+    with RequestsTransport(keep_alive_timeout=0.01) as transport:
+        transport.request("GET", local_url).close()
+        time.sleep(0.05)
+        transport.request("GET", local_url).close()
+
+        stats = transport.get_pool_stats()
+
+    assert stats.requests_sent == 2
+    assert stats.connections_opened == 2
+    assert stats.reuse_ratio == 0.0
+
+
+def test_keep_alive_timeout_applies_while_requests_are_in_flight(
+    local_url: str,
+) -> None:
+    """Expire an idle connection even though another request is running."""
+    with RequestsTransport(keep_alive_timeout=0.01) as transport:
+        slow = threading.Thread(
+            target=lambda: transport.request(
+                "GET",
+                f"{local_url}slow",
+            ).close(),
+        )
+        _OkHandler.slow_started.clear()
+        slow.start()
+        assert _OkHandler.slow_started.wait(timeout=5)
+        transport.request("GET", local_url).close()
+        time.sleep(0.05)
+        transport.request("GET", local_url).close()
+        in_flight = transport.get_pool_stats().in_flight
+        slow.join(timeout=5)
+
+        stats = transport.get_pool_stats()
+
+    assert in_flight == 1
+    assert stats.requests_sent == 3
+    assert stats.connections_opened == 3
+
+
+def test_saturation_is_counted_when_pool_is_exhausted() -> None:
+    """Count requests started while every pooled connection is busy."""
+    release = threading.Event()
+    started = threading.Barrier(4)
+    session = Mock()
+
+    def send(_prepared: object, **_kwargs: object) -> Mock:
+        started.wait(timeout=5)
+        release.wait(timeout=5)
+        return Mock()
+
+    session.send.side_effect = send
+    transport = RequestsTransport(session=session, pool_maxsize=2)
+    threads = [
+        threading.Thread(target=transport.request, args=("GET", "https://x"))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    started.wait(timeout=5)
+    in_flight = transport.get_pool_stats().in_flight
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    stats = transport.get_pool_stats()
+    assert in_flight == 3
+    assert stats.peak_in_flight == 3
+    assert stats.saturated_requests == 1
+    assert stats.saturation == pytest.approx(1.5)
+    assert stats.in_flight == 0
+
+
+def test_pool_stats_ratios_without_traffic() -> None:
+    """Report zero ratios before any request was sent."""
+    stats = PoolStats(
+        pool_maxsize=10,
+        requests_sent=0,
+        connections_opened=0,
+        in_flight=0,
+        peak_in_flight=0,
+        saturated_requests=0,
+    )
+
+    assert stats.reuse_ratio == 0.0
+    assert stats.saturation == 0.0
+
+
+def test_responses_report_time_to_first_byte(local_url: str) -> None:
+    """Expose the time until the response headers arrived."""
+    with RequestsTransport() as transport:
+        response = transport.request("GET", local_url)
+        response.close()
+
+    assert response.time_to_first_byte == response.elapsed.total_seconds()
+    assert response.time_to_first_byte > 0
@@ -62,7 +62,39 @@ class TestRequestsTransportWithRequests:
         mock_session.prepare_request.assert_called_once()
         request_obj = mock_session.prepare_request.call_args.args[0]
         assert isinstance(request_obj, requires_requests.Request)
-        mock_session.send.assert_called_once_with(prepared)
+        mock_session.send.assert_called_once_with(
+            prepared,
+            timeout=(
+                RequestsTransport.DEFAULT_CONNECT_TIMEOUT,
+                RequestsTransport.DEFAULT_READ_TIMEOUT,
+            ),
+        )
+
+    def test_request_budget_caps_configured_timeouts(
+        self: "TestRequestsTransportWithRequests",
+        requires_requests: object,
+    ) -> None:
+        """Cap connect and read timeouts by the remaining call budget."""
+        assert requires_requests is not None
+        mock_session = Mock()
+        transport = RequestsTransport(
+            session=mock_session,
+            connect_timeout=3.0,
+            read_timeout=None,
+        )
+
+        transport.request("GET", "https://api.example.com", timeout=1.5)
+
+        assert mock_session.send.call_args.kwargs["timeout"] == (1.5, 1.5)
+
+    def test_rejects_negative_timeouts(
+        self: "TestRequestsTransportWithRequests",
+        requires_requests: object,
+    ) -> None:
+        """Reject negative connect and read timeouts."""
+        assert requires_requests is not None
+        with pytest.raises(ValueError, match="read_timeout"):
+            RequestsTransport(read_timeout=-1)
 
     def test_context_manager_closes_session(
         self: "TestRequestsTransportWithRequests",
@@ -0,0 +1,193 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Test module for the urllib3 transport."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from multisafepay.api.paths.gateways.gateway_manager import GatewayManager
+from multisafepay.client import Client, RetryPolicy
+from multisafepay.transport import (
+    Urllib3HTTPError,
+    Urllib3Response,
+    Urllib3Transport,
+)
+
+pytest.importorskip("urllib3")
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self: "_EchoHandler", status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self: "_EchoHandler") -> None:  # noqa: N802
+        """Answer with the gateways listing, or an error for /error paths."""
+        if "/error" in self.path:
+            self._reply(503, {"success": False})
+            return
+        if "/redirect" in self.path:
+            self.send_response(302)
+            self.send_header("Location", "/json/gateways")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._reply(
+            200,
+            {
+                "success": True,
+                "data": [{"id": "IDEAL", "description": "iDEAL"}],
+            },
+        )
+
+    def do_POST(self: "_EchoHandler") -> None:  # noqa: N802
+        """Echo the request body and headers."""
+        length = int(self.headers["Content-Length"])
+        self._reply(
+            201,
+            {
+                "body": self.rfile.read(length).decode(),
+                "auth": self.headers["Authorization"],
+            },
+        )
+
+    def log_message(self: "_EchoHandler", *args: object) -> None:
+        """Silence request logging."""
+
+
+@pytest.fixture()
+def local_url():
+    """Serve a keep-alive HTTP endpoint on localhost."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_response_adapter_exposes_http_response_interface(local_url: str):
+    """Expose status_code, headers and json() on urllib3 responses."""
+    with Urllib3Transport() as transport:
+        response = transport.request("GET", f"{local_url}json/gateways")
+
+    assert isinstance(response, Urllib3Response)
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.json()["data"][0]["id"] == "IDEAL"
+    response.raise_for_status()
+
+
+def test_posts_string_bodies_with_headers(local_url: str):
+    """Encode string bodies and forward headers."""
+    with Urllib3Transport() as transport:
+        response = transport.request(
+            "POST",
+            f"{local_url}json/orders",
+            headers={"Authorization": "Bearer key"},
+            data='{"order_id": "1"}',
+        )
+
+    assert response.status_code == 201
+    assert response.json() == {
+        "body": '{"order_id": "1"}',
+        "auth": "Bearer key",
+    }
+
+
+def test_error_status_raises_with_response(local_url: str):
+    """Raise Urllib3HTTPError carrying the response."""
+    with Urllib3Transport() as transport:
+        response = transport.request("GET", f"{local_url}json/error")
+
+    with pytest.raises(Urllib3HTTPError, match="503") as excinfo:
+        response.raise_for_status()
+    assert excinfo.value.response is response
+
+
+def test_redirects_and_retries_are_left_to_the_sdk(local_url: str):
+    """Return redirects and error statuses without retrying them."""
+    with Urllib3Transport() as transport:
+        redirect = transport.request("GET", f"{local_url}json/redirect")
+
+    assert redirect.status_code == 302
+
+
+def test_client_retries_through_urllib3(local_url: str):
+    """Let the client's RetryPolicy retry 503 responses."""
+    sleeps: list[float] = []
+    client = Client(
+        api_key="test_key",
+        transport=Urllib3Transport(),
+        retry_policy=RetryPolicy(max_retries=2, sleep=sleeps.append),
+    )
+    client.url = local_url
+
+    with pytest.raises(Exception, match="503") as excinfo:
+        client.create_get_request("json/error")
+
+    assert len(sleeps) == 2
+    assert excinfo.value.context["retries"] == 2
+
+
+def test_manager_parses_models_through_urllib3(local_url: str):
+    """Run a manager call end to end over urllib3."""
+    client = Client(api_key="test_key", transport=Urllib3Transport())
+    client.url = local_url
+
+    gateways = GatewayManager(client).get_gateways().get_data()
+
+    assert gateways[0].id == "IDEAL"
+
+
+def test_budget_caps_configured_timeouts():
+    """Cap connect and read timeouts by the remaining call budget."""
+    pool_manager = Mock()
+    transport = Urllib3Transport(
+        pool_manager=pool_manager,
+        connect_timeout=3.0,
+        read_timeout=None,
+    )
+
+    transport.request("GET", "https://api.example.com", timeout=1.5)
+
+    kwargs = pool_manager.request.call_args.kwargs
+    assert kwargs["timeout"].connect_timeout == 1.5
+    assert kwargs["timeout"].read_timeout == 1.5
+    assert kwargs["retries"] is False
+
+
+def test_own_pool_manager_is_sized_and_never_retries():
+    """Create a PoolManager with the pool settings and retries disabled."""
+    transport = Urllib3Transport(num_pools=3, pool_maxsize=40, pool_block=True)
+
+    pool_kw = transport.pool_manager.connection_pool_kw
+    assert pool_kw["maxsize"] == 40
+    assert pool_kw["block"] is True
+    assert pool_kw["retries"].total is False
+    assert pool_kw["retries"].redirect == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"num_pools": 0}, {"pool_maxsize": 0}, {"connect_timeout": -1}],
+)
+def test_rejects_invalid_settings(kwargs: dict):
+    """Reject empty pools and negative timeouts."""
+    with pytest.raises(ValueError):
+        Urllib3Transport(**kwargs)
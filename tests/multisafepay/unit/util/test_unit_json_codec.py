@@ -0,0 +1,144 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+
+"""Unit tests for the JSON codecs."""
+
+import importlib.util
+from decimal import Decimal
+
+import pytest
+
+from multisafepay.api.paths.capture.capture_manager import CaptureManager
+from multisafepay.api.paths.capture.request.capture_request import (
+    CaptureRequest,
+)
+from multisafepay.client.client import Client
+from multisafepay.util.json_codec import (
+    OrjsonCodec,
+    StdlibJsonCodec,
+    default_json_codec,
+)
+
+_HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+CODECS = [
+    pytest.param(StdlibJsonCodec, id="stdlib"),
+    pytest.param(
+        OrjsonCodec,
+        id="orjson",
+        marks=pytest.mark.skipif(not _HAS_ORJSON, reason="orjson missing"),
+    ),
+]
+
+BODY = b'{"success":true,"data":{"status":"cancelled"}}'
+
+
+class _RecordingCodec(StdlibJsonCodec):
+    """Stdlib codec recording what it encodes and decodes."""
+
+    def __init__(self: "_RecordingCodec") -> None:
+        self.dumped: list = []
+        self.loaded: list = []
+
+    def dumps(self: "_RecordingCodec", obj: object) -> bytes:
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self: "_RecordingCodec", data: bytes) -> object:
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+class _ContentResponse:
+    """Transport response exposing its body bytes."""
+
+    status_code = 200
+    headers = {}
+    content = BODY
+
+    @staticmethod
+    def json() -> dict:
+        raise AssertionError("The body must be decoded by the codec.")
+
+    @staticmethod
+    def raise_for_status() -> None:
+        return
+
+
+class _CaptureTransport:
+    """Transport stub recording the request body."""
+
+    def __init__(self: "_CaptureTransport") -> None:
+        self.data = None
+
+    def request(
+        self: "_CaptureTransport",
+        **kwargs: object,
+    ) -> _ContentResponse:
+        self.data = kwargs.get("data")
+        return _ContentResponse()
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_dumps_is_compact_utf8_with_decimals(codec_class: type) -> None:
+    """Encode compactly as UTF-8, with Decimal values as numbers."""
+    encoded = codec_class().dumps(
+        {"amount": Decimal("10.50"), "name": "Zoë", "items": [1, None]},
+    )
+
+    assert encoded == '{"amount":10.5,"name":"Zoë","items":[1,null]}'.encode()
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_loads_accepts_bytes_and_str(codec_class: type) -> None:
+    """Decode both bytes and str documents."""
+    codec = codec_class()
+
+    assert codec.loads(b'{"a":[1,2.5]}') == {"a": [1, 2.5]}
+    assert codec.loads('{"name":"Zoë"}') == {"name": "Zoë"}
+
+
+@pytest.mark.parametrize("codec_class", CODECS)
+def test_invalid_documents_and_objects_raise(codec_class: type) -> None:
+    """Raise ValueError for invalid JSON and TypeError for unknown objects."""
+    codec = codec_class()
+
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
+
+
+def test_default_codec_prefers_orjson() -> None:
+    """Use orjson when installed and the standard library otherwise."""
+    expected = OrjsonCodec if _HAS_ORJSON else StdlibJsonCodec
+
+    assert isinstance(default_json_codec(), expected)
+    assert isinstance(
+        Client(api_key="test_key", transport=_CaptureTransport()).json_codec,
+        expected,
+    )
+
+
+def test_client_encodes_and_decodes_through_codec() -> None:
+    """Send the manager's request body and decode the response with the codec."""
+    codec = _RecordingCodec()
+    transport = _CaptureTransport()
+    client = Client(api_key="test_key", transport=transport, json_codec=codec)
+
+    response = CaptureManager(client).capture_reservation_cancel(
+        "order-1",
+        CaptureRequest().add_status("cancelled").add_reason("Überweisung"),
+    )
+
+    assert codec.dumped == [{"status": "cancelled", "reason": "Überweisung"}]
+    assert transport.data == (
+        '{"status":"cancelled","reason":"Überweisung"}'.encode()
+    )
+    assert codec.loaded == [BODY]
+    assert response.get_body_success() is True
@@ -0,0 +1,134 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""Test module for the incremental JSON item parser."""
+
+import json
+
+import pytest
+
+from multisafepay.util.json_stream import JsonItemStream
+
+BODY = {
+    "success": True,
+    "data": [
+        {"transaction_id": i, "description": 'café "quoted"' * (i % 3)}
+        for i in range(50)
+    ],
+    "pager": {"after": "abc", "limit": 50, "cursor": {"after": "next"}},
+}
+
+
+def _parse(raw: bytes, chunk_size: int, items_key: str = "data") -> tuple:
+    parser = JsonItemStream(items_key)
+    items = []
+    for start in range(0, len(raw), chunk_size):
+        items.extend(parser.feed(raw[start : start + chunk_size]))
+    items.extend(parser.close())
+    return items, parser.envelope
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 20])
+def test_yields_items_for_any_chunking(chunk_size: int):
+    """Decode the same items and envelope whatever the chunk boundaries."""
+    items, envelope = _parse(json.dumps(BODY).encode(), chunk_size)
+
+    assert items == BODY["data"]
+    assert envelope == {"success": True, "pager": BODY["pager"]}
+
+
+def test_yields_items_before_the_body_is_complete():
+    """Yield every completed item as soon as its chunk arrives."""
+    parser = JsonItemStream()
+
+    first = list(parser.feed(b'{"data": [{"id": 1}, {"id": 2}, {"id"'))
+    second = list(parser.feed(b': 3}], "success": true}'))
+
+    assert first == [{"id": 1}, {"id": 2}]
+    assert second == [{"id": 3}]
+    assert list(parser.close()) == []
+
+
+def test_waits_for_numbers_split_across_chunks():
+    """Do not decode a number that may continue in the next chunk."""
+    items, envelope = _parse(b'{"total": 12345, "data": [10, 200]}', 3)
+
+    assert items == [10, 200]
+    assert envelope == {"total": 12345}
+
+
+@pytest.mark.parametrize(
+    ("raw", "envelope"),
+    [
+        (b"{}", {}),
+        (b' {"data": [] } ', {}),
+        (
+            b'{"data": null, "success": false}',
+            {"data": None, "success": False},
+        ),
+    ],
+)
+def test_handles_empty_and_missing_items(raw: bytes, envelope: dict):
+    """Yield nothing for empty, null or absent item arrays."""
+    assert _parse(raw, 4) == ([], envelope)
+
+
+def test_streams_a_custom_items_key():
+    """Stream the items of another top-level member."""
+    items, envelope = _parse(b'{"data": {"a": 1}, "rows": [1, 2]}', 5, "rows")
+
+    assert items == [1, 2]
+    assert envelope == {"data": {"a": 1}}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"[1, 2]",
+        b'{"data": [1,]}',
+        b'{"success": true,}',
+        b'{"data": [1, 2',
+        b'{"data" [1]}',
+        b"{1: 2}",
+    ],
+)
+def test_rejects_malformed_bodies(raw: bytes):
+    """Raise ValueError for bodies that are not a complete JSON object."""
+    with pytest.raises(ValueError):
+        _parse(raw, 4)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b'{"data": [1,]', b'{"data": [{"id": 1}}', b'{"data": [trux'],
+)
+def test_rejects_syntax_errors_without_waiting_for_more_data(raw: bytes):
+    """Raise on a syntax error at once instead of buffering the rest."""
+    parser = JsonItemStream()
+
+    with pytest.raises(ValueError):
+        list(parser.feed(raw + b"e, 2, 3]}"))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_waits_for_numbers_split_inside_items(chunk_size: int):
+    """Keep waiting when a chunk ends inside a fraction or an exponent."""
+    raw = b'{"data": [2.5, 1e10, -3.25E-2, {"a": 2.0}, [1e+2]]}'
+
+    items, _ = _parse(raw, chunk_size)
+
+    assert items == [2.5, 1e10, -3.25e-2, {"a": 2.0}, [1e2]]
+
+
+def test_parses_large_items_split_across_many_chunks():
+    """Decode an item much larger than the chunk size."""
+    item = {"rows": [{"id": i, "name": 'x\\"' * 5} for i in range(20_000)]}
+    raw = json.dumps({"data": [item, 1]}).encode()
+
+    items, _ = _parse(raw, 4096)
+
+    assert items == [item, 1]
@@ -13,9 +13,11 @@ import json
 import base64
 import hashlib
 import hmac
+import importlib.util
 import time
 
 from multisafepay.exception.invalid_argument import InvalidArgumentException
+from multisafepay.util import json_codec
 from multisafepay.util.webhook import Webhook
 
 API_KEY = "your-MultiSafepay-API-key"
@@ -201,3 +203,46 @@ def test_validate_with_unicode_characters():
         api_key,
         validation_time_in_seconds=600,
     )
+
+
+@pytest.mark.parametrize(
+    "codec_class",
+    [
+        pytest.param(json_codec.StdlibJsonCodec, id="without-orjson"),
+        pytest.param(
+            json_codec.OrjsonCodec,
+            id="with-orjson",
+            marks=pytest.mark.skipif(
+                importlib.util.find_spec("orjson") is None,
+                reason="orjson missing",
+            ),
+        ),
+    ],
+)
+def test_validate_does_not_depend_on_the_json_codec(
+    monkeypatch: pytest.MonkeyPatch,
+    codec_class: type,
+):
+    """Test that signatures check out the same whichever codec the SDK uses."""
+    monkeypatch.setattr(json_codec, "_DEFAULT_CODEC", codec_class())
+    api_key = "test-api-key"
+    timestamp = "1700000000"
+    data = {
+        "rate": 1e-07,
+        "total": 1e20,
+        "reference": 2**64 + 1,
+        "amount": -(2**70),
+    }
+    compact_json = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    signature = hmac.new(
+        api_key.encode(),
+        f"{timestamp}:{compact_json}".encode(),
+        hashlib.sha512,
+    ).hexdigest()
+    auth_header = base64.b64encode(
+        f"{timestamp}:{signature}".encode(),
+    ).decode()
+
+    assert "1e-07" in compact_json
+    assert "1e+20" in compact_json
+    assert Webhook.validate(json.dumps(data), auth_header, api_key, 0)
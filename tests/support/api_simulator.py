@@ -0,0 +1,775 @@
+# Copyright (c) MultiSafepay, Inc. All rights reserved.
+
+# This file is licensed under the Open Software License (OSL) version 3.0.
+# For a copy of the license, see the LICENSE.txt file in the project root.
+
+# See the DISCLAIMER.md file for disclaimer details.
+
+"""
+Local simulator of the MultiSafepay API for throughput testing.
+
+The simulator answers the order, transaction, gateway, payment method,
+recurring and capture endpoints the SDK calls, keeping orders, transactions
+and recurring tokens in memory. It is a small asyncio HTTP/1.1 server with
+keep-alive, so it answers thousands of requests per second on one core and
+injected latencies do not hold up other connections.
+
+Like the mock transport, it lives under ``tests/`` and is not shipped with
+the SDK. Point the SDK at it with the dev-only custom base URL:
+
+    with ApiSimulator(latency=0.02) as simulator:
+        os.environ.update(simulator.environ())
+        sdk = Sdk(api_key="any-key", is_production=False)
+
+or run it as a separate process, from the root of the repository:
+
+    python -m tests.support.api_simulator --port 8080 [--latency 0.02]
+        [--jitter 0.01] [--error-rate 0.01] [--transactions 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import contextlib
+import datetime
+import itertools
+import random
+import threading
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from typing_extensions import Self
+
+from multisafepay.util.json_codec import default_json_codec
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
+
+JSON = dict[str, Any]
+Handler = Callable[[list[str], "Mapping[str, str]", JSON], tuple[int, JSON]]
+
+GATEWAYS = (
+    ("IDEAL", "iDEAL"),
+    ("VISA", "Visa"),
+    ("MASTERCARD", "Mastercard"),
+    ("PAYPAL", "PayPal"),
+    ("BANKTRANS", "Bank transfer"),
+    ("APPLEPAY", "Apple Pay"),
+)
+
+TRANSACTION_FILTERS = (
+    "site_id",
+    "financial_status",
+    "status",
+    "payment_method",
+    "type",
+    "debit_credit",
+)
+
+REASONS = {
+    200: "OK",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%S",
+    )
+
+
+def _error(status: int, code: int, info: str) -> tuple[int, JSON]:
+    return status, {"success": False, "error_code": code, "error_info": info}
+
+
+def _ok(data: object) -> tuple[int, JSON]:
+    return 200, {"success": True, "data": data}
+
+
+def _find(
+    items: list[JSON],
+    rest: list[str],
+    key: str = "id",
+) -> tuple[int, JSON]:
+    if not rest:
+        return _ok(items)
+    for item in items:
+        if str(item[key]).upper() == rest[0].upper():
+            return _ok(item)
+    return _error(404, 1035, f"Unknown {key} {rest[0]}")
+
+
+def _encode_cursor(index: int) -> str:
+    return base64.urlsafe_b64encode(f"t:{index}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> int | None:
+    try:
+        kind, index = base64.urlsafe_b64decode(cursor).decode().split(":")
+        return int(index) if kind == "t" else None
+    except ValueError:
+        return None
+
+
+class SimulatorState:
+    """
+    In-memory state of the simulated API and its request handling.
+
+    Attributes
+    ----------
+    ROUTES (dict[tuple[str, str, int], str]): Handler names by resource,
+        HTTP method and number of path segments after the resource.
+    orders (dict[str, JSON]): The orders by order id.
+    transactions (list[JSON]): All transactions, oldest first.
+    tokens (dict[str, list[JSON]]): The recurring tokens by customer
+        reference.
+
+    """
+
+    ROUTES = {
+        ("orders", "POST", 0): "_create_order",
+        ("orders", "GET", 1): "_get_order",
+        ("orders", "PATCH", 1): "_update_order",
+        ("orders", "POST", 2): "_order_action",
+        ("transactions", "GET", 0): "_list_transactions",
+        ("gateways", "GET", 0): "_gateways",
+        ("gateways", "GET", 1): "_gateways",
+        ("payment-methods", "GET", 0): "_payment_methods",
+        ("payment-methods", "GET", 1): "_payment_methods",
+        ("recurring", "GET", 1): "_list_tokens",
+        ("recurring", "GET", 3): "_get_token",
+        ("recurring", "DELETE", 3): "_remove_token",
+        ("capture", "PATCH", 1): "_cancel_reservation",
+    }
+
+    def __init__(self: SimulatorState, transactions: int = 0) -> None:
+        """
+        Initialize the SimulatorState.
+
+        Parameters
+        ----------
+        transactions (int): Number of completed transactions to create up
+            front, to page through, by default 0.
+
+        """
+        self.orders: dict[str, JSON] = {}
+        self.transactions: list[JSON] = []
+        self.tokens: dict[str, list[JSON]] = {}
+        self._ids = itertools.count(1_000_000)
+        for index in range(transactions):
+            gateway = GATEWAYS[index % len(GATEWAYS)][0]
+            self._add_transaction(
+                f"seed-{index}",
+                "payment",
+                1000 + index,
+                "EUR",
+                gateway,
+            )
+
+    def handle(
+        self: SimulatorState,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        body: JSON,
+    ) -> tuple[int, JSON]:
+        """
+        Answer an API request.
+
+        Parameters
+        ----------
+        method (str): The HTTP method.
+        path (str): The path below the base URL, e.g. ``json/orders/1``.
+        query (Mapping[str, str]): The query parameters.
+        body (JSON): The decoded request body, empty without body.
+
+        Returns
+        -------
+        tuple[int, JSON]: The status code and the response body.
+
+        """
+        segments = [unquote(s) for s in path.strip("/").split("/")]
+        if len(segments) < 2 or segments[0] != "json":
+            return _error(404, 404, "Endpoint not found")
+        rest = segments[2:]
+        name = self.ROUTES.get((segments[1], method, len(rest)))
+        if name is None:
+            return _error(404, 404, "Endpoint not simulated")
+        handler: Handler = getattr(self, name)
+        return handler(rest, query, body)
+
+    def _add_transaction(
+        self: SimulatorState,
+        order_id: str,
+        kind: str,
+        amount: int,
+        currency: str,
+        gateway: str,
+        status: str = "completed",
+    ) -> JSON:
+        created = _now()
+        transaction = {
+            "transaction_id": str(next(self._ids)),
+            "order_id": order_id,
+            "type": kind,
+            "amount": amount,
+            "net": amount,
+            "currency": currency,
+            "payment_method": gateway,
+            "status": status,
+            "financial_status": status,
+            "debit_credit": "credit" if kind == "payment" else "debit",
+            "created": created,
+            "modified": created,
+            "site_id": "10",
+        }
+        self.transactions.append(transaction)
+        return transaction
+
+    def _create_order(
+        self: SimulatorState,
+        _rest: list[str],
+        _query: Mapping[str, str],
+        body: JSON,
+    ) -> tuple[int, JSON]:
+        order_id = body.get("order_id")
+        amount = body.get("amount")
+        if not order_id or not isinstance(amount, int) or amount <= 0:
+            return _error(422, 1000, "order_id and amount are required")
+        if order_id in self.orders:
+            return _error(409, 1006, "Order id already exists")
+        gateway = body.get("gateway") or "IDEAL"
+        currency = body.get("currency") or "EUR"
+        status = "completed" if body.get("type") == "direct" else "initialized"
+        transaction = self._add_transaction(
+            order_id,
+            "payment",
+            amount,
+            currency,
+            gateway,
+            status=status,
+        )
+        customer = body.get("customer") or {}
+        order = {
+            "order_id": order_id,
+            "transaction_id": transaction["transaction_id"],
+            "amount": amount,
+            "amount_refunded": 0,
+            "currency": currency,
+            "description": body.get("description"),
+            "status": status,
+            "financial_status": status,
+            "created": transaction["created"],
+            "modified": transaction["modified"],
+            "customer": customer,
+            "payment_details": {"type": gateway},
+            "payment_url": f"https://payv2.multisafepay.com/connect/{order_id}",
+        }
+        self.orders[order_id] = order
+        reference = customer.get("reference")
+        if reference and body.get("recurring_model"):
+            self.tokens.setdefault(reference, []).append(
+                {
+                    "token": f"token-{transaction['transaction_id']}",
+                    "code": gateway,
+                    "display": "Card xxxx 1111",
+                    "bin": "411111",
+                    "name_holder": "Simulated",
+                    "expiry_date": "3012",
+                    "is_expired": False,
+                    "last_four": "1111",
+                    "model": body["recurring_model"],
+                },
+            )
+        return _ok(order)
+
+    def _get_order(
+        self: SimulatorState,
+        rest: list[str],
+        _query: Mapping[str, str],
+        _body: JSON,
+    ) -> tuple[int, JSON]:
+        order = self.orders.get(rest[0])
+        if order is None:
+            return _error(404, 1006, "Invalid transaction ID")
+        return _ok(order)
+
+    def _update_order(
+        self: SimulatorState,
+        rest: list[str],
+        _query: Mapping[str, str],
+        body: JSON,
+    ) -> tuple[int, JSON]:
+        order = self.orders.get(rest[0])
+        if order is None:
+            return _error(404, 1006, "Invalid transaction ID")
+        order.update({k: body[k] for k in ("status", "reason") if k in body})
+        order["modified"] = _now()
+        return _ok({})
+
+    def _order_action(
+        self: SimulatorState,
+        rest: list[str],
+        _query: Mapping[str, str],
+        body: JSON,
+    ) -> tuple[int, JSON]:
+        order = self.orders.get(rest[0])
+        if order is None:
+            return _error(404, 1006, "Invalid transaction ID")
+        if rest[1] == "capture":
+            kind = "capture"
+            amount = body.get("amount") or order["amount"]
+            order["status"] = body.get("new_order_status") or "completed"
+        elif rest[1] == "refunds":
+            kind = "refund"
+            amount = body.get("amount") or 0
+            left = order["amount"] - order["amount_refunded"]
+            if not 0 < amount <= left:
+                return _error(422, 1023, "Refund amount exceeds the order")
+            order["amount_refunded"] += amount
+        else:
+            return _error(404, 404, "Endpoint not simulated")
+        transaction = self._add_transaction(
+            order["order_id"],
+            kind,
+            amount,
+            order["currency"],
+            order["payment_details"]["type"],
+        )
+        order["modified"] = transaction["created"]
+        if kind == "capture":
+            return _ok(
+                {
+                    "transaction_id": transaction["transaction_id"],
+                    "order_id": order["order_id"],
+                },
+            )
+        return _ok(
+            {
+                "transaction_id": order["transaction_id"],
+                "refund_id": transaction["transaction_id"],
+            },
+        )
+
+    def _cancel_reservation(
+        self: SimulatorState,
+        rest: list[str],
+        _query: Mapping[str, str],
+        body: JSON,
+    ) -> tuple[int, JSON]:
+        order = self.orders.get(rest[0])
+        if order is None:
+            return _error(404, 1006, "Invalid transaction ID")
+        order["status"] = body.get("status") or "void"
+        order["modified"] = _now()
+        return _ok(
+            {
+                "order_id": order["order_id"],
+                "success": True,
+                "transaction_id": order["transaction_id"],
+            },
+        )
+
+    def _list_transactions(
+        self: SimulatorState,
+        _rest: list[str],
+        query: Mapping[str, str],
+        _body: JSON,
+    ) -> tuple[int, JSON]:
+        try:
+            limit = max(1, min(int(query.get("limit", 50)), 1000))
+        except ValueError:
+            return _error(422, 1000, "limit must be a number")
+        filters = [(k, query[k]) for k in TRANSACTION_FILTERS if query.get(k)]
+        # Cursors are positions in the full list, so new transactions do
+        # not shift the pages already handed out.
+        start = 0
+        if query.get("after"):
+            after = _decode_cursor(query["after"])
+            if after is None:
+                return _error(422, 1000, "Invalid cursor")
+            start = after + 1
+        page: list[tuple[int, JSON]] = []
+        for index in range(start, len(self.transactions)):
+            transaction = self.transactions[index]
+            if all(str(transaction.get(k)) == v for k, v in filters):
+                page.append((index, transaction))
+                if len(page) == limit + 1:
+                    break
+        more = len(page) > limit
+        page = page[:limit]
+        cursor = {
+            "after": _encode_cursor(page[-1][0]) if more else None,
+            "before": _encode_cursor(page[0][0]) if start and page else None,
+        }
+        return 200, {
+            "success": True,
+            "data": [transaction for _, transaction in page],
+            "pager": {**cursor, "limit": limit, "cursor": cursor},
+        }
+
+    def _gateways(
+        self: SimulatorState,
+        rest: list[str],
+        _query: Mapping[str, str],
+        _body: JSON,
+    ) -> tuple[int, JSON]:
+        return _find(
+            [
+                {"id": code, "description": name, "type": "payment"}
+                for code, name in GATEWAYS
+            ],
+            rest,
+        )
+
+    def _payment_methods(
+        self: SimulatorState,
+        rest: list[str],
+        _query: Mapping[str, str],
+        _body: JSON,
+    ) -> tuple[int, JSON]:
+        return _find(
+            [
+                {
+                    "id": code,
+                    "name": name,
+                    "type": "payment",
+                    "allowed_amount": {"min": 1, "max": None},
+                    "allowed_currencies": ["EUR"],
+                    "allowed_countries": [],
+                    "shopping_cart_required": False,
+                }
+                for code, name in GATEWAYS
+            ],
+            rest,
+        )
+
+    def _list_tokens(
+        self: SimulatorState,
+        rest: list[str],
+        _query: Mapping[str, str],
+        _body: JSON,
+    ) -> tuple[int, JSON]:
+        return _ok({"tokens": self.tokens.get(rest[0], [])})
+
+    def _get_token(
+        self: SimulatorState,
+        rest: list[str],
+        _query: Mapping[str, str],
+        _body: JSON,
+    ) -> tuple[int, JSON]:
+        reference, action, value = rest
+        if action != "token":
+            return _error(404, 404, "Endpoint not simulated")
+        return _find(self.tokens.get(reference, []), [value], key="token")
+
+    def _remove_token(
+        self: SimulatorState,
+        rest: list[str],
+        _query: Mapping[str, str],
+        _body: JSON,
+    ) -> tuple[int, JSON]:
+        reference, action, value = rest
+        if action != "remove":
+            return _error(404, 404, "Endpoint not simulated")
+        tokens = self.tokens.get(reference, [])
+        status, body = _find(tokens, [value], key="token")
+        if status == 200:
+            tokens.remove(body["data"])
+            body = {"success": True, "data": {"removed": True}}
+        return status, body
+
+
+class ApiSimulator:
+    """
+    HTTP server answering API requests from a SimulatorState.
+
+    The server runs on its own event loop, in a background thread when
+    started with start() or as a context manager, so it can share a process
+    with the SDK under test.
+
+    Attributes
+    ----------
+    host (str): The interface the server listens on.
+    port (int): The port, assigned by the system when 0 was given.
+    latency (float): Seconds added to every response.
+    jitter (float): Maximum random seconds added on top of the latency.
+    error_rate (float): Share of requests answered with error_status.
+    error_status (int): Status code of injected errors.
+    state (SimulatorState): The simulated API state.
+    requests (int): Number of requests answered.
+
+    """
+
+    def __init__(
+        self: ApiSimulator,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        transactions: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialize the ApiSimulator.
+
+        Parameters
+        ----------
+        host (str): The interface to listen on, by default 127.0.0.1.
+        port (int): The port to listen on, by default 0, any free port.
+        latency (float): Seconds added to every response, by default 0.
+        jitter (float): Maximum random seconds added on top of the latency,
+            by default 0.
+        error_rate (float): Share of requests answered with error_status,
+            between 0 and 1, by default 0.
+        error_status (int): Status code of injected errors, by default 503.
+        transactions (int): Number of transactions created up front, by
+            default 0.
+        seed (int | None): Seed of the jitter and error injection, by
+            default None.
+
+        Raises
+        ------
+        ValueError: If a latency is negative or error_rate is not a share.
+
+        """
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter must not be negative.")
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1.")
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.state = SimulatorState(transactions)
+        self.requests = 0
+        self._random = random.Random(seed)  # noqa: S311
+        self._codec = default_json_codec()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.Server | None = None
+        self._thread: threading.Thread | None = None
+        self._connections: set[asyncio.Task | None] = set()
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def base_url(self: ApiSimulator) -> str:
+        """
+        Get the base URL to pass to the SDK.
+
+        Returns
+        -------
+        str: The URL of the simulated API, ending with ``/v1/``.
+
+        """
+        return f"http://{self.host}:{self.port}/v1/"
+
+    def environ(self: ApiSimulator) -> dict[str, str]:
+        """
+        Get the environment variables pointing the SDK at the simulator.
+
+        Returns
+        -------
+        dict[str, str]: The dev profile, custom base URL opt-in and URL.
+
+        """
+        return {
+            "MSP_SDK_BUILD_PROFILE": "dev",
+            "MSP_SDK_ALLOW_CUSTOM_BASE_URL": "1",
+            "MSP_SDK_CUSTOM_BASE_URL": self.base_url,
+        }
+
+    async def listen(self: ApiSimulator) -> asyncio.Server:
+        """
+        Start listening on the running event loop.
+
+        Returns
+        -------
+        asyncio.Server: The server, serving until closed.
+
+        """
+        self._server = await asyncio.start_server(
+            self._serve_connection,
+            self.host,
+            self.port,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    def start(self: ApiSimulator) -> ApiSimulator:
+        """
+        Serve in a background thread.
+
+        Returns
+        -------
+        ApiSimulator: The simulator, listening on its port.
+
+        """
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self.listen())
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="api-simulator",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self: ApiSimulator) -> None:
+        """Stop the server started with start()."""
+        if self._loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = self._thread = None
+
+    async def _shutdown(self: ApiSimulator) -> None:
+        if self._server is not None:
+            self._server.close()
+        # Keep-alive connections would otherwise stay open until the
+        # clients close them.
+        for writer in list(self._writers):
+            writer.close()
+        await asyncio.gather(
+            *(task for task in self._connections if task is not None),
+            return_exceptions=True,
+        )
+
+    def __enter__(self: Self) -> Self:
+        """Start serving when entering context."""
+        return self.start()
+
+    def __exit__(self: ApiSimulator, *args: object) -> None:
+        """Stop serving when exiting context."""
+        self.stop()
+
+    async def _serve_connection(
+        self: ApiSimulator,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        self._writers.add(writer)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").split(
+                    "\r\n",
+                )
+                method, target, _version = request_line.split(" ", 2)
+                headers = {}
+                for line in header_lines:
+                    if line:
+                        name, _, value = line.partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                raw = await reader.readexactly(length) if length else b""
+                status, payload = await self._respond(
+                    method,
+                    target,
+                    headers,
+                    raw,
+                )
+                body = self._codec.dumps(payload)
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1")
+                    + body,
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            self._connections.discard(task)
+            writer.close()
+
+    async def _respond(
+        self: ApiSimulator,
+        method: str,
+        target: str,
+        headers: dict[str, str],
+        raw: bytes,
+    ) -> tuple[int, JSON]:
+        self.requests += 1
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0.0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return _error(self.error_status, 1, "Injected error")
+        if not headers.get("authorization") and not headers.get("api_key"):
+            return _error(401, 1032, "Invalid API key")
+        url = urlsplit(target)
+        prefix = "/v1/"
+        if not url.path.startswith(prefix):
+            return _error(404, 404, "Endpoint not found")
+        try:
+            body = self._codec.loads(raw) if raw else {}
+        except ValueError:
+            return _error(422, 1000, "Invalid JSON body")
+        return self.state.handle(
+            method,
+            url.path[len(prefix) :],
+            dict(parse_qsl(url.query)),
+            body if isinstance(body, dict) else {},
+        )
+
+
+def main() -> None:
+    """Run the simulator until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.support.api_simulator",
+        description="Serve a local simulator of the MultiSafepay API.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--transactions", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    simulator = ApiSimulator(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        transactions=args.transactions,
+        seed=args.seed,
+    )
+
+    async def serve() -> None:
+        server = await simulator.listen()
+        for name, value in simulator.environ().items():
+            print(f"export {name}={value}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -106,3 +106,45 @@ class MockTransport:
         """Clear queued responses and request history."""
         self.responses.clear()
         self.request_history.clear()
+
+
+class AsyncMockTransport:
+    """Awaitable variant of MockTransport for the asyncio client stack."""
+
+    def __init__(
+        self: AsyncMockTransport,
+        response_factory: ResponseFactory | None = None,
+    ) -> None:
+        """Initialize transport with optional response factory callback."""
+        self._transport = MockTransport(response_factory=response_factory)
+        self.responses = self._transport.responses
+        self.request_history = self._transport.request_history
+
+    def add_response(self: AsyncMockTransport, response: MockResponse) -> None:
+        """Queue a response to be returned by the next request call."""
+        self._transport.add_response(response)
+
+    async def request(
+        self: AsyncMockTransport,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        data: str | None = None,
+        **kwargs: object,
+    ) -> MockResponse:
+        """Record request details and return next mocked response."""
+        return self._transport.request(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            **kwargs,
+        )
+
+    def get_last_request(self: AsyncMockTransport) -> dict[str, object]:
+        """Return most recently recorded request entry."""
+        return self._transport.get_last_request()
+
+    def reset(self: AsyncMockTransport) -> None:
+        """Clear queued responses and request history."""
+        self._transport.reset()